@@ -1,9 +1,13 @@
 """Authentication components for MCP resource servers."""
 
 from mcp_resource_framework.auth.ssrf_protection import is_safe_url
-from mcp_resource_framework.auth.token_verifier import IntrospectionTokenVerifier
+from mcp_resource_framework.auth.token_verifier import (
+    IntrospectionStats,
+    IntrospectionTokenVerifier,
+)
 
 __all__ = [
+    "IntrospectionStats",
     "IntrospectionTokenVerifier",
     "is_safe_url",
 ]
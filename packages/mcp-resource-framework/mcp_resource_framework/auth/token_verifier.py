@@ -1,8 +1,14 @@
 """Token verifier implementation using OAuth 2.0 Token Introspection (RFC 7662)."""
 
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
+import httpx
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 from mcp.shared.auth_utils import check_resource_allowed, resource_url_from_server_url
 
@@ -10,16 +16,40 @@ from mcp_resource_framework.auth.ssrf_protection import is_safe_url
 
 logger = logging.getLogger(__name__)
 
+# How long an active token is trusted without asking the auth server again.
+# This bounds how late a revocation takes effect on this server.
+DEFAULT_CACHE_TTL = 60.0
+# How long a token the auth server reported as inactive is rejected locally.
+DEFAULT_NEGATIVE_CACHE_TTL = 10.0
+DEFAULT_MAX_CACHE_ENTRIES = 10_000
+
+
+@dataclass
+class IntrospectionStats:
+    """Counters describing how token lookups were answered."""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    failures: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    access_token: AccessToken | None
+    expires_at: float  # time.monotonic() deadline
+
 
 class IntrospectionTokenVerifier(TokenVerifier):
     """Token verifier that uses OAuth 2.0 Token Introspection (RFC 7662).
 
-    This is a simple example implementation for demonstration purposes.
-    Production implementations should consider:
-    - Connection pooling and reuse
-    - More sophisticated error handling
-    - Rate limiting and retry logic
-    - Comprehensive configuration options
+    Introspection results are cached per token: active tokens until
+    ``min(exp, cache_ttl)``, inactive tokens for ``negative_cache_ttl``.
+    Transport errors and unexpected status codes are never cached. Concurrent
+    lookups of the same uncached token share a single introspection request,
+    and all requests go through one pooled HTTP client. Set ``cache_ttl`` to
+    0 to introspect on every call.
     """
 
     def __init__(
@@ -27,16 +57,25 @@ class IntrospectionTokenVerifier(TokenVerifier):
         introspection_endpoint: str,
         server_url: str,
         validate_resource: bool = False,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL,
+        max_cache_entries: int = DEFAULT_MAX_CACHE_ENTRIES,
     ):
         self.introspection_endpoint = introspection_endpoint
         self.server_url = server_url
         self.validate_resource = validate_resource
         self.resource_url = resource_url_from_server_url(server_url)
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self.stats = IntrospectionStats()
 
-    async def verify_token(self, token: str) -> AccessToken | None:
-        """Verify token via introspection endpoint."""
-        import httpx
+        self._client: httpx.AsyncClient | None = None
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[_CacheEntry | None]] = {}
 
+    async def verify_token(self, token: str) -> AccessToken | None:
+        """Verify token via introspection endpoint, using the cache if possible."""
         # Validate URL to prevent SSRF attacks
         if not is_safe_url(self.introspection_endpoint, allow_localhost=True):
             logger.warning(
@@ -44,53 +83,109 @@ class IntrospectionTokenVerifier(TokenVerifier):
             )
             return None
 
-        # Configure secure HTTP client
-        timeout = httpx.Timeout(10.0, connect=5.0)
-        limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
-
-        # Only verify SSL for HTTPS URLs
-        verify_ssl = self.introspection_endpoint.startswith("https://")
-
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            limits=limits,
-            verify=verify_ssl,  # Enforce SSL verification for HTTPS only
-        ) as client:
-            try:
-                response = await client.post(
-                    self.introspection_endpoint,
-                    data={"token": token},
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-
-                if response.status_code != 200:
-                    logger.debug(f"Token introspection returned status {response.status_code}")
-                    return None
-
-                data = response.json()
-                if not data.get("active", False):
-                    logger.debug("Token marked as inactive")
-                    return None
-
-                # RFC 8707 resource validation (only when --oauth-strict is set)
-                if self.validate_resource and not self._validate_resource(data):
-                    logger.warning(
-                        f"Token resource validation failed. Expected: {self.resource_url}"
-                    )
-                    return None
-
-                access_token = AccessToken(
-                    token=token,
-                    client_id=data.get("client_id", "unknown"),
-                    scopes=data.get("scope", "").split() if data.get("scope") else [],
-                    expires_at=data.get("exp"),
-                    resource=data.get("aud"),  # Include resource in token
-                )
-                return access_token
-            except Exception as e:
-                logger.warning(f"Token introspection failed: {e}")
+        key = hashlib.sha256(token.encode()).hexdigest()
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                if entry.access_token is None:
+                    self.stats.negative_hits += 1
+                else:
+                    self.stats.hits += 1
+                return entry.access_token
+            del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats.misses += 1
+            task = asyncio.create_task(self._introspect(token))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats.coalesced += 1
+
+        # Shield the shared lookup so one cancelled caller does not fail the rest
+        entry = await asyncio.shield(task)
+        if entry is None:
+            return None
+        if entry.expires_at > time.monotonic():
+            self._store(key, entry)
+        return entry.access_token
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def clear_cache(self) -> None:
+        """Forget all cached introspection results."""
+        self._cache.clear()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                # Only verify SSL for HTTPS URLs
+                verify=self.introspection_endpoint.startswith("https://"),
+            )
+        return self._client
+
+    async def _introspect(self, token: str) -> _CacheEntry | None:
+        """Ask the auth server about ``token``.
+
+        Returns None when the answer must not be cached (transport errors and
+        unexpected responses), otherwise the result with its cache deadline.
+        """
+        try:
+            response = await self._get_client().post(
+                self.introspection_endpoint,
+                data={"token": token},
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+
+            if response.status_code != 200:
+                logger.debug(f"Token introspection returned status {response.status_code}")
+                self.stats.failures += 1
                 return None
 
+            data = response.json()
+            if not data.get("active", False):
+                logger.debug("Token marked as inactive")
+                return self._negative_entry()
+
+            # RFC 8707 resource validation (only when --oauth-strict is set)
+            if self.validate_resource and not self._validate_resource(data):
+                logger.warning(f"Token resource validation failed. Expected: {self.resource_url}")
+                return self._negative_entry()
+
+            access_token = AccessToken(
+                token=token,
+                client_id=data.get("client_id", "unknown"),
+                scopes=data.get("scope", "").split() if data.get("scope") else [],
+                expires_at=data.get("exp"),
+                resource=data.get("aud"),  # Include resource in token
+            )
+        except Exception as e:
+            logger.warning(f"Token introspection failed: {e}")
+            self.stats.failures += 1
+            return None
+
+        ttl = self.cache_ttl
+        if access_token.expires_at is not None:
+            ttl = min(ttl, access_token.expires_at - time.time())
+        return _CacheEntry(access_token, time.monotonic() + ttl)
+
+    def _negative_entry(self) -> _CacheEntry:
+        return _CacheEntry(None, time.monotonic() + self.negative_cache_ttl)
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
     def _validate_resource(self, token_data: dict[str, Any]) -> bool:
         """Validate token was issued for this resource server."""
         if not self.server_url or not self.resource_url:
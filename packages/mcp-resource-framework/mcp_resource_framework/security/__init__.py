@@ -2,18 +2,24 @@
 
 from mcp_resource_framework.security.lakera_guard import (
     LakeraGuardError,
+    aclose_client,
+    clear_screening_cache,
+    get_flagged_categories,
     guard_content,
     guard_tool,
-    get_flagged_categories,
     is_content_flagged,
     screen_content,
+    screen_messages,
 )
 
 __all__ = [
     "LakeraGuardError",
+    "aclose_client",
+    "clear_screening_cache",
     "guard_content",
     "guard_tool",
     "get_flagged_categories",
     "is_content_flagged",
     "screen_content",
+    "screen_messages",
 ]
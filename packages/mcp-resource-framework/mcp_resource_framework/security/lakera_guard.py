@@ -3,14 +3,23 @@
 Provides decorator-based protection against prompt injection attacks,
 data leakage, and other AI security threats.
 
+All screened inputs of one tool call are sent to Lakera Guard as a single
+multi-message request over a pooled HTTP client, and verdicts are cached by
+content hash so identical content (e.g. an unchanged task listing) is not
+screened twice within ``LAKERA_CACHE_TTL`` seconds.
+
 See: https://docs.lakera.ai/docs/api/guard
 """
 
+import asyncio
 import functools
+import hashlib
 import json
 import logging
 import os
-from collections.abc import Callable
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any, ParamSpec, TypeVar, cast
 
 import httpx
@@ -24,6 +33,9 @@ LAKERA_GUARD_ENABLED = os.environ.get("LAKERA_GUARD_ENABLED", "false").lower() =
 LAKERA_PROJECT_ID = os.environ.get("LAKERA_GUARD_PROJECT_ID", "project-9146177048")
 # When true, API errors allow the request through (fail-open). Default is fail-closed.
 LAKERA_FAIL_OPEN = os.environ.get("LAKERA_FAIL_OPEN", "false").lower() in ("true", "1", "yes")
+# Screening verdicts are cached by content hash; 0 disables the cache.
+LAKERA_CACHE_SIZE = int(os.environ.get("LAKERA_CACHE_SIZE", "1024"))
+LAKERA_CACHE_TTL = float(os.environ.get("LAKERA_CACHE_TTL", "300"))
 
 # Type variables for generic decorator
 P = ParamSpec("P")
@@ -38,12 +50,47 @@ class LakeraGuardError(Exception):
         self.categories = categories or {}
 
 
-async def screen_content(text: str, role: str = "user") -> dict[str, Any]:
-    """Screen content for security threats using Lakera Guard API.
+# Pooled client, recreated if the event loop changes (httpx connection pools
+# are bound to the loop that opened them).
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+# sha256 of the request messages -> (monotonic expiry, Lakera Guard response)
+_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=10.0)
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the pooled Lakera Guard HTTP client."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+def clear_screening_cache() -> None:
+    """Forget all cached screening verdicts."""
+    _cache.clear()
+
+
+def _cache_key(messages: list[dict[str, str]]) -> str:
+    return hashlib.sha256(json.dumps(messages, sort_keys=True).encode()).hexdigest()
+
+
+async def screen_messages(messages: list[dict[str, str]]) -> dict[str, Any]:
+    """Screen several messages for security threats in one Lakera Guard request.
 
     Args:
-        text: The content to screen
-        role: The role of the message sender (user, assistant, system, tool)
+        messages: ``{"role": ..., "content": ...}`` dicts to screen together
 
     Returns:
         Lakera Guard API response containing threat detection results
@@ -55,21 +102,50 @@ async def screen_content(text: str, role: str = "user") -> dict[str, Any]:
         logger.warning("LAKERA_GUARD_API_KEY not set, skipping content screening")
         return {"results": [{"flagged": False, "categories": {}}]}
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.post(
-            LAKERA_API_URL,
-            json={
-                "messages": [{"role": role, "content": text}],
-                "breakdown": True,
-                "project_id": LAKERA_PROJECT_ID,
-            },
-            headers={
-                "Authorization": f"Bearer {LAKERA_API_KEY}",
-                "Content-Type": "application/json",
-            },
-        )
-        response.raise_for_status()
-        return response.json()
+    key = _cache_key(messages)
+    cached = _cache.get(key)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _cache.move_to_end(key)
+            return cached[1]
+        del _cache[key]
+
+    response = await _get_client().post(
+        LAKERA_API_URL,
+        json={
+            "messages": messages,
+            "breakdown": True,
+            "project_id": LAKERA_PROJECT_ID,
+        },
+        headers={
+            "Authorization": f"Bearer {LAKERA_API_KEY}",
+            "Content-Type": "application/json",
+        },
+    )
+    response.raise_for_status()
+    result: dict[str, Any] = response.json()
+
+    if LAKERA_CACHE_SIZE > 0:
+        _cache[key] = (time.monotonic() + LAKERA_CACHE_TTL, result)
+        while len(_cache) > LAKERA_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+async def screen_content(text: str, role: str = "user") -> dict[str, Any]:
+    """Screen content for security threats using Lakera Guard API.
+
+    Args:
+        text: The content to screen
+        role: The role of the message sender (user, assistant, system, tool)
+
+    Returns:
+        Lakera Guard API response containing threat detection results
+
+    Raises:
+        httpx.HTTPError: If the API call fails
+    """
+    return await screen_messages([{"role": role, "content": text}])
 
 
 def is_content_flagged(guard_response: dict[str, Any]) -> tuple[bool, dict[str, bool]]:
@@ -85,9 +161,12 @@ def is_content_flagged(guard_response: dict[str, Any]) -> tuple[bool, dict[str,
     if not results:
         return False, {}
 
-    result = results[0]
-    flagged = result.get("flagged", False)
-    categories = result.get("categories", {})
+    # A multi-message request is flagged if any of its results is.
+    flagged = any(result.get("flagged", False) for result in results)
+    categories: dict[str, bool] = {}
+    for result in results:
+        for category, hit in result.get("categories", {}).items():
+            categories[category] = categories.get(category, False) or hit
 
     return flagged, categories
 
@@ -108,17 +187,21 @@ def guard_content(
     input_params: list[str] | None = None,
     screen_output: bool = True,
     block_on_detection: bool = True,
+    read_only: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator to protect MCP tools with Lakera Guard security screening.
 
     Screens specified input parameters and optionally the output for security
     threats including prompt injection, data leakage, and harmful content.
+    All screened inputs are sent in one request.
 
     Args:
         input_params: List of parameter names to screen (if None, screens all string params)
         screen_output: Whether to screen the tool's output
         block_on_detection: If True, raises LakeraGuardError on detection.
                            If False, logs warning but allows execution.
+        read_only: The tool has no side effects, so it may run while its
+                   inputs are being screened; a blocked input discards the result.
 
     Returns:
         Decorated function with security screening
@@ -138,42 +221,53 @@ def guard_content(
                 logger.debug(f"Lakera Guard disabled, executing {func.__name__} without screening")
                 return await func(*args, **kwargs)  # type: ignore[misc]
 
-            # Screen input parameters
+            # Collect input parameters
             params_to_screen = input_params
             if params_to_screen is None:
                 # Screen all string kwargs by default
                 params_to_screen = [k for k, v in kwargs.items() if isinstance(v, str)]
 
+            screened: list[str] = []
+            messages: list[dict[str, str]] = []
             for param_name in params_to_screen:
-                if param_name in kwargs and kwargs[param_name]:
-                    value = kwargs[param_name]
-                    if isinstance(value, str):
-                        await _screen_and_handle(
-                            content=value,
-                            role="user",
-                            context=f"input parameter '{param_name}' for {func.__name__}",
-                            block_on_detection=block_on_detection,
-                        )
-                    elif isinstance(value, list):
-                        # Handle list parameters (e.g., tags)
-                        combined = " ".join(str(v) for v in value)
-                        if combined.strip():
-                            await _screen_and_handle(
-                                content=combined,
-                                role="user",
-                                context=f"input parameter '{param_name}' for {func.__name__}",
-                                block_on_detection=block_on_detection,
-                            )
-
-            # Execute the actual function
-            result: R = await func(*args, **kwargs)  # type: ignore[misc]
+                value = kwargs.get(param_name)
+                if isinstance(value, list):
+                    # Handle list parameters (e.g., tags)
+                    value = " ".join(str(v) for v in value)
+                if isinstance(value, str) and value.strip():
+                    screened.append(param_name)
+                    messages.append({"role": "user", "content": value})
+
+            result: R
+            if not messages:
+                result = await func(*args, **kwargs)  # type: ignore[misc]
+            else:
+                names = ", ".join(f"'{name}'" for name in screened)
+                screening = _screen_messages_and_handle(
+                    messages=messages,
+                    context=f"input parameters {names} for {func.__name__}",
+                    block_on_detection=block_on_detection,
+                )
+                if read_only:
+                    # Run the tool alongside screening; whichever fails first
+                    # cancels the other.
+                    screen_task = asyncio.ensure_future(screening)
+                    run_task = asyncio.ensure_future(func(*args, **kwargs))  # type: ignore[arg-type]
+                    try:
+                        _, result = await asyncio.gather(screen_task, run_task)
+                    except BaseException:
+                        screen_task.cancel()
+                        run_task.cancel()
+                        raise
+                else:
+                    await screening
+                    result = await func(*args, **kwargs)  # type: ignore[misc]
 
             # Screen output if enabled
             if screen_output and result:
                 output_text = result if isinstance(result, str) else json.dumps(result)
-                await _screen_and_handle(
-                    content=output_text,
-                    role="assistant",
+                await _screen_messages_and_handle(
+                    messages=[{"role": "assistant", "content": output_text}],
                     context=f"output from {func.__name__}",
                     block_on_detection=block_on_detection,
                 )
@@ -185,22 +279,24 @@ def guard_content(
     return decorator
 
 
-async def _screen_and_handle(
-    content: str,
-    role: str,
+async def _screen_messages_and_handle(
+    messages: list[dict[str, str]],
     context: str,
     block_on_detection: bool,
 ) -> None:
-    """Screen content and handle detection results.
+    """Screen several messages in one request and handle detection results."""
+    content = "\n".join(message["content"] for message in messages)
+    await _handle_screening(screen_messages(messages), content, context, block_on_detection)
 
-    Args:
-        content: Text content to screen
-        role: Message role (user/assistant)
-        context: Description of what is being screened (for logging)
-        block_on_detection: Whether to raise exception on detection
-    """
+
+async def _handle_screening(
+    screening: Awaitable[dict[str, Any]],
+    content: str,
+    context: str,
+    block_on_detection: bool,
+) -> None:
     try:
-        guard_response = await screen_content(content, role=role)
+        guard_response = await screening
         flagged, categories = is_content_flagged(guard_response)
 
         if flagged:
@@ -235,6 +331,7 @@ async def _screen_and_handle(
 def guard_tool(
     input_params: list[str] | None = None,
     screen_output: bool = True,
+    read_only: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Convenience decorator for MCP tools with default blocking behavior.
 
@@ -243,6 +340,8 @@ def guard_tool(
     Args:
         input_params: List of parameter names to screen
         screen_output: Whether to screen tool output (default: True)
+        read_only: Run the tool while its inputs are screened (side-effect-free
+                   tools only; see guard_content)
 
     Example:
         @mcp.tool()
@@ -254,4 +353,5 @@ def guard_tool(
         input_params=input_params,
         screen_output=screen_output,
         block_on_detection=True,
+        read_only=read_only,
     )
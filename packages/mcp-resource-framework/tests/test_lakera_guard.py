@@ -11,7 +11,7 @@ import pytest
 import mcp_resource_framework.security.lakera_guard as lakera_module
 from mcp_resource_framework.security.lakera_guard import (
     LakeraGuardError,
-    _screen_and_handle,
+    _screen_messages_and_handle,
 )
 
 # ---------------------------------------------------------------------------
@@ -31,7 +31,7 @@ _FLAGGED_RESPONSE: dict = {
 
 
 # ---------------------------------------------------------------------------
-# Tests for _screen_and_handle – fail-open / fail-closed on HTTPError
+# Tests for _screen_messages_and_handle – fail-open / fail-closed on HTTPError
 # ---------------------------------------------------------------------------
 
 
@@ -49,15 +49,14 @@ class TestFailOpenConfig:
         with (
             patch.object(lakera_module, "LAKERA_FAIL_OPEN", True),
             patch(
-                "mcp_resource_framework.security.lakera_guard.screen_content",
+                "mcp_resource_framework.security.lakera_guard.screen_messages",
                 new_callable=AsyncMock,
                 side_effect=http_error,
             ),
         ):
             # Should not raise
-            await _screen_and_handle(
-                content="some user input",
-                role="user",
+            await _screen_messages_and_handle(
+                messages=[{"role": "user", "content": "some user input"}],
                 context="test context",
                 block_on_detection=True,
             )
@@ -73,15 +72,14 @@ class TestFailOpenConfig:
         with (
             patch.object(lakera_module, "LAKERA_FAIL_OPEN", False),
             patch(
-                "mcp_resource_framework.security.lakera_guard.screen_content",
+                "mcp_resource_framework.security.lakera_guard.screen_messages",
                 new_callable=AsyncMock,
                 side_effect=http_error,
             ),
             pytest.raises(LakeraGuardError, match="Lakera Guard API unavailable"),
         ):
-            await _screen_and_handle(
-                content="some user input",
-                role="user",
+            await _screen_messages_and_handle(
+                messages=[{"role": "user", "content": "some user input"}],
                 context="test context",
                 block_on_detection=True,
             )
@@ -102,15 +100,14 @@ class TestFailOpenConfig:
         with (
             patch.object(lakera_module, "LAKERA_FAIL_OPEN", True),
             patch(
-                "mcp_resource_framework.security.lakera_guard.screen_content",
+                "mcp_resource_framework.security.lakera_guard.screen_messages",
                 new_callable=AsyncMock,
                 side_effect=http_error,
             ),
             caplog.at_level(logging.WARNING, logger=log_name),
         ):
-            await _screen_and_handle(
-                content="test content",
-                role="user",
+            await _screen_messages_and_handle(
+                messages=[{"role": "user", "content": "test content"}],
                 context="unit test",
                 block_on_detection=True,
             )
@@ -128,16 +125,15 @@ class TestFailOpenConfig:
         with (
             patch.object(lakera_module, "LAKERA_FAIL_OPEN", False),
             patch(
-                "mcp_resource_framework.security.lakera_guard.screen_content",
+                "mcp_resource_framework.security.lakera_guard.screen_messages",
                 new_callable=AsyncMock,
                 side_effect=http_error,
             ),
             caplog.at_level(logging.ERROR, logger=log_name),
             pytest.raises(LakeraGuardError),
         ):
-            await _screen_and_handle(
-                content="test content",
-                role="user",
+            await _screen_messages_and_handle(
+                messages=[{"role": "user", "content": "test content"}],
                 context="unit test",
                 block_on_detection=True,
             )
@@ -152,15 +148,14 @@ class TestFailOpenConfig:
         with (
             patch.object(lakera_module, "LAKERA_FAIL_OPEN", True),
             patch(
-                "mcp_resource_framework.security.lakera_guard.screen_content",
+                "mcp_resource_framework.security.lakera_guard.screen_messages",
                 new_callable=AsyncMock,
                 side_effect=httpx.ConnectError("timeout"),
             ),
         ):
             # Should not raise
-            await _screen_and_handle(
-                content="some content",
-                role="user",
+            await _screen_messages_and_handle(
+                messages=[{"role": "user", "content": "some content"}],
                 context="network test",
                 block_on_detection=True,
             )
@@ -171,15 +166,14 @@ class TestFailOpenConfig:
         with (
             patch.object(lakera_module, "LAKERA_FAIL_OPEN", False),
             patch(
-                "mcp_resource_framework.security.lakera_guard.screen_content",
+                "mcp_resource_framework.security.lakera_guard.screen_messages",
                 new_callable=AsyncMock,
                 side_effect=httpx.ConnectError("timeout"),
             ),
             pytest.raises(LakeraGuardError),
         ):
-            await _screen_and_handle(
-                content="some content",
-                role="user",
+            await _screen_messages_and_handle(
+                messages=[{"role": "user", "content": "some content"}],
                 context="network test",
                 block_on_detection=True,
             )
@@ -191,15 +185,14 @@ class TestFailOpenConfig:
             with (
                 patch.object(lakera_module, "LAKERA_FAIL_OPEN", fail_open),
                 patch(
-                    "mcp_resource_framework.security.lakera_guard.screen_content",
+                    "mcp_resource_framework.security.lakera_guard.screen_messages",
                     new_callable=AsyncMock,
                     return_value=_CLEAN_RESPONSE,
                 ),
             ):
                 # Should not raise in either mode
-                await _screen_and_handle(
-                    content="safe content",
-                    role="user",
+                await _screen_messages_and_handle(
+                    messages=[{"role": "user", "content": "safe content"}],
                     context="clean content test",
                     block_on_detection=True,
                 )
@@ -213,15 +206,14 @@ class TestFailOpenConfig:
             with (
                 patch.object(lakera_module, "LAKERA_FAIL_OPEN", fail_open),
                 patch(
-                    "mcp_resource_framework.security.lakera_guard.screen_content",
+                    "mcp_resource_framework.security.lakera_guard.screen_messages",
                     new_callable=AsyncMock,
                     return_value=_FLAGGED_RESPONSE,
                 ),
                 pytest.raises(LakeraGuardError, match="prompt_injection"),
             ):
-                await _screen_and_handle(
-                    content="inject this",
-                    role="user",
+                await _screen_messages_and_handle(
+                    messages=[{"role": "user", "content": "inject this"}],
                     context="flagged content test",
                     block_on_detection=True,
                 )
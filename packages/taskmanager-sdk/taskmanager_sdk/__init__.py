@@ -21,11 +21,18 @@ Basic usage:
     >>> # Use the client
     >>> projects = client.get_projects()
     >>> todos = client.get_todos()
+    >>>
+    >>> # From async code, use the async client (same methods, awaited)
+    >>> from taskmanager_sdk import AsyncTaskManagerClient
+    >>> async with AsyncTaskManagerClient(access_token="...") as client:
+    ...     todos = await client.get_todos()
 """
 
 __version__ = "0.2.0"
 __author__ = "TaskManager SDK"
 
+from .async_client import AsyncTaskManagerClient
+from .base import BaseTaskManagerClient
 from .client import (
     VALID_DEADLINE_TYPES,
     TaskManagerClient,
@@ -65,6 +72,8 @@ from .models import (
 __all__ = [
     # Client classes
     "TaskManagerClient",
+    "AsyncTaskManagerClient",
+    "BaseTaskManagerClient",
     # Constants
     "VALID_DEADLINE_TYPES",
     # Configuration
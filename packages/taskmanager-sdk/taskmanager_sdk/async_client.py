@@ -0,0 +1,165 @@
+"""Async TaskManager client on a pooled ``httpx.AsyncClient``.
+
+:class:`AsyncTaskManagerClient` has the same methods as
+:class:`~taskmanager_sdk.client.TaskManagerClient`, but each one returns an
+awaitable, so calls never block the event loop and concurrent calls run
+concurrently. Connections are kept alive and reused across calls; share one
+client (or one ``httpx.AsyncClient``) per process rather than creating one
+per request.
+
+Example:
+    >>> async with AsyncTaskManagerClient(base_url, access_token=key) as client:
+    ...     todos, projects = await asyncio.gather(
+    ...         client.get_todos(status="pending"), client.get_projects()
+    ...     )
+"""
+
+from collections.abc import Awaitable
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from .base import BaseTaskManagerClient
+from .exceptions import NetworkError
+from .models import ApiResponse
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+class AsyncTaskManagerClient(BaseTaskManagerClient[Awaitable[ApiResponse]]):
+    """
+    Async Python SDK client for TaskManager API.
+
+    Every API method of :class:`~taskmanager_sdk.client.TaskManagerClient` is
+    available with the same arguments; await the result to get the
+    :class:`ApiResponse`.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000/api",
+        http_client: httpx.AsyncClient | None = None,
+        access_token: str | None = None,
+        http2: bool = False,
+        timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ) -> None:
+        """
+        Initialize the async TaskManager client.
+
+        Args:
+            base_url: Base URL for the TaskManager API
+            http_client: Optional ``httpx.AsyncClient`` to send requests with.
+                It is not closed by :meth:`aclose`; its owner closes it.
+            access_token: Optional OAuth access token for Bearer auth
+            http2: Negotiate HTTP/2 (requires the ``http2`` extra). Ignored
+                when ``http_client`` is given.
+            timeout: Request timeout. Ignored when ``http_client`` is given.
+            limits: Connection pool limits. Ignored when ``http_client`` is
+                given.
+        """
+        super().__init__(base_url, access_token=access_token)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            http2=http2, timeout=timeout, limits=limits
+        )
+        self.http_client.headers.update(
+            {"Content-Type": "application/json", "Accept": "application/json"}
+        )
+
+    async def __aenter__(self) -> "AsyncTaskManagerClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool, if this client created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    def _cookie_header(self, cookies: dict[str, str]) -> dict[str, str]:
+        # Sent as a header: per-request cookies= is deprecated in httpx, and
+        # the pooled client's own cookie jar may be shared with other clients
+        if not cookies:
+            return {}
+        return {
+            "Cookie": "; ".join(f"{name}={value}" for name, value in cookies.items())
+        }
+
+    async def _make_form_request(
+        self,
+        endpoint: str,
+        form_data: dict[str, str],
+        error_key: str = "error",
+        fallback_error_key: str | None = None,
+        raise_on_401: bool = True,
+        raise_on_5xx: bool = True,
+        include_session: bool = False,
+        include_auth: bool = False,
+        parse_response: bool = True,
+    ) -> ApiResponse:
+        url = f"{self.base_url}{endpoint}"
+        headers: dict[str, str] = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        # Add Bearer token only for session-authenticated endpoints
+        if include_auth:
+            headers.update(self._auth_headers())
+        if include_session:
+            headers.update(self._cookie_header(self.cookies))
+
+        try:
+            response = await self.http_client.post(url, data=form_data, headers=headers)
+        except httpx.HTTPError as e:
+            raise NetworkError(str(e)) from e
+
+        return self._parse_form_response(
+            response,
+            error_key=error_key,
+            fallback_error_key=fallback_error_key,
+            raise_on_401=raise_on_401,
+            raise_on_5xx=raise_on_5xx,
+            parse_response=parse_response,
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> ApiResponse:
+        method_name = method.upper()
+        if method_name not in ("GET", "POST", "PUT", "PATCH", "DELETE"):
+            return ApiResponse(
+                success=False, error=f"Unsupported HTTP method: {method}"
+            )
+
+        headers = {**self._auth_headers(), **self._cookie_header(self.cookies)}
+        kwargs: dict[str, Any] = {"params": params, "headers": headers}
+        if method_name in ("POST", "PUT", "PATCH"):
+            kwargs["json"] = data
+
+        try:
+            response = await self.http_client.request(
+                method_name, f"{self.base_url}{endpoint}", **kwargs
+            )
+        except httpx.HTTPError as e:
+            raise NetworkError(str(e)) from e
+
+        return self._parse_response(response)
+
+    async def health_check(self) -> ApiResponse:
+        headers = {**self._auth_headers(), **self._cookie_header(self.cookies)}
+        try:
+            response = await self.http_client.get(self._health_url(), headers=headers)
+        except httpx.HTTPError as e:
+            raise NetworkError(str(e)) from e
+        return self._parse_health_response(response)
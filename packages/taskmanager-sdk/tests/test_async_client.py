@@ -0,0 +1,222 @@
+"""Tests for AsyncTaskManagerClient."""
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from taskmanager_sdk import AsyncTaskManagerClient, TaskManagerClient
+from taskmanager_sdk.exceptions import (
+    AuthenticationError,
+    NetworkError,
+    NotFoundError,
+    ValidationError,
+)
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _client(handler: Handler, **kwargs: Any) -> AsyncTaskManagerClient:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncTaskManagerClient(
+        "http://localhost:4321/api", http_client=http_client, **kwargs
+    )
+
+
+def _run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+class TestMethodSurface:
+    """The async client mirrors the blocking client."""
+
+    def test_has_every_public_method(self) -> None:
+        sync_methods = {
+            name
+            for name in dir(TaskManagerClient)
+            if not name.startswith("_") and callable(getattr(TaskManagerClient, name))
+        }
+        async_methods = {
+            name
+            for name in dir(AsyncTaskManagerClient)
+            if not name.startswith("_")
+            and callable(getattr(AsyncTaskManagerClient, name))
+        }
+        assert sync_methods <= async_methods
+
+
+class TestRequests:
+    """Requests are built and parsed like the blocking client's."""
+
+    def test_get_todos_sends_params_and_bearer_token(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"data": [{"id": 1}], "meta": {}})
+
+        async def scenario() -> Any:
+            async with _client(handler, access_token="tok") as client:
+                return await client.get_todos(status="pending")
+
+        response = _run(scenario())
+
+        assert response.success is True
+        assert response.data == [{"id": 1}]
+        assert seen[0].method == "GET"
+        assert seen[0].url.path == "/api/todos"
+        assert seen[0].url.params["status"] == "pending"
+        assert seen[0].headers["Authorization"] == "Bearer tok"
+
+    def test_create_todo_sends_json_body(self) -> None:
+        bodies: list[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={"data": {"id": 7, "title": "New"}})
+
+        async def scenario() -> Any:
+            async with _client(handler) as client:
+                return await client.create_todo(title="New")
+
+        response = _run(scenario())
+
+        assert response.data == {"id": 7, "title": "New"}
+        assert bodies[0]["title"] == "New"
+
+    @pytest.mark.parametrize(
+        ("status", "exception"),
+        [(400, ValidationError), (401, AuthenticationError), (404, NotFoundError)],
+    )
+    def test_error_statuses_raise(self, status: int, exception: type) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                status, json={"detail": {"code": "X", "message": "nope"}}
+            )
+
+        async def scenario() -> Any:
+            async with _client(handler) as client:
+                return await client.get_todo(1)
+
+        with pytest.raises(exception, match="nope"):
+            _run(scenario())
+
+    def test_connection_error_raises_network_error(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        async def scenario() -> Any:
+            async with _client(handler) as client:
+                return await client.get_projects()
+
+        with pytest.raises(NetworkError):
+            _run(scenario())
+
+    def test_session_cookie_is_sent_on_later_requests(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200,
+                json={"success": True},
+                headers={"set-cookie": "session=abc123; Path=/; HttpOnly"},
+            )
+
+        async def scenario() -> None:
+            async with _client(handler) as client:
+                await client.login("user@example.com", "pw")
+                await client.get_projects()
+
+        _run(scenario())
+
+        assert "Cookie" not in seen[0].headers
+        assert seen[1].headers["Cookie"] == "session=abc123"
+
+    def test_oauth_token_uses_form_encoding(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"access_token": "t", "expires_in": 60})
+
+        async def scenario() -> Any:
+            async with _client(handler) as client:
+                return await client.oauth_token(
+                    grant_type="client_credentials",
+                    client_id="id",
+                    client_secret="secret",  # pragma: allowlist secret
+                )
+
+        response = _run(scenario())
+
+        assert response.data == {"access_token": "t", "expires_in": 60}
+        assert seen[0].headers["Content-Type"] == "application/x-www-form-urlencoded"
+        assert b"grant_type=client_credentials" in seen[0].content
+
+    def test_health_check_hits_root_endpoint(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(503, json={"status": "degraded"})
+
+        async def scenario() -> Any:
+            async with _client(handler) as client:
+                return await client.health_check()
+
+        response = _run(scenario())
+
+        assert response.success is False
+        assert response.data == {"status": "degraded"}
+        assert seen[0].url.path == "/health"
+
+
+class TestConcurrencyAndPooling:
+    """Calls run concurrently over one shared connection pool."""
+
+    def test_concurrent_calls_overlap(self) -> None:
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"data": []})
+
+        async def scenario() -> None:
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            client = AsyncTaskManagerClient(
+                "http://localhost:4321/api", http_client=http_client
+            )
+            await asyncio.gather(*(client.get_todos() for _ in range(5)))
+            await http_client.aclose()
+
+        _run(scenario())
+
+        assert max_in_flight == 5
+
+    def test_shared_http_client_is_not_closed(self) -> None:
+        async def scenario() -> bool:
+            http_client = httpx.AsyncClient()
+            async with AsyncTaskManagerClient(http_client=http_client):
+                pass
+            closed = http_client.is_closed
+            await http_client.aclose()
+            return closed
+
+        assert _run(scenario()) is False
+
+    def test_owned_http_client_is_closed(self) -> None:
+        async def scenario() -> bool:
+            client = AsyncTaskManagerClient()
+            await client.aclose()
+            return client.http_client.is_closed
+
+        assert _run(scenario()) is True
@@ -291,6 +291,22 @@ class TestTodos:
         assert call_args.kwargs["params"]["category"] == "Work"
         assert call_args.kwargs["params"]["limit"] == 10
 
+    def test_get_todos_cursor_and_fields(
+        self, client: TaskManagerClient, mock_session: Mock
+    ) -> None:
+        """Test paging and field projection params are passed through."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {"data": [], "meta": {"count": 0}}
+        mock_session.get.return_value = mock_response
+
+        client.get_todos(limit=100, cursor="abc", fields=["title", "status"])
+
+        params = mock_session.get.call_args.kwargs["params"]
+        assert params["cursor"] == "abc"
+        assert params["fields"] == "title,status"
+
     def test_create_todo(self, client: TaskManagerClient, mock_session: Mock) -> None:
         """Test creating a todo."""
         mock_response = Mock()
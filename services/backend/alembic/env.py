@@ -15,6 +15,7 @@ from app.models import (  # noqa: F401
     notification,
     oauth,
     project,
+    project_stats,
     recurring_task,
     session,
     shared_state,
@@ -0,0 +1,55 @@
+"""Add partial indexes for keyset pagination of todo lists.
+
+GET /api/todos pages through a user's root-level todos with a keyset on the
+active ordering. These indexes let each page be read with an index range scan
+instead of sorting every matching todo.
+
+Revision ID: 0033_add_todo_keyset_indexes
+Revises: 0032_add_shared_state_table
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0033_add_todo_keyset_indexes"
+down_revision: str | None = "0032_add_shared_state_table"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add keyset indexes for the due_date and position orderings.
+
+    Both match the ORDER BY emitted by the todo list endpoint:
+    - due_date: (due_date ASC NULLS LAST, priority DESC, id)
+    - position: (position, created_at, id)
+    """
+    op.create_index(
+        "ix_todos_user_due_date_keyset",
+        "todos",
+        [
+            "user_id",
+            sa.text("due_date ASC NULLS LAST"),
+            sa.text("priority DESC"),
+            "id",
+        ],
+        postgresql_where="deleted_at IS NULL AND parent_id IS NULL",
+    )
+    op.create_index(
+        "ix_todos_user_position_keyset",
+        "todos",
+        ["user_id", "position", "created_at", "id"],
+        postgresql_where="deleted_at IS NULL AND parent_id IS NULL",
+    )
+
+
+def downgrade() -> None:
+    """Remove the keyset indexes."""
+    op.drop_index("ix_todos_user_position_keyset", table_name="todos")
+    op.drop_index("ix_todos_user_due_date_keyset", table_name="todos")
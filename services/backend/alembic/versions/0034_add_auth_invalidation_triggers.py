@@ -0,0 +1,86 @@
+"""Add auth invalidation triggers for the in-process auth cache
+
+Revision ID: 0034_add_auth_invalidation_triggers
+Revises: 0033_add_todo_keyset_indexes
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0034_add_auth_invalidation_triggers"
+down_revision: str | None = "0033_add_todo_keyset_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Emits {"t":"api_keys","auth":true,"uid":1} on the existing 'events'
+    # channel. The payload deliberately carries no row id: session ids are
+    # credentials, and these events are never forwarded to SSE clients.
+    # users rows identify the user by id, every other table by user_id.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_auth_event() RETURNS trigger AS $$
+        DECLARE
+            rec RECORD;
+            uid BIGINT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                rec := OLD;
+            ELSE
+                rec := NEW;
+            END IF;
+
+            uid := (to_jsonb(rec) ->> (
+                CASE WHEN TG_TABLE_NAME = 'users' THEN 'id' ELSE 'user_id' END
+            ))::bigint;
+
+            IF uid IS NOT NULL THEN
+                PERFORM pg_notify('events', json_build_object(
+                    't',    TG_TABLE_NAME,
+                    'auth', true,
+                    'uid',  uid
+                )::text);
+            END IF;
+
+            RETURN rec;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Only columns that affect whether a credential is still valid, so
+    # routine writes such as api_keys.last_used_at don't flush the cache.
+    op.execute("""
+        CREATE TRIGGER trg_sessions_auth_events
+        AFTER UPDATE OF expires_at OR DELETE ON sessions
+        FOR EACH ROW EXECUTE FUNCTION notify_auth_event();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_access_tokens_auth_events
+        AFTER UPDATE OF revoked, expires_at OR DELETE ON access_tokens
+        FOR EACH ROW EXECUTE FUNCTION notify_auth_event();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_api_keys_auth_events
+        AFTER UPDATE OF is_active, expires_at, key_hash OR DELETE ON api_keys
+        FOR EACH ROW EXECUTE FUNCTION notify_auth_event();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trg_users_auth_events
+        AFTER UPDATE OF is_active OR DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_auth_event();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_users_auth_events ON users;")
+    op.execute("DROP TRIGGER IF EXISTS trg_api_keys_auth_events ON api_keys;")
+    op.execute("DROP TRIGGER IF EXISTS trg_access_tokens_auth_events ON access_tokens;")
+    op.execute("DROP TRIGGER IF EXISTS trg_sessions_auth_events ON sessions;")
+    op.execute("DROP FUNCTION IF EXISTS notify_auth_event();")
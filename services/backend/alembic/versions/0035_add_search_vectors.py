@@ -0,0 +1,64 @@
+"""Add persisted, GIN-indexed search_vector columns for full-text search.
+
+Task search used to compute to_tsvector() for every row at query time, and
+wiki, snippet and article search used ILIKE '%q%', so every search scanned the
+user's whole corpus. Each table now has a generated tsvector column with a GIN
+index, so a search only touches matching rows.
+
+Revision ID: 0035_add_search_vectors
+Revises: 0034_add_auth_invalidation_triggers
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0035_add_search_vectors"
+down_revision: str | None = "0034_add_auth_invalidation_triggers"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# table -> ((column, weight), ...). Must match the models' Computed() columns.
+SEARCH_FIELDS: dict[str, tuple[tuple[str, str], ...]] = {
+    "todos": (("title", "A"), ("description", "B")),
+    "wiki_pages": (("title", "A"), ("content", "B")),
+    "snippets": (("title", "A"), ("content", "B"), ("category", "C")),
+    "articles": (("title", "A"), ("summary", "B")),
+}
+
+
+def _tsvector_sql(fields: tuple[tuple[str, str], ...]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('english'::regconfig, coalesce({column}, '')), "
+        f"'{weight}')"
+        for column, weight in fields
+    )
+
+
+def upgrade() -> None:
+    """Add a generated search_vector column and GIN index to each table.
+
+    Adding a STORED generated column rewrites the table once to populate it.
+    """
+    for table, fields in SEARCH_FIELDS.items():
+        op.execute(f"""
+            ALTER TABLE {table}
+            ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS ({_tsvector_sql(fields)}) STORED
+        """)
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Remove the search_vector columns and their indexes."""
+    for table in reversed(SEARCH_FIELDS):
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
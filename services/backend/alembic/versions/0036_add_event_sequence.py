@@ -0,0 +1,77 @@
+"""Add a global sequence number to event bus notifications.
+
+Every NOTIFY payload gains a "seq" field drawn from the event_seq sequence.
+SSE clients use it as their Last-Event-ID, so a client that reconnects
+(possibly to a different worker) can have the events it missed replayed
+instead of reloading everything.
+
+Revision ID: 0036_add_event_sequence
+Revises: 0035_add_search_vectors
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0036_add_event_sequence"
+down_revision: str | None = "0035_add_search_vectors"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_NOTIFY_EVENT_SQL = """
+    CREATE OR REPLACE FUNCTION notify_event() RETURNS trigger AS $$
+    DECLARE
+        rec   RECORD;
+        op_ch TEXT;
+        tab   TEXT;
+    BEGIN
+        -- Pick the record (NEW for I/U, OLD for D)
+        IF TG_OP = 'DELETE' THEN
+            rec := OLD;
+            op_ch := 'D';
+        ELSE
+            rec := NEW;
+            IF TG_OP = 'INSERT' THEN
+                op_ch := 'I';
+            ELSE
+                -- Treat soft-deletes as 'D'
+                IF OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL THEN
+                    op_ch := 'D';
+                ELSE
+                    op_ch := 'U';
+                END IF;
+            END IF;
+        END IF;
+
+        -- Read the tab id GUC (empty string if unset)
+        tab := coalesce(current_setting('app.tab_id', true), '');
+
+        PERFORM pg_notify('events', json_build_object(
+            't',   TG_TABLE_NAME,
+            'op',  op_ch,
+            'id',  rec.id,
+            'uid', rec.user_id,
+            'tab', tab{seq}
+        )::text);
+
+        RETURN rec;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    # Payload becomes:
+    #   {"t":"todos","op":"U","id":42,"uid":1,"tab":"a1b2c3d4","seq":1234}
+    op.execute("CREATE SEQUENCE IF NOT EXISTS event_seq AS BIGINT;")
+    op.execute(
+        _NOTIFY_EVENT_SQL.format(seq=",\n            'seq', nextval('event_seq')")
+    )
+
+
+def downgrade() -> None:
+    op.execute(_NOTIFY_EVENT_SQL.format(seq=""))
+    op.execute("DROP SEQUENCE IF EXISTS event_seq;")
@@ -0,0 +1,35 @@
+"""Add HTTP validators to feed sources for conditional GETs.
+
+Revision ID: 0037_add_feed_conditional_get
+Revises: 0036_add_event_sequence
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0037_add_feed_conditional_get"
+down_revision: str | None = "0036_add_event_sequence"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "feed_sources",
+        sa.Column("etag", sa.String(500), nullable=True),
+    )
+    op.add_column(
+        "feed_sources",
+        sa.Column("last_modified", sa.String(100), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("feed_sources", "last_modified")
+    op.drop_column("feed_sources", "etag")
@@ -0,0 +1,33 @@
+"""Add per-feed keyword lists to feed sources.
+
+NULL keeps the built-in AI/LLM security keywords.
+
+Revision ID: 0038_add_feed_keywords
+Revises: 0037_add_feed_conditional_get
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0038_add_feed_keywords"
+down_revision: str | None = "0037_add_feed_conditional_get"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "feed_sources",
+        sa.Column("keywords", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("feed_sources", "keywords")
@@ -0,0 +1,35 @@
+"""Add content_hash to articles so duplicate stories share one AI summary.
+
+Existing rows stay NULL; the summarizer fills the hash in as it processes
+articles.
+
+Revision ID: 0039_add_article_content_hash
+Revises: 0038_add_feed_keywords
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0039_add_article_content_hash"
+down_revision: str | None = "0038_add_feed_keywords"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "articles",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+    op.create_index("ix_articles_content_hash", "articles", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_content_hash", table_name="articles")
+    op.drop_column("articles", "content_hash")
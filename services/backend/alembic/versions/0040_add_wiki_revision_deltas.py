@@ -0,0 +1,72 @@
+"""Store wiki revisions as compressed reverse deltas.
+
+Adds storage_format, compression and payload to wiki_page_revisions and makes
+content nullable. Existing rows keep their full text in content and are read
+as full revisions; scripts/compact_wiki_revisions.py rewrites them into the
+new format.
+
+Revision ID: 0040_add_wiki_revision_deltas
+Revises: 0039_add_article_content_hash
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0040_add_wiki_revision_deltas"
+down_revision: str | None = "0039_add_article_content_hash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "wiki_page_revisions",
+        sa.Column(
+            "storage_format", sa.String(length=8), nullable=False, server_default="full"
+        ),
+    )
+    op.add_column(
+        "wiki_page_revisions",
+        sa.Column(
+            "compression", sa.String(length=8), nullable=False, server_default="none"
+        ),
+    )
+    op.add_column(
+        "wiki_page_revisions", sa.Column("payload", sa.LargeBinary(), nullable=True)
+    )
+    op.alter_column("wiki_page_revisions", "content", nullable=True)
+    op.create_index(
+        "ix_wiki_page_revisions_page_number",
+        "wiki_page_revisions",
+        ["wiki_page_id", "revision_number"],
+    )
+
+
+def downgrade() -> None:
+    """Drop delta storage.
+
+    Compacted revisions cannot be expanded here, so this refuses to run while
+    any exist; run ``scripts/compact_wiki_revisions.py --expand`` first.
+    """
+    compacted = op.get_bind().scalar(
+        sa.text("SELECT count(*) FROM wiki_page_revisions WHERE content IS NULL")
+    )
+    if compacted:
+        raise RuntimeError(
+            f"{compacted} wiki revisions are stored as deltas; run "
+            "scripts/compact_wiki_revisions.py --expand before downgrading"
+        )
+
+    op.drop_index(
+        "ix_wiki_page_revisions_page_number", table_name="wiki_page_revisions"
+    )
+    op.alter_column("wiki_page_revisions", "content", nullable=False)
+    op.drop_column("wiki_page_revisions", "payload")
+    op.drop_column("wiki_page_revisions", "compression")
+    op.drop_column("wiki_page_revisions", "storage_format")
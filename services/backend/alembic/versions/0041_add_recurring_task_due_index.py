@@ -0,0 +1,38 @@
+"""Add a partial index for finding due recurring tasks.
+
+The recurring task materialisation job selects active templates by
+next_due_date, ordered by (next_due_date, id). This index lets each batch be
+read with an index range scan instead of scanning every template.
+
+Revision ID: 0041_add_recurring_task_due_index
+Revises: 0040_add_wiki_revision_deltas
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0041_add_recurring_task_due_index"
+down_revision: str | None = "0040_add_wiki_revision_deltas"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the due-template index."""
+    op.create_index(
+        "ix_recurring_tasks_due",
+        "recurring_tasks",
+        ["next_due_date", "id"],
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the due-template index."""
+    op.drop_index("ix_recurring_tasks_due", table_name="recurring_tasks")
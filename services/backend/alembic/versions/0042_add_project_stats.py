@@ -0,0 +1,226 @@
+"""Add materialised project statistics.
+
+GET /api/projects?include_stats=true used to aggregate every top-level todo
+of the listed projects on each request. This adds project_stats (per-project
+counters) and project_due_counts (open tasks per due date), maintained by
+triggers on todos, and fills both from the existing todos. Overdue counts are
+summed from project_due_counts at read time, so they stay correct as days
+pass.
+
+Revision ID: 0042_add_project_stats
+Revises: 0041_add_recurring_task_due_index
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0042_add_project_stats"
+down_revision: str | None = "0041_add_recurring_task_due_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_PROJECT_STATS_APPLY_SQL = """
+    CREATE OR REPLACE FUNCTION project_stats_apply(
+        p_project_id integer,
+        p_status text,
+        p_due_date date,
+        p_estimated_hours numeric,
+        p_actual_hours numeric,
+        p_sign integer
+    ) RETURNS void AS $$
+    BEGIN
+        INSERT INTO project_stats AS s (
+            project_id, total_tasks, completed_tasks, pending_tasks,
+            in_progress_tasks, cancelled_tasks, total_estimated_hours,
+            total_actual_hours
+        )
+        SELECT
+            p.id,
+            p_sign,
+            CASE WHEN p_status = 'completed' THEN p_sign ELSE 0 END,
+            CASE WHEN p_status = 'pending' THEN p_sign ELSE 0 END,
+            CASE WHEN p_status = 'in_progress' THEN p_sign ELSE 0 END,
+            CASE WHEN p_status = 'cancelled' THEN p_sign ELSE 0 END,
+            coalesce(p_estimated_hours, 0) * p_sign,
+            coalesce(p_actual_hours, 0) * p_sign
+        FROM projects p
+        WHERE p.id = p_project_id
+        ON CONFLICT (project_id) DO UPDATE SET
+            total_tasks = s.total_tasks + EXCLUDED.total_tasks,
+            completed_tasks = s.completed_tasks + EXCLUDED.completed_tasks,
+            pending_tasks = s.pending_tasks + EXCLUDED.pending_tasks,
+            in_progress_tasks = s.in_progress_tasks + EXCLUDED.in_progress_tasks,
+            cancelled_tasks = s.cancelled_tasks + EXCLUDED.cancelled_tasks,
+            total_estimated_hours =
+                s.total_estimated_hours + EXCLUDED.total_estimated_hours,
+            total_actual_hours = s.total_actual_hours + EXCLUDED.total_actual_hours;
+
+        IF p_due_date IS NOT NULL AND p_status IN ('pending', 'in_progress') THEN
+            INSERT INTO project_due_counts AS d (project_id, due_date, open_tasks)
+            SELECT p.id, p_due_date, p_sign
+            FROM projects p
+            WHERE p.id = p_project_id
+            ON CONFLICT (project_id, due_date) DO UPDATE SET
+                open_tasks = d.open_tasks + EXCLUDED.open_tasks;
+
+            IF p_sign < 0 THEN
+                DELETE FROM project_due_counts
+                WHERE project_id = p_project_id
+                  AND due_date = p_due_date
+                  AND open_tasks <= 0;
+            END IF;
+        END IF;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+_TODOS_PROJECT_STATS_SQL = """
+    CREATE OR REPLACE FUNCTION todos_project_stats() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT'
+            AND OLD.project_id IS NOT NULL
+            AND OLD.parent_id IS NULL
+            AND OLD.deleted_at IS NULL
+        THEN
+            PERFORM project_stats_apply(
+                OLD.project_id, OLD.status, OLD.due_date,
+                OLD.estimated_hours, OLD.actual_hours, -1
+            );
+        END IF;
+        IF TG_OP <> 'DELETE'
+            AND NEW.project_id IS NOT NULL
+            AND NEW.parent_id IS NULL
+            AND NEW.deleted_at IS NULL
+        THEN
+            PERFORM project_stats_apply(
+                NEW.project_id, NEW.status, NEW.due_date,
+                NEW.estimated_hours, NEW.actual_hours, 1
+            );
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+_UPDATE_TRIGGER_SQL = """
+    CREATE TRIGGER todos_project_stats_update
+    AFTER UPDATE ON todos
+    FOR EACH ROW
+    WHEN (
+        OLD.project_id IS DISTINCT FROM NEW.project_id
+        OR OLD.parent_id IS DISTINCT FROM NEW.parent_id
+        OR (OLD.deleted_at IS NULL) <> (NEW.deleted_at IS NULL)
+        OR OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.due_date IS DISTINCT FROM NEW.due_date
+        OR OLD.estimated_hours IS DISTINCT FROM NEW.estimated_hours
+        OR OLD.actual_hours IS DISTINCT FROM NEW.actual_hours
+    )
+    EXECUTE FUNCTION todos_project_stats();
+"""
+
+_COUNTED = "project_id IS NOT NULL AND parent_id IS NULL AND deleted_at IS NULL"
+
+
+def upgrade() -> None:
+    """Create the stats tables and triggers, then backfill from todos."""
+    op.create_table(
+        "project_stats",
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("total_tasks", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_tasks", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("pending_tasks", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "in_progress_tasks", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("cancelled_tasks", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "total_estimated_hours",
+            sa.Numeric(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "total_actual_hours", sa.Numeric(), nullable=False, server_default="0"
+        ),
+    )
+    op.create_table(
+        "project_due_counts",
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("due_date", sa.Date(), primary_key=True),
+        sa.Column("open_tasks", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.execute(_PROJECT_STATS_APPLY_SQL)
+    op.execute(_TODOS_PROJECT_STATS_SQL)
+    # Creating the triggers locks todos against writes until the backfill
+    # below commits, so no change is missed or counted twice.
+    op.execute(
+        """
+        CREATE TRIGGER todos_project_stats_insert_delete
+        AFTER INSERT OR DELETE ON todos
+        FOR EACH ROW EXECUTE FUNCTION todos_project_stats();
+        """
+    )
+    op.execute(_UPDATE_TRIGGER_SQL)
+
+    op.execute(
+        f"""
+        INSERT INTO project_stats (
+            project_id, total_tasks, completed_tasks, pending_tasks,
+            in_progress_tasks, cancelled_tasks, total_estimated_hours,
+            total_actual_hours
+        )
+        SELECT
+            project_id,
+            count(*),
+            count(*) FILTER (WHERE status = 'completed'),
+            count(*) FILTER (WHERE status = 'pending'),
+            count(*) FILTER (WHERE status = 'in_progress'),
+            count(*) FILTER (WHERE status = 'cancelled'),
+            coalesce(sum(estimated_hours), 0),
+            coalesce(sum(actual_hours), 0)
+        FROM todos
+        WHERE {_COUNTED}
+        GROUP BY project_id;
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO project_due_counts (project_id, due_date, open_tasks)
+        SELECT project_id, due_date, count(*)
+        FROM todos
+        WHERE {_COUNTED}
+          AND due_date IS NOT NULL
+          AND status IN ('pending', 'in_progress')
+        GROUP BY project_id, due_date;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers, functions and stats tables."""
+    op.execute("DROP TRIGGER IF EXISTS todos_project_stats_update ON todos;")
+    op.execute("DROP TRIGGER IF EXISTS todos_project_stats_insert_delete ON todos;")
+    op.execute("DROP FUNCTION IF EXISTS todos_project_stats();")
+    op.execute(
+        "DROP FUNCTION IF EXISTS project_stats_apply("
+        "integer, text, date, numeric, numeric, integer);"
+    )
+    op.drop_table("project_due_counts")
+    op.drop_table("project_stats")
@@ -6,8 +6,10 @@ from fastapi import APIRouter
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 
+from app.core.auth_cache import auth_cache
 from app.core.errors import errors
-from app.core.security import generate_api_key, get_api_key_prefix, hash_password
+from app.core.password_hasher import password_hasher
+from app.core.security import generate_api_key, get_api_key_prefix
 from app.db.queries import get_resource_for_user
 from app.dependencies import CurrentUser, DbSession
 from app.models.api_key import ApiKey
@@ -118,7 +120,7 @@ async def create_api_key(
 
     # Generate the key
     secret_key = generate_api_key()
-    key_hash = hash_password(secret_key)
+    key_hash = await password_hasher.hash(secret_key)
     key_prefix = get_api_key_prefix(secret_key)
 
     api_key = ApiKey(
@@ -174,6 +176,7 @@ async def update_api_key(
     update_data = request.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(api_key, field, value)
+    auth_cache.invalidate_user(user.id)
 
     return {"data": _to_response(api_key)}
 
@@ -190,6 +193,7 @@ async def delete_api_key(
     )
 
     await db.delete(api_key)
+    auth_cache.invalidate_user(user.id)
 
     return {"data": {"deleted": True}}
 
@@ -206,5 +210,6 @@ async def revoke_api_key(
     )
 
     api_key.is_active = False
+    auth_cache.invalidate_user(user.id)
 
     return {"data": _to_response(api_key)}
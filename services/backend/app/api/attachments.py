@@ -1,31 +1,51 @@
 """Attachment API routes for todo image uploads."""
 
-import io
+import asyncio
+import hashlib
 import logging
+import os
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime
+from pathlib import Path
+from typing import Annotated
 
 import filetype
-from fastapi import APIRouter, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, BackgroundTasks, Header, UploadFile
+from fastapi.responses import FileResponse, Response
 from PIL import Image
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select
 
 from app.config import settings
 from app.core.errors import ApiError, errors
+from app.core.etag import etag_matches
 from app.db.queries import get_resource_for_user
 from app.dependencies import CurrentUserFlexible, DbSession
 from app.models.attachment import Attachment
 from app.models.todo import Todo
 from app.schemas import ListResponse
-from app.services.storage import storage_service
+from app.services.storage import FileTooLargeError, storage_service
+from app.services.thumbnails import (
+    THUMBNAIL_CONTENT_TYPE,
+    THUMBNAIL_FORMAT,
+    THUMBNAIL_SIZES,
+    thumbnail_service,
+    thumbnail_storage_path,
+)
 
 logger = logging.getLogger(__name__)
 
 # Maximum image dimensions to prevent image bombs
 MAX_IMAGE_DIMENSION = 10000
 
+# Read size when copying an upload to storage
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+ORIGINAL_CACHE_CONTROL = "private, max-age=86400"
+# Thumbnail URLs always refer to the same bytes, so browsers may keep them
+THUMBNAIL_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
 
 def _sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent header injection attacks.
@@ -49,11 +69,13 @@ def _sanitize_filename(filename: str) -> str:
     return safe_filename.strip("._") or "attachment"
 
 
-def _validate_image_content(content: bytes) -> str:
-    """Validate that content is actually an allowed image type using magic bytes.
+def _validate_image_content(path: Path) -> str:
+    """Validate that a file is actually an allowed image type using magic bytes.
+
+    Only the first few KB of the file are read.
 
     Args:
-        content: The file content
+        path: The uploaded file
 
     Returns:
         The detected MIME type
@@ -61,34 +83,33 @@ def _validate_image_content(content: bytes) -> str:
     Raises:
         errors.invalid_file_type: If content is not a valid allowed image type
     """
-    kind = filetype.guess(content)
+    kind = filetype.guess(str(path))
     if kind is None or kind.mime not in settings.allowed_image_types_list:
         raise errors.invalid_file_type(settings.allowed_image_types_list)
     return kind.mime
 
 
-def _validate_image_dimensions(content: bytes) -> None:
+def _validate_image_dimensions(path: Path) -> None:
     """Validate image dimensions to prevent image bomb attacks.
 
+    The dimensions come from the image header, checked before anything else
+    is read; verify() then checks the file's structure without decoding the
+    pixel data.
+
     Args:
-        content: The image file content
+        path: The uploaded image file
 
     Raises:
         errors.invalid_file_type: If image has invalid dimensions or is corrupted
     """
     try:
-        # Use PIL to verify the image and check dimensions
-        img = Image.open(io.BytesIO(content))
-        img.verify()  # Verify image integrity
-
-        # Re-open after verify (verify() closes the file)
-        img = Image.open(io.BytesIO(content))
-        width, height = img.size
-
-        if width > MAX_IMAGE_DIMENSION or height > MAX_IMAGE_DIMENSION:
-            raise errors.invalid_file_type(
-                [f"images up to {MAX_IMAGE_DIMENSION}x{MAX_IMAGE_DIMENSION} pixels"]
-            )
+        with Image.open(path) as img:
+            width, height = img.size
+            if width > MAX_IMAGE_DIMENSION or height > MAX_IMAGE_DIMENSION:
+                raise errors.invalid_file_type(
+                    [f"images up to {MAX_IMAGE_DIMENSION}x{MAX_IMAGE_DIMENSION} pixels"]
+                )
+            img.verify()  # Verify image integrity
     except ApiError:
         # Re-raise our own errors
         raise
@@ -97,6 +118,76 @@ def _validate_image_dimensions(content: bytes) -> None:
         raise errors.invalid_file_type(settings.allowed_image_types_list) from e
 
 
+def _validate_image_file(path: Path) -> str:
+    """Run all image checks on an uploaded file; returns the detected MIME type."""
+    content_type = _validate_image_content(path)
+    _validate_image_dimensions(path)
+    return content_type
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an upload in fixed-size chunks."""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+def _file_etag(storage_path: str) -> str:
+    """Strong ETag for a stored file.
+
+    Stored files are never modified in place (a new upload gets a new UUID
+    path), so the storage path identifies the content.
+    """
+    digest = hashlib.sha256(storage_path.encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+async def _serve_file(
+    storage_path: str,
+    filename: str,
+    media_type: str,
+    cache_control: str,
+    if_none_match: str | None,
+) -> Response:
+    """Stream a stored file, honouring If-None-Match and Range requests.
+
+    FileResponse streams the file in chunks (or hands it to the server via the
+    ASGI pathsend extension where supported) and answers Range / If-Range.
+
+    Raises:
+        errors.attachment_not_found: If the file doesn't exist
+    """
+    etag = _file_etag(storage_path)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        path = storage_service.get_file_path(storage_path)
+        stat_result = await asyncio.to_thread(os.stat, path)
+    except FileNotFoundError as e:
+        raise errors.attachment_not_found() from e
+
+    # Sanitize filename for Content-Disposition header to prevent header injection
+    safe_filename = _sanitize_filename(filename)
+    headers["Content-Disposition"] = f'inline; filename="{safe_filename}"'
+
+    return FileResponse(
+        path, media_type=media_type, headers=headers, stat_result=stat_result
+    )
+
+
+async def _generate_thumbnails(storage_path: str) -> None:
+    """Render the thumbnails of a new upload, logging rather than raising.
+
+    Thumbnails are an optimization: the original is served in their place
+    if they're missing, and scripts/backfill_thumbnails.py can retry.
+    """
+    try:
+        await thumbnail_service.generate(storage_path)
+    except Exception:
+        logger.exception("Failed to generate thumbnails for %s", storage_path)
+
+
 router = APIRouter(prefix="/api/todos", tags=["attachments"])
 
 
@@ -195,6 +286,7 @@ async def upload_attachment(
     file: UploadFile,
     user: CurrentUserFlexible,
     db: DbSession,
+    background_tasks: BackgroundTasks,
 ) -> dict:
     """Upload an image attachment to a todo.
 
@@ -202,36 +294,45 @@ async def upload_attachment(
     Only image files (JPEG, PNG, GIF, WebP) are allowed.
     Maximum file size is configurable (default 10MB).
     Images are validated using magic bytes (not just Content-Type header).
+    Thumbnails are generated in the background after the response is sent.
     """
     # Verify todo exists and belongs to user
     await _get_todo_for_user(db, todo_id, user.id)
 
-    # Read file content
-    content = await file.read()
-
-    # Validate file size first (before expensive operations)
-    if len(content) > settings.max_upload_size_bytes:
+    # Reject uploads whose declared size is already too large
+    if file.size is not None and file.size > settings.max_upload_size_bytes:
         raise errors.file_too_large(settings.max_upload_size_mb)
 
-    # Validate actual file content using magic bytes (not client-provided Content-Type)
-    detected_content_type = _validate_image_content(content)
-
-    # Validate image dimensions to prevent image bombs
-    _validate_image_dimensions(content)
-
-    # Sanitize filename for safe storage and display
-    safe_filename = _sanitize_filename(file.filename or "upload")
-
-    # Save file to storage
-    storage_path: str | None = None
+    # Copy the upload to a temp file in chunks, enforcing the size limit as
+    # bytes arrive, so memory use doesn't depend on the file size
     try:
-        storage_path, file_size = await storage_service.save_file(
-            content, safe_filename, detected_content_type
+        temp_path, file_size = await storage_service.write_temp_file(
+            _iter_upload(file), settings.max_upload_size_bytes
         )
+    except FileTooLargeError as e:
+        raise errors.file_too_large(settings.max_upload_size_mb) from e
     except Exception as e:
         logger.exception("Failed to save file to storage")
         raise errors.upload_failed() from e
 
+    # Sanitize filename for safe storage and display
+    safe_filename = _sanitize_filename(file.filename or "upload")
+
+    stored = False
+    try:
+        # Validate actual file content using magic bytes (not client-provided
+        # Content-Type), and dimensions to prevent image bombs
+        detected_content_type = await asyncio.to_thread(_validate_image_file, temp_path)
+        try:
+            storage_path = storage_service.store_temp_file(temp_path, safe_filename)
+        except Exception as e:
+            logger.exception("Failed to save file to storage")
+            raise errors.upload_failed() from e
+        stored = True
+    finally:
+        if not stored:
+            storage_service.discard_temp_file(temp_path)
+
     # Create attachment record - clean up file on failure
     try:
         attachment = Attachment(
@@ -247,14 +348,16 @@ async def upload_attachment(
         await db.refresh(attachment)
     except Exception:
         # Clean up orphaned file on database failure
-        if storage_path:
-            try:
-                await storage_service.delete_file(storage_path)
-            except Exception:
-                logger.warning("Failed to clean up orphaned file: %s", storage_path)
+        try:
+            await storage_service.delete_file(storage_path)
+        except Exception:
+            logger.warning("Failed to clean up orphaned file: %s", storage_path)
         logger.exception("Failed to create attachment record")
         raise
 
+    # Rendered after the response is sent, so the upload doesn't wait on it
+    background_tasks.add_task(_generate_thumbnails, storage_path)
+
     return {"data": AttachmentResponse.model_validate(attachment)}
 
 
@@ -264,10 +367,12 @@ async def get_attachment(
     attachment_id: int,
     user: CurrentUserFlexible,
     db: DbSession,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> Response:
     """Download/view an attachment.
 
-    Returns the raw file content with appropriate content type.
+    Returns the raw file content with appropriate content type. Supports
+    conditional requests (If-None-Match) and byte ranges (Range / If-Range).
     """
     # Verify todo exists and belongs to user
     await _get_todo_for_user(db, todo_id, user.id)
@@ -275,22 +380,57 @@ async def get_attachment(
     # Get attachment
     attachment = await _get_attachment_for_user(db, attachment_id, todo_id, user.id)
 
-    # Read file from storage
-    try:
-        content = await storage_service.read_file(attachment.storage_path)
-    except FileNotFoundError as e:
-        raise errors.attachment_not_found() from e
+    return await _serve_file(
+        attachment.storage_path,
+        filename=attachment.filename,
+        media_type=attachment.content_type,
+        cache_control=ORIGINAL_CACHE_CONTROL,
+        if_none_match=if_none_match,
+    )
 
-    # Sanitize filename for Content-Disposition header to prevent header injection
-    safe_filename = _sanitize_filename(attachment.filename)
 
-    return Response(
-        content=content,
-        media_type=attachment.content_type,
-        headers={
-            "Content-Disposition": f'inline; filename="{safe_filename}"',
-            "Cache-Control": "private, max-age=86400",
-        },
+@router.get("/{todo_id}/attachments/{attachment_id}/thumbnails/{size}")
+async def get_attachment_thumbnail(
+    todo_id: int,
+    attachment_id: int,
+    size: str,
+    user: CurrentUserFlexible,
+    db: DbSession,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Download a downscaled WebP copy of an image attachment.
+
+    ``size`` is one of the names in ``THUMBNAIL_SIZES``. Thumbnails never
+    change, so they are served with long-lived immutable cache headers. If
+    the thumbnail hasn't been generated, the original is served instead.
+    """
+    if size not in THUMBNAIL_SIZES:
+        raise errors.attachment_not_found()
+
+    # Verify todo exists and belongs to user
+    await _get_todo_for_user(db, todo_id, user.id)
+
+    # Get attachment
+    attachment = await _get_attachment_for_user(db, attachment_id, todo_id, user.id)
+
+    thumbnail_path = thumbnail_storage_path(attachment.storage_path, size)
+    if not await asyncio.to_thread(storage_service.file_exists, thumbnail_path):
+        logger.info("Thumbnail %s missing, serving original", thumbnail_path)
+        # Revalidate each time so the thumbnail is picked up once generated
+        return await _serve_file(
+            attachment.storage_path,
+            filename=attachment.filename,
+            media_type=attachment.content_type,
+            cache_control="private, no-cache",
+            if_none_match=if_none_match,
+        )
+
+    return await _serve_file(
+        thumbnail_path,
+        filename=f"{Path(attachment.filename).stem}.{size}.{THUMBNAIL_FORMAT}",
+        media_type=THUMBNAIL_CONTENT_TYPE,
+        cache_control=THUMBNAIL_CACHE_CONTROL,
+        if_none_match=if_none_match,
     )
 
 
@@ -308,8 +448,9 @@ async def delete_attachment(
     # Get attachment
     attachment = await _get_attachment_for_user(db, attachment_id, todo_id, user.id)
 
-    # Delete file from storage (ignore if already deleted)
+    # Delete file and its thumbnails from storage (ignore if already deleted)
     await storage_service.delete_file(attachment.storage_path)
+    await thumbnail_service.delete(attachment.storage_path)
 
     # Delete attachment record
     await db.delete(attachment)
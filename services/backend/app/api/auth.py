@@ -9,13 +9,11 @@ from pydantic import AfterValidator, BaseModel, EmailStr, Field
 from sqlalchemy import delete, select
 
 from app.config import settings
+from app.core.auth_cache import auth_cache
 from app.core.errors import errors
+from app.core.password_hasher import password_hasher
 from app.core.rate_limit import RateLimiter, login_rate_limiter
-from app.core.security import (
-    hash_password,
-    validate_password_strength,
-    verify_password,
-)
+from app.core.security import validate_password_strength
 from app.core.session import create_session_and_set_cookie, set_session_cookie
 from app.dependencies import CurrentUser, DbSession
 from app.models.session import Session
@@ -116,7 +114,7 @@ async def register(request: RegisterRequest, db: DbSession) -> AuthResponse:
     # Create user
     user = User(
         email=request.email,
-        password_hash=hash_password(request.password),
+        password_hash=await password_hasher.hash(request.password),
     )
     db.add(user)
     await db.flush()
@@ -173,7 +171,12 @@ async def login(
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(password, user.password_hash):
+    # Verify against a dummy hash for unknown users so timing doesn't leak
+    # whether the email exists
+    password_ok = await password_hasher.verify(
+        password, user.password_hash if user else None
+    )
+    if not user or not password_ok:
         await login_rate_limiter.record(email, db)
         raise errors.invalid_credentials()
 
@@ -216,6 +219,7 @@ async def logout(
     """Logout and clear session."""
     # Delete user's sessions
     await db.execute(delete(Session).where(Session.user_id == user.id))
+    auth_cache.invalidate_user(user.id)
 
     # Clear cookie
     response.delete_cookie("session")
@@ -296,7 +300,7 @@ async def update_password(
     await account_update_rate_limiter.check(rate_limit_key, db)
 
     # Verify current password
-    if not verify_password(request.current_password, user.password_hash):
+    if not await password_hasher.verify(request.current_password, user.password_hash):
         await account_update_rate_limiter.record(rate_limit_key, db)
         raise errors.invalid_credentials()
 
@@ -304,11 +308,12 @@ async def update_password(
     await account_update_rate_limiter.reset(rate_limit_key, db)
 
     # Update password
-    user.password_hash = hash_password(request.new_password)
+    user.password_hash = await password_hasher.hash(request.new_password)
 
     # SECURITY: Invalidate all user sessions after password change
     # This ensures any compromised session tokens are revoked
     await db.execute(delete(Session).where(Session.user_id == user.id))
+    auth_cache.invalidate_user(user.id)
 
     await db.flush()
 
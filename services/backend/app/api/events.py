@@ -1,15 +1,21 @@
-"""Server-Sent Events endpoint for real-time updates."""
+"""Server-Sent Events endpoint for real-time updates.
+
+Each change event's SSE id is its global sequence number. Clients reconnect
+with that id (as the ``Last-Event-ID`` header or ``last_event_id`` query
+parameter) to have missed events replayed; if they can't be, a ``resync``
+event tells the client to reload instead.
+"""
 
 import asyncio
 import json
 import logging
 from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import StreamingResponse
 
 from app.dependencies import CurrentUserFlexible
-from app.services.event_bus import event_bus
+from app.services.event_bus import Event, Resync, event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -18,20 +24,66 @@ router = APIRouter(prefix="/api/events", tags=["events"])
 HEARTBEAT_INTERVAL = 30  # seconds
 
 
+def _format(event_type: str, data: dict, seq: int | None) -> str:
+    """Format one SSE message."""
+    payload = json.dumps(data, separators=(",", ":"))
+    message = f"event: {event_type}\ndata: {payload}\n"
+    if seq:
+        message += f"id: {seq}\n"
+    return message + "\n"
+
+
+def _format_change(event: Event) -> str:
+    return _format(
+        "change",
+        {
+            "table": event.table,
+            "op": event.op,
+            "id": event.id,
+            "tab_id": event.tab_id,
+        },
+        event.seq,
+    )
+
+
+def _parse_last_event_id(value: str | None) -> int | None:
+    """Parse a Last-Event-ID value; anything but a sequence number is ignored."""
+    if value and value.isdigit():
+        return int(value)
+    return None
+
+
 async def _event_generator(
-    request: Request, user_id: int
+    request: Request, user_id: int, last_event_id: int | None
 ) -> AsyncGenerator[str, None]:
     """Yield SSE-formatted events for a user."""
-    queue = event_bus.subscribe(user_id)
-    event_id = 0
+    # Subscribing and reading the replay buffer happen in the same tick, so
+    # no event can fall between the replayed ones and the live ones
+    subscription = event_bus.subscribe(user_id)
+    if last_event_id is None:
+        missed: list[Event] | None = []
+    else:
+        missed = event_bus.replay_since(user_id, last_event_id)
+    latest = event_bus.latest_seq()
     try:
+        if missed is None:
+            yield _format("resync", {"reason": "gap"}, latest)
+        elif last_event_id is None:
+            # Give a fresh client an id to resume from, even if it sees no events
+            yield _format("ready", {}, latest)
+        else:
+            for event in missed:
+                yield _format_change(event)
+
         while True:
             # Check if client disconnected
             if await request.is_disconnected():
                 break
 
             try:
-                event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                event = await asyncio.wait_for(
+                    subscription.get(), timeout=HEARTBEAT_INTERVAL
+                )
             except TimeoutError:
                 # Send heartbeat comment to keep connection alive
                 yield ": heartbeat\n\n"
@@ -41,30 +93,32 @@ async def _event_generator(
             if event is None:
                 break
 
-            event_id += 1
-            data = json.dumps(
-                {
-                    "table": event.table,
-                    "op": event.op,
-                    "id": event.id,
-                    "tab_id": event.tab_id,
-                },
-                separators=(",", ":"),
-            )
-            yield f"event: change\ndata: {data}\nid: {event_id}\n\n"
+            # The subscription fell behind and dropped events: reload
+            if isinstance(event, Resync):
+                data = {"reason": "overflow", "dropped": event.dropped}
+                yield _format("resync", data, event.seq)
+                continue
+
+            yield _format_change(event)
 
     finally:
-        event_bus.unsubscribe(user_id, queue)
+        event_bus.unsubscribe(user_id, subscription)
 
 
 @router.get("/stream")
 async def event_stream(
     request: Request,
     user: CurrentUserFlexible,
+    last_event_id: str | None = Query(
+        None, description="Resume after this event (alternative to Last-Event-ID)"
+    ),
 ) -> StreamingResponse:
     """SSE stream of real-time change events for the authenticated user."""
+    resume_from = _parse_last_event_id(
+        request.headers.get("Last-Event-ID") or last_event_id
+    )
     return StreamingResponse(
-        _event_generator(request, user.id),
+        _event_generator(request, user.id, resume_from),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -11,6 +11,7 @@ from sqlalchemy.types import Date
 
 from app.core.errors import errors
 from app.core.rate_limit import RateLimiter
+from app.db.search import matches, to_tsquery
 from app.dependencies import AdminUser, CurrentUser, DbSession
 from app.models.article import Article
 from app.models.article_interaction import ArticleInteraction, ArticleRating
@@ -27,11 +28,6 @@ router = APIRouter(prefix="/api/news", tags=["news"])
 summarize_rate_limiter = RateLimiter(max_attempts=10, window_ms=60000, name="summarize")
 
 
-def _escape_ilike(value: str) -> str:
-    """Escape ILIKE special characters (\\, %, _) in user input."""
-    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-
-
 # Schemas
 class ArticleResponse(BaseModel):
     """Article response."""
@@ -97,6 +93,7 @@ class FeedSourceResponse(BaseModel):
     fetch_interval_hours: int
     last_fetched_at: datetime | None
     quality_score: float
+    keywords: list[str] | None = None
     created_at: datetime
 
 
@@ -112,6 +109,10 @@ class FetchFeedRequest(BaseModel):
     hours: int = Field(default=168, ge=1, le=720)
 
 
+# Upper bound on a feed's custom keyword list
+MAX_FEED_KEYWORDS = 500
+
+
 class FeedSourceCreate(BaseModel):
     """Create a new feed source."""
 
@@ -122,6 +123,13 @@ class FeedSourceCreate(BaseModel):
     is_active: bool = True
     is_featured: bool = False
     fetch_interval_hours: int = Field(default=6, ge=1, le=168)
+    keywords: list[str] | None = Field(
+        default=None,
+        max_length=MAX_FEED_KEYWORDS,
+        description="Keywords an entry must match to be stored. "
+        "Omit or null to use the default AI/LLM security keywords; "
+        "an empty list matches no entries.",
+    )
 
 
 class FeedSourceUpdate(BaseModel):
@@ -134,6 +142,13 @@ class FeedSourceUpdate(BaseModel):
     is_active: bool | None = None
     is_featured: bool | None = None
     fetch_interval_hours: int | None = Field(default=None, ge=1, le=168)
+    keywords: list[str] | None = Field(
+        default=None,
+        max_length=MAX_FEED_KEYWORDS,
+        description="Keywords an entry must match to be stored. "
+        "Omit or null to use the default AI/LLM security keywords; "
+        "an empty list matches no entries.",
+    )
 
 
 def _get_constraint_name(exc: IntegrityError) -> str:
@@ -264,6 +279,15 @@ async def update_feed_source(
             raise errors.validation(str(e)) from None
 
     update_data = source.model_dump(exclude_unset=True)
+    # The stored ETag / Last-Modified describe what was fetched with the old
+    # URL and keywords; a 304 against them would keep new keywords from ever
+    # being applied to the feed's current entries, so force a full download
+    if any(
+        key in update_data and update_data[key] != getattr(feed_source, key)
+        for key in ("url", "keywords")
+    ):
+        feed_source.etag = None
+        feed_source.last_modified = None
     for key, value in update_data.items():
         setattr(feed_source, key, value)
 
@@ -540,14 +564,7 @@ async def list_articles(
 
     # Filter by search
     if search:
-        escaped = _escape_ilike(search)
-        search_pattern = f"%{escaped}%"
-        query = query.where(
-            or_(
-                Article.title.ilike(search_pattern, escape="\\"),
-                Article.summary.ilike(search_pattern, escape="\\"),
-            )
-        )
+        query = query.where(matches(Article.search_vector, to_tsquery(search)))
 
     # Order by published date (newest first)
     query = query.order_by(Article.published_at.desc().nulls_last(), Article.id.desc())
@@ -8,7 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 
 from app.core.errors import errors
-from app.core.security import generate_token, hash_password
+from app.core.password_hasher import password_hasher
+from app.core.security import generate_token
 from app.dependencies import ClientCredentialsToken, CurrentUserFlexible, DbSession
 from app.models.oauth import OAuthClient
 
@@ -152,7 +153,7 @@ async def _create_oauth_client(
         client_secret_hash = None
     else:
         client_secret = request.client_secret or generate_token(32)
-        client_secret_hash = hash_password(client_secret)
+        client_secret_hash = await password_hasher.hash(client_secret)
 
     client = OAuthClient(
         user_id=user_id,
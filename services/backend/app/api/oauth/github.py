@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.errors import errors
-from app.core.security import hash_password
+from app.core.password_hasher import password_hasher
 from app.core.session import create_session_and_set_cookie
 from app.dependencies import CurrentUser, DbSession
 from app.models.oauth_provider import UserOAuthProvider
@@ -278,7 +278,7 @@ async def github_callback(
 
                 user = User(
                     email=github_user.email,
-                    password_hash=hash_password(random_password),
+                    password_hash=await password_hasher.hash(random_password),
                 )
                 db.add(user)
                 await db.flush()  # Get user ID
@@ -10,8 +10,10 @@ from fastapi import APIRouter, Form, Request
 from sqlalchemy import select
 
 from app.config import settings
+from app.core.auth_cache import auth_cache
 from app.core.errors import errors
-from app.core.security import generate_token, get_token_expiry, verify_password
+from app.core.password_hasher import password_hasher
+from app.core.security import generate_token, get_token_expiry
 from app.dependencies import DbSession
 from app.models.oauth import AccessToken, AuthorizationCode, DeviceCode, OAuthClient
 from app.models.user import User
@@ -66,7 +68,9 @@ async def token_endpoint(
         and client.client_secret_hash
         and (
             not client_secret
-            or not verify_password(client_secret, client.client_secret_hash)
+            or not await password_hasher.verify(
+                client_secret, client.client_secret_hash
+            )
         )
     ):
         raise errors.oauth_invalid_client()
@@ -391,7 +395,9 @@ async def revoke_endpoint(
         and client.client_secret_hash
         and (
             not client_secret
-            or not verify_password(client_secret, client.client_secret_hash)
+            or not await password_hasher.verify(
+                client_secret, client.client_secret_hash
+            )
         )
     ):
         raise errors.oauth_invalid_client()
@@ -437,6 +443,8 @@ async def revoke_endpoint(
     if access_token_record:
         access_token_record.revoked = True
         await db.commit()
+        if access_token_record.user_id is not None:
+            auth_cache.invalidate_user(access_token_record.user_id)
 
     return {}
 
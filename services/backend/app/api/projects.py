@@ -4,9 +4,10 @@ from datetime import UTC, datetime
 
 from fastapi import APIRouter
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import case, func, select
+from sqlalchemy import select
 
 from app.core.errors import errors
+from app.db.project_stats import get_project_stats_rows
 from app.db.queries import (
     get_next_position,
     get_resource_for_user,
@@ -14,7 +15,6 @@ from app.db.queries import (
 )
 from app.dependencies import CurrentUserFlexible, DbSession
 from app.models.project import Project
-from app.models.todo import Status, Todo
 from app.schemas import ListResponse
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
@@ -87,51 +87,13 @@ async def _get_project_stats(
 ) -> dict[int, ProjectStats]:
     """Get statistics for multiple projects in a single query.
 
-    Only counts top-level tasks (parent_id IS NULL) to avoid double-counting subtasks.
+    Reads the trigger-maintained ``project_stats`` counters and derives the
+    overdue count from the open tasks' due-date histogram. Only top-level
+    tasks (parent_id IS NULL) are counted, to avoid double-counting subtasks.
     """
     # Use UTC for consistent date comparison across timezones
     today = datetime.now(UTC).date()
-
-    # Build the aggregation query
-    stats_query = (
-        select(
-            Todo.project_id,
-            func.count(Todo.id).label("total_tasks"),
-            func.sum(case((Todo.status == Status.completed, 1), else_=0)).label(
-                "completed_tasks"
-            ),
-            func.sum(case((Todo.status == Status.pending, 1), else_=0)).label(
-                "pending_tasks"
-            ),
-            func.sum(case((Todo.status == Status.in_progress, 1), else_=0)).label(
-                "in_progress_tasks"
-            ),
-            func.sum(case((Todo.status == Status.cancelled, 1), else_=0)).label(
-                "cancelled_tasks"
-            ),
-            func.sum(Todo.estimated_hours).label("total_estimated_hours"),
-            func.sum(Todo.actual_hours).label("total_actual_hours"),
-            func.sum(
-                case(
-                    (
-                        (Todo.due_date < today)
-                        & (Todo.status.in_([Status.pending, Status.in_progress])),
-                        1,
-                    ),
-                    else_=0,
-                )
-            ).label("overdue_tasks"),
-        )
-        .where(
-            Todo.project_id.in_(project_ids),
-            Todo.deleted_at.is_(None),
-            Todo.parent_id.is_(None),  # Only top-level tasks
-        )
-        .group_by(Todo.project_id)
-    )
-
-    result = await db.execute(stats_query)
-    rows = result.all()
+    rows = await get_project_stats_rows(db, project_ids, today)
 
     stats_by_project: dict[int, ProjectStats] = {}
     for row in rows:
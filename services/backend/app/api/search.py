@@ -1,8 +1,9 @@
 """Search API route."""
 
 from fastapi import APIRouter, Query
-from sqlalchemy import func, select
+from sqlalchemy import select
 
+from app.db.search import matches, rank, to_tsquery
 from app.dependencies import CurrentUserFlexible, DbSession
 from app.models.project import Project
 from app.models.todo import Todo
@@ -19,14 +20,9 @@ async def search_tasks(
 ) -> dict:
     """Full-text search for tasks.
 
-    Uses PostgreSQL tsvector for efficient searching.
+    Uses the GIN-indexed search_vector column; results are ranked by relevance.
     """
-    # Build search query using PostgreSQL full-text search
-    search_vector = func.to_tsvector(
-        "english",
-        func.concat(Todo.title, " ", func.coalesce(Todo.description, "")),
-    )
-    search_query = func.plainto_tsquery("english", q)
+    tsquery = to_tsquery(q)
 
     query = (
         select(
@@ -38,14 +34,16 @@ async def search_tasks(
         .where(
             Todo.user_id == user.id,
             Todo.deleted_at.is_(None),
-            search_vector.bool_op("@@")(search_query),
+            matches(Todo.search_vector, tsquery),
         )
     )
 
     if category:
         query = query.where(Project.name == category)
 
-    query = query.order_by(Todo.created_at.desc())
+    query = query.order_by(
+        rank(Todo.search_vector, tsquery).desc(), Todo.created_at.desc()
+    )
 
     result = await db.execute(query)
     rows = result.all()
@@ -7,8 +7,10 @@ from fastapi import APIRouter
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 
+from app.core.auth_cache import auth_cache
 from app.core.errors import errors
-from app.core.security import generate_token, hash_password
+from app.core.password_hasher import password_hasher
+from app.core.security import generate_token
 from app.dependencies import AdminUser, DbSession
 from app.models.oauth import OAuthClient
 from app.models.user import User
@@ -168,7 +170,7 @@ async def create_service_account(
     # Create a linked OAuth client with client_credentials grant
     client_id = generate_token(16)
     client_secret = generate_token(32)
-    client_secret_hash = hash_password(client_secret)
+    client_secret_hash = await password_hasher.hash(client_secret)
 
     client = OAuthClient(
         user_id=user.id,
@@ -225,6 +227,7 @@ async def update_service_account(
         user.display_name = update_data["display_name"]
     if "is_active" in update_data:
         user.is_active = update_data["is_active"]
+        auth_cache.invalidate_user(user.id)
         # Also deactivate/activate the linked OAuth client
         if client:
             client.is_active = update_data["is_active"]
@@ -248,6 +251,7 @@ async def deactivate_service_account(
     """
     user = await _get_service_account(db, account_id)
     user.is_active = False
+    auth_cache.invalidate_user(user.id)
 
     client = await _get_linked_client(db, user.id)
     if client:
@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import func, select
 
 from app.core.errors import errors
+from app.db.search import matches, rank, to_tsquery
 from app.dependencies import CurrentUserFlexible, DbSession
 from app.models.snippet import Snippet
 from app.schemas import DataResponse, ListResponse
@@ -85,20 +86,18 @@ async def list_snippets(
     date_to: date | None = None,
 ) -> ListResponse[SnippetSummary]:
     """List snippets with optional search, category, tag, and date filters."""
-    stmt = (
-        select(Snippet)
-        .where(Snippet.user_id == user.id, Snippet.deleted_at.is_(None))
-        .order_by(Snippet.snippet_date.desc(), Snippet.created_at.desc())
+    stmt = select(Snippet).where(
+        Snippet.user_id == user.id, Snippet.deleted_at.is_(None)
     )
 
     if q:
-        pattern = f"%{q}%"
-        stmt = stmt.where(
-            (Snippet.title.ilike(pattern))
-            | (Snippet.content.ilike(pattern))
-            | (Snippet.category.ilike(pattern))
+        tsquery = to_tsquery(q)
+        stmt = stmt.where(matches(Snippet.search_vector, tsquery)).order_by(
+            rank(Snippet.search_vector, tsquery).desc()
         )
 
+    stmt = stmt.order_by(Snippet.snippet_date.desc(), Snippet.created_at.desc())
+
     if category:
         stmt = stmt.where(Snippet.category == category)
 
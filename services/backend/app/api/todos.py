@@ -1,21 +1,46 @@
 """Todo API routes."""
 
+import json
 from collections import deque
+from collections.abc import AsyncGenerator
 from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING, Literal
 
 from fastapi import APIRouter, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, model_validator
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import (
+    Integer,
+    and_,
+    any_,
+    bindparam,
+    case,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.errors import errors
+from app.db.pagination import (
+    SortKey,
+    apply_keyset,
+    cursor_values,
+    decode_cursor,
+    encode_cursor,
+    order_by_clauses,
+)
 from app.db.queries import (
     get_next_position,
     get_project_info,
+    get_projects_info,
     get_resource_for_user,
     get_resources_for_user,
 )
@@ -118,6 +143,11 @@ class TodoUpdate(BaseModel):
     blocking_reason: str | None = None
 
 
+# Upper bound on todos per batch request. Batch creation issues a fixed number
+# of statements regardless of size, so this is sized for agent bulk imports.
+MAX_BATCH_TODOS = 1000
+
+
 class BatchTodoCreate(BaseModel):
     """Batch todo creation request.
 
@@ -129,7 +159,7 @@ class BatchTodoCreate(BaseModel):
     mutually exclusive with ``parent_id``.
     """
 
-    todos: list[TodoCreate] = Field(..., min_length=1, max_length=50)
+    todos: list[TodoCreate] = Field(..., min_length=1, max_length=MAX_BATCH_TODOS)
     skip_duplicates: bool = Field(
         False,
         description="If true, silently skip todos whose title matches an "
@@ -803,24 +833,39 @@ def _apply_todo_filters(
     if tag:
         query = query.where(Todo.tags.op("@>")(func.jsonb_build_array(tag)))
 
-    # Deadline type strictness ordering: flexible < preferred < firm < hard
-    _deadline_type_order = {"flexible": 0, "preferred": 1, "firm": 2, "hard": 3}
+    return query.order_by(*order_by_clauses(_todo_sort_keys(order_by)))
 
-    if order_by == "position":
-        query = query.order_by(Todo.position, Todo.created_at)
-    elif order_by == "deadline_type":
-        query = query.order_by(
-            case(
-                _deadline_type_order,
-                value=Todo.deadline_type,
-                else_=1,
-            ).desc(),
-            Todo.due_date.asc().nulls_last(),
-        )
-    else:
-        query = query.order_by(Todo.due_date.asc().nulls_last(), Todo.priority.desc())
 
-    return query
+# Deadline type strictness ordering: flexible < preferred < firm < hard
+_DEADLINE_TYPE_ORDER = {"flexible": 0, "preferred": 1, "firm": 2, "hard": 3}
+
+
+def _todo_sort_keys(order_by: str | None) -> list[SortKey]:
+    """Return the keyset ordering for a todo list ``order_by`` value.
+
+    Every ordering ends with ``Todo.id`` so that rows with equal sort values
+    have a stable order, which keyset pagination relies on.
+    """
+    if order_by == "position":
+        return [
+            SortKey(Todo.position),
+            SortKey(Todo.created_at, decode=datetime.fromisoformat),
+            SortKey(Todo.id),
+        ]
+    if order_by == "deadline_type":
+        return [
+            SortKey(
+                case(_DEADLINE_TYPE_ORDER, value=Todo.deadline_type, else_=1),
+                descending=True,
+            ),
+            SortKey(Todo.due_date, nullable=True, decode=date.fromisoformat),
+            SortKey(Todo.id),
+        ]
+    return [
+        SortKey(Todo.due_date, nullable=True, decode=date.fromisoformat),
+        SortKey(Todo.priority, descending=True),
+        SortKey(Todo.id),
+    ]
 
 
 async def _fetch_subtasks_map(
@@ -932,7 +977,172 @@ async def _apply_category_resolution(
             )
 
 
-@router.get("")
+# Relationship fields of TodoResponse that cannot be column-projected
+_TODO_RELATION_FIELDS = frozenset(
+    {"parent_task", "subtasks", "dependencies", "dependents"}
+)
+_TODO_PROJECT_COLUMNS = {"project_name": Project.name, "project_color": Project.color}
+_TODO_PROJECTION_FIELDS = frozenset(TodoResponse.model_fields) - _TODO_RELATION_FIELDS
+
+# Number of rows fetched from the server-side cursor per round-trip when
+# streaming a todo list.
+_STREAM_BATCH_SIZE = 200
+
+
+def _parse_todo_fields(fields: str | None) -> list[str] | None:
+    """Parse the ``fields`` query parameter into an ordered projection.
+
+    Returns None when no projection was requested. ``id`` is always included
+    as the first field.
+
+    Raises:
+        ApiError: If any requested field is unknown.
+    """
+    if fields is None:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - _TODO_PROJECTION_FIELDS)
+    if unknown:
+        raise errors.validation(
+            f"Unknown fields: {', '.join(unknown)}. "
+            f"Allowed fields: {', '.join(sorted(_TODO_PROJECTION_FIELDS))}"
+        )
+    return ["id", *dict.fromkeys(name for name in requested if name != "id")]
+
+
+def _todo_projection_columns(projection: list[str]) -> list:
+    """Return the SELECT columns for a todo field projection."""
+    return [
+        _TODO_PROJECT_COLUMNS[name].label(name)
+        if name in _TODO_PROJECT_COLUMNS
+        else getattr(Todo, name)
+        for name in projection
+    ]
+
+
+def _todo_row_payload(
+    row,
+    projection: list[str] | None,
+    subtasks_map: dict[int, list[Todo]],
+    include_subtasks: bool,
+) -> dict:
+    """Build the JSON-ready payload for one row of a todo list query."""
+    if projection is None:
+        todo = row[0]
+        return _build_todo_response(
+            todo,
+            project_name=row.project_name,
+            project_color=row.project_color,
+            subtasks=subtasks_map.get(todo.id, []),
+        ).model_dump(mode="json")
+
+    mapping = row._mapping
+    item: dict = {}
+    for name in projection:
+        value = mapping[name]
+        if name in ("estimated_hours", "actual_hours"):
+            value = _to_float(value)
+        elif name == "tags":
+            value = value or []
+        item[name] = value
+    if include_subtasks:
+        item["subtasks"] = [
+            _build_subtask_response(s).model_dump(mode="json")
+            for s in subtasks_map.get(row.id, [])
+        ]
+    return jsonable_encoder(item)
+
+
+def _todo_list_meta(
+    count: int,
+    *,
+    paginated: bool,
+    ordering: str,
+    sort_keys: list[SortKey],
+    last_row,
+    has_more: bool,
+) -> dict:
+    """Build the ``meta`` object for a todo list response."""
+    meta: dict = {"count": count}
+    if paginated:
+        meta["has_more"] = has_more
+        meta["next_cursor"] = (
+            encode_cursor(ordering, cursor_values(last_row, sort_keys))
+            if has_more and last_row is not None
+            else None
+        )
+    return meta
+
+
+async def _stream_todo_list(
+    db: "DbSession",
+    query,
+    *,
+    user_id: int,
+    ndjson: bool,
+    projection: list[str] | None,
+    include_subtasks: bool,
+    limit: int | None,
+    paginated: bool,
+    ordering: str,
+    sort_keys: list[SortKey],
+) -> AsyncGenerator[str, None]:
+    """Stream a todo list query as a JSON document or NDJSON lines.
+
+    Rows are read from a server-side cursor in batches of
+    ``_STREAM_BATCH_SIZE`` and serialized as they arrive, so memory use is
+    bounded by the batch size rather than the number of matching todos. In
+    NDJSON mode each todo is one line and the final line carries ``meta``.
+    """
+    result = await db.stream(query)
+    count = 0
+    last_row = None
+    has_more = False
+    if not ndjson:
+        yield '{"data":['
+    try:
+        async for batch in result.partitions(_STREAM_BATCH_SIZE):
+            if limit is not None and count + len(batch) > limit:
+                has_more = True
+                batch = batch[: limit - count]
+            subtasks_map: dict[int, list[Todo]] = {}
+            if include_subtasks and batch:
+                subtasks_map = await _fetch_subtasks_map(
+                    db,
+                    [row._mapping["id"] if projection else row[0].id for row in batch],
+                    user_id,
+                )
+            for row in batch:
+                item = json.dumps(
+                    _todo_row_payload(row, projection, subtasks_map, include_subtasks),
+                    separators=(",", ":"),
+                )
+                if ndjson:
+                    yield item + "\n"
+                else:
+                    yield item if count == 0 else "," + item
+                count += 1
+                last_row = row
+            if has_more:
+                break
+    finally:
+        await result.close()
+
+    meta = json.dumps(
+        _todo_list_meta(
+            count,
+            paginated=paginated,
+            ordering=ordering,
+            sort_keys=sort_keys,
+            last_row=last_row,
+            has_more=has_more,
+        ),
+        separators=(",", ":"),
+    )
+    yield f'{{"meta":{meta}}}\n' if ndjson else f'],"meta":{meta}}}'
+
+
+@router.get("", response_model=ListResponse[TodoResponse])
 async def list_todos(
     user: CurrentUserFlexible,
     db: DbSession,
@@ -955,7 +1165,21 @@ async def list_todos(
         description="Exclude tasks from projects with show_on_calendar=false",
     ),
     tag: str | None = Query(None, description="Filter by tag"),
-) -> ListResponse[TodoResponse]:
+    limit: int | None = Query(
+        None, ge=1, le=1000, description="Page size (enables cursor pagination)"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from meta.next_cursor of the previous page"
+    ),
+    fields: str | None = Query(
+        None,
+        description="Comma-separated list of fields to return (id is always included)",
+    ),
+    stream: Literal["json", "ndjson"] | None = Query(
+        None,
+        description="Stream the response body as a JSON document or as NDJSON",
+    ),
+) -> ListResponse[TodoResponse] | Response:
     """List todos with optional filters.
 
     By default, only returns root-level todos (no parent).
@@ -963,13 +1187,30 @@ async def list_todos(
     Use include_subtasks=true to include subtasks in the response.
     Use order_by='position' to sort by manual position instead of due date.
     Use exclude_no_calendar=true to hide tasks from non-calendar projects.
+
+    Passing limit (or cursor) switches to keyset pagination on the active
+    order_by: meta gains has_more and next_cursor, and the next page is
+    requested with cursor=<next_cursor> and the same filters. Use fields to
+    select only some columns, and stream=json or stream=ndjson to have rows
+    serialized as they are read instead of buffering the whole list.
     """
-    query = (
-        select(
+    sort_keys = _todo_sort_keys(order_by)
+    ordering = order_by or "due_date"
+    after = decode_cursor(cursor, ordering, sort_keys)
+    projection = _parse_todo_fields(fields)
+    paginated = limit is not None or cursor is not None
+
+    if projection is None:
+        columns: list = [
             Todo,
             Project.name.label("project_name"),
             Project.color.label("project_color"),
-        )
+        ]
+    else:
+        columns = _todo_projection_columns(projection)
+
+    query = (
+        select(*columns)
         .outerjoin(Project, Todo.project_id == Project.id)
         .where(Todo.user_id == user.id)
         .where(Todo.deleted_at.is_(None))
@@ -989,14 +1230,59 @@ async def list_todos(
         exclude_no_calendar=exclude_no_calendar,
         tag=tag,
     )
+    if paginated:
+        query = apply_keyset(query, sort_keys, after, limit)
+
+    if stream is not None:
+        return StreamingResponse(
+            _stream_todo_list(
+                db,
+                query,
+                user_id=user.id,
+                ndjson=stream == "ndjson",
+                projection=projection,
+                include_subtasks=include_subtasks,
+                limit=limit,
+                paginated=paginated,
+                ordering=ordering,
+                sort_keys=sort_keys,
+            ),
+            media_type="application/x-ndjson"
+            if stream == "ndjson"
+            else "application/json",
+        )
 
     result = await db.execute(query)
     rows = result.all()
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+    meta = _todo_list_meta(
+        len(rows),
+        paginated=paginated,
+        ordering=ordering,
+        sort_keys=sort_keys,
+        last_row=rows[-1] if rows else None,
+        has_more=has_more,
+    )
 
     subtasks_map: dict[int, list[Todo]] = {}
     if include_subtasks:
         subtasks_map = await _fetch_subtasks_map(
-            db, [row[0].id for row in rows], user.id
+            db,
+            [row._mapping["id"] if projection else row[0].id for row in rows],
+            user.id,
+        )
+
+    if projection is not None:
+        return JSONResponse(
+            {
+                "data": [
+                    _todo_row_payload(row, projection, subtasks_map, include_subtasks)
+                    for row in rows
+                ],
+                "meta": meta,
+            }
         )
 
     tasks = []
@@ -1012,7 +1298,7 @@ async def list_todos(
             )
         )
 
-    return ListResponse(data=tasks, meta={"count": len(tasks)})
+    return ListResponse(data=tasks, meta=meta)
 
 
 async def _find_duplicate_active_todo(
@@ -1180,6 +1466,34 @@ def _validate_batch_depends_on(todos: list[TodoCreate]) -> None:
     _validate_batch_dependency_graph(todos)
 
 
+async def _find_duplicate_active_todos(
+    db: "AsyncSession",
+    user_id: int,
+    titles: list[str],
+) -> dict[str, Todo]:
+    """Batch form of ``_find_duplicate_active_todo``.
+
+    Returns a map of normalized (stripped, lower-cased) title to an existing
+    active todo with that title, using a single query for all titles.
+    """
+    normalized = {title.strip().lower() for title in titles}
+    if not normalized:
+        return {}
+    stmt = (
+        select(Todo)
+        .where(Todo.user_id == user_id)
+        .where(func.lower(func.trim(Todo.title)).in_(normalized))
+        .where(Todo.status.in_([Status.pending, Status.in_progress]))
+        .where(Todo.deleted_at.is_(None))
+        .order_by(Todo.id)
+    )
+    result = await db.execute(stmt)
+    existing: dict[str, Todo] = {}
+    for todo in result.scalars():
+        existing.setdefault(todo.title.strip().lower(), todo)
+    return existing
+
+
 async def _detect_batch_duplicates(
     db: "AsyncSession",
     todos: list[TodoCreate],
@@ -1187,6 +1501,9 @@ async def _detect_batch_duplicates(
     skip_duplicates: bool,
 ) -> set[int]:
     """Phase 0c: Check intra-batch and DB duplicates. Return skipped indices."""
+    existing_by_title = await _find_duplicate_active_todos(
+        db, user_id, [item.title for item in todos]
+    )
     skipped_indices: set[int] = set()
     seen_titles: dict[str, int] = {}  # normalized title -> first batch index
     for i, item in enumerate(todos):
@@ -1205,30 +1522,95 @@ async def _detect_batch_duplicates(
         seen_titles[normalized] = i
 
         # Check against existing DB todos
-        existing = await _find_duplicate_active_todo(db, user_id, item.title)
+        existing = existing_by_title.get(normalized)
         if existing:
             if skip_duplicates:
                 skipped_indices.add(i)
-                # Mark as seen so later batch items with the same title are
-                # caught by the in-memory check instead of a redundant DB query.
-                seen_titles[normalized] = i
                 continue
             raise errors.duplicate_todo(existing.id, existing.title)
 
     return skipped_indices
 
 
+async def _resolve_batch_categories(
+    db: "AsyncSession",
+    todos: list[TodoCreate],
+    user_id: int,
+    skipped_indices: set[int],
+) -> None:
+    """Phase 1a: Resolve each distinct category name to a project_id once."""
+    resolved: dict[str, int] = {}  # lower-cased category -> project_id
+    for i, item in enumerate(todos):
+        if i in skipped_indices or not item.category or item.project_id:
+            continue
+        key = item.category.lower()
+        if key not in resolved:
+            resolved[key] = await _resolve_category_to_project(
+                db, item.category, user_id
+            )
+        item.project_id = resolved[key]
+
+
+async def _verify_batch_parents(
+    db: "AsyncSession",
+    todos: list[TodoCreate],
+    user_id: int,
+    skipped_indices: set[int],
+) -> None:
+    """Phase 1b: Verify every ``parent_id`` in the batch with one query."""
+    parent_ids = {
+        item.parent_id
+        for i, item in enumerate(todos)
+        if i not in skipped_indices and item.parent_id
+    }
+    if not parent_ids:
+        return
+    parents = await get_resources_for_user(db, Todo, list(parent_ids), user_id)
+    if parent_ids - parents.keys():
+        raise errors.todo_not_found()
+    for parent in parents.values():
+        _verify_parent_allows_children(parent)
+
+
+async def _next_batch_positions(
+    db: "AsyncSession",
+    user_id: int,
+    parent_ids: set[int | None],
+) -> dict[int | None, int]:
+    """Next free position under each of ``parent_ids`` (``None`` = root level).
+
+    Grouped equivalent of ``get_next_position`` for many parents at once.
+    """
+    if not parent_ids:
+        return {}
+    ids = [pid for pid in parent_ids if pid is not None]
+    scope = Todo.parent_id.in_(ids)
+    if None in parent_ids:
+        scope = or_(scope, Todo.parent_id.is_(None))
+    result = await db.execute(
+        select(Todo.parent_id, func.max(Todo.position))
+        .where(Todo.user_id == user_id, Todo.deleted_at.is_(None), scope)
+        .group_by(Todo.parent_id)
+    )
+    max_positions = dict(result.tuples().all())
+    return {pid: (max_positions.get(pid) or 0) + 1 for pid in parent_ids}
+
+
 async def _prepare_batch_todos(
     db: "AsyncSession",
     todos: list[TodoCreate],
     user_id: int,
     skipped_indices: set[int],
-) -> tuple[list[Todo], dict[int, int], dict[int, int]]:
-    """Phase 1: Validate items, resolve categories, build Todo objects.
+) -> tuple[list[dict], dict[int, int], dict[int, int]]:
+    """Phase 1: Validate items, resolve categories, build Todo insert rows.
 
-    Returns (prepared, batch_to_prepared, parent_index_map).
+    Returns (prepared, batch_to_prepared, parent_index_map). Rows that use
+    ``parent_index`` have ``parent_id=None`` until the parents are inserted.
     """
-    prepared: list[Todo] = []
+    await _resolve_batch_categories(db, todos, user_id, skipped_indices)
+    await _verify_batch_parents(db, todos, user_id, skipped_indices)
+
+    prepared: list[dict] = []
     batch_to_prepared: dict[int, int] = {}
     parent_index_map: dict[int, int] = {}  # prepared idx -> parent batch idx
 
@@ -1236,20 +1618,6 @@ async def _prepare_batch_todos(
         if i in skipped_indices:
             continue
 
-        # Resolve category name to project_id
-        if item.category and not item.project_id:
-            item.project_id = await _resolve_category_to_project(
-                db, item.category, user_id
-            )
-
-        # Verify parent todo exists and belongs to user (only for parent_id,
-        # not parent_index which references items within this batch)
-        if item.parent_id:
-            parent = await get_resource_for_user(
-                db, Todo, item.parent_id, user_id, errors.todo_not_found
-            )
-            _verify_parent_allows_children(parent)
-
         # Record parent_index for later resolution (skip if parent was skipped)
         if item.parent_index is not None:
             if item.parent_index in skipped_indices:
@@ -1261,16 +1629,6 @@ async def _prepare_batch_todos(
 
         batch_to_prepared[i] = len(prepared)
 
-        # Auto-assign position if not provided.
-        # For parent_index items, parent_id is not yet known so we pass None
-        # and positions will be recalculated in phase 3.
-        effective_parent_id = item.parent_id  # None for parent_index items
-        position = item.position
-        if position is None:
-            position = await get_next_position(
-                db, Todo, user_id, parent_id=effective_parent_id
-            )
-
         # Infer agent fields if not provided
         agent_actionable, action_type, autonomy_tier = _resolve_agent_fields(
             item.agent_actionable,
@@ -1282,58 +1640,93 @@ async def _prepare_batch_todos(
         )
 
         prepared.append(
-            Todo(
-                user_id=user_id,
-                title=item.title,
-                description=item.description,
-                priority=item.priority,
-                status=item.status,
-                due_date=item.due_date,
-                deadline_type=item.deadline_type,
-                project_id=item.project_id,
-                tags=item.tags,
-                context=item.context,
-                estimated_hours=item.estimated_hours,
-                parent_id=item.parent_id,
-                position=position,
-                agent_actionable=agent_actionable,
-                action_type=action_type,
-                autonomy_tier=autonomy_tier,
-            )
+            {
+                "user_id": user_id,
+                "title": item.title,
+                "description": item.description,
+                "priority": item.priority,
+                "status": item.status,
+                "due_date": item.due_date,
+                "deadline_type": item.deadline_type,
+                "project_id": item.project_id,
+                "tags": item.tags,
+                "context": item.context,
+                "estimated_hours": item.estimated_hours,
+                "parent_id": item.parent_id,
+                "position": item.position,
+                "agent_actionable": agent_actionable,
+                "action_type": action_type,
+                "autonomy_tier": autonomy_tier,
+            }
         )
 
+    # Auto-assign positions, appending after existing siblings in batch order.
+    # Children of parents created in this batch start at 1 (see phase 3).
+    next_positions = await _next_batch_positions(
+        db,
+        user_id,
+        {
+            row["parent_id"]
+            for idx, row in enumerate(prepared)
+            if row["position"] is None and idx not in parent_index_map
+        },
+    )
+    for idx, row in enumerate(prepared):
+        if row["position"] is None and idx not in parent_index_map:
+            row["position"] = next_positions[row["parent_id"]]
+            next_positions[row["parent_id"]] += 1
+
     return prepared, batch_to_prepared, parent_index_map
 
 
-async def _resolve_batch_parent_indices(
+async def _insert_batch_todos(db: "AsyncSession", rows: list[dict]) -> list[Todo]:
+    """Phase 2: Insert rows with one multi-row INSERT ... RETURNING.
+
+    Returned Todo instances are in the same order as ``rows``.
+    """
+    if not rows:
+        return []
+    result = await db.scalars(
+        insert(Todo).returning(Todo, sort_by_parameter_order=True), rows
+    )
+    return list(result.all())
+
+
+async def _insert_batch_subtasks(
     db: "AsyncSession",
-    prepared: list[Todo],
+    prepared: list[dict],
+    created: dict[int, Todo],
     batch_to_prepared: dict[int, int],
     parent_index_map: dict[int, int],
-    user_id: int,
 ) -> None:
-    """Phase 3: Set parent_id on items that used parent_index, recalculate positions."""
-    for child_prepared_idx, parent_batch_idx in parent_index_map.items():
-        child_todo = prepared[child_prepared_idx]
-        parent_prepared_idx = batch_to_prepared[parent_batch_idx]
-        parent_todo = prepared[parent_prepared_idx]
-        child_todo.parent_id = parent_todo.id
-        # Recalculate position under the new parent
-        child_todo.position = await get_next_position(
-            db, Todo, user_id, parent_id=parent_todo.id
-        )
-        await db.flush()
-        await db.refresh(child_todo)
+    """Phase 3: Insert items that used parent_index under their new parents.
+
+    Parents are always top-level items of the batch, so they are all in
+    ``created`` already. Adds the new subtasks to ``created``.
+    """
+    child_indices = list(parent_index_map)
+    next_positions: dict[int, int] = {}
+    for child_prepared_idx in child_indices:
+        row = prepared[child_prepared_idx]
+        parent = created[batch_to_prepared[parent_index_map[child_prepared_idx]]]
+        row["parent_id"] = parent.id
+        if row["position"] is None:
+            row["position"] = next_positions.get(parent.id, 1)
+            next_positions[parent.id] = row["position"] + 1
+
+    children = await _insert_batch_todos(db, [prepared[idx] for idx in child_indices])
+    created.update(zip(child_indices, children, strict=True))
 
 
 async def _create_batch_dependencies(
     db: "AsyncSession",
     todos: list[TodoCreate],
-    prepared: list[Todo],
+    created: list[Todo],
     batch_to_prepared: dict[int, int],
     skipped_indices: set[int],
 ) -> None:
     """Phase 4: Insert dependency relationships using the now-assigned IDs."""
+    rows: list[dict[str, int]] = []
     for i, item in enumerate(todos):
         if i in skipped_indices:
             continue
@@ -1344,22 +1737,24 @@ async def _create_batch_dependencies(
                         f"Todo at index {i}: dependency at index {dep_idx} "
                         f"was skipped as a duplicate."
                     )
-                await db.execute(
-                    task_dependencies.insert().values(
-                        dependent_id=prepared[batch_to_prepared[i]].id,
-                        dependency_id=prepared[batch_to_prepared[dep_idx]].id,
-                    )
+                rows.append(
+                    {
+                        "dependent_id": created[batch_to_prepared[i]].id,
+                        "dependency_id": created[batch_to_prepared[dep_idx]].id,
+                    }
                 )
-    await db.flush()
+    if rows:
+        await db.execute(task_dependencies.insert(), rows)
 
 
 async def _link_batch_wiki_pages(
-    db: "AsyncSession", prepared: list[Todo], wiki_page_id: int
+    db: "AsyncSession", created: list[Todo], wiki_page_id: int
 ) -> None:
     """Phase 6: Link all created tasks to a wiki page."""
-    for todo in prepared:
+    if created:
         await db.execute(
-            todo_wiki_links.insert().values(todo_id=todo.id, wiki_page_id=wiki_page_id)
+            todo_wiki_links.insert(),
+            [{"todo_id": todo.id, "wiki_page_id": wiki_page_id} for todo in created],
         )
 
 
@@ -1371,8 +1766,8 @@ async def batch_create_todos(
 ) -> dict:
     """Create multiple todos in a single request.
 
-    Accepts up to 50 todo objects. By default, if any validation fails or a
-    duplicate is detected, none are created.
+    Accepts up to ``MAX_BATCH_TODOS`` todo objects. By default, if any
+    validation fails or a duplicate is detected, none are created.
 
     When ``skip_duplicates`` is ``True``, items whose titles match an existing
     active todo or another item in the same batch are silently skipped instead
@@ -1391,6 +1786,11 @@ async def batch_create_todos(
 
     If ``wiki_page_id`` is provided, all created tasks are automatically
     linked to that wiki page.
+
+    The number of round-trips does not depend on the batch size: todos are
+    written with at most two multi-row inserts (top-level items, then
+    ``parent_index`` children), and dependencies and wiki links with one
+    executemany each.
     """
     # Validation
     if request.wiki_page_id is not None:
@@ -1404,36 +1804,44 @@ async def batch_create_todos(
     prepared, batch_to_prepared, parent_index_map = await _prepare_batch_todos(
         db, request.todos, user.id, skipped_indices
     )
-    for todo in prepared:
-        db.add(todo)
-        await db.flush()
-        await db.refresh(todo)
+    top_level = [idx for idx in range(len(prepared)) if idx not in parent_index_map]
+    inserted = await _insert_batch_todos(db, [prepared[idx] for idx in top_level])
+    created_by_idx = dict(zip(top_level, inserted, strict=True))
 
     # Resolve references and dependencies
-    await _resolve_batch_parent_indices(
-        db, prepared, batch_to_prepared, parent_index_map, user.id
+    await _insert_batch_subtasks(
+        db, prepared, created_by_idx, batch_to_prepared, parent_index_map
     )
+    created = [created_by_idx[idx] for idx in range(len(prepared))]
     await _create_batch_dependencies(
-        db, request.todos, prepared, batch_to_prepared, skipped_indices
+        db, request.todos, created, batch_to_prepared, skipped_indices
     )
 
     # Build response
-    created: list[TodoResponse] = []
-    for todo in prepared:
-        project_name, project_color = await get_project_info(
-            db, todo.project_id, user.id
+    projects = await get_projects_info(
+        db, {todo.project_id for todo in created if todo.project_id}, user.id
+    )
+    data = [
+        _build_todo_response(
+            todo,
+            *(
+                projects.get(todo.project_id, (None, None))
+                if todo.project_id is not None
+                else (None, None)
+            ),
         )
-        created.append(_build_todo_response(todo, project_name, project_color))
+        for todo in created
+    ]
 
     if request.wiki_page_id is not None:
-        await _link_batch_wiki_pages(db, prepared, request.wiki_page_id)
+        await _link_batch_wiki_pages(db, created, request.wiki_page_id)
 
-    result: dict = {"data": created, "meta": {"count": len(created)}}
+    result: dict = {"data": data, "meta": {"count": len(data)}}
     if skipped_indices:
         result["meta"]["skipped_duplicates"] = len(skipped_indices)
     if request.wiki_page_id is not None:
         result["meta"]["wiki_page_id"] = request.wiki_page_id
-        result["meta"]["wiki_links_created"] = len(created)
+        result["meta"]["wiki_links_created"] = len(data)
     return result
 
 
@@ -1589,9 +1997,19 @@ async def bulk_update_todos(
     user: CurrentUserFlexible,
     db: DbSession,
 ) -> dict:
-    """Bulk update todos."""
-    todos_dict = await get_resources_for_user(db, Todo, request.ids, user.id)
-    todos = list(todos_dict.values())
+    """Bulk update todos.
+
+    Applies the same changes to every todo in ``ids`` with a single
+    ``UPDATE ... RETURNING``. IDs that don't exist, are deleted, or belong to
+    another user are left untouched and reported in ``not_found``.
+    """
+    ids = list(dict.fromkeys(request.ids))
+    ids_param = bindparam("ids", ids, type_=ARRAY(Integer))
+    in_scope = (
+        Todo.id == any_(ids_param),
+        Todo.user_id == user.id,
+        Todo.deleted_at.is_(None),
+    )
 
     # Resolve category name to project_id
     update_data = request.updates.model_dump(exclude_unset=True)
@@ -1605,25 +2023,39 @@ async def bulk_update_todos(
         _verify_parent_allows_children(parent)
 
         # Prevent tasks with existing children from becoming subtasks
-        for todo in todos:
-            children_count = await db.scalar(
-                select(func.count(Todo.id)).where(
-                    Todo.parent_id == todo.id,
-                    Todo.user_id == user.id,
-                    Todo.deleted_at.is_(None),
-                )
+        with_children = await db.scalars(
+            select(Todo.parent_id)
+            .where(
+                Todo.parent_id == any_(ids_param),
+                Todo.user_id == user.id,
+                Todo.deleted_at.is_(None),
+            )
+            .group_by(Todo.parent_id)
+        )
+        if with_children.first() is not None:
+            raise errors.validation(
+                "Cannot make a task with subtasks into a subtask. "
+                "Remove or reassign its subtasks first."
             )
-            if children_count:
-                raise errors.validation(
-                    "Cannot make a task with subtasks into a subtask. "
-                    "Remove or reassign its subtasks first."
-                )
 
-    for todo in todos:
-        for field, value in update_data.items():
-            setattr(todo, field, value)
+    if update_data:
+        result = await db.execute(
+            update(Todo)
+            .where(*in_scope)
+            .values(**update_data)
+            .returning(Todo.id)
+            .execution_options(synchronize_session="fetch")
+        )
+    else:
+        result = await db.execute(select(Todo.id).where(*in_scope))
+    updated = set(result.scalars().all())
 
-    return {"data": {"updated": len(todos)}}
+    return {
+        "data": {
+            "updated": len(updated),
+            "not_found": [todo_id for todo_id in ids if todo_id not in updated],
+        }
+    }
 
 
 @router.delete("/{todo_id}")
@@ -1,13 +1,24 @@
-"""Unified search API route across tasks, wiki, snippets, and articles."""
+"""Unified search API route across tasks, wiki, snippets, and articles.
 
+Each content type is searched concurrently on its own pooled session, so the
+response time is that of the slowest search rather than the sum of all four.
+Every search has its own timeout and the request as a whole has a deadline;
+types that don't finish in time come back empty and are listed in
+``meta.timed_out`` instead of holding up the others.
+"""
+
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
-from sqlalchemy import func, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
 
-from app.api.wiki import extract_snippet
+from app.config import settings
+from app.db.search import headline, matches, rank, to_tsquery
 from app.dependencies import CurrentUserFlexible, DbSession
 from app.models.article import Article
 from app.models.feed_source import FeedSource
@@ -33,23 +44,15 @@ class UnifiedSearchItem(BaseModel):
     subtitle: str | None = None
     url: str
     metadata: dict = {}
-
-
-def _escape_ilike(value: str) -> str:
-    """Escape ILIKE special characters."""
-    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    score: float = 0.0
 
 
 async def _search_tasks(
     db: AsyncSession, user_id: int, query: str, limit: int
 ) -> list[UnifiedSearchItem]:
-    """Search tasks using full-text search."""
-    search_vector = func.to_tsvector(
-        "english",
-        func.concat(Todo.title, " ", func.coalesce(Todo.description, "")),
-    )
-    search_query = func.plainto_tsquery("english", query)
-
+    """Search tasks using the full-text search index."""
+    tsquery = to_tsquery(query)
+    score = rank(Todo.search_vector, tsquery)
     stmt = (
         select(
             Todo.id,
@@ -57,14 +60,15 @@ async def _search_tasks(
             Todo.status,
             Todo.priority,
             Project.name.label("project_name"),
+            score.label("score"),
         )
         .outerjoin(Project, Todo.project_id == Project.id)
         .where(
             Todo.user_id == user_id,
             Todo.deleted_at.is_(None),
-            search_vector.bool_op("@@")(search_query),
+            matches(Todo.search_vector, tsquery),
         )
-        .order_by(Todo.created_at.desc())
+        .order_by(score.desc(), Todo.created_at.desc())
         .limit(limit)
     )
 
@@ -77,6 +81,7 @@ async def _search_tasks(
             subtitle=row.project_name or row.status,
             url=f"/task/{row.id}",
             metadata={"status": row.status, "priority": row.priority},
+            score=row.score,
         )
         for row in result.all()
     ]
@@ -85,20 +90,26 @@ async def _search_tasks(
 async def _search_wiki(
     db: AsyncSession, user_id: int, query: str, limit: int
 ) -> list[UnifiedSearchItem]:
-    """Search wiki pages using ILIKE."""
-    escaped = _escape_ilike(query)
-    pattern = f"%{escaped}%"
+    """Search wiki pages using the full-text search index."""
+    tsquery = to_tsquery(query)
+    score = rank(WikiPage.search_vector, tsquery)
     stmt = (
-        select(WikiPage.id, WikiPage.title, WikiPage.slug, WikiPage.content)
+        select(
+            WikiPage.id,
+            WikiPage.title,
+            WikiPage.slug,
+            headline(WikiPage.content, tsquery).label("snippet"),
+            score.label("score"),
+        )
         .where(
             WikiPage.user_id == user_id,
             WikiPage.deleted_at.is_(None),
-            or_(
-                WikiPage.title.ilike(pattern, escape="\\"),
-                WikiPage.content.ilike(pattern, escape="\\"),
-            ),
+            matches(WikiPage.search_vector, tsquery),
+        )
+        .order_by(
+            score.desc(),
+            WikiPage.updated_at.desc().nulls_last(),
         )
-        .order_by(WikiPage.updated_at.desc().nulls_last())
         .limit(limit)
     )
 
@@ -108,8 +119,9 @@ async def _search_wiki(
             type="wiki",
             id=row.id,
             title=row.title,
-            subtitle=extract_snippet(row.content, query) if row.content else None,
+            subtitle=row.snippet or None,
             url=f"/wiki/{row.slug}",
+            score=row.score,
         )
         for row in result.all()
     ]
@@ -118,21 +130,27 @@ async def _search_wiki(
 async def _search_snippets(
     db: AsyncSession, user_id: int, query: str, limit: int
 ) -> list[UnifiedSearchItem]:
-    """Search snippets using ILIKE."""
-    escaped = _escape_ilike(query)
-    pattern = f"%{escaped}%"
+    """Search snippets using the full-text search index."""
+    tsquery = to_tsquery(query)
+    score = rank(Snippet.search_vector, tsquery)
     stmt = (
-        select(Snippet.id, Snippet.title, Snippet.category, Snippet.snippet_date)
+        select(
+            Snippet.id,
+            Snippet.title,
+            Snippet.category,
+            Snippet.snippet_date,
+            score.label("score"),
+        )
         .where(
             Snippet.user_id == user_id,
             Snippet.deleted_at.is_(None),
-            or_(
-                Snippet.title.ilike(pattern, escape="\\"),
-                Snippet.content.ilike(pattern, escape="\\"),
-                Snippet.category.ilike(pattern, escape="\\"),
-            ),
+            matches(Snippet.search_vector, tsquery),
+        )
+        .order_by(
+            score.desc(),
+            Snippet.snippet_date.desc(),
+            Snippet.created_at.desc(),
         )
-        .order_by(Snippet.snippet_date.desc(), Snippet.created_at.desc())
         .limit(limit)
     )
 
@@ -144,6 +162,7 @@ async def _search_snippets(
             title=row.title,
             subtitle=f"{row.category} \u2022 {row.snippet_date.isoformat()}",
             url=f"/snippets/{row.id}",
+            score=row.score,
         )
         for row in result.all()
     ]
@@ -152,9 +171,9 @@ async def _search_snippets(
 async def _search_articles(
     db: AsyncSession, query: str, limit: int
 ) -> list[UnifiedSearchItem]:
-    """Search articles using ILIKE with escaping (global, not user-scoped)."""
-    escaped = _escape_ilike(query)
-    pattern = f"%{escaped}%"
+    """Search articles using the full-text search index (global, not user-scoped)."""
+    tsquery = to_tsquery(query)
+    score = rank(Article.search_vector, tsquery)
     stmt = (
         select(
             Article.id,
@@ -162,15 +181,14 @@ async def _search_articles(
             Article.url,
             Article.summary,
             FeedSource.name.label("feed_source_name"),
+            score.label("score"),
         )
         .join(FeedSource, Article.feed_source_id == FeedSource.id)
-        .where(
-            or_(
-                Article.title.ilike(pattern, escape="\\"),
-                Article.summary.ilike(pattern, escape="\\"),
-            ),
+        .where(matches(Article.search_vector, tsquery))
+        .order_by(
+            score.desc(),
+            Article.published_at.desc().nulls_last(),
         )
-        .order_by(Article.published_at.desc().nulls_last())
         .limit(limit)
     )
 
@@ -183,11 +201,93 @@ async def _search_articles(
             subtitle=row.feed_source_name,
             url=row.url,
             metadata={"external": True},
+            score=row.score,
         )
         for row in result.all()
     ]
 
 
+Searcher = Callable[[AsyncSession, int, str, int], Awaitable[list[UnifiedSearchItem]]]
+
+SEARCHERS: dict[str, Searcher] = {
+    "task": _search_tasks,
+    "wiki": _search_wiki,
+    "snippet": _search_snippets,
+    "article": lambda db, _user_id, query, limit: _search_articles(db, query, limit),
+}
+
+# Caps the pooled connections held by searches across all requests in this
+# worker, so a burst of searches (up to four sessions each) can't take the
+# whole connection pool away from everything else
+_search_sessions = asyncio.Semaphore(settings.search_max_sessions)
+
+
+async def _run_search(
+    bind: AsyncEngine | AsyncConnection,
+    content_type: str,
+    user_id: int,
+    query: str,
+    limit: int,
+) -> list[UnifiedSearchItem]:
+    """Run one content type's search on its own session, bounded by a timeout.
+
+    Waiting for a free search slot counts against the request deadline, not
+    the per-type timeout.
+    """
+    timeout = settings.search_type_timeout_seconds
+    async with _search_sessions, AsyncSession(bind=bind) as session:
+        # Have PostgreSQL abandon the query too, not just stop waiting for it
+        await session.execute(
+            select(func.set_config("statement_timeout", str(int(timeout * 1000)), True))
+        )
+        return await asyncio.wait_for(
+            SEARCHERS[content_type](session, user_id, query, limit), timeout
+        )
+
+
+# SQLSTATE of a query cancelled by statement_timeout
+_QUERY_CANCELED = "57014"
+
+
+def _timed_out(task: asyncio.Task) -> bool:
+    """Whether a search task was cancelled or hit either of its timeouts.
+
+    The per-search timeout fires either as ``TimeoutError`` from
+    ``asyncio.wait_for`` or, when PostgreSQL's ``statement_timeout`` gets
+    there first, as a query-cancelled ``DBAPIError``.
+    """
+    if task.cancelled():
+        return True
+    exc = task.exception()
+    if isinstance(exc, TimeoutError):
+        return True
+    return (
+        isinstance(exc, DBAPIError)
+        and getattr(exc.orig, "sqlstate", None) == _QUERY_CANCELED
+    )
+
+
+def _merge_ranked(
+    searchers: list[tuple[str, list[UnifiedSearchItem]]], limit: int
+) -> list[dict]:
+    """Merge per-type results into one list ranked by normalised score.
+
+    ts_rank values aren't comparable across tables (they depend on document
+    length and field weights), so each type's scores are scaled by that type's
+    best score before merging.
+    """
+    scored: list[tuple[float, UnifiedSearchItem]] = []
+    for _, items in searchers:
+        best = max((item.score for item in items), default=0.0)
+        for item in items:
+            scored.append((item.score / best if best > 0 else 0.0, item))
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [
+        item.model_dump() | {"score": round(normalised, 4)}
+        for normalised, item in scored[:limit]
+    ]
+
+
 @router.get("/search")
 async def unified_search(
     user: CurrentUserFlexible,
@@ -195,6 +295,7 @@ async def unified_search(
     q: str = Query(..., min_length=1, max_length=200),
     types: str | None = Query(None),
     limit: int = Query(5, ge=1, le=20),
+    merge: bool = Query(False, description="Also return one cross-type ranked list"),
 ) -> DataResponse[dict]:
     """Search across tasks, wiki pages, snippets, and articles."""
     if types:
@@ -203,35 +304,55 @@ async def unified_search(
     else:
         requested = VALID_TYPES
 
-    results: dict[str, list[dict]] = {}
-    total = 0
+    tasks = {
+        content_type: asyncio.create_task(
+            _run_search(db.bind, content_type, user.id, q, limit)
+        )
+        for content_type in TYPE_ORDER
+        if content_type in requested
+    }
+    if tasks:
+        _, pending = await asyncio.wait(
+            tasks.values(), timeout=settings.search_deadline_seconds
+        )
+        for task in pending:
+            task.cancel()
+        # Wait for cancelled searches to release their connections
+        await asyncio.gather(*pending, return_exceptions=True)
 
     searchers: list[tuple[str, list[UnifiedSearchItem]]] = []
+    timed_out: list[str] = []
 
-    for content_type in TYPE_ORDER:
-        if content_type not in requested:
-            continue
-        try:
-            if content_type == "task":
-                items = await _search_tasks(db, user.id, q, limit)
-            elif content_type == "wiki":
-                items = await _search_wiki(db, user.id, q, limit)
-            elif content_type == "snippet":
-                items = await _search_snippets(db, user.id, q, limit)
-            else:
-                items = await _search_articles(db, q, limit)
-            searchers.append((content_type, items))
-        except Exception:
-            logger.warning("Unified search failed for %s", content_type, exc_info=True)
-            searchers.append((content_type, []))
+    for content_type, task in tasks.items():
+        items: list[UnifiedSearchItem] = []
+        if _timed_out(task):
+            logger.warning("Unified search timed out for %s", content_type)
+            timed_out.append(content_type)
+        elif task.exception() is not None:
+            logger.warning(
+                "Unified search failed for %s",
+                content_type,
+                exc_info=task.exception(),
+            )
+        else:
+            items = task.result()
+        searchers.append((content_type, items))
 
+    results: dict[str, list[dict]] = {}
+    total = 0
     for key, items in searchers:
         results[key] = [item.model_dump() for item in items]
         total += len(items)
 
-    return DataResponse(
-        data={
-            "results": results,
-            "meta": {"total": total, "types": list(results.keys())},
-        }
-    )
+    data: dict = {
+        "results": results,
+        "meta": {
+            "total": total,
+            "types": list(results.keys()),
+            "timed_out": timed_out,
+        },
+    }
+    if merge:
+        data["merged"] = _merge_ranked(searchers, limit)
+
+    return DataResponse(data=data)
@@ -1,21 +1,34 @@
 """Wiki page API routes."""
 
+import hashlib
 import re
-from datetime import UTC, date, datetime
+from datetime import date, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Query, Response
+from fastapi import APIRouter, Header, Query, Response
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import CursorResult, delete, or_, select, update
 from sqlalchemy import func as sa_func
 
 from app.core.errors import errors
+from app.core.etag import etag_matches
+from app.db.pagination import (
+    SortKey,
+    apply_keyset,
+    cursor_values,
+    decode_cursor,
+    encode_cursor,
+    order_by_clauses,
+)
 from app.db.queries import get_resource_for_user
+from app.db.search import headline, matches, rank, to_tsquery
+from app.db.wiki_hierarchy import get_ancestors, get_subtree_depth, soft_delete_subtree
 from app.dependencies import CurrentUserFlexible, DbSession
 from app.models.notification import Notification, NotificationType, WikiPageSubscription
 from app.models.todo import Todo
 from app.models.wiki_page import WikiPage, WikiPageRevision, todo_wiki_links
 from app.schemas import DataResponse, ListResponse
+from app.services.wiki_revisions import load_revision, save_revision
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -33,6 +46,17 @@ MAX_TAG_LENGTH = 50
 
 Tag = Annotated[str, Field(min_length=1, max_length=MAX_TAG_LENGTH)]
 
+# Columns needed for list and tree entries; never the page body
+SUMMARY_COLUMNS = (
+    WikiPage.id,
+    WikiPage.title,
+    WikiPage.slug,
+    WikiPage.parent_id,
+    WikiPage.tags,
+    WikiPage.created_at,
+    WikiPage.updated_at,
+)
+
 # ---------------------------------------------------------------------------
 # Schemas
 # ---------------------------------------------------------------------------
@@ -200,21 +224,6 @@ def generate_slug(title: str) -> str:
     return slug or "untitled"
 
 
-def extract_snippet(content: str, query: str) -> str | None:
-    """Extract a snippet of content around the first match of query."""
-    idx = content.lower().find(query.lower())
-    if idx == -1:
-        return None
-    start = max(0, idx - 80)
-    end = min(len(content), idx + len(query) + 80)
-    snippet = content[start:end]
-    if start > 0:
-        snippet = "..." + snippet
-    if end < len(content):
-        snippet = snippet + "..."
-    return snippet
-
-
 async def ensure_unique_slug(
     db: DbSession,
     user_id: int,
@@ -244,41 +253,13 @@ async def ensure_unique_slug(
     raise errors.validation("Too many pages with similar slugs; provide a unique slug")
 
 
-async def _save_revision(db: DbSession, page: WikiPage) -> None:
-    """Save the current page state as a revision before updating."""
-    revision = WikiPageRevision(
-        wiki_page_id=page.id,
-        user_id=page.user_id,
-        title=page.title,
-        slug=page.slug,
-        content=page.content,
-        revision_number=page.revision_number,
-    )
-    db.add(revision)
-
-
 async def _get_ancestors(db: DbSession, page: WikiPage) -> list[WikiPageAncestor]:
-    """Walk parent chain and return root-first ancestor list."""
-    ancestors: list[WikiPageAncestor] = []
-    current = page
-    seen: set[int] = {page.id}
-    while current.parent_id is not None:
-        result = await db.execute(
-            select(WikiPage).where(
-                WikiPage.id == current.parent_id,
-                WikiPage.deleted_at.is_(None),
-            )
-        )
-        parent = result.scalar_one_or_none()
-        if parent is None or parent.id in seen:
-            break
-        seen.add(parent.id)
-        ancestors.append(
-            WikiPageAncestor(id=parent.id, title=parent.title, slug=parent.slug)
-        )
-        current = parent
-    ancestors.reverse()
-    return ancestors
+    """Return the page's ancestors, root first."""
+    chain = await get_ancestors(db, page.id)
+    return [
+        WikiPageAncestor(id=row.id, title=row.title, slug=row.slug)
+        for row in reversed(chain[1:])
+    ]
 
 
 async def _get_children_with_counts(
@@ -330,80 +311,32 @@ async def _validate_parent(
     exclude_id: int | None = None,
 ) -> None:
     """Validate parent_id: exists, owned by user, not circular, depth OK."""
-    # Check existence and ownership
-    result = await db.execute(
-        select(WikiPage).where(
-            WikiPage.id == parent_id,
-            WikiPage.user_id == user_id,
-            WikiPage.deleted_at.is_(None),
-        )
-    )
-    parent = result.scalar_one_or_none()
-    if parent is None:
+    # The parent followed by its ancestors, nearest first
+    chain = await get_ancestors(db, parent_id)
+    if not chain or chain[0].user_id != user_id:
         raise errors.validation("Parent page not found")
 
     # Cannot be self
     if exclude_id is not None and parent_id == exclude_id:
         raise errors.validation("A page cannot be its own parent")
 
-    # Check depth: walk up from parent, counting levels
-    depth = 1  # parent is at least depth 1
-    current = parent
-    seen: set[int] = {parent_id}
-    if exclude_id is not None:
-        seen.add(exclude_id)
-    while current.parent_id is not None:
-        if current.parent_id in seen:
-            raise errors.validation("Circular parent reference detected")
-        seen.add(current.parent_id)
-        r = await db.execute(
-            select(WikiPage).where(
-                WikiPage.id == current.parent_id,
-                WikiPage.deleted_at.is_(None),
-            )
-        )
-        current = r.scalar_one_or_none()
-        if current is None:
-            break
-        depth += 1
+    # Reject moving a page under its own descendant, and chains that loop
+    chain_ids = {row.id for row in chain}
+    if exclude_id in chain_ids or chain[-1].parent_id in chain_ids:
+        raise errors.validation("Circular parent reference detected")
 
     # page_depth = depth of the moved/new page under the new parent
-    page_depth = depth + 1
+    page_depth = len(chain) + 1
 
     # When reparenting, also account for the subtree depth below the moved page
     subtree_depth = 0
     if exclude_id is not None:
-        subtree_depth = await _get_subtree_depth(db, exclude_id)
+        subtree_depth = await get_subtree_depth(db, exclude_id)
 
     if page_depth + subtree_depth > MAX_WIKI_DEPTH:
         raise errors.validation(f"Maximum nesting depth of {MAX_WIKI_DEPTH} exceeded")
 
 
-async def _get_subtree_depth(db: DbSession, page_id: int) -> int:
-    """Return the maximum depth of descendants below page_id (0 if leaf)."""
-    max_depth = 0
-    # BFS with depth tracking
-    to_visit: list[tuple[int, int]] = [(page_id, 0)]
-    visited: set[int] = set()
-    while to_visit:
-        current_id, current_depth = to_visit.pop()
-        if current_id in visited:
-            continue
-        visited.add(current_id)
-        result = await db.execute(
-            select(WikiPage.id).where(
-                WikiPage.parent_id == current_id,
-                WikiPage.deleted_at.is_(None),
-            )
-        )
-        for row in result.all():
-            child_depth = current_depth + 1
-            if child_depth > max_depth:
-                max_depth = child_depth
-            to_visit.append((row.id, child_depth))
-    return max_depth
-
-
 async def _build_wiki_page_response(
     db: DbSession,
     page: WikiPage,
@@ -432,18 +365,31 @@ async def _build_wiki_page_response(
     return resp
 
 
-async def _soft_delete_descendants(db: DbSession, page_id: int) -> None:
-    """Recursively soft-delete all descendants of a page."""
-    result = await db.execute(
-        select(WikiPage).where(
-            WikiPage.parent_id == page_id,
-            WikiPage.deleted_at.is_(None),
-        )
-    )
-    children = result.scalars().all()
-    for child in children:
-        child.deleted_at = datetime.now(UTC)
-        await _soft_delete_descendants(db, child.id)
+def _wiki_list_sort_keys(tsquery) -> list[SortKey]:
+    """Keyset ordering for the page list: relevance first when searching."""
+    keys = [
+        SortKey(
+            WikiPage.updated_at,
+            descending=True,
+            nullable=True,
+            decode=datetime.fromisoformat,
+        ),
+        SortKey(WikiPage.id, descending=True),
+    ]
+    if tsquery is not None:
+        keys.insert(0, SortKey(rank(WikiPage.search_vector, tsquery), descending=True))
+    return keys
+
+
+def _wiki_tree_etag(page_count: int, last_updated: datetime | None) -> str:
+    """Weak ETag for a user's page tree.
+
+    Every create, edit, move or delete bumps either the number of live pages
+    or the latest ``updated_at`` among them.
+    """
+    stamp = last_updated.isoformat() if last_updated else ""
+    digest = hashlib.sha256(f"{page_count}:{stamp}".encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
 
 
 # ---------------------------------------------------------------------------
@@ -460,16 +406,34 @@ async def list_wiki_pages(
     q: str | None = Query(None, description="Search query"),
     tag: str | None = Query(None, description="Filter by tag"),
     parent_id: int | None = Query(None, description="Filter by parent (0=root only)"),
+    limit: int | None = Query(
+        None, ge=1, le=1000, description="Page size (enables cursor pagination)"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from meta.next_cursor of the previous page"
+    ),
 ) -> ListResponse[WikiPageSearchResult]:
-    """List wiki pages for the current user, optionally filtered by search."""
-    query = select(WikiPage).where(
+    """List wiki pages for the current user, optionally filtered by search.
+
+    Page bodies are never returned; searches include a content_snippet.
+    Passing limit (or cursor) switches to keyset pagination: meta gains
+    has_more and next_cursor, and the next page is requested with
+    cursor=<next_cursor> and the same filters.
+    """
+    tsquery = to_tsquery(q) if q else None
+    sort_keys = _wiki_list_sort_keys(tsquery)
+    ordering = "relevance" if q else "updated_at"
+    after = decode_cursor(cursor, ordering, sort_keys)
+    paginated = limit is not None or cursor is not None
+
+    query = select(*SUMMARY_COLUMNS).where(
         WikiPage.user_id == user.id,
         WikiPage.deleted_at.is_(None),
     )
-    if q:
-        query = query.where(
-            WikiPage.title.ilike(f"%{q}%") | WikiPage.content.ilike(f"%{q}%")
-        )
+    if tsquery is not None:
+        query = query.add_columns(
+            headline(WikiPage.content, tsquery).label("content_snippet")
+        ).where(matches(WikiPage.search_vector, tsquery))
     if tag:
         query = query.where(WikiPage.tags.op("@>")(sa_func.jsonb_build_array(tag)))
     if parent_id is not None:
@@ -477,17 +441,38 @@ async def list_wiki_pages(
             query = query.where(WikiPage.parent_id.is_(None))
         else:
             query = query.where(WikiPage.parent_id == parent_id)
-    query = query.order_by(WikiPage.updated_at.desc().nullslast())
+    query = query.order_by(*order_by_clauses(sort_keys))
+    if paginated:
+        query = apply_keyset(query, sort_keys, after, limit)
+
     result = await db.execute(query)
-    pages = result.scalars().all()
+    rows = result.all()
+    has_more = limit is not None and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
 
-    data = []
-    for p in pages:
-        item = WikiPageSearchResult.model_validate(p)
-        if q:
-            item.content_snippet = extract_snippet(p.content, q)
-        data.append(item)
-    return ListResponse(data=data, meta={"count": len(data)})
+    data = [
+        WikiPageSearchResult(
+            id=row.id,
+            title=row.title,
+            slug=row.slug,
+            parent_id=row.parent_id,
+            tags=row.tags or [],
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            content_snippet=(row.content_snippet or None) if q else None,
+        )
+        for row in rows
+    ]
+    meta: dict = {"count": len(data)}
+    if paginated:
+        meta["has_more"] = has_more
+        meta["next_cursor"] = (
+            encode_cursor(ordering, cursor_values(rows[-1], sort_keys))
+            if has_more
+            else None
+        )
+    return ListResponse(data=data, meta=meta)
 
 
 @router.post("", status_code=201)
@@ -563,43 +548,55 @@ async def resolve_wiki_links(
     return DataResponse(data=result_map)
 
 
-@router.get("/tree")
+@router.get("/tree", response_model=DataResponse[list[WikiTreeNode]])
 async def get_wiki_tree(
     user: CurrentUserFlexible,
     db: DbSession,
-) -> DataResponse[list[WikiTreeNode]]:
-    """Get full nested tree of wiki pages."""
-    result = await db.execute(
-        select(WikiPage)
-        .where(
-            WikiPage.user_id == user.id,
-            WikiPage.deleted_at.is_(None),
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> DataResponse[list[WikiTreeNode]] | Response:
+    """Get full nested tree of wiki pages.
+
+    The response carries an ETag; sending it back as If-None-Match returns
+    304 Not Modified when no page has been added, changed or removed.
+    """
+    live = (WikiPage.user_id == user.id, WikiPage.deleted_at.is_(None))
+    stats = await db.execute(
+        select(sa_func.count(WikiPage.id), sa_func.max(WikiPage.updated_at)).where(
+            *live
         )
-        .order_by(WikiPage.title)
     )
-    pages = result.scalars().all()
+    page_count, last_updated = stats.one()
+    etag = _wiki_tree_etag(page_count, last_updated)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
 
-    # Build lookup maps
-    children_map: dict[int | None, list[WikiPage]] = {}
-    for p in pages:
-        children_map.setdefault(p.parent_id, []).append(p)
-
-    def build_tree(parent_id: int | None) -> list[WikiTreeNode]:
-        nodes: list[WikiTreeNode] = []
-        for p in children_map.get(parent_id, []):
-            nodes.append(
-                WikiTreeNode(
-                    id=p.id,
-                    title=p.title,
-                    slug=p.slug,
-                    tags=p.tags or [],
-                    updated_at=p.updated_at,
-                    children=build_tree(p.id),
-                )
+    result = await db.execute(
+        select(*SUMMARY_COLUMNS).where(*live).order_by(WikiPage.title)
+    )
+
+    # Rows arrive in title order, so siblings stay sorted. Only pages reachable
+    # from a root are attached; orphans (and corrupt cycles) are left out.
+    children_map: dict[int | None, list[WikiTreeNode]] = {}
+    for row in result.all():
+        children_map.setdefault(row.parent_id, []).append(
+            WikiTreeNode(
+                id=row.id,
+                title=row.title,
+                slug=row.slug,
+                tags=row.tags or [],
+                updated_at=row.updated_at,
             )
-        return nodes
+        )
 
-    tree = build_tree(None)
+    tree = children_map.get(None, [])
+    to_visit = list(tree)
+    while to_visit:
+        node = to_visit.pop()
+        node.children = children_map.get(node.id, [])
+        to_visit.extend(node.children)
     return DataResponse(data=tree)
 
 
@@ -628,7 +625,7 @@ async def update_wiki_page(
     )
 
     # Save current state as revision before making changes
-    await _save_revision(db, page)
+    await save_revision(db, page)
 
     # Atomically increment revision_number at the SQL level
     await db.execute(
@@ -724,8 +721,7 @@ async def delete_wiki_page(
     # Notify subscribers before soft-deleting (need parent chain intact)
     await _notify_subscribers(db, page, NotificationType.WIKI_PAGE_DELETED, user.id)
 
-    page.deleted_at = datetime.now(UTC)
-    await _soft_delete_descendants(db, page.id)
+    await soft_delete_subtree(db, page.id)
     await db.flush()
     return {"data": {"deleted": True, "id": page_id}}
 
@@ -769,11 +765,18 @@ async def list_revisions(
         db, WikiPage, page_id, user.id, errors.wiki_page_not_found
     )
     result = await db.execute(
-        select(WikiPageRevision)
+        select(
+            WikiPageRevision.id,
+            WikiPageRevision.wiki_page_id,
+            WikiPageRevision.title,
+            WikiPageRevision.slug,
+            WikiPageRevision.revision_number,
+            WikiPageRevision.created_at,
+        )
         .where(WikiPageRevision.wiki_page_id == page_id)
         .order_by(WikiPageRevision.revision_number.desc())
     )
-    revisions = result.scalars().all()
+    revisions = result.all()
     return ListResponse(
         data=[WikiPageRevisionSummary.model_validate(r) for r in revisions],
         meta={"count": len(revisions)},
@@ -791,16 +794,21 @@ async def get_revision(
     await get_resource_for_user(
         db, WikiPage, page_id, user.id, errors.wiki_page_not_found
     )
-    result = await db.execute(
-        select(WikiPageRevision).where(
-            WikiPageRevision.wiki_page_id == page_id,
-            WikiPageRevision.revision_number == revision_number,
+    loaded = await load_revision(db, page_id, revision_number)
+    if loaded is None:
+        raise errors.not_found("Revision")
+    revision, content = loaded
+    return DataResponse(
+        data=WikiPageRevisionResponse(
+            id=revision.id,
+            wiki_page_id=revision.wiki_page_id,
+            title=revision.title,
+            slug=revision.slug,
+            revision_number=revision.revision_number,
+            created_at=revision.created_at,
+            content=content,
         )
     )
-    revision = result.scalar_one_or_none()
-    if not revision:
-        raise errors.not_found("Revision")
-    return DataResponse(data=WikiPageRevisionResponse.model_validate(revision))
 
 
 # ---------------------------------------------------------------------------
@@ -1095,31 +1103,12 @@ async def _notify_subscribers(
     Finds direct subscribers plus subscribers of ancestor pages with
     include_children=True. Skips the actor (the user who made the change).
     """
-    page_ids_to_check = [page.id]
-
-    # Walk up the parent chain to collect ancestor IDs
-    current = page
-    seen: set[int] = {page.id}
-    while current.parent_id is not None:
-        if current.parent_id in seen:
-            break
-        seen.add(current.parent_id)
-        result = await db.execute(
-            select(WikiPage).where(
-                WikiPage.id == current.parent_id,
-                WikiPage.deleted_at.is_(None),
-            )
-        )
-        parent = result.scalar_one_or_none()
-        if parent is None:
-            break
-        page_ids_to_check.append(parent.id)
-        current = parent
+    chain = await get_ancestors(db, page.id)
 
     # Find all subscriptions: direct subscriptions to this page,
     # OR subscriptions to ancestor pages with include_children=True
     direct_page_id = page.id
-    ancestor_ids = page_ids_to_check[1:]  # exclude the page itself
+    ancestor_ids = [row.id for row in chain[1:]]  # exclude the page itself
 
     conditions = [
         (WikiPageSubscription.wiki_page_id == direct_page_id),
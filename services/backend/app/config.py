@@ -50,6 +50,49 @@ class Settings(BaseSettings):
     secret_key: str = "change-me-in-production"
     bcrypt_rounds: int = 12
     session_duration_days: int = 7
+    # bcrypt runs on a dedicated thread pool; jobs beyond max_pending get a 503
+    password_hash_workers: int = Field(default=4, ge=1)
+    password_hash_max_pending: int = Field(default=64, ge=1)
+
+    # Auth cache (resolved session / OAuth token / API key principals).
+    # Set auth_cache_ttl_seconds to 0 to disable caching.
+    auth_cache_ttl_seconds: int = Field(default=60, ge=0)
+    auth_cache_max_entries: int = Field(default=10000, ge=0)
+    api_key_usage_flush_seconds: int = Field(default=30, ge=1)
+
+    # Unified search: per-type timeout and overall deadline. Types that don't
+    # finish in time are returned empty and listed in meta.timed_out.
+    search_type_timeout_seconds: float = Field(default=2.0, gt=0)
+    search_deadline_seconds: float = Field(default=3.0, gt=0)
+    # Search sessions open at once per worker; keep well below the connection
+    # pool size (5 + 10 overflow) so other requests still get connections
+    search_max_sessions: int = Field(default=6, ge=1)
+
+    # Event stream replay: recent events kept per user for Last-Event-ID
+    # resumption, how many users' histories are kept per worker, and how many
+    # recent events of any user can be located as a resume point
+    event_replay_buffer_size: int = Field(default=256, ge=1)
+    event_replay_max_users: int = Field(default=10000, ge=1)
+    event_replay_window: int = Field(default=65536, ge=1)
+
+    # RSS fetching: feeds fetched at once across all hosts, and per host. Each
+    # fetch briefly takes a database connection to store its articles, so keep
+    # this below the connection pool size (5 + 10 overflow by default).
+    feed_fetch_concurrency: int = Field(default=8, ge=1)
+    feed_fetch_per_host: int = Field(default=2, ge=1)
+
+    # Wiki revisions: every Nth revision is stored in full so rebuilding an
+    # old revision applies at most N-1 deltas; payloads are zlib-compressed
+    # unless disabled
+    wiki_revision_keyframe_interval: int = Field(default=20, ge=1)
+    wiki_revision_compression: bool = True
+
+    # Recurring tasks: how often due templates are turned into todos, how many
+    # templates are locked per transaction, and how many missed occurrences of
+    # a fixed schedule are generated per template per transaction
+    recurring_task_interval_minutes: int = Field(default=15, ge=1)
+    recurring_task_batch_size: int = Field(default=500, ge=1)
+    recurring_task_max_catch_up: int = Field(default=50, ge=1)
 
     # Rate limiting
     login_max_attempts: int = 5
@@ -140,10 +183,16 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
     ai_summary_batch_size: int = 20
     ai_summary_model: str = "claude-haiku-4-5-20251001"
+    ai_summary_base_url: str = ""  # Override the API endpoint (e.g. a local stub)
+    ai_summary_concurrency: int = 4
+    ai_summary_requests_per_minute: int = 50
+    ai_summary_max_retries: int = 3
 
     # File uploads
     upload_dir: str = "./uploads"
     max_upload_size_mb: int = 10
+    # Image thumbnails are rendered on a process pool of this size
+    thumbnail_workers: int = Field(default=2, ge=1)
     allowed_image_types: str = "image/jpeg,image/png,image/gif,image/webp"
 
     @property
@@ -0,0 +1,197 @@
+"""In-process cache of resolved authentication principals.
+
+Resolving a credential to a user costs several queries per request and, for
+API keys, a full bcrypt verification. This module caches the outcome of a
+successful resolution (credential -> user ID) for a short TTL so repeat
+requests with the same credential only need to load the user row.
+
+Entries are keyed by a SHA-256 digest of the credential, so raw session IDs,
+tokens and API keys are never held as dictionary keys. Each entry expires at
+the earlier of the configured TTL and the credential's own expiry. When a
+session, token or key is revoked, or a user is deactivated, all of that
+user's entries are dropped -- directly by the endpoint that made the change,
+and in every other worker via the event bus ``auth`` notifications.
+
+API key ``last_used_at`` updates for cache hits are collected in memory and
+written in one batch by :func:`flush_api_key_usage`, which the scheduler runs
+periodically.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import update
+
+from app.config import settings
+from app.models.api_key import ApiKey
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPrincipal:
+    """A credential that has been successfully resolved to a user."""
+
+    user_id: int
+    api_key_id: int | None
+    deadline: float  # time.monotonic() value after which the entry is stale
+
+
+class AuthCache:
+    """TTL + LRU cache of resolved principals, indexed by user for invalidation."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedPrincipal] = OrderedDict()
+        self._keys_by_user: dict[int, set[str]] = {}
+        self._pending_api_key_usage: dict[int, datetime] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled (a TTL of 0 disables it)."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def _key(kind: str, credential: str) -> str:
+        return hashlib.sha256(f"{kind}:{credential}".encode()).hexdigest()
+
+    def get(self, kind: str, credential: str) -> CachedPrincipal | None:
+        """Return the cached principal for a credential, if fresh.
+
+        Args:
+            kind: Credential type ("session", "oauth" or "api_key")
+            credential: The raw credential value
+        """
+        if not self.enabled:
+            return None
+        key = self._key(kind, credential)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.deadline <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        kind: str,
+        credential: str,
+        user_id: int,
+        *,
+        expires_at: datetime | None = None,
+        api_key_id: int | None = None,
+    ) -> None:
+        """Cache a successfully resolved credential.
+
+        Args:
+            kind: Credential type ("session", "oauth" or "api_key")
+            credential: The raw credential value
+            user_id: ID of the user the credential resolved to
+            expires_at: When the credential itself expires, if it does
+            api_key_id: ID of the API key, for batched last_used_at updates
+        """
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=UTC)
+            ttl = min(ttl, (expires_at - datetime.now(UTC)).total_seconds())
+            if ttl <= 0:
+                return
+
+        key = self._key(kind, credential)
+        self._remove(key)
+        self._entries[key] = CachedPrincipal(
+            user_id=user_id,
+            api_key_id=api_key_id,
+            deadline=time.monotonic() + ttl,
+        )
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest, evicted = self._entries.popitem(last=False)
+            self._unindex(oldest, evicted.user_id)
+
+    def invalidate_user(self, user_id: int | None) -> None:
+        """Drop every cached principal for a user.
+
+        Passing None drops the whole cache; the event bus does this when its
+        connection drops, since invalidations may have been missed.
+        """
+        if user_id is None:
+            self.clear()
+            return
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry.user_id)
+
+    def _unindex(self, key: str, user_id: int) -> None:
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Batched API key usage tracking
+    # ------------------------------------------------------------------
+
+    def record_api_key_use(self, api_key_id: int) -> None:
+        """Remember that an API key was used; written by the next flush."""
+        self._pending_api_key_usage[api_key_id] = datetime.now(UTC)
+
+    def take_pending_api_key_usage(self) -> dict[int, datetime]:
+        """Return and clear the pending API key usage timestamps."""
+        pending = self._pending_api_key_usage
+        self._pending_api_key_usage = {}
+        return pending
+
+
+auth_cache = AuthCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    max_entries=settings.auth_cache_max_entries,
+)
+
+
+async def flush_api_key_usage() -> None:
+    """Write batched API key last_used_at timestamps in a single statement."""
+    from app.db.database import async_session_maker
+
+    pending = auth_cache.take_pending_api_key_usage()
+    if not pending:
+        return
+
+    try:
+        async with async_session_maker() as session:
+            # ORM bulk UPDATE by primary key: one executemany round-trip
+            await session.execute(
+                update(ApiKey),
+                [
+                    {"id": key_id, "last_used_at": used_at}
+                    for key_id, used_at in pending.items()
+                ],
+            )
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to flush API key usage for %d keys", len(pending))
+        return
+    logger.debug("Flushed last_used_at for %d API keys", len(pending))
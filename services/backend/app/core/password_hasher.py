@@ -0,0 +1,172 @@
+"""Async password hashing on a bounded worker pool.
+
+bcrypt is deliberately slow (~250ms per call at the default rounds), so
+calling it directly from a request handler blocks the event loop and stalls
+every other request and SSE stream served by the worker. :class:`PasswordHasher`
+runs hashing and verification on a dedicated thread pool instead. bcrypt
+releases the GIL while it works, so threads give real parallelism without the
+cost of a process pool.
+
+The pool has a fixed number of workers and a bounded backlog. Once the backlog
+is full, new requests are rejected with a 503 rather than queueing without
+limit, so a credential-stuffing burst cannot pile up unbounded work.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache, partial
+from typing import TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config import settings
+from app.core.errors import errors
+from app.core.security import hash_password, verify_password
+
+T = TypeVar("T")
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hashing jobs waiting for a worker",
+)
+PASSWORD_HASH_IN_PROGRESS = Gauge(
+    "password_hash_in_progress",
+    "Password hashing jobs currently running on a worker",
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent running bcrypt, excluding queue wait",
+    ["operation"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hashing jobs spent queued before a worker picked them up",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs rejected because the backlog was full",
+)
+
+# Input for the dummy hash used to equalize timing when there is no real
+# hash to check against (unknown user, unknown API key prefix).
+_DUMMY_PASSWORD = "dummy_timing_normalization_value"  # pragma: allowlist secret
+
+
+@cache
+def _dummy_hash() -> str:
+    return hash_password(_DUMMY_PASSWORD)
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop with a concurrency cap and bounded backlog."""
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        """Initialize the hasher.
+
+        Args:
+            max_workers: Number of bcrypt calls that may run concurrently
+            max_pending: Maximum number of jobs queued or running at once;
+                further jobs are rejected with a 503
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        # Jobs finish on worker threads, so the count is updated under a lock
+        self._pending_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    def _job_done(self, future: Future) -> None:
+        """Release a job's backlog slot once its thread is done with it.
+
+        Runs on the worker thread, or on the event loop if the job was
+        cancelled before a worker picked it up.
+        """
+        if future.cancelled():
+            # Never started, so job() didn't take itself off the queue
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+        with self._pending_lock:
+            self._pending -= 1
+
+    async def _run(self, operation: str, func: Callable[[], T]) -> T:
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                PASSWORD_HASH_REJECTED.inc()
+                raise errors.service_unavailable()
+            self._pending += 1
+
+        queued_at = time.perf_counter()
+
+        def job() -> T:
+            started_at = time.perf_counter()
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+            PASSWORD_HASH_WAIT.observe(started_at - queued_at)
+            with PASSWORD_HASH_IN_PROGRESS.track_inprogress():
+                try:
+                    return func()
+                finally:
+                    PASSWORD_HASH_DURATION.labels(operation=operation).observe(
+                        time.perf_counter() - started_at
+                    )
+
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        # The slot is released when the thread finishes, not when this
+        # coroutine stops waiting: a cancelled request can't stop a bcrypt
+        # call that is already running
+        future = self._get_executor().submit(job)
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs currently queued or running."""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with bcrypt on the worker pool."""
+        return await self._run("hash", partial(hash_password, password))
+
+    async def verify(self, plain_password: str, hashed_password: str | None) -> bool:
+        """Verify a password against a bcrypt hash on the worker pool.
+
+        If ``hashed_password`` is None (e.g. the user does not exist), a dummy
+        hash is checked instead and False is returned, so the response time
+        does not reveal whether there was anything to check against.
+        """
+        if hashed_password is None:
+            await self._run("verify", partial(_dummy_verify, plain_password))
+            return False
+        return await self._run(
+            "verify", partial(verify_password, plain_password, hashed_password)
+        )
+
+    async def dummy_verify(self) -> None:
+        """Spend the same time as a real verification, for timing normalization."""
+        await self.verify(_DUMMY_PASSWORD, None)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, waiting for in-flight jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def _dummy_verify(plain_password: str) -> bool:
+    return verify_password(plain_password, _dummy_hash())
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
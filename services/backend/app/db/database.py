@@ -47,6 +47,7 @@ async def init_db() -> None:
             notification,
             oauth,
             project,
+            project_stats,
             recurring_task,
             session,
             todo,
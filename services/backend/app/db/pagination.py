@@ -0,0 +1,165 @@
+"""Keyset (cursor) pagination helpers.
+
+Keyset pagination filters on the sort key of the last row a client has seen
+instead of using OFFSET, so fetching a page costs the same regardless of how
+deep into the result set the client is. Cursors are opaque, URL-safe tokens
+that encode the sort key values of the last row on the previous page.
+
+Example:
+    keys = [SortKey(Todo.due_date, nullable=True, decode=date.fromisoformat),
+            SortKey(Todo.id)]
+    query = query.order_by(*order_by_clauses(keys))
+    query = apply_keyset(query, keys, decode_cursor(cursor, "due_date", keys), limit)
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.engine import Row
+
+from app.core.errors import errors
+
+KEYSET_LABEL_PREFIX = "keyset_"
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One component of a keyset ordering.
+
+    Attributes:
+        column: SQL expression to sort by.
+        descending: Sort in descending order.
+        nullable: Whether the expression may be NULL. NULLs always sort last.
+        decode: Converts a JSON-decoded cursor value back into the Python type
+            expected by ``column`` (e.g. ``date.fromisoformat``).
+    """
+
+    column: Any
+    descending: bool = False
+    nullable: bool = False
+    decode: Callable[[Any], Any] | None = None
+
+    def order_by(self) -> Any:
+        """Return the ORDER BY clause for this key."""
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def equals(self, value: Any) -> Any:
+        """Return a predicate matching rows whose key equals ``value``."""
+        if value is None:
+            return self.column.is_(None)
+        return self.column == value
+
+    def beyond(self, value: Any) -> Any:
+        """Return a predicate matching rows that sort strictly after ``value``."""
+        if value is None:
+            # NULLs sort last, so nothing can follow a NULL key.
+            return false()
+        clause = self.column < value if self.descending else self.column > value
+        if self.nullable:
+            clause = or_(clause, self.column.is_(None))
+        return clause
+
+
+def order_by_clauses(keys: Sequence[SortKey]) -> list[Any]:
+    """Return the ORDER BY clauses for a keyset ordering."""
+    return [key.order_by() for key in keys]
+
+
+def keyset_predicate(keys: Sequence[SortKey], values: Sequence[Any]) -> Any:
+    """Build a WHERE clause selecting rows that sort after ``values``.
+
+    Expands the lexicographic comparison ``(k0, k1, ...) > (v0, v1, ...)``
+    into ``k0 > v0 OR (k0 = v0 AND k1 > v1) OR ...`` so that mixed sort
+    directions and NULLS LAST columns are handled correctly.
+    """
+    clauses = []
+    for i, key in enumerate(keys):
+        prefix = [keys[j].equals(values[j]) for j in range(i)]
+        clauses.append(and_(*prefix, key.beyond(values[i])))
+    return or_(*clauses)
+
+
+def apply_keyset(
+    query: Any,
+    keys: Sequence[SortKey],
+    after: Sequence[Any] | None,
+    limit: int | None,
+) -> Any:
+    """Add keyset columns, the cursor predicate and the page limit to a query.
+
+    The sort key expressions are appended to the SELECT list as labeled
+    columns so :func:`cursor_values` can read them back from the last row.
+    One extra row beyond ``limit`` is fetched to detect whether another page
+    exists. The query must already be ordered by ``order_by_clauses(keys)``.
+    """
+    query = query.add_columns(
+        *(key.column.label(f"{KEYSET_LABEL_PREFIX}{i}") for i, key in enumerate(keys))
+    )
+    if after is not None:
+        query = query.where(keyset_predicate(keys, after))
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def cursor_values(row: Row, keys: Sequence[SortKey]) -> list[Any]:
+    """Read the keyset column values from a row returned by :func:`apply_keyset`."""
+    mapping = row._mapping
+    return [mapping[f"{KEYSET_LABEL_PREFIX}{i}"] for i in range(len(keys))]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(ordering: str, values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor token.
+
+    Args:
+        ordering: Name of the ordering the values belong to. A cursor is only
+            accepted back for the same ordering.
+        values: Sort key values of the last row on the page.
+    """
+    payload = json.dumps(
+        {"o": ordering, "v": [_encode_value(v) for v in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str | None, ordering: str, keys: Sequence[SortKey]
+) -> list[Any] | None:
+    """Decode a cursor token produced by :func:`encode_cursor`.
+
+    Returns:
+        The sort key values, or None if no cursor was given.
+
+    Raises:
+        ApiError: If the cursor is malformed or belongs to another ordering.
+    """
+    if cursor is None:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["o"] != ordering or len(payload["v"]) != len(keys):
+            raise ValueError("cursor does not match ordering")
+        return [
+            key.decode(value) if key.decode and value is not None else value
+            for key, value in zip(keys, payload["v"], strict=True)
+        ]
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise errors.validation(
+            "Invalid cursor. Cursors are only valid for the ordering and "
+            "filters they were issued with."
+        ) from e
@@ -0,0 +1,130 @@
+"""Reads and rebuilds of the materialised project statistics.
+
+The counters in ``project_stats`` and the due-date histogram in
+``project_due_counts`` are kept current by triggers on ``todos`` (see
+``app.models.project_stats``). Reading stats for any number of projects is
+one query over those small tables; the overdue count is the sum of the
+histogram below ``today``.
+
+``rebuild_project_stats`` recomputes both tables from ``todos``, to repair
+drift (see scripts/rebuild_project_stats.py).
+
+Example:
+    rows = await get_project_stats_rows(db, [project.id], today)
+    await rebuild_project_stats(db)
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+from sqlalchemy import Row, case, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project_stats import ProjectDueCount, ProjectStatsSummary
+from app.models.todo import Status, Todo
+
+_OPEN_STATUSES = [Status.pending, Status.in_progress]
+
+
+def _status_count(status: Status):
+    return func.sum(case((Todo.status == status, 1), else_=0))
+
+
+async def get_project_stats_rows(
+    db: AsyncSession, project_ids: list[int], today: date
+) -> Sequence[Row]:
+    """Return the stats row of each project that has counted tasks.
+
+    Rows have the ``ProjectStatsSummary`` columns plus ``overdue_tasks``.
+    """
+    overdue = (
+        select(func.coalesce(func.sum(ProjectDueCount.open_tasks), 0))
+        .where(
+            ProjectDueCount.project_id == ProjectStatsSummary.project_id,
+            ProjectDueCount.due_date < today,
+        )
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(
+            ProjectStatsSummary.project_id,
+            ProjectStatsSummary.total_tasks,
+            ProjectStatsSummary.completed_tasks,
+            ProjectStatsSummary.pending_tasks,
+            ProjectStatsSummary.in_progress_tasks,
+            ProjectStatsSummary.cancelled_tasks,
+            ProjectStatsSummary.total_estimated_hours,
+            ProjectStatsSummary.total_actual_hours,
+            overdue.label("overdue_tasks"),
+        ).where(ProjectStatsSummary.project_id.in_(project_ids))
+    )
+    return result.all()
+
+
+async def rebuild_project_stats(
+    db: AsyncSession, project_ids: list[int] | None = None
+) -> None:
+    """Recompute the stats tables from ``todos``.
+
+    Takes a SHARE lock on ``todos`` for the rest of the transaction, so no
+    todo write can interleave with the rebuild.
+
+    Args:
+        db: Database session (not committed)
+        project_ids: Projects to rebuild; all projects if None
+    """
+    counted = [
+        Todo.project_id.is_not(None),
+        Todo.parent_id.is_(None),
+        Todo.deleted_at.is_(None),
+    ]
+    stats_delete = delete(ProjectStatsSummary)
+    due_delete = delete(ProjectDueCount)
+    if project_ids is not None:
+        counted.append(Todo.project_id.in_(project_ids))
+        stats_delete = stats_delete.where(
+            ProjectStatsSummary.project_id.in_(project_ids)
+        )
+        due_delete = due_delete.where(ProjectDueCount.project_id.in_(project_ids))
+
+    await db.execute(text("LOCK TABLE todos IN SHARE MODE"))
+    await db.execute(stats_delete)
+    await db.execute(due_delete)
+    await db.execute(
+        insert(ProjectStatsSummary).from_select(
+            [
+                "project_id",
+                "total_tasks",
+                "completed_tasks",
+                "pending_tasks",
+                "in_progress_tasks",
+                "cancelled_tasks",
+                "total_estimated_hours",
+                "total_actual_hours",
+            ],
+            select(
+                Todo.project_id,
+                func.count(Todo.id),
+                _status_count(Status.completed),
+                _status_count(Status.pending),
+                _status_count(Status.in_progress),
+                _status_count(Status.cancelled),
+                func.coalesce(func.sum(Todo.estimated_hours), 0),
+                func.coalesce(func.sum(Todo.actual_hours), 0),
+            )
+            .where(*counted)
+            .group_by(Todo.project_id),
+        )
+    )
+    await db.execute(
+        insert(ProjectDueCount).from_select(
+            ["project_id", "due_date", "open_tasks"],
+            select(Todo.project_id, Todo.due_date, func.count(Todo.id))
+            .where(
+                *counted,
+                Todo.due_date.is_not(None),
+                Todo.status.in_(_OPEN_STATUSES),
+            )
+            .group_by(Todo.project_id, Todo.due_date),
+        )
+    )
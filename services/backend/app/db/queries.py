@@ -9,7 +9,7 @@ simple Protocol definitions. Type safety is ensured at runtime via
 `hasattr` checks. All models must have `id` and `user_id` columns.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from typing import Any
 
 from sqlalchemy import func as sql_func
@@ -209,6 +209,35 @@ async def get_project_info(
     return (row.name, row.color) if row else (None, None)
 
 
+async def get_projects_info(
+    db: AsyncSession,
+    project_ids: Collection[int],
+    user_id: int,
+) -> dict[int, tuple[str, str | None]]:
+    """Get name and color for many projects at once, with authorization check.
+
+    Batch form of ``get_project_info`` for building lists of todos.
+
+    Args:
+        db: Database session
+        project_ids: Project IDs to look up
+        user_id: User ID for authorization check
+
+    Returns:
+        Dictionary mapping project ID to (project_name, project_color). IDs
+        that don't exist or belong to another user are omitted.
+    """
+    if not project_ids:
+        return {}
+    result = await db.execute(
+        select(Project.id, Project.name, Project.color).where(
+            Project.id.in_(list(project_ids)),
+            Project.user_id == user_id,
+        )
+    )
+    return {row.id: (row.name, row.color) for row in result}
+
+
 async def get_resources_for_user(
     db: AsyncSession,
     model: Any,
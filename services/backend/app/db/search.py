@@ -0,0 +1,81 @@
+"""Full-text search helpers.
+
+Todos, wiki pages, snippets and articles each have a stored, GIN-indexed
+``search_vector`` column generated by PostgreSQL from their text fields, so
+searches are index lookups whose cost grows with the number of matches rather
+than the size of the table. Fields are weighted (title ``A``, body ``B``,
+secondary fields ``C``) so ``ts_rank`` prefers title matches.
+
+Example:
+    tsquery = to_tsquery(q)
+    query = (
+        select(WikiPage.id, headline(WikiPage.content, tsquery).label("snippet"))
+        .where(matches(WikiPage.search_vector, tsquery))
+        .order_by(rank(WikiPage.search_vector, tsquery).desc())
+    )
+"""
+
+import re
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+SEARCH_CONFIG = "english"
+
+# ts_headline options: plain-text fragments (no <b> markers) of roughly the
+# same length as a couple of lines of context around the first match.
+HEADLINE_OPTIONS = 'StartSel="", StopSel="", MaxWords=30, MinWords=12'
+
+# Runs of letters and digits; everything else (including tsquery operators)
+# separates terms.
+_TERM_RE = re.compile(r"[^\W_]+")
+
+
+def weighted_tsvector(*fields: tuple[str, str]) -> str:
+    """Build the SQL for a generated ``search_vector`` column.
+
+    Args:
+        fields: ``(column_name, weight)`` pairs, e.g. ``("title", "A")``
+
+    Returns:
+        An immutable SQL expression suitable for ``GENERATED ALWAYS AS``
+    """
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+        f"coalesce({column}, '')), '{weight}')"
+        for column, weight in fields
+    )
+
+
+def to_tsquery(text: str) -> ColumnElement[Any]:
+    """Parse free-form user input into a tsquery (all terms must match).
+
+    The last term is matched as a prefix, so results keep up with
+    search-as-you-type input: ``"release no"`` finds "release notes".
+    """
+    terms = _TERM_RE.findall(text)
+    if not terms:
+        return func.plainto_tsquery(SEARCH_CONFIG, text)
+    terms[-1] += ":*"
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(terms))
+
+
+def matches(vector: Any, tsquery: ColumnElement[Any]) -> ColumnElement[bool]:
+    """``vector @@ tsquery`` -- uses the GIN index on ``vector``."""
+    return vector.bool_op("@@")(tsquery)
+
+
+def rank(vector: Any, tsquery: ColumnElement[Any]) -> ColumnElement[float]:
+    """Relevance of a row for ``tsquery``; higher is better."""
+    return func.ts_rank(vector, tsquery)
+
+
+def headline(column: Any, tsquery: ColumnElement[Any]) -> ColumnElement[str]:
+    """A plain-text excerpt of ``column`` around the terms of ``tsquery``."""
+    return func.ts_headline(
+        SEARCH_CONFIG,
+        func.coalesce(column, ""),
+        tsquery,
+        HEADLINE_OPTIONS,
+    )
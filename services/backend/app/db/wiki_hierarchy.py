@@ -0,0 +1,149 @@
+"""Wiki page hierarchy queries.
+
+Wiki pages form a tree through ``parent_id``. Each helper here answers its
+question with a single recursive CTE rather than walking the tree with one
+query per level, so the cost of an ancestor lookup, a depth check or a
+subtree soft-delete no longer grows in round-trips with the size of the tree.
+
+Soft-deleted pages end a walk, as if the tree stopped there. Every walk also
+carries the path of IDs it has visited and refuses to revisit one, so a
+corrupt ``parent_id`` cycle terminates instead of recursing forever.
+
+Example:
+    chain = await get_ancestors(db, page.id)  # page first, then parent, ...
+    depth = await get_subtree_depth(db, page.id)
+    await soft_delete_subtree(db, page.id)
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import Integer, Row, any_, literal, not_, select, update
+from sqlalchemy import func as sa_func
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.selectable import CTE
+
+from app.models.wiki_page import WikiPage
+
+
+def _ancestors_cte(page_id: int) -> CTE:
+    """Rows for ``page_id`` (level 0) and each live ancestor above it."""
+    anchor = select(
+        WikiPage.id,
+        WikiPage.parent_id,
+        WikiPage.user_id,
+        WikiPage.title,
+        WikiPage.slug,
+        literal(0, Integer).label("level"),
+        array([WikiPage.id]).label("path"),
+    ).where(WikiPage.id == page_id, WikiPage.deleted_at.is_(None))
+    chain = anchor.cte("wiki_ancestors", recursive=True)
+
+    parent = aliased(WikiPage)
+    return chain.union_all(
+        select(
+            parent.id,
+            parent.parent_id,
+            parent.user_id,
+            parent.title,
+            parent.slug,
+            chain.c.level + 1,
+            sa_func.array_append(chain.c.path, parent.id),
+        ).where(
+            parent.id == chain.c.parent_id,
+            parent.deleted_at.is_(None),
+            not_(parent.id == any_(chain.c.path)),
+        )
+    )
+
+
+def _subtree_cte(page_id: int) -> CTE:
+    """Rows for ``page_id`` (level 0) and each live page below it."""
+    anchor = select(
+        WikiPage.id,
+        literal(0, Integer).label("level"),
+        array([WikiPage.id]).label("path"),
+    ).where(WikiPage.id == page_id)
+    subtree = anchor.cte("wiki_subtree", recursive=True)
+
+    child = aliased(WikiPage)
+    return subtree.union_all(
+        select(
+            child.id,
+            subtree.c.level + 1,
+            sa_func.array_append(subtree.c.path, child.id),
+        ).where(
+            child.parent_id == subtree.c.id,
+            child.deleted_at.is_(None),
+            not_(child.id == any_(subtree.c.path)),
+        )
+    )
+
+
+async def get_ancestors(db: AsyncSession, page_id: int) -> Sequence[Row]:
+    """Return a live page and its live ancestors, nearest first.
+
+    The first row is the page itself (``level`` 0), followed by its parent
+    (``level`` 1) and so on up to the root, or up to the first soft-deleted
+    ancestor. Rows have ``id``, ``parent_id``, ``user_id``, ``title``,
+    ``slug`` and ``level``. Returns an empty list if the page does not exist
+    or is soft-deleted.
+
+    The last row's ``parent_id`` is ``None`` at a root, points at a
+    soft-deleted page, or (only for corrupt data) points back into the chain.
+    """
+    chain = _ancestors_cte(page_id)
+    result = await db.execute(
+        select(
+            chain.c.id,
+            chain.c.parent_id,
+            chain.c.user_id,
+            chain.c.title,
+            chain.c.slug,
+            chain.c.level,
+        ).order_by(chain.c.level)
+    )
+    return result.all()
+
+
+async def get_subtree_depth(db: AsyncSession, page_id: int) -> int:
+    """Return the number of levels of live descendants below ``page_id``.
+
+    A leaf page has depth 0, a page with children but no grandchildren 1.
+    """
+    subtree = _subtree_cte(page_id)
+    depth = await db.scalar(select(sa_func.coalesce(sa_func.max(subtree.c.level), 0)))
+    return int(depth or 0)
+
+
+async def soft_delete_subtree(db: AsyncSession, page_id: int) -> int:
+    """Soft-delete ``page_id`` and all its live descendants in one UPDATE.
+
+    Pages of the subtree already loaded in ``db`` get the new ``deleted_at``
+    too.
+
+    Returns:
+        Number of pages soft-deleted
+    """
+    subtree = _subtree_cte(page_id)
+    deleted_at = datetime.now(UTC)
+    result = await db.scalars(
+        update(WikiPage)
+        .where(
+            WikiPage.id.in_(select(subtree.c.id)),
+            WikiPage.deleted_at.is_(None),
+        )
+        .values(deleted_at=deleted_at)
+        .returning(WikiPage.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_ids = result.all()
+    for deleted_id in deleted_ids:
+        page = db.identity_map.get(identity_key(WikiPage, deleted_id))
+        if page is not None:
+            set_committed_value(page, "deleted_at", deleted_at)
+    return len(deleted_ids)
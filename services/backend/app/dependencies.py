@@ -11,9 +11,11 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.auth_cache import auth_cache
 from app.core.errors import errors
+from app.core.password_hasher import password_hasher
 from app.core.rate_limit import api_key_rate_limiter
-from app.core.security import hash_password, is_api_key, verify_password
+from app.core.security import is_api_key
 from app.core.tab_id import tab_id_var
 from app.db.database import async_session_maker
 from app.models.api_key import ApiKey
@@ -52,6 +54,13 @@ async def get_current_user(
     if not session_id:
         raise errors.auth_required()
 
+    cached = auth_cache.get("session", session_id)
+    if cached is not None:
+        user = await db.get(User, cached.user_id)
+        if not user:
+            raise errors.auth_required()
+        return user
+
     # Query session with user
     result = await db.execute(
         select(Session)
@@ -70,6 +79,7 @@ async def get_current_user(
     if not user:
         raise errors.auth_required()
 
+    auth_cache.put("session", session_id, user.id, expires_at=session.expires_at)
     return user
 
 
@@ -146,8 +156,16 @@ async def get_current_user_oauth(
     db: DbSession,
 ) -> User:
     """Get current authenticated user from OAuth Bearer token."""
-    # Extract and validate token
     token = await _extract_bearer_token(request)
+
+    cached = auth_cache.get("oauth", token)
+    if cached is not None:
+        user = await db.get(User, cached.user_id)
+        if not user or not user.is_active:
+            raise errors.auth_required()
+        return user
+
+    # Validate token
     access_token = await _validate_access_token(db, token)
 
     # Client credentials grants don't have a user_id
@@ -161,6 +179,7 @@ async def get_current_user_oauth(
     if not user or not user.is_active:
         raise errors.auth_required()
 
+    auth_cache.put("oauth", token, user.id, expires_at=access_token.expires_at)
     return user
 
 
@@ -231,14 +250,14 @@ async def _validate_api_key(
     # Always perform at least one bcrypt verification to prevent timing attacks
     # This ensures consistent response time regardless of whether prefix exists
     if not api_keys:
-        # Dummy hash to maintain constant timing
-        hash_password("dummy_timing_normalization_value")
+        # Dummy verification to maintain constant timing
+        await password_hasher.dummy_verify()
         await api_key_rate_limiter.record(rate_limit_key, db)
         raise errors.invalid_token()
 
     # Check each candidate with bcrypt verification
     for api_key in api_keys:
-        if verify_password(key, api_key.key_hash):
+        if await password_hasher.verify(key, api_key.key_hash):
             # Check expiration
             if api_key.expires_at and api_key.expires_at < datetime.now(UTC):
                 await api_key_rate_limiter.record(rate_limit_key, db)
@@ -312,6 +331,33 @@ def _get_client_ip(request: Request) -> str | None:
     return None
 
 
+async def _authenticate_api_key(db: DbSession, key: str, client_ip: str | None) -> User:
+    """Resolve an API key to its user, using the auth cache when possible.
+
+    Cache hits skip rate limiting, the prefix lookup and bcrypt verification;
+    their last_used_at update is batched instead of committed per request.
+    """
+    cached = auth_cache.get("api_key", key)
+    if cached is not None:
+        user = await db.get(User, cached.user_id)
+        if not user:
+            raise errors.auth_required()
+        if cached.api_key_id is not None:
+            auth_cache.record_api_key_use(cached.api_key_id)
+        return user
+
+    api_key = await _validate_api_key(db, key, client_ip)
+    result = await db.execute(select(User).where(User.id == api_key.user_id))
+    user = result.scalar_one_or_none()
+    if not user:
+        raise errors.auth_required()
+
+    auth_cache.put(
+        "api_key", key, user.id, expires_at=api_key.expires_at, api_key_id=api_key.id
+    )
+    return user
+
+
 async def get_current_user_api_key(
     request: Request,
     db: DbSession,
@@ -322,24 +368,14 @@ async def get_current_user_api_key(
     # Check X-API-Key header
     api_key_header = request.headers.get("X-API-Key")
     if api_key_header and is_api_key(api_key_header):
-        api_key = await _validate_api_key(db, api_key_header, client_ip)
-        result = await db.execute(select(User).where(User.id == api_key.user_id))
-        user = result.scalar_one_or_none()
-        if not user:
-            raise errors.auth_required()
-        return user
+        return await _authenticate_api_key(db, api_key_header, client_ip)
 
     # Check Authorization: Bearer header for API key
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header.replace("Bearer ", "")
         if is_api_key(token):
-            api_key = await _validate_api_key(db, token, client_ip)
-            result = await db.execute(select(User).where(User.id == api_key.user_id))
-            user = result.scalar_one_or_none()
-            if not user:
-                raise errors.auth_required()
-            return user
+            return await _authenticate_api_key(db, token, client_ip)
 
     raise errors.auth_required()
 
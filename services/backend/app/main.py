@@ -39,13 +39,16 @@ from app.api import (
 )
 from app.api.oauth import authorize, clients, device, github, token
 from app.config import settings
+from app.core.auth_cache import auth_cache, flush_api_key_usage
 from app.core.csrf import CSRFMiddleware
+from app.core.password_hasher import password_hasher
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.core.tab_id import TabIdMiddleware
 from app.db.database import init_db
 from app.dependencies import get_db
 from app.services.event_bus import event_bus
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.thumbnails import thumbnail_service
 
 
 @asynccontextmanager
@@ -55,10 +58,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Ensure upload directory exists
     settings.upload_path.mkdir(parents=True, exist_ok=True)
     start_scheduler()
+    event_bus.add_auth_listener(auth_cache.invalidate_user)
     await event_bus.start()
     yield
     await event_bus.stop()
     stop_scheduler()
+    await flush_api_key_usage()
+    password_hasher.shutdown()
+    thumbnail_service.shutdown()
 
 
 app = FastAPI(
@@ -10,6 +10,7 @@ from app.models.notification import Notification, NotificationType, WikiPageSubs
 from app.models.oauth import AccessToken, AuthorizationCode, DeviceCode, OAuthClient
 from app.models.oauth_provider import UserOAuthProvider
 from app.models.project import Project
+from app.models.project_stats import ProjectDueCount, ProjectStatsSummary
 from app.models.recurring_task import Frequency, RecurringTask
 from app.models.registration_code import RegistrationCode
 from app.models.session import Session
@@ -30,6 +31,8 @@ __all__ = [
     "Status",
     "TimeHorizon",
     "Project",
+    "ProjectStatsSummary",
+    "ProjectDueCount",
     "OAuthClient",
     "AuthorizationCode",
     "AccessToken",
@@ -5,11 +5,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.search import weighted_tsvector
 
 if TYPE_CHECKING:
     from app.models.article_interaction import ArticleInteraction
@@ -20,6 +21,9 @@ class Article(Base):
     """News article model."""
 
     __tablename__ = "articles"
+    __table_args__ = (
+        Index("ix_articles_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     feed_source_id: Mapped[int] = mapped_column(
@@ -30,12 +34,19 @@ class Article(Base):
     summary: Mapped[str | None] = mapped_column(Text)
     content: Mapped[str | None] = mapped_column(Text)
     ai_summary: Mapped[str | None] = mapped_column(Text)
+    # sha256 of the normalized summarization input; syndicated copies share it
+    content_hash: Mapped[str | None] = mapped_column(String(64), index=True)
     author: Mapped[str | None] = mapped_column(String(1000))
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     keywords: Mapped[list] = mapped_column(JSONB, default=list)
     fetched_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(weighted_tsvector(("title", "A"), ("summary", "B")), persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     feed_source: Mapped[FeedSource] = relationship(
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
@@ -36,7 +37,13 @@ class FeedSource(Base):
     is_featured: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     fetch_interval_hours: Mapped[int] = mapped_column(Integer, default=6)
     last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # Validators from the last successful fetch, sent back as If-None-Match /
+    # If-Modified-Since so unchanged feeds answer 304 without a body
+    etag: Mapped[str | None] = mapped_column(String(500))
+    last_modified: Mapped[str | None] = mapped_column(String(100))
     quality_score: Mapped[float] = mapped_column(default=1.0)
+    # Keywords an entry must match to be stored; NULL uses SECURITY_KEYWORDS
+    keywords: Mapped[list[str] | None] = mapped_column(JSONB)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -0,0 +1,174 @@
+"""Materialised per-project todo statistics.
+
+``project_stats`` holds one row of counters per project and
+``project_due_counts`` a histogram of open (pending or in progress) tasks by
+due date. Both count only live top-level todos and are maintained by
+triggers on ``todos``, so every write path (ORM, bulk inserts, raw SQL) keeps
+them current. The overdue count for any day is the sum of the histogram
+below that day, so it stays correct as days pass without rescanning todos.
+
+The trigger DDL is attached to the metadata so ``create_all`` (tests,
+``init_db``) installs it too; migration 0042 installs it in production.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import DDL, Date, ForeignKey, Integer, Numeric, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class ProjectStatsSummary(Base):
+    """Task counters for one project."""
+
+    __tablename__ = "project_stats"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    total_tasks: Mapped[int] = mapped_column(Integer, default=0)
+    completed_tasks: Mapped[int] = mapped_column(Integer, default=0)
+    pending_tasks: Mapped[int] = mapped_column(Integer, default=0)
+    in_progress_tasks: Mapped[int] = mapped_column(Integer, default=0)
+    cancelled_tasks: Mapped[int] = mapped_column(Integer, default=0)
+    total_estimated_hours: Mapped[Decimal] = mapped_column(Numeric, default=0)
+    total_actual_hours: Mapped[Decimal] = mapped_column(Numeric, default=0)
+
+
+class ProjectDueCount(Base):
+    """Number of open tasks in a project due on one date."""
+
+    __tablename__ = "project_due_counts"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    due_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    open_tasks: Mapped[int] = mapped_column(Integer, default=0)
+
+
+# Adds p_sign times one todo to its project's counters. Rows are only written
+# for projects that still exist: when a project is deleted, its todos'
+# project_id is set to NULL after the project row (and its counters) are gone.
+PROJECT_STATS_APPLY_SQL = """
+CREATE OR REPLACE FUNCTION project_stats_apply(
+    p_project_id integer,
+    p_status text,
+    p_due_date date,
+    p_estimated_hours numeric,
+    p_actual_hours numeric,
+    p_sign integer
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO project_stats AS s (
+        project_id, total_tasks, completed_tasks, pending_tasks,
+        in_progress_tasks, cancelled_tasks, total_estimated_hours,
+        total_actual_hours
+    )
+    SELECT
+        p.id,
+        p_sign,
+        CASE WHEN p_status = 'completed' THEN p_sign ELSE 0 END,
+        CASE WHEN p_status = 'pending' THEN p_sign ELSE 0 END,
+        CASE WHEN p_status = 'in_progress' THEN p_sign ELSE 0 END,
+        CASE WHEN p_status = 'cancelled' THEN p_sign ELSE 0 END,
+        coalesce(p_estimated_hours, 0) * p_sign,
+        coalesce(p_actual_hours, 0) * p_sign
+    FROM projects p
+    WHERE p.id = p_project_id
+    ON CONFLICT (project_id) DO UPDATE SET
+        total_tasks = s.total_tasks + EXCLUDED.total_tasks,
+        completed_tasks = s.completed_tasks + EXCLUDED.completed_tasks,
+        pending_tasks = s.pending_tasks + EXCLUDED.pending_tasks,
+        in_progress_tasks = s.in_progress_tasks + EXCLUDED.in_progress_tasks,
+        cancelled_tasks = s.cancelled_tasks + EXCLUDED.cancelled_tasks,
+        total_estimated_hours =
+            s.total_estimated_hours + EXCLUDED.total_estimated_hours,
+        total_actual_hours = s.total_actual_hours + EXCLUDED.total_actual_hours;
+
+    IF p_due_date IS NOT NULL AND p_status IN ('pending', 'in_progress') THEN
+        INSERT INTO project_due_counts AS d (project_id, due_date, open_tasks)
+        SELECT p.id, p_due_date, p_sign
+        FROM projects p
+        WHERE p.id = p_project_id
+        ON CONFLICT (project_id, due_date) DO UPDATE SET
+            open_tasks = d.open_tasks + EXCLUDED.open_tasks;
+
+        IF p_sign < 0 THEN
+            DELETE FROM project_due_counts
+            WHERE project_id = p_project_id
+              AND due_date = p_due_date
+              AND open_tasks <= 0;
+        END IF;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TODOS_PROJECT_STATS_SQL = """
+CREATE OR REPLACE FUNCTION todos_project_stats() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT'
+        AND OLD.project_id IS NOT NULL
+        AND OLD.parent_id IS NULL
+        AND OLD.deleted_at IS NULL
+    THEN
+        PERFORM project_stats_apply(
+            OLD.project_id, OLD.status, OLD.due_date,
+            OLD.estimated_hours, OLD.actual_hours, -1
+        );
+    END IF;
+    IF TG_OP <> 'DELETE'
+        AND NEW.project_id IS NOT NULL
+        AND NEW.parent_id IS NULL
+        AND NEW.deleted_at IS NULL
+    THEN
+        PERFORM project_stats_apply(
+            NEW.project_id, NEW.status, NEW.due_date,
+            NEW.estimated_hours, NEW.actual_hours, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Updates that don't touch a counted column (reordering, renaming, ...) skip
+# the trigger function entirely.
+PROJECT_STATS_TRIGGER_SQL = [
+    "DROP TRIGGER IF EXISTS todos_project_stats_insert_delete ON todos",
+    """
+    CREATE TRIGGER todos_project_stats_insert_delete
+    AFTER INSERT OR DELETE ON todos
+    FOR EACH ROW EXECUTE FUNCTION todos_project_stats()
+    """,
+    "DROP TRIGGER IF EXISTS todos_project_stats_update ON todos",
+    """
+    CREATE TRIGGER todos_project_stats_update
+    AFTER UPDATE ON todos
+    FOR EACH ROW
+    WHEN (
+        OLD.project_id IS DISTINCT FROM NEW.project_id
+        OR OLD.parent_id IS DISTINCT FROM NEW.parent_id
+        OR (OLD.deleted_at IS NULL) <> (NEW.deleted_at IS NULL)
+        OR OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.due_date IS DISTINCT FROM NEW.due_date
+        OR OLD.estimated_hours IS DISTINCT FROM NEW.estimated_hours
+        OR OLD.actual_hours IS DISTINCT FROM NEW.actual_hours
+    )
+    EXECUTE FUNCTION todos_project_stats()
+    """,
+]
+
+for _statement in [
+    PROJECT_STATS_APPLY_SQL,
+    TODOS_PROJECT_STATS_SQL,
+    *PROJECT_STATS_TRIGGER_SQL,
+]:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
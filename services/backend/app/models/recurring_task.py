@@ -11,11 +11,13 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -41,6 +43,15 @@ class RecurringTask(Base):
     """Recurring task template for generating todos on a schedule."""
 
     __tablename__ = "recurring_tasks"
+    __table_args__ = (
+        # Due-template scan of the materialisation job (app/services/recurrence.py)
+        Index(
+            "ix_recurring_tasks_due",
+            "next_due_date",
+            "id",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -5,11 +5,21 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.search import weighted_tsvector
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -19,6 +29,9 @@ class Snippet(Base):
     """Snippet model for quick, dated log entries."""
 
     __tablename__ = "snippets"
+    __table_args__ = (
+        Index("ix_snippets_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -36,6 +49,14 @@ class Snippet(Base):
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), default=None
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            weighted_tsvector(("title", "A"), ("content", "B"), ("category", "C")),
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Relationships
     user: Mapped[User] = relationship("User", back_populates="snippets")
@@ -10,9 +10,11 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     Column,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -20,10 +22,11 @@ from sqlalchemy import (
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.search import weighted_tsvector
 from app.models.wiki_page import todo_wiki_links
 
 # Association table for task dependencies (many-to-many self-referential)
@@ -172,6 +175,7 @@ class Todo(Base):
             "autonomy_tier IS NULL OR (autonomy_tier >= 1 AND autonomy_tier <= 4)",
             name="ck_todos_autonomy_tier_range",
         ),
+        Index("ix_todos_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -213,6 +217,13 @@ class Todo(Base):
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            weighted_tsvector(("title", "A"), ("description", "B")), persisted=True
+        ),
+        deferred=True,
+    )
 
     # Agent integration fields
     agent_actionable: Mapped[bool | None] = mapped_column(
@@ -7,19 +7,23 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     Column,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Table,
     Text,
     UniqueConstraint,
     func,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
+from app.db.search import weighted_tsvector
 
 if TYPE_CHECKING:
     from app.models.todo import Todo
@@ -53,6 +57,7 @@ class WikiPage(Base):
     __tablename__ = "wiki_pages"
     __table_args__ = (
         UniqueConstraint("user_id", "slug", name="uq_wiki_page_user_slug"),
+        Index("ix_wiki_pages_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -74,6 +79,11 @@ class WikiPage(Base):
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), default=None
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(weighted_tsvector(("title", "A"), ("content", "B")), persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     user: Mapped[User] = relationship("User", back_populates="wiki_pages")
@@ -101,9 +111,17 @@ class WikiPage(Base):
 
 
 class WikiPageRevision(Base):
-    """Snapshot of a wiki page at a specific revision."""
+    """Snapshot of a wiki page at a specific revision.
+
+    The content is stored in ``payload``, either in full or as a reverse
+    delta against the next revision (see app.services.wiki_revisions).
+    Rows written before delta storage keep their text in ``content``.
+    """
 
     __tablename__ = "wiki_page_revisions"
+    __table_args__ = (
+        Index("ix_wiki_page_revisions_page_number", "wiki_page_id", "revision_number"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     wiki_page_id: Mapped[int] = mapped_column(
@@ -112,7 +130,14 @@ class WikiPageRevision(Base):
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(500))
     slug: Mapped[str] = mapped_column(String(500))
-    content: Mapped[str] = mapped_column(Text)
+    content: Mapped[str | None] = mapped_column(Text, default=None)
+    storage_format: Mapped[str] = mapped_column(
+        String(8), default="full", server_default="full"
+    )
+    compression: Mapped[str] = mapped_column(
+        String(8), default="none", server_default="none"
+    )
+    payload: Mapped[bytes | None] = mapped_column(LargeBinary, default=None)
     revision_number: Mapped[int] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
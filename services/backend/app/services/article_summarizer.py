@@ -1,8 +1,24 @@
-"""AI-powered article summarization service using Anthropic API."""
+"""AI-powered article summarization service using Anthropic API.
 
+The batch job summarizes pending articles on a small worker pool. Requests
+share one client, are paced by a token bucket (``ai_summary_requests_per_
+minute``), and transient API errors are retried with exponential backoff.
+Each summary is committed as soon as it arrives, so a crash mid-batch keeps
+the work already done.
+
+Articles are keyed by a hash of their normalized source text, so syndicated
+copies of the same story (same text under different URLs) are summarized
+once and share the result, including with copies summarized in earlier runs.
+"""
+
+import asyncio
+import hashlib
 import logging
+import random
+from functools import lru_cache
 
 import anthropic
+from anthropic import APIConnectionError, APIStatusError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +30,14 @@ logger = logging.getLogger(__name__)
 
 MAX_SOURCE_CHARS = 4000
 
+# Backoff for retryable API errors: RETRY_BASE_DELAY * 2**attempt seconds,
+# capped at RETRY_MAX_DELAY, with jitter
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits, overload
+_RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
 SYSTEM_PROMPT = (
     "You are a technical article summarizer. Given an article's title, summary, "
     "and/or content, produce a concise 2-3 sentence summary that captures the key "
@@ -37,12 +61,69 @@ def _build_source_text(
     return text
 
 
-async def _generate_summary(
-    client: anthropic.AsyncAnthropic, article: Article
-) -> str | None:
-    """Generate an AI summary for a single article."""
-    source_text = _build_source_text(article.title, article.summary, article.content)
+def content_hash(source_text: str) -> str:
+    """Hash of the source text, ignoring case and whitespace differences."""
+    normalized = " ".join(source_text.lower().split())
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second.
+    ``acquire()`` takes one token, waiting for a refill when empty.
+    """
 
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(
+                        self.capacity, self._tokens + elapsed * self.rate
+                    )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str, base_url: str | None) -> anthropic.AsyncAnthropic:
+    """Shared client (and connection pool) for the configured endpoint.
+
+    SDK retries are disabled; ``_summarize_with_retry`` retries instead so
+    that every attempt goes through the rate limiter.
+    """
+    return anthropic.AsyncAnthropic(api_key=api_key, base_url=base_url, max_retries=0)
+
+
+def _client() -> anthropic.AsyncAnthropic:
+    return _get_client(settings.anthropic_api_key, settings.ai_summary_base_url or None)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, APIConnectionError):  # includes timeouts
+        return True
+    if isinstance(exc, APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUSES or exc.status_code >= 500
+    return False
+
+
+async def _request_summary(
+    client: anthropic.AsyncAnthropic, source_text: str
+) -> str | None:
+    """Ask the model for a summary of ``source_text``."""
     response = await client.messages.create(
         model=settings.ai_summary_model,
         max_tokens=256,
@@ -55,6 +136,38 @@ async def _generate_summary(
     return None
 
 
+async def _summarize_with_retry(
+    client: anthropic.AsyncAnthropic,
+    source_text: str,
+    rate_limiter: TokenBucket | None = None,
+) -> str | None:
+    """``_request_summary`` with exponential backoff on transient errors."""
+    attempt = 0
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        try:
+            return await _request_summary(client, source_text)
+        except Exception as exc:
+            if attempt >= settings.ai_summary_max_retries or not _is_retryable(exc):
+                raise
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+            delay *= random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.warning(
+                "Summary request failed (%s), retry %d in %.1fs", exc, attempt, delay
+            )
+            await asyncio.sleep(delay)
+
+
+async def _generate_summary(
+    client: anthropic.AsyncAnthropic, article: Article
+) -> str | None:
+    """Generate an AI summary for a single article."""
+    source_text = _build_source_text(article.title, article.summary, article.content)
+    return await _summarize_with_retry(client, source_text)
+
+
 async def generate_single_summary(db: AsyncSession, article: Article) -> str | None:
     """Generate an AI summary for a single article.
 
@@ -64,18 +177,32 @@ async def generate_single_summary(db: AsyncSession, article: Article) -> str | N
     if not settings.anthropic_api_key:
         return None
 
-    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
-    summary = await _generate_summary(client, article)
+    summary = await _generate_summary(_client(), article)
     if summary:
         article.ai_summary = summary
+        article.content_hash = content_hash(
+            _build_source_text(article.title, article.summary, article.content)
+        )
         await db.commit()
     return summary
 
 
+async def _cached_summaries(db: AsyncSession, hashes: list[str]) -> dict[str, str]:
+    """Existing summaries of articles with any of the given content hashes."""
+    result = await db.execute(
+        select(Article.content_hash, Article.ai_summary).where(
+            Article.content_hash.in_(hashes),
+            Article.ai_summary.is_not(None),
+        )
+    )
+    return {row.content_hash: row.ai_summary for row in result}
+
+
 async def generate_article_summaries_with_session(db: AsyncSession) -> int:
     """Generate AI summaries for articles that don't have one yet.
 
-    Returns the number of articles summarized.
+    Returns the number of articles summarized (including those that reused
+    the summary of a duplicate).
     """
     if not settings.anthropic_api_key:
         logger.debug("ANTHROPIC_API_KEY not set, skipping article summarization")
@@ -94,21 +221,69 @@ async def generate_article_summaries_with_session(db: AsyncSession) -> int:
         logger.debug("No articles need summarization")
         return 0
 
-    logger.info("Generating AI summaries for %d articles", len(articles))
-    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    # Group duplicates by content hash; each group needs one model call
+    groups: dict[str, list[Article]] = {}
+    sources: dict[str, str] = {}
+    for article in articles:
+        source_text = _build_source_text(
+            article.title, article.summary, article.content
+        )
+        digest = content_hash(source_text)
+        article.content_hash = digest
+        groups.setdefault(digest, []).append(article)
+        sources.setdefault(digest, source_text)
+
     count = 0
+    for digest, summary in (await _cached_summaries(db, list(groups))).items():
+        for article in groups.pop(digest):
+            article.ai_summary = summary
+            count += 1
+    await db.commit()
 
-    for article in articles:
-        try:
-            summary = await _generate_summary(client, article)
-            if summary:
+    if not groups:
+        logger.info("Reused %d AI summaries", count)
+        return count
+
+    logger.info(
+        "Generating AI summaries for %d articles (%d unique)",
+        len(articles) - count,
+        len(groups),
+    )
+    client = _client()
+    rate_limiter = TokenBucket(
+        rate=settings.ai_summary_requests_per_minute / 60,
+        capacity=settings.ai_summary_concurrency,
+    )
+    workers = asyncio.Semaphore(settings.ai_summary_concurrency)
+
+    async def summarize(digest: str) -> tuple[str, str | None]:
+        async with workers:
+            try:
+                summary = await _summarize_with_retry(
+                    client, sources[digest], rate_limiter
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to generate summary for article %d", groups[digest][0].id
+                )
+                summary = None
+            return digest, summary
+
+    tasks = [asyncio.create_task(summarize(digest)) for digest in groups]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            digest, summary = await next_done
+            if not summary:
+                continue
+            for article in groups[digest]:
                 article.ai_summary = summary
                 count += 1
-        except Exception:
-            logger.exception("Failed to generate summary for article %d", article.id)
+            await db.commit()
+    finally:
+        for task in tasks:
+            task.cancel()
 
     if count > 0:
-        await db.commit()
         logger.info("Generated %d AI summaries", count)
 
     return count
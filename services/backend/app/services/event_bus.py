@@ -1,19 +1,45 @@
 """Real-time event bus using PostgreSQL LISTEN/NOTIFY.
 
 Opens a dedicated asyncpg connection (separate from SQLAlchemy's pool) and
-dispatches row-change events to per-user asyncio.Queue subscribers.
+dispatches row-change events to per-user :class:`Subscription` buffers.
+
+NOTIFY payloads are collected as they arrive and decoded and fanned out once
+per event loop tick, so a burst of notifications costs one dispatch pass.
+Each subscription coalesces pending events by ``(table, id)`` -- if a row
+changes several times while a client is behind, only its latest event is
+kept. A subscription that still falls more than ``SUBSCRIBER_MAX_PENDING``
+distinct rows behind discards its backlog and yields a :class:`Resync` marker
+so the client reloads, instead of silently missing changes.
+
+Each event carries a global sequence number (``seq``, from the ``event_seq``
+database sequence) that SSE clients use as their Last-Event-ID. A
+:class:`ReplayBuffer` keeps the most recent events per user so a reconnecting
+client -- on this worker or, after a deploy, a new one -- can be sent just the
+events it missed; only when those are no longer available does it resync.
+Replay follows arrival order, not sequence order (see :class:`ReplayBuffer`),
+and needs the event the client last saw to have arrived while this worker's
+bus was listening: a client whose last event predates that (a worker that
+just started, or a bus that just reconnected) resyncs.
 
 On connection loss the bus automatically reconnects with exponential backoff
 and sends a sentinel to all subscribers so SSE clients reconnect.
+
+Payloads flagged with ``"auth": true`` (emitted when a session, OAuth token or
+API key is revoked, or a user is deactivated) are never forwarded to SSE
+subscribers; they are passed to auth listeners such as the auth cache.
 """
 
 import asyncio
 import contextlib
 import json
 import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import asyncpg
+from prometheus_client import Counter, Gauge, Histogram
 
 from app.config import settings
 
@@ -22,6 +48,40 @@ logger = logging.getLogger(__name__)
 _RECONNECT_BASE = 1.0  # seconds
 _RECONNECT_MAX = 30.0
 
+# Maximum distinct rows a subscription may have pending before it resyncs
+SUBSCRIBER_MAX_PENDING = 256
+
+EVENT_BUS_SUBSCRIBERS = Gauge(
+    "event_bus_subscribers",
+    "Active event stream subscriptions",
+)
+EVENT_BUS_FANOUT_SECONDS = Histogram(
+    "event_bus_fanout_seconds",
+    "Time from the first NOTIFY of a batch arriving to its dispatch completing",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+EVENT_BUS_BATCH_SIZE = Histogram(
+    "event_bus_batch_size",
+    "NOTIFY payloads dispatched per event loop tick",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+EVENT_BUS_QUEUE_HIGH_WATER = Gauge(
+    "event_bus_queue_high_water",
+    "Largest number of pending events seen in any single subscription",
+)
+EVENT_BUS_COALESCED = Counter(
+    "event_bus_coalesced_total",
+    "Events merged into an already-pending event for the same row",
+)
+EVENT_BUS_DROPPED = Counter(
+    "event_bus_dropped_total",
+    "Pending events discarded because a subscription fell too far behind",
+)
+EVENT_BUS_RESYNCS = Counter(
+    "event_bus_resyncs_total",
+    "Resync markers issued to subscriptions that fell too far behind",
+)
+
 
 @dataclass(frozen=True, slots=True)
 class Event:
@@ -32,6 +92,194 @@ class Event:
     id: int  # row PK
     user_id: int  # owner
     tab_id: str  # originating browser tab
+    seq: int = 0  # global sequence number (0 if the payload has none)
+
+
+@dataclass(frozen=True, slots=True)
+class Resync:
+    """Marker telling a subscriber it fell behind and must reload its data."""
+
+    dropped: int  # number of pending events that were discarded
+    seq: int = 0  # sequence number the client's data is current as of once reloaded
+
+
+class ReplayBuffer:
+    """Bounded per-user history of recent events for resuming event streams.
+
+    Sequence numbers are drawn when a row changes but NOTIFYs are delivered at
+    commit, so events don't arrive in sequence order. PostgreSQL does deliver
+    them to every listener in the same (commit) order, though, so the buffer
+    numbers events by arrival *position* and resumes a client after the
+    position of the last event it saw, which every worker listening at the
+    time agrees on. The positions of the ``window`` most recent events of any
+    user are kept for that lookup.
+
+    Each user's history is complete after a per-user *floor* position: every
+    later event for the user is still held. The floor starts at the position
+    of the last (re)set and rises as old events are evicted, so ``since`` can
+    tell whether a gap is still fully covered.
+    """
+
+    def __init__(self, size: int, max_users: int, window: int) -> None:
+        self.size = size
+        self.max_users = max_users
+        self.window = window
+        self._positions: OrderedDict[int, int] = OrderedDict()  # seq -> position
+        self._rings: OrderedDict[int, deque[tuple[int, Event]]] = OrderedDict()
+        self._floors: dict[int, int] = {}
+        self._position: int | None = None
+        self._evicted_floor = 0
+
+    def reset(self, available: bool = True) -> None:
+        """Drop all history; if not ``available``, until the next reset."""
+        self._positions.clear()
+        self._rings.clear()
+        self._floors.clear()
+        self._position = 0 if available else None
+        self._evicted_floor = 0
+
+    def append(self, event: Event) -> None:
+        """Record a dispatched event; events must be appended in arrival order."""
+        if self._position is None or not event.seq:
+            return
+        self._position += 1
+        position = self._position
+        self._positions[event.seq] = position
+        if len(self._positions) > self.window:
+            self._positions.popitem(last=False)
+
+        ring = self._rings.get(event.user_id)
+        if ring is None:
+            ring = deque(maxlen=self.size)
+            self._rings[event.user_id] = ring
+            self._floors[event.user_id] = self._evicted_floor
+            if len(self._rings) > self.max_users:
+                # Forget the least recently active user; any user without
+                # history of their own now gets this conservative floor
+                user_id, evicted = self._rings.popitem(last=False)
+                del self._floors[user_id]
+                self._evicted_floor = max(self._evicted_floor, evicted[-1][0])
+        else:
+            self._rings.move_to_end(event.user_id)
+            if len(ring) == ring.maxlen:
+                self._floors[event.user_id] = ring[0][0]
+        ring.append((position, event))
+
+    def _user_floor(self, user_id: int) -> int:
+        return self._floors.get(user_id, self._evicted_floor)
+
+    def since(self, user_id: int, last_seq: int) -> list[Event] | None:
+        """Events for a user that arrived after event ``last_seq``.
+
+        Returns None if that event's position is unknown or some later events
+        for the user are missing.
+        """
+        if self._position is None:
+            return None
+        position = self._positions.get(last_seq)
+        if position is None or position < self._user_floor(user_id):
+            return None
+        return [e for p, e in self._rings.get(user_id, ()) if p > position]
+
+    def latest(self) -> int | None:
+        """A sequence number a client that just loaded its data is current as of.
+
+        This is the last event to arrive, for any user; None if none has
+        arrived since the last reset.
+        """
+        if not self._position:
+            return None
+        return next(reversed(self._positions))
+
+
+class Subscription:
+    """Pending events for one event stream connection.
+
+    Events are coalesced by ``(table, id)`` (last write wins) and delivered in
+    the order their rows were last changed.
+    """
+
+    def __init__(self, user_id: int, maxsize: int = SUBSCRIBER_MAX_PENDING) -> None:
+        self.user_id = user_id
+        self.maxsize = maxsize
+        self.high_water = 0
+        self.dropped = 0  # total events discarded over the subscription's life
+        self._pending: OrderedDict[tuple[str, int], Event] = OrderedDict()
+        self._dropped_since_resync = 0
+        self._resync_seq = 0
+        self._closed = False
+        self._ready = asyncio.Event()
+
+    def offer(self, event: Event) -> None:
+        """Add an event, replacing any pending event for the same row."""
+        if self._closed:
+            return
+        key = (event.table, event.id)
+        if key in self._pending:
+            del self._pending[key]
+            EVENT_BUS_COALESCED.inc()
+        elif len(self._pending) >= self.maxsize:
+            # Too far behind to catch up event by event: the client reloads
+            # everything on Resync, so the backlog (and this event) can go.
+            dropped = len(self._pending) + 1
+            if not self._dropped_since_resync:
+                EVENT_BUS_RESYNCS.inc()
+            self._pending.clear()
+            self._dropped_since_resync += dropped
+            self._resync_seq = event.seq
+            self.dropped += dropped
+            EVENT_BUS_DROPPED.inc(dropped)
+            logger.warning(
+                "User %d subscription fell behind — dropped %d events, resyncing",
+                self.user_id,
+                dropped,
+            )
+            self._ready.set()
+            return
+        self._pending[key] = event
+        self.high_water = max(self.high_water, len(self._pending))
+        self._ready.set()
+
+    def close(self) -> None:
+        """Mark the subscription closed; ``get`` returns None once drained."""
+        self._closed = True
+        self._ready.set()
+
+    def qsize(self) -> int:
+        """Number of pending events."""
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        """True if there is nothing to deliver."""
+        return not (self._pending or self._dropped_since_resync or self._closed)
+
+    def get_nowait(self) -> Event | Resync | None:
+        """Return the next item without waiting.
+
+        Returns a :class:`Resync` first if events were dropped, then pending
+        events, then None once the subscription is closed.
+
+        Raises:
+            asyncio.QueueEmpty: If there is nothing to deliver yet
+        """
+        if self._dropped_since_resync:
+            resync = Resync(dropped=self._dropped_since_resync, seq=self._resync_seq)
+            self._dropped_since_resync = 0
+            return resync
+        if self._pending:
+            return self._pending.popitem(last=False)[1]
+        if self._closed:
+            return None
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> Event | Resync | None:
+        """Wait for and return the next item (see :meth:`get_nowait`)."""
+        while True:
+            try:
+                return self.get_nowait()
+            except asyncio.QueueEmpty:
+                self._ready.clear()
+                await self._ready.wait()
 
 
 class EventBus:
@@ -39,7 +287,16 @@ class EventBus:
 
     def __init__(self) -> None:
         self._conn: asyncpg.Connection | None = None
-        self._subscribers: dict[int, set[asyncio.Queue[Event | None]]] = {}
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._auth_listeners: list[Callable[[int | None], None]] = []
+        self._inbox: list[str] = []
+        self._replay = ReplayBuffer(
+            size=settings.event_replay_buffer_size,
+            max_users=settings.event_replay_max_users,
+            window=settings.event_replay_window,
+        )
+        self._batch_started = 0.0
+        self._high_water = 0
         self._stopping = False
         self._reconnect_task: asyncio.Task[None] | None = None
 
@@ -59,6 +316,8 @@ class EventBus:
         )
         conn.add_termination_listener(self._on_connection_lost)
         await conn.add_listener("events", self._on_notify)
+        # Earlier events may have been missed while not listening
+        self._replay.reset()
         self._conn = conn
         logger.info("EventBus connected — listening on 'events' channel")
 
@@ -93,6 +352,7 @@ class EventBus:
 
         # Send sentinel to all subscribers so SSE generators exit cleanly
         self._send_sentinel_to_all()
+        EVENT_BUS_SUBSCRIBERS.dec(sum(len(subs) for subs in self._subscribers.values()))
         self._subscribers.clear()
         logger.info("EventBus stopped")
 
@@ -106,6 +366,10 @@ class EventBus:
         self._conn = None
         # Notify all subscribers so SSE clients reconnect and reload
         self._send_sentinel_to_all()
+        # Auth invalidations and replayable events may be missed while
+        # disconnected
+        self._dispatch_auth(None)
+        self._replay.reset(available=False)
         if not self._stopping:
             self._schedule_reconnect()
 
@@ -135,37 +399,66 @@ class EventBus:
                 attempt += 1
 
     def _send_sentinel_to_all(self) -> None:
-        """Push None to every subscriber queue so SSE generators exit."""
-        for queues in self._subscribers.values():
-            for q in queues:
-                with contextlib.suppress(asyncio.QueueFull):
-                    q.put_nowait(None)
+        """Close every subscription so SSE generators exit."""
+        for subscriptions in self._subscribers.values():
+            for sub in subscriptions:
+                sub.close()
 
     # ------------------------------------------------------------------
     # Subscribe / unsubscribe
     # ------------------------------------------------------------------
 
-    def subscribe(self, user_id: int) -> asyncio.Queue[Event | None]:
-        """Register a bounded queue for a user and return it."""
-        q: asyncio.Queue[Event | None] = asyncio.Queue(maxsize=256)
-        self._subscribers.setdefault(user_id, set()).add(q)
+    def subscribe(self, user_id: int) -> Subscription:
+        """Register a subscription for a user and return it."""
+        sub = Subscription(user_id)
+        self._subscribers.setdefault(user_id, set()).add(sub)
+        EVENT_BUS_SUBSCRIBERS.inc()
         total = len(self._subscribers.get(user_id, set()))
-        logger.debug("User %d subscribed (total queues: %d)", user_id, total)
-        return q
-
-    def unsubscribe(self, user_id: int, q: asyncio.Queue[Event | None]) -> None:
-        """Remove a queue from the registry."""
-        queues = self._subscribers.get(user_id)
-        if queues:
-            queues.discard(q)
-            if not queues:
+        logger.debug("User %d subscribed (total subscriptions: %d)", user_id, total)
+        return sub
+
+    def unsubscribe(self, user_id: int, sub: Subscription) -> None:
+        """Remove a subscription from the registry."""
+        subscriptions = self._subscribers.get(user_id)
+        if subscriptions and sub in subscriptions:
+            subscriptions.discard(sub)
+            EVENT_BUS_SUBSCRIBERS.dec()
+            if not subscriptions:
                 del self._subscribers[user_id]
         logger.debug("User %d unsubscribed", user_id)
 
+    def replay_since(self, user_id: int, last_seq: int) -> list[Event] | None:
+        """Events for a user that arrived after event ``last_seq``.
+
+        Returns None if some of them can no longer be replayed, in which case
+        the client must reload instead.
+        """
+        return self._replay.since(user_id, last_seq)
+
+    def latest_seq(self) -> int | None:
+        """Sequence number a client that reloads now is current as of."""
+        return self._replay.latest()
+
+    def add_auth_listener(self, callback: Callable[[int | None], None]) -> None:
+        """Register a callback for auth invalidation notifications.
+
+        The callback receives the affected user ID, or None when
+        notifications may have been missed (connection lost).
+        """
+        self._auth_listeners.append(callback)
+
     # ------------------------------------------------------------------
     # Internal dispatch
     # ------------------------------------------------------------------
 
+    def _dispatch_auth(self, user_id: int | None) -> None:
+        """Invoke every auth listener for a user (None = everyone)."""
+        for callback in self._auth_listeners:
+            try:
+                callback(user_id)
+            except Exception:
+                logger.exception("Auth listener failed for user %s", user_id)
+
     def _on_notify(
         self,
         conn: asyncpg.Connection,
@@ -173,31 +466,54 @@ class EventBus:
         channel: str,
         payload: str,
     ) -> None:
-        """Parse NOTIFY payload and dispatch to matching user queues."""
+        """Queue a NOTIFY payload; the batch is dispatched on the next tick."""
+        if not self._inbox:
+            self._batch_started = time.perf_counter()
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._inbox.append(payload)
+
+    def _flush(self) -> None:
+        """Decode every queued payload and fan the events out to subscribers."""
+        payloads = self._inbox
+        self._inbox = []
+        if not payloads:
+            return
+
+        touched: set[Subscription] = set()
+        for payload in payloads:
+            event = self._decode(payload)
+            if event is None:
+                continue
+            self._replay.append(event)
+            for sub in self._subscribers.get(event.user_id, ()):
+                sub.offer(event)
+                touched.add(sub)
+
+        high_water = max((sub.high_water for sub in touched), default=0)
+        if high_water > self._high_water:
+            self._high_water = high_water
+            EVENT_BUS_QUEUE_HIGH_WATER.set(high_water)
+        EVENT_BUS_BATCH_SIZE.observe(len(payloads))
+        EVENT_BUS_FANOUT_SECONDS.observe(time.perf_counter() - self._batch_started)
+
+    def _decode(self, payload: str) -> Event | None:
+        """Parse a NOTIFY payload; auth payloads go to auth listeners."""
         try:
             data = json.loads(payload)
-            event = Event(
+            if data.get("auth"):
+                self._dispatch_auth(int(data["uid"]))
+                return None
+            return Event(
                 table=data["t"],
                 op=data["op"],
                 id=data["id"],
                 user_id=data["uid"],
                 tab_id=data.get("tab", ""),
+                seq=int(data.get("seq", 0)),
             )
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError):
             logger.warning("Malformed event payload: %s", payload)
-            return
-
-        queues = self._subscribers.get(event.user_id)
-        if not queues:
-            return
-
-        for q in queues:
-            try:
-                q.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning(
-                    "Dropping event for user %d — queue full", event.user_id
-                )
+            return None
 
 
 # Module-level singleton
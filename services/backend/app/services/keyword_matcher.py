@@ -0,0 +1,241 @@
+"""Multi-keyword matching for article filtering.
+
+``KeywordMatcher`` compiles a keyword set once into an Aho-Corasick automaton
+whose alphabet is words rather than characters: a keyword such as
+"prompt injection" is the word sequence ``("prompt", "injection")``. Matches
+therefore always start on a word boundary ("alignment" does not match
+"misalignment"), and any run of whitespace or punctuation between two words
+counts as a single separator ("prompt-injection" matches "prompt injection").
+The last word of a keyword may also carry a suffix, so plurals and
+inflections match ("language model" matches "language models", "jailbreak"
+matches "jailbreaking"). Words shorter than four letters must match exactly,
+so "ai" does not match "aim".
+
+How a scan runs depends on the size of the keyword set. Each keyword has an
+anchor, its longest word. When there are only a few distinct anchors, each
+one is located with ``str.find``, which runs in C, and the words around every
+hit are compared with the keywords that share it. That beats splitting the
+text into words until there are dozens of anchors. Larger sets tokenize the
+text instead and step the automaton over the tokens that can be part of a
+keyword, at a cost linear in the text length that does not grow with the
+number of keywords.
+"""
+
+import re
+import string
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import islice
+
+# Characters that separate words besides whitespace: ASCII punctuation
+# (except "_") and common typographic punctuation
+_PUNCTUATION = string.punctuation.replace("_", "") + "‘’“”–—…•·«»"
+_SEPARATORS = str.maketrans(dict.fromkeys(_PUNCTUATION, " "))
+
+# Shortest last word that also matches words it is the start of
+_MIN_STEM = 4
+
+# Keyword sets with at most this many distinct anchors are scanned with
+# str.find; larger ones with the token automaton
+_SCAN_MAX_ANCHORS = 32
+
+_WORD = re.compile(rf"[^\s{re.escape(_PUNCTUATION)}]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split ``text`` into lower-cased words."""
+    return text.lower().translate(_SEPARATORS).split()
+
+
+def _is_separator(char: str) -> bool:
+    return char.isspace() or char in _PUNCTUATION
+
+
+def _preceding_words(text: str, end: int, count: int) -> list[str]:
+    """Up to ``count`` words of ``text`` before ``end``, in order."""
+    words: list[str] = []
+    while len(words) < count:
+        while end and _is_separator(text[end - 1]):
+            end -= 1
+        start = end
+        while start and not _is_separator(text[start - 1]):
+            start -= 1
+        if start == end:
+            break
+        words.append(text[start:end])
+        end = start
+    words.reverse()
+    return words
+
+
+class KeywordMatcher:
+    """Compiled matcher for a fixed set of keywords (case-insensitive).
+
+    Example:
+        matcher = KeywordMatcher(["prompt injection", "jailbreak"])
+        matcher.find("New Prompt-Injections and jailbreaking results")
+        # ["prompt injection", "jailbreak"]
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        # Keywords are reported in their original form, deduplicated by their
+        # word sequence, in the order given.
+        by_words: dict[tuple[str, ...], str] = {}
+        for keyword in keywords:
+            words = tuple(tokenize(keyword))
+            if words and words not in by_words:
+                by_words[words] = keyword
+        self.keywords: tuple[str, ...] = tuple(by_words.values())
+        self._words = tuple(by_words)
+        self._vocabulary = frozenset(word for words in by_words for word in words)
+
+        # Last words that may carry a suffix, keyed by their first _MIN_STEM
+        # letters; tokens are prefiltered on the same key
+        self._stems: dict[str, tuple[str, ...]] = {}
+        for words in by_words:
+            stem = words[-1]
+            if len(stem) >= _MIN_STEM:
+                key = stem[:_MIN_STEM]
+                if stem not in self._stems.get(key, ()):
+                    self._stems[key] = self._stems.get(key, ()) + (stem,)
+        self._prefixes = frozenset(word[:_MIN_STEM] for word in self._vocabulary)
+
+        # Anchor word -> (keyword index, position of the anchor in the keyword)
+        self._anchors: dict[str, list[tuple[int, int]]] = {}
+        for index, words in enumerate(by_words):
+            position = max(range(len(words)), key=lambda i: len(words[i]))
+            self._anchors.setdefault(words[position], []).append((index, position))
+
+        # Trie over words: _goto[node][word] -> child node
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[tuple[int, ...]] = [()]
+        for index, words in enumerate(by_words):
+            node = 0
+            for word in words:
+                child = self._goto[node].get(word)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][word] = child
+                    self._goto.append({})
+                    self._output.append(())
+                node = child
+            self._output[node] += (index,)
+
+        # Failure links, computed breadth-first; each node also inherits the
+        # outputs of its failure node so a scan only looks at one node.
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for word, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+        self._scan = len(self._anchors) <= _SCAN_MAX_ANCHORS
+
+    def find(self, *texts: str) -> list[str]:
+        """Return the keywords that occur in any of ``texts``, in keyword order.
+
+        A keyword never spans two texts.
+        """
+        scan = self._scan_anchors if self._scan else self._step_tokens
+        found: set[int] = set()
+        for text in texts:
+            if not text:
+                continue
+            scan(text, found)
+            if len(found) == len(self.keywords):
+                break
+        return [self.keywords[index] for index in sorted(found)]
+
+    def _extends(self, token: str, word: str) -> bool:
+        """Whether ``token`` is ``word`` plus a suffix, e.g. a plural."""
+        return (
+            len(word) >= _MIN_STEM
+            and token.startswith(word)
+            and token not in self._vocabulary
+        )
+
+    def _scan_anchors(self, text: str, found: set[int]) -> None:
+        lowered = text.lower()
+        for anchor, candidates in self._anchors.items():
+            start = lowered.find(anchor)
+            while start != -1:
+                if start == 0 or _is_separator(lowered[start - 1]):
+                    self._check_anchor(lowered, start, candidates, found)
+                start = lowered.find(anchor, start + len(anchor))
+
+    def _check_anchor(
+        self,
+        lowered: str,
+        start: int,
+        candidates: list[tuple[int, int]],
+        found: set[int],
+    ) -> None:
+        """Record the ``candidates`` whose words surround the anchor at ``start``."""
+        before = _preceding_words(
+            lowered, start, max(position for _, position in candidates)
+        )
+        after = [
+            match.group()
+            for match in islice(
+                _WORD.finditer(lowered, start),
+                max(
+                    len(self._words[index]) - position for index, position in candidates
+                ),
+            )
+        ]
+        for index, position in candidates:
+            words = self._words[index]
+            if position > len(before) or len(words) - position > len(after):
+                continue
+            text_words = (
+                before[len(before) - position :] + after[: len(words) - position]
+            )
+            if text_words[:-1] == list(words[:-1]) and (
+                text_words[-1] == words[-1] or self._extends(text_words[-1], words[-1])
+            ):
+                found.add(index)
+
+    def _step_tokens(self, text: str, found: set[int]) -> None:
+        vocabulary, prefixes, stems = self._vocabulary, self._prefixes, self._stems
+        goto, fail, output = self._goto, self._fail, self._output
+        tokens = tokenize(text)
+        node = 0
+        previous = -1
+        for position, word in [
+            (i, w) for i, w in enumerate(tokens) if w[:_MIN_STEM] in prefixes
+        ]:
+            # A word outside every keyword came in between: restart.
+            if position != previous + 1:
+                node = 0
+            previous = position
+            if word in vocabulary:
+                while node and word not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(word, 0)
+                found.update(output[node])
+                continue
+            # A word with a suffix can end a keyword but not continue one
+            for stem in stems.get(word[:_MIN_STEM], ()):
+                if word.startswith(stem):
+                    state = node
+                    while state and stem not in goto[state]:
+                        state = fail[state]
+                    found.update(output[goto[state].get(stem, 0)])
+            node = 0
+
+
+@lru_cache(maxsize=256)
+def get_keyword_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    """Return the compiled matcher for ``keywords``, building it on first use.
+
+    Matchers are cached by keyword set, so editing a feed's keywords simply
+    produces (and caches) a new matcher on the next fetch.
+    """
+    return KeywordMatcher(keywords)
@@ -1,21 +1,34 @@
-"""RSS news fetching service."""
+"""RSS news fetching service.
+
+A refresh fetches all active feeds concurrently over one shared, SSRF-safe
+connection pool. Feeds are fetched with conditional GETs (ETag /
+Last-Modified), parsed in a worker thread, and deduplicated against stored
+articles with a single query per feed.
+"""
 
 import asyncio
 import ipaddress
 import logging
 import socket
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlparse
 
 import feedparser
 import httpx
-from sqlalchemy import select
+from sqlalchemy import Row, String, any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.database import async_session_maker
 from app.models.article import Article
 from app.models.feed_source import FeedSource
+from app.services.keyword_matcher import get_keyword_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +106,8 @@ def validate_feed_url(url: str) -> None:
         raise ValueError("URL has no hostname")
 
 
-# AI/LLM security keywords to filter articles
+# Default AI/LLM security keywords to filter articles (FeedSource.keywords
+# overrides them per feed)
 SECURITY_KEYWORDS = [
     "llm security",
     "ai security",
@@ -145,16 +159,21 @@ def parse_feed_datetime(time_tuple) -> datetime:
 
 
 def article_matches_keywords(
-    title: str, summary: str, content: str
+    title: str,
+    summary: str,
+    content: str,
+    keywords: Sequence[str] | None = None,
 ) -> tuple[bool, list[str]]:
-    """Check if article matches AI/LLM security keywords."""
-    text = f"{title} {summary} {content}".lower()
-    matched_keywords = []
-
-    for keyword in SECURITY_KEYWORDS:
-        if keyword.lower() in text:
-            matched_keywords.append(keyword)
+    """Check if article matches ``keywords`` (default: AI/LLM security keywords).
 
+    Keywords match at word boundaries, case-insensitively, and their last word
+    may carry a suffix; see ``KeywordMatcher``. An empty ``keywords`` matches
+    nothing, unlike ``None``.
+    """
+    if keywords is None:
+        keywords = SECURITY_KEYWORDS
+    matcher = get_keyword_matcher(tuple(keywords))
+    matched_keywords = matcher.find(title, summary, content)
     return len(matched_keywords) > 0, matched_keywords
 
 
@@ -186,13 +205,44 @@ def _parse_feed_entry(
     return title, url, summary, content, author, published_at
 
 
-async def _safe_fetch_feed_content(url: str) -> str:
-    """Fetch feed content via httpx with SSRF protection BEFORE connection.
+@dataclass
+class FeedResponse:
+    """Result of a (possibly conditional) feed GET."""
+
+    content: bytes | None  # None when the server answered 304 Not Modified
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def _create_feed_client(max_connections: int = 10) -> httpx.AsyncClient:
+    """Create an HTTP client for fetching feeds.
+
+    The client's transport enforces SSRF protection on every request, and its
+    connection pool is reused across feeds so that feeds on the same host
+    share keep-alive connections.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    return httpx.AsyncClient(
+        timeout=FEED_FETCH_TIMEOUT,
+        transport=SSRFProtectionTransport(limits=limits),
+        follow_redirects=True,
+        max_redirects=5,
+    )
+
+
+async def _fetch_feed_response(
+    client: httpx.AsyncClient,
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> FeedResponse:
+    """GET a feed, sending If-None-Match / If-Modified-Since when known.
 
-    Uses SSRFProtectionTransport to resolve DNS and validate all IPs
-    before any TCP connection is established, preventing TOCTOU and
-    DNS-rebinding attacks. Also enforces timeouts to prevent resource
-    exhaustion from slow/malicious servers.
+    SSRF protection is enforced by the client's SSRFProtectionTransport,
+    which resolves DNS and validates all IPs before any connection is made.
 
     Raises:
         ValueError: If the URL resolves to a blocked network or has
@@ -202,109 +252,179 @@ async def _safe_fetch_feed_content(url: str) -> str:
     """
     validate_feed_url(url)
 
-    transport = SSRFProtectionTransport()
-    async with httpx.AsyncClient(
-        timeout=FEED_FETCH_TIMEOUT,
-        transport=transport,
-        follow_redirects=True,
-        max_redirects=5,
-    ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.text
-
-
-async def _fetch_feed_entries(
-    feed_source: FeedSource,
-    db: AsyncSession,
-    since: datetime | None = None,
-) -> int:
-    """Fetch and store articles from an RSS feed.
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304:
+        return FeedResponse(content=None, etag=etag, last_modified=last_modified)
+    response.raise_for_status()
+    return FeedResponse(
+        content=response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
 
-    SSRF protection is enforced at connection time (not just at URL
-    validation time) to prevent TOCTOU and DNS-rebinding attacks.
 
-    Args:
-        feed_source: The feed source to fetch.
-        db: Database session.
-        since: If provided, skip entries published before this datetime.
+def _parse_feed(
+    content: bytes,
+    feed_name: str,
+    since: datetime | None,
+    keywords: Sequence[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Parse a feed document into Article rows that match ``keywords``.
 
-    Returns:
-        Number of new articles added.
+    CPU-bound (XML parsing and keyword scanning); run in a worker thread.
+    Entries published before ``since`` and repeated URLs are dropped.
     """
-    label = "Force-fetching" if since else "Fetching"
-    since_str = f" since {since.isoformat()}" if since else ""
-    logger.info(f"{label} feed: {feed_source.name} ({feed_source.url}){since_str}")
-
-    content = await _safe_fetch_feed_content(feed_source.url)
     feed = feedparser.parse(content)
 
     if feed.bozo:
-        logger.warning(
-            f"Feed parsing error for {feed_source.name}: {feed.bozo_exception}"
-        )
-
-    new_articles = 0
+        logger.warning(f"Feed parsing error for {feed_name}: {feed.bozo_exception}")
 
+    rows: dict[str, dict[str, Any]] = {}
     for entry in feed.entries:
-        title, url, summary, content, author, published_at = _parse_feed_entry(entry)
+        title, url, summary, body, author, published_at = _parse_feed_entry(entry)
 
         # Skip entries published before the cutoff
         if since and published_at and published_at < since:
             continue
-
-        # Check if article already exists
-        stmt = select(Article).where(Article.url == url)
-        result = await db.execute(stmt)
-        if result.scalar_one_or_none():
+        if url in rows:
             continue
 
         # Filter by keywords
-        matches, keywords = article_matches_keywords(title, summary, content)
+        matches, matched = article_matches_keywords(title, summary, body, keywords)
         if not matches:
             logger.debug(f"Article filtered out (no keyword match): {title}")
             continue
 
-        article = Article(
-            feed_source_id=feed_source.id,
-            title=title,
-            url=url,
-            summary=summary,
-            content=content,
-            author=author,
-            published_at=published_at,
-            keywords=keywords,
+        rows[url] = {
+            "title": title,
+            "url": url,
+            "summary": summary,
+            "content": body,
+            "author": author,
+            "published_at": published_at,
+            "keywords": matched,
+        }
+    return list(rows.values())
+
+
+async def _store_new_articles(
+    db: AsyncSession, feed_source_id: int, rows: list[dict[str, Any]]
+) -> int:
+    """Insert the rows whose URL isn't already stored; return how many were added.
+
+    Existing URLs are found with one ``url = ANY(...)`` query and the rest are
+    written with one multi-row INSERT. ON CONFLICT DO NOTHING covers another
+    feed inserting the same URL concurrently.
+    """
+    if not rows:
+        return 0
+
+    urls = [row["url"] for row in rows]
+    result = await db.execute(
+        select(Article.url).where(
+            Article.url == any_(bindparam("urls", urls, type_=ARRAY(String)))
         )
-        db.add(article)
-        new_articles += 1
+    )
+    existing = set(result.scalars().all())
+    new_rows = [
+        {**row, "feed_source_id": feed_source_id}
+        for row in rows
+        if row["url"] not in existing
+    ]
+    if not new_rows:
+        return 0
+
+    result = await db.execute(
+        pg_insert(Article)
+        .values(new_rows)
+        .on_conflict_do_nothing(index_elements=[Article.url])
+        .returning(Article.title)
+    )
+    titles = result.scalars().all()
+    for title in titles:
         logger.info(f"Added article: {title}")
+    return len(titles)
 
-    feed_source.last_fetched_at = datetime.now(UTC)
-    await db.commit()
 
-    logger.info(f"Fetched {new_articles} new articles from {feed_source.name}")
-    return new_articles
+async def _download_feed(
+    client: httpx.AsyncClient,
+    feed: FeedSource | Row,
+    since: datetime | None = None,
+) -> tuple[FeedResponse, list[dict[str, Any]]]:
+    """GET and parse a feed, without touching the database.
 
+    Regular fetches send the feed's stored ETag / Last-Modified and return no
+    rows on 304 Not Modified. Force-fetches (``since`` given) always download.
 
-async def fetch_feed(feed_source: FeedSource, db: AsyncSession) -> int:
-    """Fetch articles from a single RSS feed."""
-    try:
-        return await _fetch_feed_entries(feed_source, db)
-    except (ValueError, httpx.TimeoutException, httpx.HTTPStatusError) as e:
-        logger.error(f"Feed fetch failed for {feed_source.name}: {e}")
-        return 0
-    except Exception as e:
-        logger.error(f"Error fetching feed {feed_source.name}: {e}")
-        await db.rollback()
-        return 0
+    Args:
+        client: Feed client (see ``_create_feed_client``).
+        feed: Feed source, or a row with its name, url, etag, last_modified
+            and keywords.
+        since: If provided, skip entries published before this datetime.
+
+    Returns:
+        The response and the Article rows parsed from it.
+    """
+    label = "Force-fetching" if since else "Fetching"
+    since_str = f" since {since.isoformat()}" if since else ""
+    logger.info(f"{label} feed: {feed.name} ({feed.url}){since_str}")
+
+    if since:
+        response = await _fetch_feed_response(client, feed.url)
+    else:
+        response = await _fetch_feed_response(
+            client, feed.url, feed.etag, feed.last_modified
+        )
+
+    if response.content is None:
+        logger.info(f"Feed not modified: {feed.name}")
+        return response, []
+
+    rows = await asyncio.to_thread(
+        _parse_feed, response.content, feed.name, since, feed.keywords
+    )
+    return response, rows
+
+
+async def _save_downloaded_feed(
+    db: AsyncSession, feed_id: int, response: FeedResponse, rows: list[dict[str, Any]]
+) -> int:
+    """Store a downloaded feed's articles and validators; return how many were added.
+
+    A 304 response only updates ``last_fetched_at``; the stored validators
+    still describe the feed.
+    """
+    values: dict[str, Any] = {"last_fetched_at": datetime.now(UTC)}
+    if response.content is not None:
+        values["etag"] = response.etag
+        values["last_modified"] = response.last_modified
+
+    new_articles = await _store_new_articles(db, feed_id, rows)
+    await db.execute(
+        update(FeedSource).where(FeedSource.id == feed_id).values(**values)
+    )
+    await db.commit()
+    return new_articles
 
 
 async def fetch_feed_since(
     feed_source: FeedSource, db: AsyncSession, since: datetime
 ) -> int:
-    """Fetch articles from a feed, skipping entries published before `since`."""
+    """Fetch articles from a feed, skipping entries published before `since`.
+
+    SSRF protection is enforced at connection time (not just at URL
+    validation time) to prevent TOCTOU and DNS-rebinding attacks.
+    """
     try:
-        return await _fetch_feed_entries(feed_source, db, since=since)
+        async with _create_feed_client() as client:
+            response, rows = await _download_feed(client, feed_source, since)
+        new_articles = await _save_downloaded_feed(db, feed_source.id, response, rows)
     except (ValueError, httpx.TimeoutException, httpx.HTTPStatusError) as e:
         logger.error(f"Feed fetch failed for {feed_source.name}: {e}")
         return 0
@@ -313,25 +433,63 @@ async def fetch_feed_since(
         await db.rollback()
         return 0
 
+    logger.info(f"Fetched {new_articles} new articles from {feed_source.name}")
+    return new_articles
+
 
 async def fetch_all_feeds() -> dict[str, int]:
-    """Fetch articles from all active feeds."""
+    """Fetch articles from all active feeds.
+
+    Feeds are fetched concurrently over one shared connection pool, at most
+    ``feed_fetch_concurrency`` at a time and ``feed_fetch_per_host`` per host.
+    No database connection is held while a feed downloads: each feed's
+    articles are stored afterwards on a short session of its own, so one
+    failing feed doesn't affect the others.
+    """
     logger.info("Starting feed fetch job")
 
     async with async_session_maker() as db:
         # Get all active feed sources
-        stmt = select(FeedSource).where(FeedSource.is_active == True)  # noqa: E712
-        result = await db.execute(stmt)
-        feed_sources = result.scalars().all()
-
-        if not feed_sources:
-            logger.warning("No active feed sources found")
-            return {}
+        stmt = select(
+            FeedSource.id,
+            FeedSource.name,
+            FeedSource.url,
+            FeedSource.etag,
+            FeedSource.last_modified,
+            FeedSource.keywords,
+        ).where(FeedSource.is_active == True)  # noqa: E712
+        feed_sources = (await db.execute(stmt)).all()
+
+    if not feed_sources:
+        logger.warning("No active feed sources found")
+        return {}
+
+    limit = asyncio.Semaphore(settings.feed_fetch_concurrency)
+    host_limits: dict[str | None, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(settings.feed_fetch_per_host)
+    )
 
-        results = {}
-        for feed_source in feed_sources:
-            count = await fetch_feed(feed_source, db)
-            results[feed_source.name] = count
+    async def fetch_one(client: httpx.AsyncClient, feed: Row) -> int:
+        # Wait for the host first, so feeds queued behind a busy host don't
+        # occupy global slots that other hosts could use
+        async with host_limits[urlparse(feed.url).hostname], limit:
+            response, rows = await _download_feed(client, feed)
+            async with async_session_maker() as db:
+                new_articles = await _save_downloaded_feed(db, feed.id, response, rows)
+        logger.info(f"Fetched {new_articles} new articles from {feed.name}")
+        return new_articles
+
+    async with _create_feed_client(settings.feed_fetch_concurrency) as client:
+        outcomes = await asyncio.gather(
+            *(fetch_one(client, feed) for feed in feed_sources),
+            return_exceptions=True,
+        )
 
+    results: dict[str, int] = {}
+    for feed, outcome in zip(feed_sources, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Feed fetch failed for {feed.name}: {outcome!r}")
+            outcome = 0
+        results[feed.name] = outcome
     logger.info(f"Feed fetch job completed: {results}")
     return results
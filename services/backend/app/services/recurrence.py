@@ -0,0 +1,219 @@
+"""Materialise todos from recurring task templates.
+
+A ``RecurringTask`` is due when it is active and its ``next_due_date`` has
+arrived. The scheduler job below turns due templates into todos in batches:
+
+- Each batch locks up to ``recurring_task_batch_size`` due templates with
+  ``FOR UPDATE SKIP LOCKED``, so several workers (or overlapping runs) can
+  materialise concurrently without generating the same occurrence twice.
+- Occurrences are computed in Python from the template's pattern, the
+  generated todos are inserted with one multi-row INSERT, and each
+  template's ``next_due_date`` is advanced in the same transaction.
+- A fixed schedule (``skip_missed`` false) gets a todo for every missed
+  occurrence, at most ``recurring_task_max_catch_up`` per template per batch;
+  a template with a longer backlog stays due and is picked up by the next
+  batch. A floating schedule (``skip_missed`` true) only gets a todo for the
+  most recent missed occurrence.
+
+Batches repeat until no due template is left, so a run costs a handful of
+queries per batch rather than per template.
+"""
+
+import calendar
+import logging
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.database import async_session_maker
+from app.models.recurring_task import Frequency, RecurringTask
+from app.models.todo import Todo
+
+logger = logging.getLogger(__name__)
+
+
+def _sunday_weekday(day: date) -> int:
+    """Weekday of ``day`` numbered like ``RecurringTask.weekdays`` (0=Sunday)."""
+    return (day.weekday() + 1) % 7
+
+
+def _add_months(day: date, months: int, day_of_month: int) -> date:
+    """Move ``months`` ahead, landing on ``day_of_month`` clamped to the month."""
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    month += 1
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, min(day_of_month, last_day))
+
+
+def _weekly(task: RecurringTask, day: date, *, inclusive: bool) -> date:
+    interval = max(task.interval_value or 1, 1)
+    weekdays = sorted({d % 7 for d in task.weekdays or []})
+    if not weekdays:
+        return day if inclusive else day + timedelta(weeks=interval)
+
+    current = _sunday_weekday(day)
+    week_start = day - timedelta(days=current)
+    for weekday in weekdays:
+        if weekday > current or (inclusive and weekday == current):
+            return week_start + timedelta(days=weekday)
+    return week_start + timedelta(weeks=interval, days=weekdays[0])
+
+
+def _monthly_anchor(task: RecurringTask) -> int:
+    return task.day_of_month or task.start_date.day
+
+
+def first_occurrence(task: RecurringTask, on_or_after: date) -> date:
+    """Return the first occurrence of ``task`` on or after ``on_or_after``.
+
+    ``next_due_date`` starts out as the template's ``start_date``, which need
+    not fall on a selected weekday or day of month; this aligns it.
+    """
+    if task.frequency == Frequency.weekly:
+        return _weekly(task, on_or_after, inclusive=True)
+    if task.frequency == Frequency.monthly and task.day_of_month:
+        candidate = _add_months(on_or_after, 0, task.day_of_month)
+        if candidate >= on_or_after:
+            return candidate
+        return _add_months(on_or_after, task.interval_value or 1, task.day_of_month)
+    return on_or_after
+
+
+def next_occurrence(task: RecurringTask, current: date) -> date:
+    """Return the occurrence of ``task`` that follows the occurrence ``current``."""
+    interval = max(task.interval_value or 1, 1)
+    if task.frequency == Frequency.daily:
+        return current + timedelta(days=interval)
+    if task.frequency == Frequency.weekly:
+        return _weekly(task, current, inclusive=False)
+    if task.frequency == Frequency.monthly:
+        return _add_months(current, interval, _monthly_anchor(task))
+    if task.frequency == Frequency.yearly:
+        return _add_months(current, 12 * interval, task.start_date.day)
+    raise ValueError(f"Unknown recurrence frequency: {task.frequency!r}")
+
+
+def due_occurrences(
+    task: RecurringTask, today: date, limit: int
+) -> tuple[list[date], date]:
+    """Return the occurrences of ``task`` due by ``today`` and the next due date.
+
+    Fixed schedules return every due occurrence, up to ``limit``; floating
+    schedules (``skip_missed``) only the most recent one. Occurrences after
+    ``end_date`` are never returned.
+    """
+
+    def due(day: date) -> bool:
+        return day <= today and (task.end_date is None or day <= task.end_date)
+
+    occurrence = first_occurrence(task, task.next_due_date)
+    dates: list[date] = []
+    while due(occurrence) and (task.skip_missed or len(dates) < limit):
+        dates.append(occurrence)
+        occurrence = next_occurrence(task, occurrence)
+    if task.skip_missed:
+        dates = dates[-1:]
+    return dates, occurrence
+
+
+def _todo_row(task: RecurringTask, due_date: date) -> dict[str, Any]:
+    return {
+        "user_id": task.user_id,
+        "project_id": task.project_id,
+        "recurring_task_id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "priority": task.priority,
+        "estimated_hours": task.estimated_hours,
+        "tags": list(task.tags or []),
+        "context": task.context,
+        "due_date": due_date,
+    }
+
+
+async def _next_root_positions(
+    db: AsyncSession, user_ids: Iterable[int]
+) -> dict[int, int]:
+    """Return the next free root-level todo position for each user."""
+    result = await db.execute(
+        select(Todo.user_id, func.max(Todo.position))
+        .where(
+            Todo.user_id.in_(list(user_ids)),
+            Todo.parent_id.is_(None),
+            Todo.deleted_at.is_(None),
+        )
+        .group_by(Todo.user_id)
+    )
+    positions = dict.fromkeys(user_ids, 0)
+    for user_id, max_position in result.all():
+        positions[user_id] = (max_position or 0) + 1
+    return positions
+
+
+async def materialize_recurring_tasks_with_session(
+    db: AsyncSession, today: date | None = None
+) -> int:
+    """Generate todos for all due recurring tasks, one batch per transaction.
+
+    Args:
+        db: Database session; committed after each batch
+        today: Date to materialise up to (defaults to the current UTC date)
+
+    Returns:
+        Number of todos created
+    """
+    today = today or datetime.now(UTC).date()
+    created = 0
+    while True:
+        result = await db.scalars(
+            select(RecurringTask)
+            .where(
+                RecurringTask.is_active.is_(True),
+                RecurringTask.next_due_date <= today,
+                or_(
+                    RecurringTask.end_date.is_(None),
+                    RecurringTask.next_due_date <= RecurringTask.end_date,
+                ),
+            )
+            .order_by(RecurringTask.next_due_date, RecurringTask.id)
+            .limit(settings.recurring_task_batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        tasks = result.all()
+        if not tasks:
+            break
+
+        rows: list[dict[str, Any]] = []
+        for task in tasks:
+            dates, task.next_due_date = due_occurrences(
+                task, today, settings.recurring_task_max_catch_up
+            )
+            rows.extend(_todo_row(task, due_date) for due_date in dates)
+
+        if rows:
+            positions = await _next_root_positions(db, {row["user_id"] for row in rows})
+            for row in rows:
+                row["position"] = positions[row["user_id"]]
+                positions[row["user_id"]] += 1
+            await db.execute(insert(Todo), rows)
+
+        await db.commit()
+        created += len(rows)
+
+    if created:
+        logger.info(f"Generated {created} todos from recurring tasks")
+    return created
+
+
+async def materialize_recurring_tasks() -> None:
+    """Standalone entry point for the scheduler.
+
+    Creates its own database session, same pattern as fetch_all_feeds().
+    """
+    async with async_session_maker() as db:
+        await materialize_recurring_tasks_with_session(db)
@@ -5,8 +5,11 @@ import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.config import settings
+from app.core.auth_cache import flush_api_key_usage
 from app.services.article_summarizer import generate_article_summaries
 from app.services.news_fetcher import fetch_all_feeds
+from app.services.recurrence import materialize_recurring_tasks
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,24 @@ def start_scheduler() -> None:
         replace_existing=True,
     )
 
+    # Write batched API key last_used_at timestamps from the auth cache
+    scheduler.add_job(
+        flush_api_key_usage,
+        trigger=IntervalTrigger(seconds=settings.api_key_usage_flush_seconds),
+        id="flush_api_key_usage",
+        name="Flush API key last_used_at updates",
+        replace_existing=True,
+    )
+
+    # Generate todos from due recurring task templates
+    scheduler.add_job(
+        materialize_recurring_tasks,
+        trigger=IntervalTrigger(minutes=settings.recurring_task_interval_minutes),
+        id="materialize_recurring_tasks",
+        name="Generate todos from recurring tasks",
+        replace_existing=True,
+    )
+
     scheduler.start()
     logger.info("Background task scheduler started")
 
@@ -2,12 +2,17 @@
 
 import os
 import uuid
+from collections.abc import AsyncIterable
 from pathlib import Path
 
 import aiofiles
 
 from app.config import settings
 
+# Subdirectory of the upload directory holding in-progress uploads. Keeping it
+# on the same filesystem lets finished uploads be moved into place by rename.
+TEMP_DIR = ".tmp"
+
 
 class PathTraversalError(ValueError):
     """Raised when a path traversal attack is detected."""
@@ -15,6 +20,14 @@ class PathTraversalError(ValueError):
     pass
 
 
+class FileTooLargeError(ValueError):
+    """Raised when streamed content exceeds the allowed size."""
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(f"File exceeds {max_size} bytes")
+        self.max_size = max_size
+
+
 class StorageService:
     """Service for managing file storage on the local filesystem."""
 
@@ -22,10 +35,6 @@ class StorageService:
         """Initialize storage service with base path."""
         self.base_path = base_path or settings.upload_path
 
-    def _ensure_base_dir(self) -> None:
-        """Ensure the base upload directory exists."""
-        self.base_path.mkdir(parents=True, exist_ok=True)
-
     def _validate_path(self, storage_path: str) -> Path:
         """Validate that the storage path stays within the base directory.
 
@@ -44,58 +53,87 @@ class StorageService:
             raise PathTraversalError("Invalid storage path")
         return full_path
 
-    async def save_file(
-        self, content: bytes, filename: str, content_type: str
-    ) -> tuple[str, int]:
+    def _new_storage_path(self, filename: str) -> str:
+        """Generate a UUID-based storage path, keeping the file extension."""
+        # Generate UUID-based path to prevent traversal attacks
+        file_uuid = uuid.uuid4()
+        extension = Path(filename).suffix.lower()
+        # Subdirectory based on first two chars of UUID for better distribution
+        return f"{str(file_uuid)[:2]}/{file_uuid}{extension}"
+
+    async def write_temp_file(
+        self, chunks: AsyncIterable[bytes], max_size: int
+    ) -> tuple[Path, int]:
         """
-        Save file content to storage with a UUID-based path.
+        Stream chunks into a temporary file inside the storage directory.
+
+        The size limit is enforced as chunks arrive, so an oversized upload
+        is abandoned after ``max_size`` bytes rather than buffered in full.
 
         Args:
-            content: The file content as bytes
-            filename: Original filename (used for extension)
-            content_type: MIME type of the file
+            chunks: The file content, in chunks
+            max_size: Maximum number of bytes to accept
 
         Returns:
-            Tuple of (storage_path, file_size)
+            Tuple of (temp_path, file_size)
+
+        Raises:
+            FileTooLargeError: If the content exceeds max_size (the partial
+                file is removed)
         """
-        # Ensure base directory exists
-        self._ensure_base_dir()
+        temp_dir = self.base_path / TEMP_DIR
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = temp_dir / f"{uuid.uuid4()}.part"
 
-        # Generate UUID-based path to prevent traversal attacks
-        file_uuid = uuid.uuid4()
-        extension = Path(filename).suffix.lower()
-        storage_filename = f"{file_uuid}{extension}"
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > max_size:
+                        raise FileTooLargeError(max_size)
+                    await f.write(chunk)
+        except BaseException:
+            self.discard_temp_file(temp_path)
+            raise
+        return temp_path, size
+
+    def store_temp_file(self, temp_path: Path, filename: str) -> str:
+        """
+        Move a file written by write_temp_file() to its permanent location.
 
-        # Create subdirectory based on first two chars of UUID for better distribution
-        subdir = str(file_uuid)[:2]
-        storage_dir = self.base_path / subdir
-        os.makedirs(storage_dir, exist_ok=True)
+        Args:
+            temp_path: Path returned by write_temp_file()
+            filename: Original filename (used for extension)
 
-        storage_path = f"{subdir}/{storage_filename}"
+        Returns:
+            The relative storage path
+        """
+        storage_path = self._new_storage_path(filename)
         full_path = self.base_path / storage_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        # Same filesystem, so this is an atomic rename rather than a copy
+        os.replace(temp_path, full_path)
+        return storage_path
 
-        async with aiofiles.open(full_path, "wb") as f:
-            await f.write(content)
-
-        return storage_path, len(content)
+    def discard_temp_file(self, temp_path: Path) -> None:
+        """Remove a temporary upload file, ignoring it if already gone."""
+        temp_path.unlink(missing_ok=True)
 
-    async def read_file(self, storage_path: str) -> bytes:
+    def get_file_path(self, storage_path: str) -> Path:
         """
-        Read file content from storage.
+        Resolve a storage path to its location on disk, for streaming.
 
         Args:
             storage_path: The relative storage path
 
         Returns:
-            File content as bytes
+            The absolute file path (the file may not exist)
 
         Raises:
-            FileNotFoundError: If file doesn't exist
             PathTraversalError: If path attempts to escape base directory
         """
-        full_path = self._validate_path(storage_path)
-        async with aiofiles.open(full_path, "rb") as f:
-            return await f.read()
+        return self._validate_path(storage_path)
 
     async def delete_file(self, storage_path: str) -> bool:
         """
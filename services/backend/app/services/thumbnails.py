@@ -0,0 +1,147 @@
+"""Downscaled derivatives of image attachments.
+
+Each uploaded image gets a WebP derivative per entry in ``THUMBNAIL_SIZES``,
+stored next to the original (``ab/<uuid>.png`` -> ``ab/<uuid>.small.webp``)
+so views that only need a preview don't download the full-resolution file.
+
+Decoding and resizing is CPU-bound and holds the GIL, so it runs on a
+process pool rather than the event loop or a thread pool.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+from PIL import Image, ImageOps
+
+from app.config import settings
+from app.services.storage import StorageService, storage_service
+
+logger = logging.getLogger(__name__)
+
+# Derivative name -> longest edge in pixels
+THUMBNAIL_SIZES: dict[str, int] = {"small": 320, "medium": 1280}
+THUMBNAIL_FORMAT = "webp"
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+THUMBNAIL_QUALITY = 80
+
+
+def thumbnail_storage_path(storage_path: str, size: str) -> str:
+    """Storage path of the ``size`` derivative of an original file."""
+    stem = PurePosixPath(storage_path).with_suffix("")
+    return f"{stem}.{size}.{THUMBNAIL_FORMAT}"
+
+
+def render_thumbnails(source: str, targets: dict[str, tuple[str, int]]) -> list[str]:
+    """Write resized copies of the image at ``source``.
+
+    Runs in a worker process. Each derivative is written to a temporary file
+    and renamed into place, so a reader never sees a partial file; the
+    temporary file is removed if writing fails.
+
+    Args:
+        source: Path of the original image
+        targets: Derivative name -> (output path, longest edge in pixels)
+
+    Returns:
+        Names of the derivatives written
+    """
+    with Image.open(source) as original:
+        # JPEGs can be decoded at a reduced scale, which is much cheaper than
+        # decoding the full image and shrinking it afterwards
+        largest = max(edge for _, edge in targets.values())
+        original.draft(None, (largest, largest))
+        # First frame only for animations; apply EXIF rotation so phone
+        # photos aren't shown sideways
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    written = []
+    # Largest first, so each smaller size is resampled from fewer pixels
+    for name, (path, edge) in sorted(
+        targets.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        image.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        temp_path = f"{path}.part"
+        try:
+            image.save(temp_path, THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY, method=4)
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        written.append(name)
+    return written
+
+
+class ThumbnailService:
+    """Generates and locates attachment thumbnails on a process pool."""
+
+    def __init__(self, max_workers: int, storage: StorageService) -> None:
+        """Initialize the service.
+
+        Args:
+            max_workers: Number of worker processes
+            storage: Storage holding the originals and their derivatives
+        """
+        self.max_workers = max_workers
+        self.storage = storage
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn rather than fork: the server process has threads running
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def get_path(self, storage_path: str, size: str) -> Path:
+        """Absolute path of a derivative (which may not exist yet)."""
+        return self.storage.get_file_path(thumbnail_storage_path(storage_path, size))
+
+    async def generate(self, storage_path: str) -> list[str]:
+        """Create all derivatives of an original image.
+
+        Returns:
+            Names of the derivatives written
+
+        Raises:
+            Exception: If the image cannot be decoded or written
+        """
+        targets = {
+            size: (str(self.get_path(storage_path, size)), edge)
+            for size, edge in THUMBNAIL_SIZES.items()
+        }
+        source = str(self.storage.get_file_path(storage_path))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), render_thumbnails, source, targets
+        )
+
+    def missing(self, storage_path: str) -> list[str]:
+        """Names of the derivatives that don't exist for an original."""
+        return [
+            size
+            for size in THUMBNAIL_SIZES
+            if not self.get_path(storage_path, size).exists()
+        ]
+
+    async def delete(self, storage_path: str) -> None:
+        """Remove all derivatives of an original, ignoring missing ones."""
+        for size in THUMBNAIL_SIZES:
+            await self.storage.delete_file(thumbnail_storage_path(storage_path, size))
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, waiting for in-flight jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+thumbnail_service = ThumbnailService(
+    max_workers=settings.thumbnail_workers, storage=storage_service
+)
@@ -0,0 +1,299 @@
+"""Compact storage for wiki page revisions.
+
+Every update of a wiki page saves the page's previous state as a
+``WikiPageRevision``. Storing each revision in full makes storage grow with
+page size times number of edits, which is quadratic for a page that is
+appended to over and over. Revisions are therefore stored RCS-style:
+
+- The newest revision of a page is stored in full.
+- When a newer revision is saved, the previous newest one is re-encoded as a
+  reverse delta: the edits that turn the newer revision's text back into its
+  own.
+- Every ``wiki_revision_keyframe_interval``-th revision stays in full (a
+  keyframe), as does any revision whose delta would not be smaller than its
+  text, so rebuilding a revision applies a bounded number of deltas.
+
+Deltas are line-based: a JSON list whose items are either ``[start, end]``
+(copy lines ``start:end`` of the newer text) or a string (insert this text).
+Payloads, full or delta, are zlib-compressed when that makes them smaller.
+
+Rows written before delta storage have their text in ``content`` and no
+``payload``; they read as full revisions and are re-encoded by
+``compact_page_revisions`` (see scripts/compact_wiki_revisions.py).
+"""
+
+import json
+import zlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.wiki_page import WikiPage, WikiPageRevision
+
+FULL = "full"
+DELTA = "delta"
+COMPRESSION_NONE = "none"
+COMPRESSION_ZLIB = "zlib"
+
+# Payloads shorter than this are not worth compressing
+COMPRESS_MIN_BYTES = 256
+
+DeltaOp = list[int] | str
+
+
+@dataclass(frozen=True)
+class StoredContent:
+    """Encoded revision content, as kept in a WikiPageRevision row."""
+
+    storage_format: str
+    compression: str
+    payload: bytes
+
+
+def make_delta(base: str, target: str) -> list[DeltaOp]:
+    """Return delta ops that rebuild ``target`` from the lines of ``base``."""
+    a = base.splitlines(keepends=True)
+    b = target.splitlines(keepends=True)
+
+    # Trim the common prefix and suffix first: appends and local edits then
+    # leave only a small window for SequenceMatcher to compare.
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    ops: list[DeltaOp] = []
+
+    def copy(start: int, end: int) -> None:
+        if start == end:
+            return
+        last = ops[-1] if ops else None
+        if isinstance(last, list) and last[1] == start:
+            last[1] = end
+        else:
+            ops.append([start, end])
+
+    def insert(lines: list[str]) -> None:
+        if not lines:
+            return
+        last = ops[-1] if ops else None
+        if isinstance(last, str):
+            ops[-1] = last + "".join(lines)
+        else:
+            ops.append("".join(lines))
+
+    copy(0, prefix)
+    matcher = SequenceMatcher(
+        None, a[prefix : len(a) - suffix], b[prefix : len(b) - suffix]
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            copy(prefix + i1, prefix + i2)
+        else:
+            insert(b[prefix + j1 : prefix + j2])
+    copy(len(a) - suffix, len(a))
+    return ops
+
+
+def apply_delta(base: str, ops: Sequence[DeltaOp]) -> str:
+    """Rebuild the target text of ``make_delta(base, target)``."""
+    lines = base.splitlines(keepends=True)
+    return "".join(
+        op if isinstance(op, str) else "".join(lines[op[0] : op[1]]) for op in ops
+    )
+
+
+def _pack(data: bytes, compress: bool) -> tuple[bytes, str]:
+    if compress and len(data) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(data)
+        if len(packed) < len(data):
+            return packed, COMPRESSION_ZLIB
+    return data, COMPRESSION_NONE
+
+
+def _unpack(payload: bytes, compression: str) -> bytes:
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(payload)
+    if compression == COMPRESSION_NONE:
+        return payload
+    raise ValueError(f"Unknown revision compression: {compression!r}")
+
+
+def encode_full(text: str, *, compress: bool = True) -> StoredContent:
+    """Encode ``text`` as a full revision."""
+    payload, compression = _pack(text.encode(), compress)
+    return StoredContent(FULL, compression, payload)
+
+
+def encode_delta(newer: str, text: str, *, compress: bool = True) -> StoredContent:
+    """Encode ``text`` as a reverse delta against the next revision's text.
+
+    Falls back to a full revision when the delta would not be smaller.
+    """
+    full = encode_full(text, compress=compress)
+    delta = json.dumps(make_delta(newer, text), separators=(",", ":")).encode()
+    payload, compression = _pack(delta, compress)
+    if len(payload) >= len(full.payload):
+        return full
+    return StoredContent(DELTA, compression, payload)
+
+
+def decode_content(stored: StoredContent, newer: str | None) -> str:
+    """Decode revision content; deltas need the next revision's text."""
+    data = _unpack(stored.payload, stored.compression)
+    if stored.storage_format == FULL:
+        return data.decode()
+    if stored.storage_format == DELTA:
+        if newer is None:
+            raise ValueError("A delta revision needs the next revision's text")
+        return apply_delta(newer, json.loads(data))
+    raise ValueError(f"Unknown revision storage format: {stored.storage_format!r}")
+
+
+def is_keyframe(revision_number: int) -> bool:
+    """Whether a revision is always kept in full."""
+    return revision_number % settings.wiki_revision_keyframe_interval == 0
+
+
+def stored_size(revision: WikiPageRevision) -> int:
+    """Bytes a revision's content takes up in the database."""
+    if revision.payload is not None:
+        return len(revision.payload)
+    return len((revision.content or "").encode())
+
+
+def _revision_text(revision: WikiPageRevision, newer: str | None) -> str:
+    if revision.payload is None:
+        # Written before delta storage
+        return revision.content or ""
+    stored = StoredContent(
+        revision.storage_format, revision.compression, revision.payload
+    )
+    return decode_content(stored, newer)
+
+
+def _store(revision: WikiPageRevision, stored: StoredContent) -> None:
+    revision.storage_format = stored.storage_format
+    revision.compression = stored.compression
+    revision.payload = stored.payload
+    revision.content = None
+
+
+async def save_revision(db: AsyncSession, page: WikiPage) -> WikiPageRevision:
+    """Save the page's current state as its newest revision.
+
+    The previous newest revision is re-encoded as a delta against this one,
+    unless it is a keyframe.
+    """
+    compress = settings.wiki_revision_compression
+    # Lock the previous newest revision so concurrent saves don't both
+    # re-encode it
+    previous = await db.scalar(
+        select(WikiPageRevision)
+        .where(WikiPageRevision.wiki_page_id == page.id)
+        .order_by(WikiPageRevision.revision_number.desc())
+        .limit(1)
+        .with_for_update()
+    )
+    if (
+        previous is not None
+        and previous.storage_format == FULL
+        and not is_keyframe(previous.revision_number)
+    ):
+        text = _revision_text(previous, None)
+        _store(previous, encode_delta(page.content, text, compress=compress))
+
+    revision = WikiPageRevision(
+        wiki_page_id=page.id,
+        user_id=page.user_id,
+        title=page.title,
+        slug=page.slug,
+        revision_number=page.revision_number,
+    )
+    _store(revision, encode_full(page.content, compress=compress))
+    db.add(revision)
+    return revision
+
+
+async def load_revision(
+    db: AsyncSession, page_id: int, revision_number: int
+) -> tuple[WikiPageRevision, str] | None:
+    """Return a revision and its rebuilt content, or None if it doesn't exist.
+
+    Loads the revision and the newer ones up to the nearest full revision in
+    one query, then applies their deltas from newest to oldest.
+    """
+    keyframe = (
+        select(func.min(WikiPageRevision.revision_number))
+        .where(
+            WikiPageRevision.wiki_page_id == page_id,
+            WikiPageRevision.revision_number >= revision_number,
+            WikiPageRevision.storage_format == FULL,
+        )
+        .scalar_subquery()
+    )
+    result = await db.scalars(
+        select(WikiPageRevision)
+        .where(
+            WikiPageRevision.wiki_page_id == page_id,
+            WikiPageRevision.revision_number >= revision_number,
+            WikiPageRevision.revision_number <= keyframe,
+        )
+        .order_by(WikiPageRevision.revision_number.desc())
+    )
+    chain = result.all()
+    if not chain or chain[-1].revision_number != revision_number:
+        return None
+
+    text = _revision_text(chain[0], None)
+    for revision in chain[1:]:
+        text = _revision_text(revision, text)
+    return chain[-1], text
+
+
+async def compact_page_revisions(
+    db: AsyncSession, page_id: int, *, expand: bool = False
+) -> tuple[int, int]:
+    """Re-encode all revisions of a page under the current storage settings.
+
+    With ``expand``, revisions are instead written back as plain text in
+    ``content`` (the layout from before delta storage).
+
+    Returns:
+        Stored content bytes before and after
+    """
+    compress = settings.wiki_revision_compression
+    result = await db.scalars(
+        select(WikiPageRevision)
+        .where(WikiPageRevision.wiki_page_id == page_id)
+        .order_by(WikiPageRevision.revision_number.desc())
+        .with_for_update()
+    )
+    revisions = result.all()
+    before = sum(stored_size(revision) for revision in revisions)
+
+    texts: list[str] = []
+    for revision in revisions:
+        texts.append(_revision_text(revision, texts[-1] if texts else None))
+
+    for index, revision in enumerate(revisions):
+        text = texts[index]
+        if expand:
+            revision.storage_format = FULL
+            revision.compression = COMPRESSION_NONE
+            revision.payload = None
+            revision.content = text
+        elif index == 0 or is_keyframe(revision.revision_number):
+            _store(revision, encode_full(text, compress=compress))
+        else:
+            _store(revision, encode_delta(texts[index - 1], text, compress=compress))
+
+    after = sum(stored_size(revision) for revision in revisions)
+    return before, after
@@ -0,0 +1,68 @@
+"""Generate missing thumbnails for existing image attachments.
+
+Attachments uploaded before thumbnails existed (or whose thumbnail generation
+failed) are served at full resolution. This walks all attachments in ID order
+and renders the derivatives that are missing. It is safe to re-run.
+
+Usage:
+    uv run python scripts/backfill_thumbnails.py [--batch-size 200] [--force]
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from app.db.database import async_session_maker
+from app.models.attachment import Attachment
+from app.services.thumbnails import thumbnail_service
+
+
+async def backfill(batch_size: int, force: bool) -> None:
+    generated = skipped = failed = 0
+    last_id = 0
+    while True:
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(Attachment.id, Attachment.storage_path)
+                .where(Attachment.id > last_id)
+                .order_by(Attachment.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        todo = [
+            row for row in rows if force or thumbnail_service.missing(row.storage_path)
+        ]
+        skipped += len(rows) - len(todo)
+        # The process pool renders up to thumbnail_workers images in parallel
+        results = await asyncio.gather(
+            *(thumbnail_service.generate(row.storage_path) for row in todo),
+            return_exceptions=True,
+        )
+        for row, outcome in zip(todo, results, strict=True):
+            if isinstance(outcome, BaseException):
+                failed += 1
+                print(f"✗ Attachment {row.id}: {outcome}")
+            else:
+                generated += 1
+        print(f"… up to attachment {last_id}: {generated} generated")
+
+    thumbnail_service.shutdown()
+    print(
+        f"\n✓ Generated thumbnails for {generated} attachments "
+        f"({skipped} already done, {failed} failed)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument(
+        "--force", action="store_true", help="Re-render existing thumbnails too"
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size, args.force))
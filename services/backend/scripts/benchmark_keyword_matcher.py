@@ -0,0 +1,75 @@
+"""Micro-benchmark: keyword matching on large feed bodies.
+
+Compares the compiled KeywordMatcher against the previous per-keyword
+substring scan for several body sizes and keyword-set sizes.
+
+Usage:
+    uv run python scripts/benchmark_keyword_matcher.py
+"""
+
+import random
+import string
+import timeit
+
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.news_fetcher import SECURITY_KEYWORDS
+
+BODY_SIZES_KB = [10, 100, 1000]
+EXTRA_KEYWORDS = [0, 100, 500]
+REPEAT = 5
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+
+
+def _body(rng: random.Random, size_kb: int) -> str:
+    vocabulary = [_random_word(rng) for _ in range(5000)]
+    vocabulary += ["model", "security", "attack", "data", "ai", "language"]
+    words: list[str] = []
+    length = 0
+    while length < size_kb * 1024:
+        word = rng.choice(vocabulary)
+        words.append(word)
+        length += len(word) + 1
+    # One real match near the end so neither approach can stop early
+    words.insert(len(words) - 10, "prompt injection")
+    return " ".join(words)
+
+
+def _substring_scan(keywords: list[str], text: str) -> list[str]:
+    text = text.lower()
+    return [keyword for keyword in keywords if keyword.lower() in text]
+
+
+def main() -> None:
+    rng = random.Random(42)
+    print(f"{'body':>8} {'keywords':>9} {'substring':>12} {'matcher':>12}")
+    for extra in EXTRA_KEYWORDS:
+        keywords = SECURITY_KEYWORDS + [
+            f"{_random_word(rng)} {_random_word(rng)}" for _ in range(extra)
+        ]
+        matcher = KeywordMatcher(keywords)
+        for size_kb in BODY_SIZES_KB:
+            body = _body(rng, size_kb)
+            assert "prompt injection" in matcher.find(body)
+            substring = min(
+                timeit.repeat(
+                    lambda k=keywords, b=body: _substring_scan(k, b),
+                    number=1,
+                    repeat=REPEAT,
+                )
+            )
+            compiled = min(
+                timeit.repeat(
+                    lambda m=matcher, b=body: m.find(b), number=1, repeat=REPEAT
+                )
+            )
+            print(
+                f"{size_kb:>6}KB {len(keywords):>9} "
+                f"{substring * 1000:>10.2f}ms {compiled * 1000:>10.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark: wiki revision storage and reconstruction.
+
+Simulates two editing patterns, an agent appending to a growing log page and
+scattered edits to a large page, and stores their revisions the way
+app.services.wiki_revisions does. Reports bytes stored against one full copy
+per revision, and the time to rebuild a revision from its nearest full
+keyframe. No database is needed.
+
+Usage:
+    uv run python scripts/benchmark_wiki_revisions.py [--revisions 500]
+"""
+
+import argparse
+import random
+import statistics
+import string
+import time
+from collections.abc import Callable, Iterator
+
+from app.config import settings
+from app.services.wiki_revisions import (
+    FULL,
+    StoredContent,
+    decode_content,
+    encode_delta,
+    encode_full,
+)
+
+
+def _sentence(rng: random.Random) -> str:
+    words = (
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(rng.randint(6, 20))
+    )
+    return " ".join(words).capitalize() + "."
+
+
+def _appends(rng: random.Random, count: int) -> Iterator[str]:
+    """A log page that gets one short paragraph appended per revision."""
+    text = "# Agent log\n\n"
+    for i in range(count):
+        text += f"\n## Step {i}\n{_sentence(rng)} {_sentence(rng)}\n"
+        yield text
+
+
+def _edits(rng: random.Random, count: int) -> Iterator[str]:
+    """A ~100KB page where each revision rewrites a few random lines."""
+    lines = [_sentence(rng) + "\n" for _ in range(1500)]
+    for _ in range(count):
+        for _ in range(rng.randint(1, 3)):
+            lines[rng.randrange(len(lines))] = _sentence(rng) + "\n"
+        yield "".join(lines)
+
+
+def _store(texts: list[str], interval: int, compress: bool) -> list[StoredContent]:
+    """Encode revisions 1..n the way save_revision does, one save at a time."""
+    stored: list[StoredContent] = []
+    for number, text in enumerate(texts, start=1):
+        previous = number - 1
+        if stored and stored[-1].storage_format == FULL and previous % interval:
+            stored[-1] = encode_delta(text, texts[previous - 1], compress=compress)
+        stored.append(encode_full(text, compress=compress))
+    return stored
+
+
+def _rebuild(stored: list[StoredContent], index: int) -> str:
+    keyframe = index
+    while stored[keyframe].storage_format != FULL:
+        keyframe += 1
+    text = decode_content(stored[keyframe], None)
+    for position in range(keyframe - 1, index - 1, -1):
+        text = decode_content(stored[position], text)
+    return text
+
+
+def _run(
+    name: str,
+    workload: Callable[[random.Random, int], Iterator[str]],
+    revisions: int,
+    interval: int,
+) -> None:
+    texts = list(workload(random.Random(42), revisions))
+    raw = sum(len(text.encode()) for text in texts)
+    for compress in (False, True):
+        started = time.perf_counter()
+        stored = _store(texts, interval, compress)
+        encode_ms = (time.perf_counter() - started) * 1000 / len(texts)
+        size = sum(len(item.payload) for item in stored)
+
+        latencies = []
+        for index in range(len(texts)):
+            started = time.perf_counter()
+            assert _rebuild(stored, index) == texts[index]
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        print(
+            f"{name:<8} {'zlib' if compress else 'none':<5} {raw:>13,} "
+            f"{size:>11,} {100 * (1 - size / raw):>6.1f}% {encode_ms:>9.2f} "
+            f"{statistics.median(latencies):>9.2f} {max(latencies):>9.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--revisions", type=int, default=500)
+    parser.add_argument(
+        "--keyframe-interval",
+        type=int,
+        default=settings.wiki_revision_keyframe_interval,
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.revisions} revisions, keyframe every {args.keyframe_interval}\n"
+        f"{'workload':<8} {'codec':<5} {'full copies':>13} {'stored':>11} "
+        f"{'saved':>7} {'save ms':>9} {'p50 ms':>9} {'max ms':>9}"
+    )
+    _run("append", _appends, args.revisions, args.keyframe_interval)
+    _run("edit", _edits, args.revisions, args.keyframe_interval)
+
+
+if __name__ == "__main__":
+    main()
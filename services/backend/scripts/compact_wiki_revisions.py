@@ -0,0 +1,68 @@
+"""Convert stored wiki revisions to compressed reverse deltas.
+
+Revisions saved before delta storage hold a full copy of the page in
+``content``. This walks every page with revisions in ID order and re-encodes
+them with the current keyframe interval and compression settings, one page
+batch per transaction. It is safe to re-run, e.g. after changing
+``WIKI_REVISION_KEYFRAME_INTERVAL``.
+
+Pass ``--expand`` to go the other way and write every revision back as plain
+text in ``content`` (needed before downgrading migration 0040).
+
+Usage:
+    uv run python scripts/compact_wiki_revisions.py [--batch-size 100] [--expand]
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from app.db.database import async_session_maker
+from app.models.wiki_page import WikiPageRevision
+from app.services.wiki_revisions import compact_page_revisions
+
+
+async def compact(batch_size: int, expand: bool) -> None:
+    pages = 0
+    total_before = total_after = 0
+    last_id = 0
+    while True:
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(WikiPageRevision.wiki_page_id)
+                .where(WikiPageRevision.wiki_page_id > last_id)
+                .group_by(WikiPageRevision.wiki_page_id)
+                .order_by(WikiPageRevision.wiki_page_id)
+                .limit(batch_size)
+            )
+            page_ids = result.scalars().all()
+            if not page_ids:
+                break
+            for page_id in page_ids:
+                before, after = await compact_page_revisions(db, page_id, expand=expand)
+                total_before += before
+                total_after += after
+            await db.commit()
+        pages += len(page_ids)
+        last_id = page_ids[-1]
+        print(f"… up to page {last_id}: {pages} pages")
+
+    saved = total_before - total_after
+    percent = 100 * saved / total_before if total_before else 0.0
+    print(
+        f"\n✓ {'Expanded' if expand else 'Compacted'} revisions of {pages} pages: "
+        f"{total_before:,} → {total_after:,} bytes ({percent:.1f}% saved)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--expand",
+        action="store_true",
+        help="Write revisions back as plain full text instead",
+    )
+    args = parser.parse_args()
+    asyncio.run(compact(args.batch_size, args.expand))
@@ -0,0 +1,37 @@
+"""Recompute the materialised project statistics from todos.
+
+``project_stats`` and ``project_due_counts`` are kept current by triggers on
+``todos`` and normally never need this. Run it if they are suspected to have
+drifted, e.g. after restoring ``todos`` from a dump taken without triggers.
+Todo writes are blocked while it runs.
+
+Usage:
+    uv run python scripts/rebuild_project_stats.py [--project-id 12 ...]
+"""
+
+import argparse
+import asyncio
+
+from app.db.database import async_session_maker
+from app.db.project_stats import rebuild_project_stats
+
+
+async def rebuild(project_ids: list[int] | None) -> None:
+    async with async_session_maker() as db:
+        await rebuild_project_stats(db, project_ids)
+        await db.commit()
+    scope = f"{len(project_ids)} projects" if project_ids else "all projects"
+    print(f"✓ Rebuilt project stats for {scope}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--project-id",
+        type=int,
+        action="append",
+        dest="project_ids",
+        help="Only rebuild this project (repeatable)",
+    )
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.project_ids))
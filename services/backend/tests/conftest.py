@@ -30,6 +30,7 @@ from sqlalchemy.ext.asyncio import (  # noqa: E402
     create_async_engine,
 )
 
+from app.core.auth_cache import auth_cache  # noqa: E402
 from app.core.security import hash_password  # noqa: E402
 from app.db.database import Base  # noqa: E402
 from app.dependencies import get_db  # noqa: E402
@@ -156,6 +157,9 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
     app.dependency_overrides[get_db] = override_get_db
 
+    # Database ids are reused across tests, so start with an empty auth cache
+    auth_cache.clear()
+
     # Clear rate limiter state from database before each test
     await db_session.execute(
         delete(SharedState).where(SharedState.namespace == "rate_limit")
@@ -1,5 +1,7 @@
 """Tests for AI article summarization service."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,12 +10,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.article import Article
 from app.models.feed_source import FeedSource, FeedType
+from app.services import article_summarizer
 from app.services.article_summarizer import (
+    TokenBucket,
     _build_source_text,
+    content_hash,
     generate_article_summaries_with_session,
 )
 
 
+def _configure(mock_settings: MagicMock, base_url: str = "") -> None:
+    mock_settings.anthropic_api_key = "test-key"
+    mock_settings.ai_summary_model = "claude-haiku-4-5-20251001"
+    mock_settings.ai_summary_batch_size = 20
+    mock_settings.ai_summary_base_url = base_url
+    mock_settings.ai_summary_concurrency = 4
+    mock_settings.ai_summary_requests_per_minute = 6000
+    mock_settings.ai_summary_max_retries = 3
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client(monkeypatch: pytest.MonkeyPatch):
+    """Don't share the cached API client (or its mocks) between tests."""
+    monkeypatch.setattr(article_summarizer, "RETRY_BASE_DELAY", 0.01)
+    article_summarizer._get_client.cache_clear()
+    yield
+    article_summarizer._get_client.cache_clear()
+
+
 class TestBuildSourceText:
     def test_title_only(self):
         result = _build_source_text("My Title", None, None)
@@ -43,6 +67,25 @@ class TestBuildSourceText:
         assert "Content: Some content" in result
 
 
+class TestContentHash:
+    def test_ignores_case_and_whitespace(self):
+        assert content_hash("Title: A  Story\n") == content_hash("title: a story")
+
+    def test_differs_for_different_text(self):
+        assert content_hash("Title: A") != content_hash("Title: B")
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=100, capacity=2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(4):
+        await bucket.acquire()
+    # Two tokens up front, then two refills at 100/s
+    assert loop.time() - start >= 0.015
+
+
 @pytest_asyncio.fixture
 async def feed_source(db_session: AsyncSession) -> FeedSource:
     source = FeedSource(
@@ -119,9 +162,7 @@ class TestGenerateArticleSummaries:
         db_session: AsyncSession,
         article_without_summary: Article,
     ):
-        mock_settings.anthropic_api_key = "test-key"
-        mock_settings.ai_summary_model = "claude-haiku-4-5-20251001"
-        mock_settings.ai_summary_batch_size = 20
+        _configure(mock_settings)
 
         # Mock the API response
         mock_text_block = MagicMock()
@@ -151,9 +192,7 @@ class TestGenerateArticleSummaries:
         db_session: AsyncSession,
         article_with_summary: Article,
     ):
-        mock_settings.anthropic_api_key = "test-key"
-        mock_settings.ai_summary_model = "claude-haiku-4-5-20251001"
-        mock_settings.ai_summary_batch_size = 20
+        _configure(mock_settings)
 
         mock_client = AsyncMock()
         mock_anthropic.AsyncAnthropic.return_value = mock_client
@@ -173,9 +212,7 @@ class TestGenerateArticleSummaries:
         db_session: AsyncSession,
         article_without_summary: Article,
     ):
-        mock_settings.anthropic_api_key = "test-key"
-        mock_settings.ai_summary_model = "claude-haiku-4-5-20251001"
-        mock_settings.ai_summary_batch_size = 20
+        _configure(mock_settings)
 
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(side_effect=Exception("API error"))
@@ -188,3 +225,170 @@ class TestGenerateArticleSummaries:
         # Article should still have no AI summary
         await db_session.refresh(article_without_summary)
         assert article_without_summary.ai_summary is None
+
+
+class StubMessagesServer:
+    """Minimal local stand-in for the Messages API.
+
+    Answers ``POST /v1/messages`` with a summary echoing the request's title
+    line. The first ``fail_first`` requests get a 529 (overloaded) instead.
+    """
+
+    def __init__(self, fail_first: int = 0, delay: float = 0.05) -> None:
+        self.fail_first = fail_first
+        self.delay = delay
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "StubMessagesServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # One request per connection, so closing the server never waits on
+        # keep-alive connections held by the client's pool.
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            headers = dict(
+                line.lower().split(": ", 1)
+                for line in head.decode().split("\r\n")[1:]
+                if line
+            )
+            body = json.loads(await reader.readexactly(int(headers["content-length"])))
+            status, payload = await self._respond(body)
+            data = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status} Stub\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: close\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode()
+                + data
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, body: dict) -> tuple[int, dict]:
+        self.requests.append(body)
+        index = len(self.requests)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if index <= self.fail_first:
+            return 529, {
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Overloaded"},
+            }
+        title = body["messages"][0]["content"].splitlines()[0]
+        return 200, {
+            "id": f"msg_{index}",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": f"Summary of {title}"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+        }
+
+
+class TestSummaryPipeline:
+    @pytest.mark.asyncio
+    @patch("app.services.article_summarizer.settings")
+    async def test_concurrent_batch_against_stub_server(
+        self,
+        mock_settings: MagicMock,
+        db_session: AsyncSession,
+        feed_source: FeedSource,
+    ):
+        articles = [
+            Article(
+                feed_source_id=feed_source.id,
+                title=f"Story {i}",
+                url=f"https://example.com/story/{i}",
+                summary=f"Body of story {i}",
+                keywords=[],
+            )
+            for i in range(8)
+        ]
+        # A syndicated copy of story 0 under another URL
+        articles.append(
+            Article(
+                feed_source_id=feed_source.id,
+                title="Story 0",
+                url="https://mirror.example.com/story-0",
+                summary="Body of  story 0",
+                keywords=[],
+            )
+        )
+        db_session.add_all(articles)
+        await db_session.commit()
+
+        async with StubMessagesServer(fail_first=1) as server:
+            _configure(mock_settings, base_url=server.base_url)
+            count = await generate_article_summaries_with_session(db_session)
+
+        assert count == 9
+        # 8 unique stories, plus one retry of the overloaded request
+        assert len(server.requests) == 9
+        assert 1 < server.max_in_flight <= 4
+        for article in articles:
+            await db_session.refresh(article)
+            assert article.ai_summary == f"Summary of Title: {article.title}"
+        assert articles[0].content_hash == articles[-1].content_hash
+
+    @pytest.mark.asyncio
+    @patch("app.services.article_summarizer.settings")
+    async def test_reuses_summary_of_duplicate_from_earlier_run(
+        self,
+        mock_settings: MagicMock,
+        db_session: AsyncSession,
+        feed_source: FeedSource,
+    ):
+        source = _build_source_text("Same Story", "Same body", None)
+        db_session.add_all(
+            [
+                Article(
+                    feed_source_id=feed_source.id,
+                    title="Same Story",
+                    url="https://example.com/same",
+                    summary="Same body",
+                    ai_summary="Summarized earlier",
+                    content_hash=content_hash(source),
+                    keywords=[],
+                ),
+                Article(
+                    feed_source_id=feed_source.id,
+                    title="Same Story",
+                    url="https://mirror.example.com/same",
+                    summary="Same body",
+                    keywords=[],
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        async with StubMessagesServer() as server:
+            _configure(mock_settings, base_url=server.base_url)
+            count = await generate_article_summaries_with_session(db_session)
+
+        assert count == 1
+        assert server.requests == []
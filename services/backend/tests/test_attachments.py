@@ -10,6 +10,13 @@ from PIL import Image
 from sqlalchemy import select
 
 from app.models.attachment import Attachment
+from app.services.storage import TEMP_DIR, FileTooLargeError, StorageService
+from app.services.thumbnails import (
+    THUMBNAIL_SIZES,
+    render_thumbnails,
+    thumbnail_service,
+    thumbnail_storage_path,
+)
 
 
 @pytest.fixture
@@ -693,3 +700,213 @@ async def test_delete_nonexistent_attachment_returns_404(
         f"/api/todos/{test_todo['id']}/attachments/99999"
     )
     assert response.status_code == 404
+
+
+# =============================================================================
+# Streaming Upload & Conditional/Range Download Tests
+# =============================================================================
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_storage_stops_writing_once_size_limit_exceeded(tmp_path):
+    """Streaming writes abort past the limit and leave no partial file."""
+    storage = StorageService(tmp_path)
+
+    with pytest.raises(FileTooLargeError):
+        await storage.write_temp_file(_chunks(b"a" * 6, b"b" * 6), max_size=10)
+
+    assert list((tmp_path / TEMP_DIR).iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_storage_moves_temp_file_into_place(tmp_path):
+    """A finished temp file is renamed to a UUID storage path."""
+    storage = StorageService(tmp_path)
+
+    temp_path, size = await storage.write_temp_file(_chunks(b"abc", b"def"), 10)
+    storage_path = storage.store_temp_file(temp_path, "photo.JPG")
+
+    assert size == 6
+    assert not temp_path.exists()
+    assert storage_path.endswith(".jpg")
+    assert storage.get_file_path(storage_path).read_bytes() == b"abcdef"
+
+
+@pytest.mark.asyncio
+async def test_get_attachment_supports_range_requests(
+    authenticated_client: AsyncClient, test_todo, valid_png_bytes
+):
+    """A Range request returns 206 with just the requested bytes."""
+    response = await authenticated_client.post(
+        f"/api/todos/{test_todo['id']}/attachments",
+        files={"file": ("range.png", valid_png_bytes, "image/png")},
+    )
+    attachment_id = response.json()["data"]["id"]
+
+    get_response = await authenticated_client.get(
+        f"/api/todos/{test_todo['id']}/attachments/{attachment_id}",
+        headers={"Range": "bytes=0-15"},
+    )
+    assert get_response.status_code == 206
+    assert get_response.content == valid_png_bytes[:16]
+    assert get_response.headers["content-range"] == (
+        f"bytes 0-15/{len(valid_png_bytes)}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_attachment_honours_if_none_match(
+    authenticated_client: AsyncClient, test_todo, valid_jpeg_bytes
+):
+    """Revalidating with the ETag returns 304 without a body."""
+    response = await authenticated_client.post(
+        f"/api/todos/{test_todo['id']}/attachments",
+        files={"file": ("cached.jpg", valid_jpeg_bytes, "image/jpeg")},
+    )
+    url = f"/api/todos/{test_todo['id']}/attachments/{response.json()['data']['id']}"
+
+    first = await authenticated_client.get(url)
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+
+    second = await authenticated_client.get(url, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+    other = await authenticated_client.get(url, headers={"If-None-Match": '"other"'})
+    assert other.status_code == 200
+    assert other.content == valid_jpeg_bytes
+
+
+# =============================================================================
+# Thumbnail Tests
+# =============================================================================
+
+
+def test_render_thumbnails_fits_each_size(tmp_path):
+    """Derivatives keep the aspect ratio and fit within their edge size."""
+    source = tmp_path / "photo.png"
+    Image.new("RGBA", (2000, 1000), color=(0, 0, 255, 128)).save(source)
+    targets = {
+        name: (str(tmp_path / f"photo.{name}.webp"), edge)
+        for name, edge in THUMBNAIL_SIZES.items()
+    }
+
+    written = render_thumbnails(str(source), targets)
+
+    assert sorted(written) == sorted(THUMBNAIL_SIZES)
+    for name, edge in THUMBNAIL_SIZES.items():
+        with Image.open(targets[name][0]) as thumb:
+            assert thumb.format == "WEBP"
+            assert thumb.size == (edge, edge // 2)
+            assert thumb.mode == "RGBA"
+
+
+def test_render_thumbnails_removes_partial_file_on_failure(tmp_path, monkeypatch):
+    """A derivative that fails to save leaves no temporary file behind."""
+    source = tmp_path / "photo.png"
+    Image.new("RGB", (400, 400)).save(source)
+    target = tmp_path / "photo.small.webp"
+
+    def failing_save(self, fp, *args, **kwargs):
+        with open(fp, "wb") as f:
+            f.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Image.Image, "save", failing_save)
+
+    with pytest.raises(OSError):
+        render_thumbnails(str(source), {"small": (str(target), 320)})
+    assert list(tmp_path.iterdir()) == [source]
+
+
+def test_thumbnail_stored_next_to_original():
+    assert thumbnail_storage_path("ab/abcd-1234.png", "small") == (
+        "ab/abcd-1234.small.webp"
+    )
+
+
+@pytest.mark.asyncio
+async def test_upload_generates_thumbnail(authenticated_client: AsyncClient, test_todo):
+    """A thumbnail is served with immutable caching after upload."""
+    img = Image.new("RGB", (1920, 1080), color="black")
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG")
+
+    response = await authenticated_client.post(
+        f"/api/todos/{test_todo['id']}/attachments",
+        files={"file": ("screen.jpg", buf.getvalue(), "image/jpeg")},
+    )
+    assert response.status_code == 201
+    attachment_id = response.json()["data"]["id"]
+
+    thumb = await authenticated_client.get(
+        f"/api/todos/{test_todo['id']}/attachments/{attachment_id}/thumbnails/small"
+    )
+    assert thumb.status_code == 200
+    assert thumb.headers["content-type"] == "image/webp"
+    assert "immutable" in thumb.headers["cache-control"]
+    with Image.open(io.BytesIO(thumb.content)) as small:
+        assert max(small.size) == THUMBNAIL_SIZES["small"]
+    assert len(thumb.content) < len(buf.getvalue())
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_failure_does_not_fail_upload(
+    authenticated_client: AsyncClient, test_todo, valid_png_bytes, monkeypatch
+):
+    """Thumbnails are rendered after the response; their errors are only logged."""
+
+    async def failing_generate(storage_path: str) -> list[str]:
+        raise OSError("cannot render")
+
+    monkeypatch.setattr(thumbnail_service, "generate", failing_generate)
+
+    response = await authenticated_client.post(
+        f"/api/todos/{test_todo['id']}/attachments",
+        files={"file": ("broken.png", valid_png_bytes, "image/png")},
+    )
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_missing_thumbnail_falls_back_to_original(
+    authenticated_client: AsyncClient, test_todo, valid_png_bytes, db_session
+):
+    """Attachments without thumbnails (not yet backfilled) serve the original."""
+    response = await authenticated_client.post(
+        f"/api/todos/{test_todo['id']}/attachments",
+        files={"file": ("old.png", valid_png_bytes, "image/png")},
+    )
+    attachment_id = response.json()["data"]["id"]
+    attachment = await db_session.get(Attachment, attachment_id)
+    await thumbnail_service.delete(attachment.storage_path)
+
+    thumb = await authenticated_client.get(
+        f"/api/todos/{test_todo['id']}/attachments/{attachment_id}/thumbnails/small"
+    )
+    assert thumb.status_code == 200
+    assert thumb.content == valid_png_bytes
+    assert "immutable" not in thumb.headers["cache-control"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_thumbnail_size_returns_404(
+    authenticated_client: AsyncClient, test_todo, valid_png_bytes
+):
+    response = await authenticated_client.post(
+        f"/api/todos/{test_todo['id']}/attachments",
+        files={"file": ("size.png", valid_png_bytes, "image/png")},
+    )
+    attachment_id = response.json()["data"]["id"]
+
+    thumb = await authenticated_client.get(
+        f"/api/todos/{test_todo['id']}/attachments/{attachment_id}/thumbnails/huge"
+    )
+    assert thumb.status_code == 404
@@ -0,0 +1,280 @@
+"""Tests for the in-process auth cache."""
+
+import asyncio
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.auth_cache import AuthCache, auth_cache, flush_api_key_usage
+from app.core.errors import ApiError
+from app.core.security import generate_api_key, generate_token, hash_password
+from app.dependencies import get_current_user, get_current_user_flexible
+from app.models.api_key import ApiKey
+from app.models.session import Session
+from app.models.user import User
+from app.services.event_bus import EventBus
+
+
+def _request(headers: list[tuple[bytes, bytes]] | None = None, cookies=None):
+    from fastapi import Request
+
+    request = Request(
+        scope={
+            "type": "http",
+            "headers": headers or [],
+            "query_string": b"",
+            "root_path": "",
+            "path": "/",
+            "method": "GET",
+            "scheme": "http",
+            "client": ("127.0.0.1", 1234),
+        }
+    )
+    request._cookies = cookies or {}
+    return request
+
+
+# =============================================================================
+# AuthCache unit tests
+# =============================================================================
+
+
+class TestAuthCache:
+    """Test AuthCache TTL, LRU and invalidation behaviour."""
+
+    def test_put_and_get(self) -> None:
+        cache = AuthCache(ttl_seconds=60, max_entries=10)
+        cache.put("session", "abc", 1)
+        entry = cache.get("session", "abc")
+        assert entry is not None
+        assert entry.user_id == 1
+        # Kind is part of the key
+        assert cache.get("oauth", "abc") is None
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = AuthCache(ttl_seconds=60, max_entries=10)
+        cache.put("session", "abc", 1)
+        with patch(
+            "app.core.auth_cache.time.monotonic", return_value=time.monotonic() + 61
+        ):
+            assert cache.get("session", "abc") is None
+        assert len(cache) == 0
+
+    def test_credential_expiry_caps_ttl(self) -> None:
+        cache = AuthCache(ttl_seconds=3600, max_entries=10)
+        cache.put(
+            "oauth", "tok", 1, expires_at=datetime.now(UTC) + timedelta(seconds=5)
+        )
+        with patch(
+            "app.core.auth_cache.time.monotonic", return_value=time.monotonic() + 10
+        ):
+            assert cache.get("oauth", "tok") is None
+
+    def test_expired_credential_not_cached(self) -> None:
+        cache = AuthCache(ttl_seconds=60, max_entries=10)
+        cache.put(
+            "oauth", "tok", 1, expires_at=datetime.now(UTC) - timedelta(seconds=1)
+        )
+        assert cache.get("oauth", "tok") is None
+
+    def test_lru_eviction(self) -> None:
+        cache = AuthCache(ttl_seconds=60, max_entries=2)
+        cache.put("session", "a", 1)
+        cache.put("session", "b", 2)
+        cache.get("session", "a")  # a becomes most recently used
+        cache.put("session", "c", 3)
+        assert cache.get("session", "a") is not None
+        assert cache.get("session", "b") is None
+        assert cache.get("session", "c") is not None
+
+    def test_invalidate_user(self) -> None:
+        cache = AuthCache(ttl_seconds=60, max_entries=10)
+        cache.put("session", "a", 1)
+        cache.put("api_key", "b", 1, api_key_id=7)
+        cache.put("session", "c", 2)
+        cache.invalidate_user(1)
+        assert cache.get("session", "a") is None
+        assert cache.get("api_key", "b") is None
+        assert cache.get("session", "c") is not None
+        cache.invalidate_user(None)
+        assert len(cache) == 0
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        cache = AuthCache(ttl_seconds=0, max_entries=10)
+        cache.put("session", "a", 1)
+        assert cache.get("session", "a") is None
+
+    def test_pending_api_key_usage(self) -> None:
+        cache = AuthCache(ttl_seconds=60, max_entries=10)
+        cache.record_api_key_use(1)
+        cache.record_api_key_use(1)
+        cache.record_api_key_use(2)
+        assert set(cache.take_pending_api_key_usage()) == {1, 2}
+        assert cache.take_pending_api_key_usage() == {}
+
+
+class TestEventBusAuthDispatch:
+    """Auth payloads invalidate listeners and never reach SSE queues."""
+
+    @pytest.mark.asyncio
+    async def test_auth_payload_goes_to_listeners_only(self) -> None:
+        bus = EventBus()
+        calls: list[int | None] = []
+        bus.add_auth_listener(calls.append)
+        q = bus.subscribe(10)
+
+        payload = json.dumps({"t": "sessions", "auth": True, "uid": 10})
+        bus._on_notify(None, 0, "events", payload)  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+
+        assert calls == [10]
+        assert q.empty()
+
+    def test_connection_lost_invalidates_everything(self) -> None:
+        bus = EventBus()
+        calls: list[int | None] = []
+        bus.add_auth_listener(calls.append)
+        bus._stopping = True  # don't schedule a reconnect
+        bus._on_connection_lost(None)  # type: ignore[arg-type]
+        assert calls == [None]
+
+
+# =============================================================================
+# Dependency integration tests
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def _clear_auth_cache():
+    auth_cache.clear()
+    auth_cache.take_pending_api_key_usage()
+    yield
+    auth_cache.clear()
+
+
+async def _make_user(db_session: AsyncSession) -> User:
+    user = User(
+        email="cache@example.com",
+        password_hash=hash_password("TestPass123!"),  # pragma: allowlist secret
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+@pytest.mark.asyncio
+async def test_session_lookup_is_cached(db_session: AsyncSession):
+    """A cached session resolves without querying the sessions table."""
+    user = await _make_user(db_session)
+    session = Session(
+        id=generate_token(),
+        user_id=user.id,
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+    )
+    db_session.add(session)
+    await db_session.commit()
+
+    request = _request(cookies={"session": session.id})
+    assert (await get_current_user(request, db_session)).id == user.id
+
+    # Deleting the row behind the cache's back doesn't affect the cached entry...
+    await db_session.delete(session)
+    await db_session.commit()
+    assert (await get_current_user(request, db_session)).id == user.id
+
+    # ...until the user is invalidated
+    auth_cache.invalidate_user(user.id)
+    with pytest.raises(ApiError):
+        await get_current_user(request, db_session)
+
+
+@pytest.mark.asyncio
+async def test_api_key_cache_hit_skips_bcrypt(db_session: AsyncSession):
+    """Repeat API key requests skip bcrypt and batch last_used_at."""
+    user = await _make_user(db_session)
+    raw_key = generate_api_key()
+    api_key = ApiKey(
+        user_id=user.id,
+        name="Cached Key",
+        key_hash=hash_password(raw_key),
+        key_prefix=raw_key[:11],
+        is_active=True,
+    )
+    db_session.add(api_key)
+    await db_session.commit()
+
+    request = _request(headers=[(b"x-api-key", raw_key.encode())])
+    assert (await get_current_user_flexible(request, db_session)).id == user.id
+
+    with patch("app.core.password_hasher.verify_password") as verify:
+        assert (await get_current_user_flexible(request, db_session)).id == user.id
+        verify.assert_not_called()
+
+    assert set(auth_cache.take_pending_api_key_usage()) == {api_key.id}
+
+
+@pytest.mark.asyncio
+async def test_revoking_api_key_invalidates_cache(authenticated_client: AsyncClient):
+    """Revoking a key through the API takes effect immediately."""
+    create_response = await authenticated_client.post(
+        "/api/api-keys", json={"name": "Revoke Me"}
+    )
+    raw_key = create_response.json()["data"]["key"]
+    key_id = create_response.json()["data"]["id"]
+
+    response = await authenticated_client.get(
+        "/api/todos", headers={"X-API-Key": raw_key}
+    )
+    assert response.status_code == 200
+
+    await authenticated_client.post(f"/api/api-keys/{key_id}/revoke")
+
+    session_cookie = authenticated_client.cookies.get("session")
+    authenticated_client.cookies.clear()
+    response = await authenticated_client.get(
+        "/api/todos", headers={"X-API-Key": raw_key}
+    )
+    assert response.status_code == 401
+    authenticated_client.cookies.set("session", session_cookie)
+
+
+@pytest.mark.asyncio
+async def test_flush_api_key_usage(db_engine, db_session: AsyncSession):
+    """Batched usage timestamps are written in one flush."""
+    user = await _make_user(db_session)
+    keys = [
+        ApiKey(
+            user_id=user.id,
+            name=f"Key {i}",
+            key_hash="unused",
+            key_prefix=f"tm_{i:08d}",
+            is_active=True,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(keys)
+    await db_session.commit()
+
+    for key in keys[:2]:
+        auth_cache.record_api_key_use(key.id)
+
+    maker = async_sessionmaker(db_engine, expire_on_commit=False)
+    with patch("app.db.database.async_session_maker", maker):
+        await flush_api_key_usage()
+
+    result = await db_session.execute(
+        select(ApiKey.id, ApiKey.last_used_at)
+        .where(ApiKey.user_id == user.id)
+        .execution_options(populate_existing=True)
+    )
+    used = {row.id: row.last_used_at for row in result}
+    assert used[keys[0].id] is not None
+    assert used[keys[1].id] is not None
+    assert used[keys[2].id] is None
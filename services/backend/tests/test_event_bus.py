@@ -3,6 +3,7 @@
 import asyncio
 import json
 from collections.abc import AsyncGenerator
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_asyncio
@@ -10,10 +11,17 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api import events as events_api
 from app.core.tab_id import tab_id_var
 from app.dependencies import get_db
 from app.main import app
-from app.services.event_bus import Event, EventBus
+from app.services.event_bus import (
+    SUBSCRIBER_MAX_PENDING,
+    Event,
+    EventBus,
+    ReplayBuffer,
+    Resync,
+)
 
 # ---------------------------------------------------------------------------
 # Unit tests for EventBus dispatch (no DB needed)
@@ -45,9 +53,16 @@ class TestEventBusDispatch:
             }
         )
 
-    def test_dispatch_to_correct_user(self) -> None:
+    async def _notify(self, *payloads: str) -> None:
+        """Deliver payloads and let the bus dispatch them on the next tick."""
+        for payload in payloads:
+            self.bus._on_notify(None, 0, "events", payload)  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_to_correct_user(self) -> None:
         q = self.bus.subscribe(10)
-        self.bus._on_notify(None, 0, "events", self._make_payload(user_id=10))  # type: ignore[arg-type]
+        await self._notify(self._make_payload(user_id=10))
         assert not q.empty()
         event = q.get_nowait()
         assert isinstance(event, Event)
@@ -57,61 +72,97 @@ class TestEventBusDispatch:
         assert event.user_id == 10
         assert event.tab_id == "abc123"
 
-    def test_events_for_user_a_dont_reach_user_b(self) -> None:
+    @pytest.mark.asyncio
+    async def test_dispatch_is_batched_per_tick(self) -> None:
+        q = self.bus.subscribe(10)
+        self.bus._on_notify(None, 0, "events", self._make_payload())  # type: ignore[arg-type]
+        assert q.empty()
+        await asyncio.sleep(0)
+        assert not q.empty()
+
+    @pytest.mark.asyncio
+    async def test_events_for_user_a_dont_reach_user_b(self) -> None:
         q_a = self.bus.subscribe(10)
         q_b = self.bus.subscribe(20)
-        self.bus._on_notify(None, 0, "events", self._make_payload(user_id=10))  # type: ignore[arg-type]
+        await self._notify(self._make_payload(user_id=10))
         assert not q_a.empty()
         assert q_b.empty()
 
-    def test_malformed_payload_silently_dropped(self) -> None:
+    @pytest.mark.asyncio
+    async def test_malformed_payload_silently_dropped(self) -> None:
         q = self.bus.subscribe(10)
         # Invalid JSON
-        self.bus._on_notify(None, 0, "events", "not-json")  # type: ignore[arg-type]
+        await self._notify("not-json")
         assert q.empty()
         # Valid JSON but missing keys
-        self.bus._on_notify(None, 0, "events", '{"foo": "bar"}')  # type: ignore[arg-type]
+        await self._notify('{"foo": "bar"}')
         assert q.empty()
 
-    def test_full_queue_drops_event(self) -> None:
-        """Full queues drop events without crashing."""
+    @pytest.mark.asyncio
+    async def test_events_for_same_row_coalesce(self) -> None:
+        """Repeated changes to a row while the client is behind keep the last."""
         q = self.bus.subscribe(10)
-        # Fill the queue (maxsize=256)
-        for i in range(256):
-            self.bus._on_notify(  # type: ignore[arg-type]
-                None,  # pyright: ignore[reportArgumentType]
-                0,
-                "events",
-                self._make_payload(user_id=10, row_id=i),
-            )
-        assert q.full()
-        # This should not raise
-        self.bus._on_notify(  # type: ignore[arg-type]
-            None,  # pyright: ignore[reportArgumentType]
-            0,
-            "events",
-            self._make_payload(user_id=10, row_id=999),
+        await self._notify(
+            self._make_payload(row_id=1, op="I"),
+            self._make_payload(row_id=2, op="I"),
+            self._make_payload(row_id=1, op="U"),
         )
-        # Queue is still full, event was dropped
-        assert q.full()
+        assert q.qsize() == 2
+        first = q.get_nowait()
+        second = q.get_nowait()
+        assert isinstance(first, Event) and isinstance(second, Event)
+        assert (first.id, first.op) == (2, "I")
+        assert (second.id, second.op) == (1, "U")
 
-    def test_unsubscribe_removes_queue(self) -> None:
+    @pytest.mark.asyncio
+    async def test_overflow_emits_resync(self) -> None:
+        """A subscription that falls too far behind gets a Resync marker."""
+        q = self.bus.subscribe(10)
+        await self._notify(
+            *(self._make_payload(row_id=i) for i in range(SUBSCRIBER_MAX_PENDING + 1))
+        )
+        item = q.get_nowait()
+        assert isinstance(item, Resync)
+        assert item.dropped == SUBSCRIBER_MAX_PENDING + 1
+        assert q.dropped == SUBSCRIBER_MAX_PENDING + 1
+        # The backlog was discarded; newer events are delivered normally
+        with pytest.raises(asyncio.QueueEmpty):
+            q.get_nowait()
+        await self._notify(self._make_payload(row_id=999))
+        event = q.get_nowait()
+        assert isinstance(event, Event)
+        assert event.id == 999
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_events(self) -> None:
+        q = self.bus.subscribe(10)
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        await self._notify(self._make_payload(user_id=10))
+        event = await asyncio.wait_for(getter, timeout=1.0)
+        assert isinstance(event, Event)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_queue(self) -> None:
         q = self.bus.subscribe(10)
         self.bus.unsubscribe(10, q)
-        self.bus._on_notify(None, 0, "events", self._make_payload(user_id=10))  # type: ignore[arg-type]
+        await self._notify(self._make_payload(user_id=10))
         assert q.empty()
 
-    def test_subscribe_returns_queue_that_receives_events(self) -> None:
+    @pytest.mark.asyncio
+    async def test_subscribe_returns_queue_that_receives_events(self) -> None:
         q = self.bus.subscribe(42)
-        self.bus._on_notify(None, 0, "events", self._make_payload(user_id=42))  # type: ignore[arg-type]
+        await self._notify(self._make_payload(user_id=42))
         event = q.get_nowait()
-        assert event is not None
+        assert isinstance(event, Event)
         assert event.user_id == 42
 
-    def test_multiple_subscribers_same_user(self) -> None:
+    @pytest.mark.asyncio
+    async def test_multiple_subscribers_same_user(self) -> None:
         q1 = self.bus.subscribe(10)
         q2 = self.bus.subscribe(10)
-        self.bus._on_notify(None, 0, "events", self._make_payload(user_id=10))  # type: ignore[arg-type]
+        await self._notify(self._make_payload(user_id=10))
         assert not q1.empty()
         assert not q2.empty()
 
@@ -132,15 +183,116 @@ class TestEventBusDispatch:
         assert q1.get_nowait() is None
         assert q2.get_nowait() is None
 
-    def test_empty_tab_id(self) -> None:
+    @pytest.mark.asyncio
+    async def test_empty_tab_id(self) -> None:
         q = self.bus.subscribe(10)
-        payload = json.dumps({"t": "todos", "op": "U", "id": 5, "uid": 10})
-        self.bus._on_notify(None, 0, "events", payload)  # type: ignore[arg-type]
+        await self._notify(json.dumps({"t": "todos", "op": "U", "id": 5, "uid": 10}))
         event = q.get_nowait()
-        assert event is not None
+        assert isinstance(event, Event)
         assert event.tab_id == ""
 
 
+def _event(seq: int, user_id: int = 1) -> Event:
+    return Event(table="todos", op="U", id=seq, user_id=user_id, tab_id="", seq=seq)
+
+
+class TestReplayBuffer:
+    """Test Last-Event-ID replay bookkeeping."""
+
+    def test_unavailable_until_reset(self) -> None:
+        buf = ReplayBuffer(size=3, max_users=10, window=100)
+        buf.reset(available=False)
+        buf.append(_event(1))
+        assert buf.since(1, 1) is None
+        assert buf.latest() is None
+
+    def test_replays_events_after_last_seen(self) -> None:
+        buf = ReplayBuffer(size=10, max_users=10, window=100)
+        buf.reset()
+        for seq in (101, 102, 103):
+            buf.append(_event(seq))
+        assert [e.seq for e in buf.since(1, 101) or []] == [102, 103]
+        assert buf.since(1, 103) == []
+        assert buf.latest() == 103
+
+    def test_replays_in_arrival_order_not_sequence_order(self) -> None:
+        """Sequence numbers are drawn before commit, so they arrive out of order."""
+        buf = ReplayBuffer(size=10, max_users=10, window=100)
+        buf.reset()
+        for seq in (102, 100, 103, 101):
+            buf.append(_event(seq))
+        assert [e.seq for e in buf.since(1, 102) or []] == [100, 103, 101]
+        assert [e.seq for e in buf.since(1, 103) or []] == [101]
+        assert buf.latest() == 101
+
+    def test_resumes_from_another_users_event(self) -> None:
+        buf = ReplayBuffer(size=10, max_users=10, window=100)
+        buf.reset()
+        buf.append(_event(5, user_id=1))
+        buf.append(_event(3, user_id=2))
+        marker = buf.latest()
+        buf.append(_event(4, user_id=1))
+        assert marker == 3
+        assert [e.seq for e in buf.since(1, marker) or []] == [4]
+        assert buf.since(2, marker) == []
+
+    def test_event_from_before_reset_needs_reload(self) -> None:
+        buf = ReplayBuffer(size=10, max_users=10, window=100)
+        buf.reset()
+        buf.append(_event(1))
+        buf.reset()
+        buf.append(_event(2))
+        assert buf.since(1, 1) is None
+
+    def test_position_outside_window_needs_reload(self) -> None:
+        buf = ReplayBuffer(size=10, max_users=10, window=2)
+        buf.reset()
+        for seq in (1, 2, 3):
+            buf.append(_event(seq))
+        assert buf.since(1, 1) is None
+        assert [e.seq for e in buf.since(1, 2) or []] == [3]
+
+    def test_evicted_events_raise_floor(self) -> None:
+        buf = ReplayBuffer(size=2, max_users=10, window=100)
+        buf.reset()
+        for seq in (1, 2, 3, 4):
+            buf.append(_event(seq))
+        assert buf.since(1, 1) is None
+        assert [e.seq for e in buf.since(1, 2) or []] == [3, 4]
+
+    def test_evicted_user_falls_back_to_reload(self) -> None:
+        buf = ReplayBuffer(size=10, max_users=1, window=100)
+        buf.reset()
+        buf.append(_event(1, user_id=1))
+        buf.append(_event(2, user_id=1))
+        buf.append(_event(3, user_id=2))
+        assert buf.since(1, 1) is None
+        assert buf.since(1, 2) == []
+        assert [e.seq for e in buf.since(2, 1) or []] == [3]
+
+    @pytest.mark.asyncio
+    async def test_bus_records_dispatched_events(self) -> None:
+        bus = EventBus()
+        bus._replay.reset()
+        for row_id, seq in ((1, 8), (2, 7)):
+            payload = json.dumps(
+                {"t": "todos", "op": "U", "id": row_id, "uid": 10, "seq": seq}
+            )
+            bus._on_notify(None, 0, "events", payload)  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+        assert [e.seq for e in bus.replay_since(10, 8) or []] == [7]
+        assert bus.latest_seq() == 7
+
+    def test_connection_lost_clears_history(self) -> None:
+        bus = EventBus()
+        bus._replay.reset()
+        bus._replay.append(_event(1, user_id=10))
+        bus._replay.append(_event(2, user_id=10))
+        bus._stopping = True  # prevent reconnect scheduling
+        bus._on_connection_lost(None)  # type: ignore[arg-type]
+        assert bus.replay_since(10, 1) is None
+
+
 # ---------------------------------------------------------------------------
 # Integration tests for SSE endpoint
 # ---------------------------------------------------------------------------
@@ -171,6 +323,27 @@ class TestSSEEndpoint:
         with pytest.raises(asyncio.TimeoutError):
             await asyncio.wait_for(_check_stream(), timeout=1.0)
 
+    @pytest.mark.asyncio
+    async def test_unreplayable_last_event_id_sends_resync(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A client resuming from an event the server can't replay resyncs."""
+        # The stream never ends, so read the generator rather than the response
+        bus = EventBus()
+        bus._replay.reset()
+        bus._replay.append(_event(7, user_id=10))
+        monkeypatch.setattr(events_api, "event_bus", bus)
+
+        stream = events_api._event_generator(MagicMock(), 10, 42)
+        try:
+            first_message = await anext(stream)
+        finally:
+            await stream.aclose()
+
+        assert first_message.startswith("event: resync\n")
+        assert "id: 7\n" in first_message
+        assert not bus._subscribers
+
 
 # ---------------------------------------------------------------------------
 # Integration test: X-Tab-Id header with set_config()
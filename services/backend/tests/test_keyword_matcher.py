@@ -0,0 +1,137 @@
+"""Tests for the word-level Aho-Corasick keyword matcher."""
+
+import pytest
+
+from app.services import keyword_matcher
+from app.services.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from app.services.news_fetcher import SECURITY_KEYWORDS, article_matches_keywords
+
+
+@pytest.fixture(autouse=True, params=["scan", "automaton"])
+def strategy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Run every test against both the str.find scan and the token automaton."""
+    limit = 1000 if request.param == "scan" else 0
+    monkeypatch.setattr(keyword_matcher, "_SCAN_MAX_ANCHORS", limit)
+    get_keyword_matcher.cache_clear()
+    yield
+    get_keyword_matcher.cache_clear()
+
+
+def test_finds_keywords_in_keyword_order():
+    matcher = KeywordMatcher(["prompt injection", "jailbreak", "red teaming"])
+
+    found = matcher.find("Red teaming report: a JAILBREAK via prompt injection")
+
+    assert found == ["prompt injection", "jailbreak", "red teaming"]
+
+
+def test_matches_whole_words_only():
+    matcher = KeywordMatcher(["alignment", "ai"])
+
+    assert matcher.find("misalignment in chairs") == []
+    assert matcher.find("AI alignment") == ["alignment", "ai"]
+
+
+def test_last_word_may_carry_a_suffix():
+    matcher = KeywordMatcher(["language model", "jailbreak", "prompt injection"])
+
+    assert matcher.find("New large language models released") == ["language model"]
+    assert matcher.find("Jailbreaking GPT-5") == ["jailbreak"]
+    assert matcher.find("Prompt injections everywhere") == ["prompt injection"]
+    # Only the last word may carry a suffix
+    assert matcher.find("languages model") == []
+    assert matcher.find("language models safety", "misjailbreak") == ["language model"]
+
+
+def test_short_words_need_an_exact_match():
+    matcher = KeywordMatcher(["ai", "gpt security"])
+
+    assert matcher.find("aim and aid") == []
+    assert matcher.find("gpt securityish") == ["gpt security"]
+    assert matcher.find("AI, said the gpts security") == ["ai"]
+
+
+def test_exact_word_wins_over_a_shorter_keyword_with_suffix():
+    matcher = KeywordMatcher(["model", "models safety"])
+
+    assert matcher.find("models safety") == ["models safety"]
+    assert matcher.find("modeling") == ["model"]
+
+
+def test_words_before_and_after_the_longest_word():
+    matcher = KeywordMatcher(["neural network attack", "federated learning security"])
+
+    assert matcher.find("A neural—network attacks survey") == ["neural network attack"]
+    assert matcher.find("federated,\n learning security.") == [
+        "federated learning security"
+    ]
+    assert matcher.find("network attack", "learning security") == []
+
+
+def test_punctuation_and_whitespace_separate_words():
+    matcher = KeywordMatcher(["prompt injection"])
+
+    assert matcher.find("prompt-injection") == ["prompt injection"]
+    assert matcher.find("prompt\n   injection.") == ["prompt injection"]
+    assert matcher.find("prompt and injection") == []
+
+
+def test_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(
+        ["language model", "model safety", "b c d", "a b c e", "c"]
+    )
+
+    assert matcher.find("language model safety") == ["language model", "model safety"]
+    # Falls back from the failed "a b c e" branch to "b c d"
+    assert matcher.find("a b c d") == ["b c d", "c"]
+
+
+def test_keywords_do_not_span_fields():
+    matcher = KeywordMatcher(["language model"])
+
+    assert matcher.find("language", "model") == []
+    assert matcher.find("", "a language model") == ["language model"]
+
+
+def test_duplicate_and_empty_keywords_are_ignored():
+    matcher = KeywordMatcher(["Jailbreak", "jailbreak", "  ", "!!"])
+
+    assert matcher.keywords == ("Jailbreak",)
+    assert matcher.find("jailbreak") == ["Jailbreak"]
+    assert KeywordMatcher([]).find("anything") == []
+
+
+def test_matchers_are_cached_per_keyword_set():
+    first = get_keyword_matcher(("a", "b"))
+
+    assert get_keyword_matcher(("a", "b")) is first
+    assert get_keyword_matcher(("a", "c")) is not first
+
+
+def test_article_matches_keywords_defaults_and_overrides():
+    assert article_matches_keywords("Prompt injection", "", "") == (
+        True,
+        ["prompt injection"],
+    )
+    assert article_matches_keywords("Gardening", "", "", ["gardening"]) == (
+        True,
+        ["gardening"],
+    )
+    assert article_matches_keywords("Gardening", "", "", SECURITY_KEYWORDS) == (
+        False,
+        [],
+    )
+
+
+def test_article_matches_keywords_default_keywords_cover_inflections():
+    for title, keyword in [
+        ("New large language models released", "language model"),
+        ("Jailbreaking GPT-5", "jailbreak"),
+        ("Prompt injections everywhere", "prompt injection"),
+        ("foundation models survey", "foundation model"),
+    ]:
+        assert article_matches_keywords(title, "", "") == (True, [keyword])
+
+
+def test_article_matches_keywords_empty_list_matches_nothing():
+    assert article_matches_keywords("Prompt injection", "", "", []) == (False, [])
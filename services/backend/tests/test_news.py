@@ -7,38 +7,11 @@ import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.news import _escape_ilike
 from app.core.security import hash_password
 from app.models.article import Article
 from app.models.feed_source import FeedSource, FeedType
 from app.models.user import User
 
-
-class TestEscapeIlike:
-    """Tests for the _escape_ilike helper."""
-
-    def test_no_special_chars(self):
-        assert _escape_ilike("hello world") == "hello world"
-
-    def test_escape_percent(self):
-        assert _escape_ilike("100%") == "100\\%"
-
-    def test_escape_underscore(self):
-        assert _escape_ilike("my_var") == "my\\_var"
-
-    def test_escape_backslash(self):
-        assert _escape_ilike("path\\to") == "path\\\\to"
-
-    def test_escape_all_special_chars(self):
-        assert _escape_ilike("%_\\") == "\\%\\_\\\\"
-
-    def test_multiple_wildcards(self):
-        assert _escape_ilike("%%%") == "\\%\\%\\%"
-
-    def test_empty_string(self):
-        assert _escape_ilike("") == ""
-
-
 ADMIN_PASSWORD = "AdminPass123!"  # pragma: allowlist secret
 
 
@@ -339,6 +312,36 @@ class TestUpdateFeedSource:
         assert response.status_code == 200
         assert response.json()["data"]["description"] == "Changed desc"
 
+    @pytest.mark.asyncio
+    async def test_update_keywords_clears_validators(
+        self,
+        admin_client: AsyncClient,
+        sample_source: FeedSource,
+        db_session: AsyncSession,
+    ):
+        """New keywords force a full download instead of a 304 on the next fetch."""
+        sample_source.etag = '"v1"'
+        sample_source.last_modified = "Mon, 12 Oct 2026 10:00:00 GMT"
+        await db_session.commit()
+
+        response = await admin_client.put(
+            f"/api/news/sources/{sample_source.id}",
+            json={"description": "Same feed"},
+        )
+        assert response.status_code == 200
+        await db_session.refresh(sample_source)
+        assert sample_source.etag == '"v1"'
+
+        response = await admin_client.put(
+            f"/api/news/sources/{sample_source.id}",
+            json={"keywords": ["gardening"]},
+        )
+        assert response.status_code == 200
+        await db_session.refresh(sample_source)
+        assert sample_source.keywords == ["gardening"]
+        assert sample_source.etag is None
+        assert sample_source.last_modified is None
+
 
 # =============================================================================
 # DELETE /api/news/sources/{source_id} - Delete feed source
@@ -0,0 +1,257 @@
+"""Tests for the RSS fetch engine (conditional GETs, parsing, bulk dedup)."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.article import Article
+from app.models.feed_source import FeedSource
+from app.services import news_fetcher
+from app.services.news_fetcher import (
+    FeedResponse,
+    _fetch_feed_response,
+    _parse_feed,
+    _save_downloaded_feed,
+    _store_new_articles,
+    fetch_all_feeds,
+    fetch_feed_since,
+)
+
+FEED_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item>
+  <title>Prompt injection in the wild</title>
+  <link>https://example.com/a</link>
+  <description>A study of prompt injection attacks.</description>
+  <pubDate>Mon, 12 Oct 2026 10:00:00 GMT</pubDate>
+</item>
+<item>
+  <title>Prompt injection in the wild (repost)</title>
+  <link>https://example.com/a</link>
+  <description>Same link again.</description>
+</item>
+<item>
+  <title>Gardening tips</title>
+  <link>https://example.com/b</link>
+  <description>Nothing relevant here.</description>
+</item>
+<item>
+  <title>Jailbreak benchmarks</title>
+  <link>https://example.com/c</link>
+  <description>Measuring jailbreak robustness.</description>
+</item>
+</channel></rss>
+"""
+
+
+@pytest_asyncio.fixture
+async def feed_source(db_session: AsyncSession) -> FeedSource:
+    source = FeedSource(name="Fetcher Source", url="https://example.com/feed.xml")
+    db_session.add(source)
+    await db_session.commit()
+    await db_session.refresh(source)
+    return source
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_parse_feed_filters_keywords_and_repeated_urls():
+    rows = _parse_feed(FEED_XML, "Test", since=None)
+
+    assert [row["url"] for row in rows] == [
+        "https://example.com/a",
+        "https://example.com/c",
+    ]
+    assert "prompt injection" in rows[0]["keywords"]
+
+
+def test_parse_feed_uses_feed_keywords():
+    rows = _parse_feed(FEED_XML, "Test", since=None, keywords=["gardening"])
+
+    assert [(row["url"], row["keywords"]) for row in rows] == [
+        ("https://example.com/b", ["gardening"])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_sends_validators_and_handles_304():
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return httpx.Response(304)
+
+    async with _client(handler) as client:
+        response = await _fetch_feed_response(
+            client,
+            "https://example.com/feed.xml",
+            etag='"v1"',
+            last_modified="Mon, 12 Oct 2026 10:00:00 GMT",
+        )
+
+    assert response.content is None
+    assert response.etag == '"v1"'
+    assert seen[0]["If-None-Match"] == '"v1"'
+    assert seen[0]["If-Modified-Since"] == "Mon, 12 Oct 2026 10:00:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_store_new_articles_skips_existing_urls(
+    db_session: AsyncSession, feed_source: FeedSource
+):
+    db_session.add(
+        Article(
+            feed_source_id=feed_source.id,
+            title="Already stored",
+            url="https://example.com/a",
+            keywords=[],
+        )
+    )
+    await db_session.commit()
+
+    rows = _parse_feed(FEED_XML, "Test", since=None)
+    added = await _store_new_articles(db_session, feed_source.id, rows)
+    await db_session.commit()
+
+    assert added == 1
+    urls = (await db_session.execute(select(Article.url))).scalars().all()
+    assert sorted(urls) == ["https://example.com/a", "https://example.com/c"]
+
+
+@pytest.mark.asyncio
+async def test_save_downloaded_feed_stores_rows_and_validators(
+    db_session: AsyncSession, feed_source: FeedSource
+):
+    rows = _parse_feed(FEED_XML, "Test", since=None)
+    response = FeedResponse(
+        content=FEED_XML, etag='"v1"', last_modified="Mon, 12 Oct 2026 10:00:00 GMT"
+    )
+
+    added = await _save_downloaded_feed(db_session, feed_source.id, response, rows)
+
+    assert added == 2
+    await db_session.refresh(feed_source)
+    assert feed_source.etag == '"v1"'
+    assert feed_source.last_modified == "Mon, 12 Oct 2026 10:00:00 GMT"
+    first_fetched_at = feed_source.last_fetched_at
+    assert first_fetched_at is not None
+
+    # 304: nothing stored, validators kept, fetch time advanced
+    not_modified = FeedResponse(content=None, etag=None, last_modified=None)
+    added = await _save_downloaded_feed(db_session, feed_source.id, not_modified, [])
+
+    assert added == 0
+    await db_session.refresh(feed_source)
+    assert feed_source.etag == '"v1"'
+    assert feed_source.last_fetched_at > first_fetched_at
+    count = await db_session.scalar(select(func.count(Article.id)))
+    assert count == 2
+
+
+@pytest.mark.asyncio
+async def test_force_fetch_ignores_validators(
+    db_session: AsyncSession, feed_source: FeedSource, monkeypatch: pytest.MonkeyPatch
+):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=FEED_XML, headers={"ETag": '"v2"'})
+
+    monkeypatch.setattr(
+        news_fetcher, "_create_feed_client", lambda *_args: _client(handler)
+    )
+    feed_source.etag = '"v1"'
+    await db_session.commit()
+
+    added = await fetch_feed_since(
+        feed_source, db_session, since=datetime(2026, 1, 1, tzinfo=UTC)
+    )
+
+    assert added == 2
+    assert "If-None-Match" not in requests[0].headers
+    assert feed_source.etag == '"v2"'
+
+
+async def _fetch_all_with_peak(
+    db_engine, monkeypatch: pytest.MonkeyPatch, hosts: list[str]
+) -> tuple[dict[str, int], dict[str | None, int], int]:
+    """Run fetch_all_feeds against one feed per entry of ``hosts``.
+
+    Returns the results and the highest number of requests in flight, per
+    host and overall.
+    """
+    running: dict[str | None, int] = {}
+    peak: dict[str | None, int] = {}
+    total_peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal total_peak
+        host = request.url.host
+        running[host] = running.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), running[host])
+        total_peak = max(total_peak, sum(running.values()))
+        await asyncio.sleep(0.02)
+        running[host] -= 1
+        return httpx.Response(200, content=FEED_XML, headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(
+        news_fetcher, "_create_feed_client", lambda *_args: _client(handler)
+    )
+    monkeypatch.setattr(
+        news_fetcher,
+        "async_session_maker",
+        async_sessionmaker(db_engine, expire_on_commit=False),
+    )
+
+    async with async_sessionmaker(db_engine)() as db:
+        db.add_all(
+            FeedSource(name=f"Feed {i}", url=f"https://{host}/feed-{i}.xml")
+            for i, host in enumerate(hosts)
+        )
+        await db.commit()
+
+    results = await fetch_all_feeds()
+    return results, peak, total_peak
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_feeds_limits_concurrency(
+    db_engine, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "feed_fetch_concurrency", 2)
+    monkeypatch.setattr(settings, "feed_fetch_per_host", 10)
+    hosts = [f"feed{i}.example.com" for i in range(6)]
+
+    results, _, total_peak = await _fetch_all_with_peak(db_engine, monkeypatch, hosts)
+
+    assert total_peak == 2
+    assert sorted(results) == [f"Feed {i}" for i in range(6)]
+    # Every feed carries the same two articles; they're stored once
+    assert sum(results.values()) == 2
+    count = await db_session.scalar(select(func.count(Article.id)))
+    assert count == 2
+    etags = (await db_session.execute(select(FeedSource.etag))).scalars().all()
+    assert etags == ['"v1"'] * 6
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_feeds_limits_each_host(
+    db_engine, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "feed_fetch_concurrency", 8)
+    monkeypatch.setattr(settings, "feed_fetch_per_host", 1)
+    hosts = ["busy.example.com"] * 4 + ["quiet.example.com"] * 2
+
+    _, peak, total_peak = await _fetch_all_with_peak(db_engine, monkeypatch, hosts)
+
+    assert peak == {"busy.example.com": 1, "quiet.example.com": 1}
+    assert total_peak == 2
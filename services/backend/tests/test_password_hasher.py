@@ -0,0 +1,110 @@
+"""Tests for the async password hashing pool."""
+
+import asyncio
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.errors import ApiError
+from app.core.password_hasher import PasswordHasher
+from app.core.security import hash_password
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=2, max_pending=4)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip(hasher: PasswordHasher):
+    """Hashes produced on the pool verify with the synchronous helper too."""
+    password = "ComplexP@ssw0rd!"  # pragma: allowlist secret
+    hashed = await hasher.hash(password)
+
+    assert hashed.startswith("$2b$")
+    assert await hasher.verify(password, hashed) is True
+    assert await hasher.verify("WrongPassword", hashed) is False
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_verify_accepts_existing_hashes(hasher: PasswordHasher):
+    """Hashes created before the pool existed still verify."""
+    hashed = hash_password("legacy-password")  # pragma: allowlist secret
+    assert await hasher.verify("legacy-password", hashed) is True
+
+
+@pytest.mark.asyncio
+async def test_verify_without_hash_returns_false(hasher: PasswordHasher):
+    """A missing hash still runs a dummy verification and fails."""
+    assert await hasher.verify("anything", None) is False
+    await hasher.dummy_verify()
+
+
+@pytest.mark.asyncio
+async def test_runs_off_the_event_loop(hasher: PasswordHasher):
+    """bcrypt runs on a worker thread, not the event loop thread."""
+    seen: list[str] = []
+
+    def record() -> None:
+        seen.append(threading.current_thread().name)
+
+    await hasher._run("hash", record)
+    assert seen[0].startswith("bcrypt")
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_backlog_full():
+    """Jobs beyond max_pending are rejected with a 503."""
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    release = threading.Event()
+    try:
+        blocked = asyncio.create_task(hasher._run("hash", release.wait))
+        await asyncio.sleep(0)
+        assert hasher.pending == 1
+
+        with pytest.raises(ApiError) as exc_info:
+            await hasher.hash("overflow")
+        assert exc_info.value.status_code == 503
+
+        release.set()
+        await blocked
+        assert hasher.pending == 0
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_holds_slot_until_thread_finishes():
+    """A cancelled caller doesn't free a slot while its bcrypt call still runs."""
+    hasher = PasswordHasher(max_workers=1, max_pending=2)
+    started = threading.Event()
+    release = threading.Event()
+    depth_before = REGISTRY.get_sample_value("password_hash_queue_depth")
+
+    def work() -> None:
+        started.set()
+        release.wait()
+
+    try:
+        running = asyncio.create_task(hasher._run("hash", work))
+        queued = asyncio.create_task(hasher._run("hash", release.wait))
+        await asyncio.to_thread(started.wait)
+        running.cancel()
+        queued.cancel()
+        await asyncio.gather(running, queued, return_exceptions=True)
+
+        # The queued job never started and is gone; the running one isn't
+        assert hasher.pending == 1
+        assert REGISTRY.get_sample_value("password_hash_queue_depth") == depth_before
+
+        release.set()
+        hasher.shutdown()
+        assert hasher.pending == 0
+    finally:
+        release.set()
+        hasher.shutdown()
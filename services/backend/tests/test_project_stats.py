@@ -0,0 +1,130 @@
+"""Tests for the trigger-maintained project statistics."""
+
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.project_stats import get_project_stats_rows, rebuild_project_stats
+from app.models.project import Project
+from app.models.project_stats import ProjectDueCount
+from app.models.todo import Todo
+from app.models.user import User
+
+TODAY = date(2026, 3, 10)
+
+
+async def _project(db: AsyncSession, user: User, name: str) -> Project:
+    project = Project(user_id=user.id, name=name)
+    db.add(project)
+    await db.flush()
+    return project
+
+
+async def _todo(db: AsyncSession, user: User, project: Project, **kwargs) -> Todo:
+    todo = Todo(user_id=user.id, project_id=project.id, title="Task", **kwargs)
+    db.add(todo)
+    await db.flush()
+    return todo
+
+
+async def _stats(db: AsyncSession, project: Project, today: date = TODAY) -> dict:
+    rows = await get_project_stats_rows(db, [project.id], today)
+    if not rows:
+        return {}
+    row = rows[0]._asdict()
+    row.pop("project_id")
+    return row
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_todo_writes(db_session: AsyncSession, test_user: User):
+    project = await _project(db_session, test_user, "Stats")
+    other = await _project(db_session, test_user, "Other")
+    done = await _todo(db_session, test_user, project, status="completed")
+    open_todo = await _todo(
+        db_session, test_user, project, estimated_hours=2.5, due_date=date(2026, 3, 1)
+    )
+    await _todo(db_session, test_user, project, parent_id=done.id)  # subtask
+
+    stats = await _stats(db_session, project)
+    assert stats["total_tasks"] == 2
+    assert stats["completed_tasks"] == 1
+    assert stats["pending_tasks"] == 1
+    assert stats["total_estimated_hours"] == pytest.approx(2.5)
+    assert stats["overdue_tasks"] == 1
+
+    open_todo.status = "in_progress"
+    await db_session.flush()
+    stats = await _stats(db_session, project)
+    assert (stats["pending_tasks"], stats["in_progress_tasks"]) == (0, 1)
+    assert stats["overdue_tasks"] == 1
+
+    open_todo.project_id = other.id
+    await db_session.flush()
+    assert (await _stats(db_session, project))["total_tasks"] == 1
+    assert (await _stats(db_session, other))["overdue_tasks"] == 1
+
+    done.deleted_at = datetime.now(UTC)
+    await db_session.flush()
+    assert (await _stats(db_session, project))["total_tasks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_overdue_comes_from_due_date_histogram(
+    db_session: AsyncSession, test_user: User
+):
+    project = await _project(db_session, test_user, "Due")
+    await _todo(db_session, test_user, project, due_date=date(2026, 3, 9))
+    await _todo(db_session, test_user, project, due_date=date(2026, 3, 12))
+    closing = await _todo(db_session, test_user, project, due_date=date(2026, 3, 12))
+    await _todo(
+        db_session, test_user, project, due_date=date(2026, 3, 1), status="completed"
+    )
+
+    assert (await _stats(db_session, project, date(2026, 3, 10)))["overdue_tasks"] == 1
+    assert (await _stats(db_session, project, date(2026, 3, 13)))["overdue_tasks"] == 3
+
+    closing.status = "cancelled"
+    await db_session.flush()
+    assert (await _stats(db_session, project, date(2026, 3, 13)))["overdue_tasks"] == 2
+
+    histogram = await db_session.execute(
+        select(ProjectDueCount.due_date, ProjectDueCount.open_tasks)
+        .where(ProjectDueCount.project_id == project.id)
+        .order_by(ProjectDueCount.due_date)
+    )
+    assert histogram.all() == [(date(2026, 3, 9), 1), (date(2026, 3, 12), 1)]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_trigger_maintained_stats(
+    db_session: AsyncSession, test_user: User
+):
+    project = await _project(db_session, test_user, "Rebuild")
+    await _todo(db_session, test_user, project, status="completed", actual_hours=1)
+    moved = await _todo(db_session, test_user, project, due_date=date(2026, 3, 1))
+    await _todo(db_session, test_user, project, due_date=date(2026, 3, 1))
+    moved.due_date = date(2026, 3, 20)
+    await db_session.flush()
+    maintained = await _stats(db_session, project)
+
+    await rebuild_project_stats(db_session)
+
+    assert await _stats(db_session, project) == maintained
+
+
+@pytest.mark.asyncio
+async def test_deleting_project_drops_its_stats(
+    db_session: AsyncSession, test_user: User
+):
+    project = await _project(db_session, test_user, "Doomed")
+    todo = await _todo(db_session, test_user, project, due_date=date(2026, 3, 1))
+
+    await db_session.delete(project)
+    await db_session.flush()
+    await db_session.refresh(todo)
+
+    assert todo.project_id is None
+    assert await get_project_stats_rows(db_session, [project.id], TODAY) == []
@@ -0,0 +1,167 @@
+"""Tests for recurring task materialisation."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.recurring_task import RecurringTask
+from app.models.todo import Todo
+from app.models.user import User
+from app.services.recurrence import (
+    due_occurrences,
+    first_occurrence,
+    materialize_recurring_tasks_with_session,
+    next_occurrence,
+)
+
+
+def _task(**kwargs) -> RecurringTask:
+    values = {
+        "frequency": "daily",
+        "interval_value": 1,
+        "start_date": date(2026, 1, 1),
+        "next_due_date": date(2026, 1, 1),
+        "skip_missed": False,
+        "is_active": True,
+        "title": "Recurring",
+        "priority": "medium",
+        "tags": [],
+    }
+    values.update(kwargs)
+    return RecurringTask(**values)
+
+
+def test_daily_interval():
+    task = _task(interval_value=3)
+    assert next_occurrence(task, date(2026, 1, 30)) == date(2026, 2, 2)
+
+
+def test_weekly_selected_weekdays():
+    # Mondays and Thursdays every other week; 2026-03-02 is a Monday
+    task = _task(frequency="weekly", interval_value=2, weekdays=[4, 1])
+
+    assert next_occurrence(task, date(2026, 3, 2)) == date(2026, 3, 5)
+    assert next_occurrence(task, date(2026, 3, 5)) == date(2026, 3, 16)
+    # A start date between selected weekdays is moved to the next one
+    assert first_occurrence(task, date(2026, 3, 3)) == date(2026, 3, 5)
+    assert first_occurrence(task, date(2026, 3, 5)) == date(2026, 3, 5)
+
+
+def test_monthly_day_is_clamped_to_month_length():
+    task = _task(frequency="monthly", day_of_month=31)
+
+    assert first_occurrence(task, date(2026, 1, 15)) == date(2026, 1, 31)
+    assert next_occurrence(task, date(2026, 1, 31)) == date(2026, 2, 28)
+    assert next_occurrence(task, date(2026, 2, 28)) == date(2026, 3, 31)
+
+
+def test_yearly_leap_day():
+    task = _task(frequency="yearly", start_date=date(2024, 2, 29))
+
+    assert next_occurrence(task, date(2024, 2, 29)) == date(2025, 2, 28)
+    assert next_occurrence(task, date(2027, 2, 28)) == date(2028, 2, 29)
+
+
+def test_fixed_schedule_catches_up_to_limit():
+    task = _task(next_due_date=date(2026, 1, 1))
+
+    dates, next_due = due_occurrences(task, date(2026, 1, 10), limit=4)
+
+    assert dates == [date(2026, 1, d) for d in (1, 2, 3, 4)]
+    assert next_due == date(2026, 1, 5)
+
+
+def test_floating_schedule_keeps_only_latest():
+    task = _task(next_due_date=date(2026, 1, 1), skip_missed=True)
+
+    dates, next_due = due_occurrences(task, date(2026, 1, 10), limit=4)
+
+    assert dates == [date(2026, 1, 10)]
+    assert next_due == date(2026, 1, 11)
+
+
+def test_end_date_stops_occurrences():
+    task = _task(next_due_date=date(2026, 1, 1), end_date=date(2026, 1, 2))
+
+    dates, next_due = due_occurrences(task, date(2026, 1, 10), limit=10)
+
+    assert dates == [date(2026, 1, 1), date(2026, 1, 2)]
+    assert next_due == date(2026, 1, 3)
+
+
+async def _template(db: AsyncSession, user: User, **kwargs) -> RecurringTask:
+    task = _task(user_id=user.id, **kwargs)
+    db.add(task)
+    await db.flush()
+    return task
+
+
+@pytest.mark.asyncio
+async def test_materialize_catches_up_in_batches(
+    db_session: AsyncSession, test_user: User, monkeypatch
+):
+    monkeypatch.setattr(settings, "recurring_task_batch_size", 1)
+    monkeypatch.setattr(settings, "recurring_task_max_catch_up", 2)
+    fixed = await _template(db_session, test_user, title="Fixed")
+    floating = await _template(
+        db_session, test_user, title="Floating", skip_missed=True
+    )
+    await _template(db_session, test_user, title="Inactive", is_active=False)
+    await _template(
+        db_session, test_user, title="Future", next_due_date=date(2026, 2, 1)
+    )
+    await db_session.commit()
+
+    created = await materialize_recurring_tasks_with_session(
+        db_session, today=date(2026, 1, 5)
+    )
+
+    assert created == 6
+    result = await db_session.execute(
+        select(Todo.title, Todo.due_date, Todo.position).order_by(Todo.position)
+    )
+    rows = result.all()
+    assert [(row.title, row.due_date) for row in rows if row.title == "Fixed"] == [
+        ("Fixed", date(2026, 1, d)) for d in range(1, 6)
+    ]
+    assert [row.due_date for row in rows if row.title == "Floating"] == [
+        date(2026, 1, 5)
+    ]
+    assert [row.position for row in rows] == list(range(6))
+    assert fixed.next_due_date == date(2026, 1, 6)
+    assert floating.next_due_date == date(2026, 1, 6)
+
+    # Nothing is due any more
+    assert (
+        await materialize_recurring_tasks_with_session(
+            db_session, today=date(2026, 1, 5)
+        )
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_materialize_skips_templates_locked_elsewhere(
+    db_engine, db_session: AsyncSession, test_user: User
+):
+    locked = await _template(db_session, test_user, title="Locked")
+    await _template(db_session, test_user, title="Free")
+    await db_session.commit()
+
+    other_session = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with other_session() as other:
+        await other.execute(
+            select(RecurringTask).where(RecurringTask.id == locked.id).with_for_update()
+        )
+
+        created = await materialize_recurring_tasks_with_session(
+            db_session, today=date(2026, 1, 1)
+        )
+        await other.rollback()
+
+    assert created == 1
+    titles = await db_session.scalars(select(Todo.title))
+    assert titles.all() == ["Free"]
@@ -14,8 +14,9 @@ from app.models.feed_source import FeedSource, FeedType
 from app.models.user import User
 from app.services.news_fetcher import (
     SSRFProtectionTransport,
+    _create_feed_client,
+    _fetch_feed_response,
     _is_ip_blocked,
-    _safe_fetch_feed_content,
     validate_feed_url,
 )
 
@@ -220,15 +221,20 @@ class TestSSRFProtectionTransport:
 
 
 # =============================================================================
-# Unit tests for _safe_fetch_feed_content
+# Unit tests for _fetch_feed_response
 # =============================================================================
 
 
-class TestSafeFetchFeedContent:
+async def _fetch(url: str):
+    async with _create_feed_client() as client:
+        return await _fetch_feed_response(client, url)
+
+
+class TestFetchFeedResponse:
     @pytest.mark.asyncio
     async def test_rejects_invalid_scheme(self):
         with pytest.raises(ValueError, match="Invalid URL scheme"):
-            await _safe_fetch_feed_content("file:///etc/passwd")
+            await _fetch("file:///etc/passwd")
 
     @pytest.mark.asyncio
     async def test_timeout_on_slow_server(self):
@@ -241,7 +247,7 @@ class TestSafeFetchFeedContent:
             ),
             pytest.raises(httpx.ReadTimeout),
         ):
-            await _safe_fetch_feed_content("https://slow-server.com/feed")
+            await _fetch("https://slow-server.com/feed")
 
     @pytest.mark.asyncio
     async def test_blocked_ip_raises_before_connect(self):
@@ -251,19 +257,19 @@ class TestSafeFetchFeedContent:
                 (socket.AF_INET, socket.SOCK_STREAM, 0, "", ("127.0.0.1", 443)),
             ]
             with pytest.raises(ValueError, match="blocked network"):
-                await _safe_fetch_feed_content("https://evil-rebind.com/feed")
+                await _fetch("https://evil-rebind.com/feed")
 
     @pytest.mark.asyncio
     async def test_fetches_content_successfully(self):
-        """Verify successful content fetch returns response text."""
+        """Verify successful content fetch returns the response body."""
         with patch.object(
             SSRFProtectionTransport,
             "handle_async_request",
             new_callable=AsyncMock,
             return_value=httpx.Response(200, text="<rss>test feed</rss>"),
         ):
-            result = await _safe_fetch_feed_content("https://example.com/feed.xml")
-            assert result == "<rss>test feed</rss>"
+            result = await _fetch("https://example.com/feed.xml")
+            assert result.content == b"<rss>test feed</rss>"
 
 
 # =============================================================================
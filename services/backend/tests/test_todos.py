@@ -1,5 +1,7 @@
 """Tests for todo endpoints."""
 
+import json
+
 import pytest
 from httpx import AsyncClient
 
@@ -495,6 +497,32 @@ async def test_bulk_update_cannot_make_parent_with_children_a_subtask(
     assert "subtasks" in response.json()["detail"]["message"].lower()
 
 
+@pytest.mark.asyncio
+async def test_bulk_update_reports_not_found_ids(authenticated_client: AsyncClient):
+    """Bulk update applies to existing todos and lists the IDs it skipped."""
+    ids = []
+    for i in range(3):
+        created = await authenticated_client.post(
+            "/api/todos", json={"title": f"Bulk priority {i}"}
+        )
+        ids.append(created.json()["data"]["id"])
+    await authenticated_client.delete(f"/api/todos/{ids[2]}")
+
+    response = await authenticated_client.put(
+        "/api/todos",
+        json={"ids": [*ids, 999999, ids[0]], "updates": {"priority": "urgent"}},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {
+        "updated": 2,
+        "not_found": [ids[2], 999999],
+    }
+    for todo_id in ids[:2]:
+        todo = await authenticated_client.get(f"/api/todos/{todo_id}")
+        assert todo.json()["data"]["priority"] == "urgent"
+
+
 # Parent Task Link Tests
 
 
@@ -1844,15 +1872,45 @@ async def test_batch_create_atomic_rollback(authenticated_client: AsyncClient):
 
 @pytest.mark.asyncio
 async def test_batch_create_over_limit(authenticated_client: AsyncClient):
-    """Test batch create rejects more than 50 todos."""
+    """Test batch create rejects more than 1000 todos."""
     response = await authenticated_client.post(
         "/api/todos/batch",
-        json={"todos": [{"title": f"Task {i}"} for i in range(51)]},
+        json={"todos": [{"title": f"Task {i}"} for i in range(1001)]},
     )
 
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_batch_create_large_import(authenticated_client: AsyncClient):
+    """A large batch keeps order, positions, subtasks, dependencies and projects."""
+    await authenticated_client.post("/api/todos", json={"title": "Existing task"})
+    todos: list[dict] = []
+    for i in range(100):
+        todos.append({"title": f"Epic {i}", "category": f"Area {i % 3}"})
+        todos.append({"title": f"Step {i}.1", "parent_index": 2 * i})
+    todos[3]["depends_on"] = [0]
+
+    response = await authenticated_client.post(
+        "/api/todos/batch", json={"todos": todos}
+    )
+
+    assert response.status_code == 201
+    data = response.json()["data"]
+    assert [t["title"] for t in data] == [t["title"] for t in todos]
+
+    epics = data[::2]
+    assert [t["position"] for t in epics] == list(range(2, 102))
+    assert len({t["project_id"] for t in epics}) == 3
+    assert all(t["project_name"] == f"Area {i % 3}" for i, t in enumerate(epics))
+    for i, step in enumerate(data[1::2]):
+        assert step["parent_id"] == epics[i]["id"]
+        assert step["position"] == 1
+
+    detail = await authenticated_client.get(f"/api/todos/{data[3]['id']}")
+    assert [d["id"] for d in detail.json()["data"]["dependencies"]] == [data[0]["id"]]
+
+
 # --- Batch create with parent_index tests ---
 
 
@@ -2976,3 +3034,137 @@ async def test_clear_time_horizon(authenticated_client: AsyncClient):
     )
     assert update_resp.status_code == 200
     assert update_resp.json()["data"]["time_horizon"] is None
+
+
+async def _create_paging_fixture(client: AsyncClient) -> None:
+    """Create todos with repeated and missing due dates via the batch endpoint."""
+    todos = []
+    for i in range(7):
+        todo: dict = {
+            "title": f"Page Task {i}",
+            "priority": ["low", "high", "urgent"][i % 3],
+            "deadline_type": ["flexible", "hard", "firm"][i % 3],
+        }
+        if i % 3 != 0:
+            todo["due_date"] = f"2026-05-0{1 + i % 2}"
+        todos.append(todo)
+    response = await client.post("/api/todos/batch", json={"todos": todos})
+    assert response.status_code == 201
+
+
+async def _collect_pages(client: AsyncClient, params: dict) -> list[int]:
+    ids: list[int] = []
+    cursor = None
+    for _ in range(10):
+        page_params = dict(params)
+        if cursor:
+            page_params["cursor"] = cursor
+        response = await client.get("/api/todos", params=page_params)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["meta"]["count"] == len(body["data"])
+        ids.extend(t["id"] for t in body["data"])
+        cursor = body["meta"]["next_cursor"]
+        if not body["meta"]["has_more"]:
+            assert cursor is None
+            break
+    return ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", [None, "position", "deadline_type"])
+async def test_list_todos_cursor_pagination(
+    authenticated_client: AsyncClient, order_by: str | None
+):
+    """Keyset pages concatenate to the same order as the unpaginated list."""
+    await _create_paging_fixture(authenticated_client)
+    params = {"order_by": order_by} if order_by else {}
+
+    full = await authenticated_client.get("/api/todos", params=params)
+    expected = [t["id"] for t in full.json()["data"]]
+    assert "next_cursor" not in full.json()["meta"]
+
+    paged = await _collect_pages(authenticated_client, {**params, "limit": 2})
+    assert paged == expected
+
+
+@pytest.mark.asyncio
+async def test_list_todos_cursor_rejects_other_ordering(
+    authenticated_client: AsyncClient,
+):
+    """A cursor issued for one ordering is rejected for another."""
+    await _create_paging_fixture(authenticated_client)
+    first = await authenticated_client.get("/api/todos", params={"limit": 2})
+    cursor = first.json()["meta"]["next_cursor"]
+
+    response = await authenticated_client.get(
+        "/api/todos", params={"cursor": cursor, "order_by": "position"}
+    )
+    assert response.status_code == 400
+
+    response = await authenticated_client.get(
+        "/api/todos", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_todos_fields_projection(authenticated_client: AsyncClient):
+    """fields= returns only the requested columns plus id."""
+    await _create_paging_fixture(authenticated_client)
+
+    response = await authenticated_client.get(
+        "/api/todos", params={"fields": "title,due_date,estimated_hours"}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert len(data) == 7
+    assert set(data[0]) == {"id", "title", "due_date", "estimated_hours"}
+
+
+@pytest.mark.asyncio
+async def test_list_todos_fields_rejects_unknown(authenticated_client: AsyncClient):
+    """Unknown or relationship fields cannot be projected."""
+    response = await authenticated_client.get(
+        "/api/todos", params={"fields": "title,subtasks"}
+    )
+    assert response.status_code == 400
+    assert "subtasks" in response.json()["detail"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_list_todos_stream_json(authenticated_client: AsyncClient):
+    """stream=json produces the same document as the buffered response."""
+    await _create_paging_fixture(authenticated_client)
+    params = {"limit": 3, "fields": "title"}
+
+    buffered = await authenticated_client.get("/api/todos", params=params)
+    streamed = await authenticated_client.get(
+        "/api/todos", params={**params, "stream": "json"}
+    )
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/json")
+    assert streamed.json() == buffered.json()
+
+
+@pytest.mark.asyncio
+async def test_list_todos_stream_ndjson(authenticated_client: AsyncClient):
+    """stream=ndjson emits one todo per line followed by a meta line."""
+    await _create_paging_fixture(authenticated_client)
+    parent = await authenticated_client.get("/api/todos", params={"limit": 1})
+    parent_id = parent.json()["data"][0]["id"]
+    await authenticated_client.post(
+        "/api/todos", json={"title": "Streamed Child", "parent_id": parent_id}
+    )
+
+    response = await authenticated_client.get(
+        "/api/todos", params={"stream": "ndjson", "include_subtasks": True}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1] == {"meta": {"count": 7}}
+    todos = lines[:-1]
+    assert len(todos) == 7
+    by_id = {t["id"]: t for t in todos}
+    assert [s["title"] for s in by_id[parent_id]["subtasks"]] == ["Streamed Child"]
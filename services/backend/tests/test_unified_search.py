@@ -1,11 +1,15 @@
 """Tests for the Unified Search API."""
 
+import asyncio
 from datetime import date
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api import unified_search
+from app.config import settings
 from app.models.article import Article
 from app.models.feed_source import FeedSource
 from app.models.snippet import Snippet
@@ -196,3 +200,219 @@ async def test_cross_user_isolation(
     wiki_results = results.get("wiki", [])
     assert len(task_results) == 0
     assert len(wiki_results) == 0
+
+
+@pytest.mark.asyncio
+async def test_results_ranked_by_relevance(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+) -> None:
+    """Title matches outrank description-only matches."""
+    db_session.add(
+        Todo(
+            user_id=test_user.id,
+            title="Unrelated chore",
+            description="mentions the delta project",
+            status="pending",
+            priority="low",
+        )
+    )
+    await db_session.flush()
+    db_session.add(
+        Todo(
+            user_id=test_user.id, title="Delta review", status="pending", priority="low"
+        )
+    )
+    await db_session.commit()
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "delta", "types": "task"}
+    )
+    assert response.status_code == 200
+    titles = [item["title"] for item in response.json()["data"]["results"]["task"]]
+    assert titles == ["Delta review", "Unrelated chore"]
+
+
+@pytest.mark.asyncio
+async def test_last_term_matches_as_prefix(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+) -> None:
+    """A partially typed last word still finds its matches."""
+    await _seed_data(db_session, test_user.id)
+    await db_session.commit()
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "searchable alp", "types": "task,wiki"}
+    )
+    assert response.status_code == 200
+    results = response.json()["data"]["results"]
+    assert [item["title"] for item in results["task"]] == ["Searchable task alpha"]
+    assert [item["title"] for item in results["wiki"]] == ["Searchable wiki alpha"]
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "alp searchable", "types": "task"}
+    )
+    assert response.json()["data"]["results"]["task"] == []
+
+
+@pytest.mark.asyncio
+async def test_operators_in_query_are_plain_text(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+) -> None:
+    """tsquery syntax in user input is treated as separators, not operators."""
+    await _seed_data(db_session, test_user.id)
+    await db_session.commit()
+
+    for q in ["alpha & | !", "(alpha):*", "'alpha'", "!!!"]:
+        response = await authenticated_client.get(
+            "/api/search", params={"q": q, "types": "task"}
+        )
+        assert response.status_code == 200, q
+
+
+@pytest.mark.asyncio
+async def test_wiki_result_has_headline_subtitle(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+) -> None:
+    """Wiki results carry an excerpt around the matched terms."""
+    db_session.add(
+        WikiPage(
+            user_id=test_user.id,
+            title="Notes",
+            slug="notes",
+            content="Intro text. The epsilon configuration lives here.",
+        )
+    )
+    await db_session.commit()
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "epsilon", "types": "wiki"}
+    )
+    assert response.status_code == 200
+    subtitle = response.json()["data"]["results"]["wiki"][0]["subtitle"]
+    assert "epsilon configuration" in subtitle
+
+
+@pytest.mark.asyncio
+async def test_slow_type_times_out_without_blocking_others(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A search that exceeds its timeout is reported, others still return."""
+    await _seed_data(db_session, test_user.id)
+    await db_session.commit()
+
+    async def slow_search(*_args):
+        await asyncio.sleep(5)
+        return []
+
+    monkeypatch.setitem(unified_search.SEARCHERS, "wiki", slow_search)
+    monkeypatch.setattr(settings, "search_type_timeout_seconds", 0.2)
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "alpha", "types": "task,wiki"}
+    )
+    assert response.status_code == 200
+
+    body = response.json()["data"]
+    assert body["meta"]["timed_out"] == ["wiki"]
+    assert body["results"]["wiki"] == []
+    assert len(body["results"]["task"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_statement_timeout_counts_as_timed_out(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A search cancelled by PostgreSQL's statement_timeout is reported too."""
+    await _seed_data(db_session, test_user.id)
+    await db_session.commit()
+
+    async def cancelled_search(session: AsyncSession, *_args):
+        await session.execute(text("SET LOCAL statement_timeout = 50"))
+        await session.execute(text("SELECT pg_sleep(2)"))
+        return []
+
+    monkeypatch.setitem(unified_search.SEARCHERS, "wiki", cancelled_search)
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "alpha", "types": "task,wiki"}
+    )
+    assert response.status_code == 200
+
+    body = response.json()["data"]
+    assert body["meta"]["timed_out"] == ["wiki"]
+    assert body["results"]["wiki"] == []
+    assert len(body["results"]["task"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_sessions_are_capped(
+    authenticated_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Searches beyond the session cap wait for a free slot."""
+    running = 0
+    peak = 0
+
+    async def counting_search(*_args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return []
+
+    for content_type in unified_search.TYPE_ORDER:
+        monkeypatch.setitem(unified_search.SEARCHERS, content_type, counting_search)
+    monkeypatch.setattr(unified_search, "_search_sessions", asyncio.Semaphore(2))
+
+    response = await authenticated_client.get("/api/search", params={"q": "alpha"})
+    assert response.status_code == 200
+    assert response.json()["data"]["meta"]["timed_out"] == []
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_merged_results(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user,
+) -> None:
+    """merge=true returns one list ranked by normalised score."""
+    await _seed_data(db_session, test_user.id)
+    await db_session.commit()
+
+    response = await authenticated_client.get(
+        "/api/search", params={"q": "alpha", "merge": "true", "limit": 3}
+    )
+    assert response.status_code == 200
+
+    body = response.json()["data"]
+    assert body["meta"]["timed_out"] == []
+    merged = body["merged"]
+    assert len(merged) == 3
+    scores = [item["score"] for item in merged]
+    assert scores == sorted(scores, reverse=True)
+    # Each type's best match is normalised to 1.0
+    assert scores[0] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_merge_not_returned_by_default(
+    authenticated_client: AsyncClient,
+) -> None:
+    response = await authenticated_client.get("/api/search", params={"q": "alpha"})
+    assert "merged" not in response.json()["data"]
@@ -1438,3 +1438,70 @@ async def test_tags_in_tree_response(authenticated_client: AsyncClient) -> None:
     assert response.status_code == 200
     node = response.json()["data"][0]
     assert node["tags"] == ["arch"]
+
+
+@pytest.mark.asyncio
+async def test_list_pagination(authenticated_client: AsyncClient) -> None:
+    """limit/cursor page through the list without repeats or gaps."""
+    for i in range(5):
+        await authenticated_client.post("/api/wiki", json={"title": f"Paged {i}"})
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        params: dict = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client.get("/api/wiki", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        assert "content" not in body["data"][0]
+        seen.extend(page["id"] for page in body["data"])
+        if not body["meta"]["has_more"]:
+            assert body["meta"]["next_cursor"] is None
+            break
+        cursor = body["meta"]["next_cursor"]
+
+    full = await authenticated_client.get("/api/wiki")
+    assert seen == [page["id"] for page in full.json()["data"]]
+    assert len(seen) == 5
+    assert "next_cursor" not in full.json()["meta"]
+
+
+@pytest.mark.asyncio
+async def test_list_cursor_rejected_for_other_ordering(
+    authenticated_client: AsyncClient,
+) -> None:
+    """A cursor from the plain list is not accepted for a search."""
+    for i in range(3):
+        await authenticated_client.post("/api/wiki", json={"title": f"Cursor {i}"})
+    first = await authenticated_client.get("/api/wiki", params={"limit": 1})
+    cursor = first.json()["meta"]["next_cursor"]
+
+    response = await authenticated_client.get(
+        "/api/wiki", params={"q": "cursor", "cursor": cursor}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_tree_etag_not_modified(authenticated_client: AsyncClient) -> None:
+    """An unchanged tree answers If-None-Match with 304; a new page changes it."""
+    await authenticated_client.post("/api/wiki", json={"title": "Cached"})
+
+    first = await authenticated_client.get("/api/wiki/tree")
+    etag = first.headers["ETag"]
+
+    cached = await authenticated_client.get(
+        "/api/wiki/tree", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    await authenticated_client.post("/api/wiki", json={"title": "Another"})
+    changed = await authenticated_client.get(
+        "/api/wiki/tree", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()["data"]) == 2
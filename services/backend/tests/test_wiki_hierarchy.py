@@ -0,0 +1,101 @@
+"""Tests for the recursive-CTE wiki hierarchy queries."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.wiki_hierarchy import get_ancestors, get_subtree_depth, soft_delete_subtree
+from app.models.user import User
+from app.models.wiki_page import WikiPage
+
+
+async def _page(
+    db: AsyncSession, user: User, slug: str, parent: WikiPage | None = None
+) -> WikiPage:
+    page = WikiPage(
+        user_id=user.id,
+        title=slug.title(),
+        slug=slug,
+        parent_id=parent.id if parent else None,
+    )
+    db.add(page)
+    await db.flush()
+    return page
+
+
+@pytest.mark.asyncio
+async def test_ancestors_are_nearest_first(db_session: AsyncSession, test_user: User):
+    root = await _page(db_session, test_user, "root")
+    child = await _page(db_session, test_user, "child", root)
+    leaf = await _page(db_session, test_user, "leaf", child)
+
+    chain = await get_ancestors(db_session, leaf.id)
+
+    assert [(row.slug, row.level) for row in chain] == [
+        ("leaf", 0),
+        ("child", 1),
+        ("root", 2),
+    ]
+    assert chain[-1].parent_id is None
+
+
+@pytest.mark.asyncio
+async def test_ancestors_stop_at_soft_deleted_page(
+    db_session: AsyncSession, test_user: User
+):
+    root = await _page(db_session, test_user, "root")
+    child = await _page(db_session, test_user, "child", root)
+    leaf = await _page(db_session, test_user, "leaf", child)
+    child.deleted_at = datetime.now(UTC)
+    await db_session.flush()
+
+    assert [row.slug for row in await get_ancestors(db_session, leaf.id)] == ["leaf"]
+    assert await get_ancestors(db_session, child.id) == []
+
+
+@pytest.mark.asyncio
+async def test_ancestors_terminate_on_cycle(db_session: AsyncSession, test_user: User):
+    a = await _page(db_session, test_user, "a")
+    b = await _page(db_session, test_user, "b", a)
+    a.parent_id = b.id
+    await db_session.flush()
+
+    chain = await get_ancestors(db_session, a.id)
+
+    assert [row.slug for row in chain] == ["a", "b"]
+    assert chain[-1].parent_id == a.id
+
+
+@pytest.mark.asyncio
+async def test_subtree_depth(db_session: AsyncSession, test_user: User):
+    root = await _page(db_session, test_user, "root")
+    child = await _page(db_session, test_user, "child", root)
+    await _page(db_session, test_user, "sibling", root)
+    leaf = await _page(db_session, test_user, "leaf", child)
+
+    assert await get_subtree_depth(db_session, root.id) == 2
+    assert await get_subtree_depth(db_session, child.id) == 1
+    assert await get_subtree_depth(db_session, leaf.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_subtree(db_session: AsyncSession, test_user: User):
+    root = await _page(db_session, test_user, "root")
+    child = await _page(db_session, test_user, "child", root)
+    await _page(db_session, test_user, "leaf", child)
+    await _page(db_session, test_user, "sibling", root)
+    other = await _page(db_session, test_user, "other")
+
+    deleted = await soft_delete_subtree(db_session, child.id)
+
+    assert deleted == 2
+    live = await db_session.scalars(
+        select(WikiPage.slug)
+        .where(WikiPage.deleted_at.is_(None))
+        .order_by(WikiPage.slug)
+    )
+    assert live.all() == ["other", "root", "sibling"]
+    assert child.deleted_at is not None
+    assert other.deleted_at is None
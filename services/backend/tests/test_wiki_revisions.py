@@ -0,0 +1,139 @@
+"""Tests for delta-compressed wiki revision storage."""
+
+import random
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.user import User
+from app.models.wiki_page import WikiPage, WikiPageRevision
+from app.services.wiki_revisions import (
+    DELTA,
+    FULL,
+    apply_delta,
+    compact_page_revisions,
+    decode_content,
+    encode_delta,
+    encode_full,
+    load_revision,
+    make_delta,
+    save_revision,
+)
+
+
+def test_delta_roundtrip_random_edits():
+    rng = random.Random(0)
+    pieces = ["alpha\n", "beta\n", "\n", "gamma", "delta\r\n", "é\n"]
+    for _ in range(500):
+        base = "".join(rng.choices(pieces, k=rng.randint(0, 30)))
+        target = "".join(rng.choices(pieces, k=rng.randint(0, 30)))
+        assert apply_delta(base, make_delta(base, target)) == target
+
+
+def test_delta_for_append_only_copies():
+    older = "line\n" * 1000
+    newer = older + "appended\n"
+
+    assert make_delta(newer, older) == [[0, 1000]]
+    stored = encode_delta(newer, older)
+    assert stored.storage_format == DELTA
+    assert len(stored.payload) < 20
+    assert decode_content(stored, newer) == older
+
+
+def test_rewrite_falls_back_to_full():
+    stored = encode_delta("completely different\n", "new text\n")
+
+    assert stored.storage_format == FULL
+    assert decode_content(stored, None) == "new text\n"
+
+
+def test_large_payloads_are_compressed():
+    text = "the same words again " * 200
+
+    assert encode_full(text).compression == "zlib"
+    assert encode_full(text, compress=False).compression == "none"
+    assert decode_content(encode_full(text), None) == text
+
+
+async def _page_with_history(
+    db: AsyncSession, user: User, versions: list[str]
+) -> WikiPage:
+    """Create a page and save a revision before each new version."""
+    page = WikiPage(user_id=user.id, title="Log", slug="log", content=versions[0])
+    db.add(page)
+    await db.flush()
+    for content in versions[1:]:
+        await save_revision(db, page)
+        page.content = content
+        page.revision_number += 1
+        await db.flush()
+    return page
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_revisions(
+    db_session: AsyncSession, test_user: User, monkeypatch
+):
+    monkeypatch.setattr(settings, "wiki_revision_keyframe_interval", 4)
+    header = "# Log\n" + "intro line\n" * 20
+    versions = [header + "".join(f"entry {i}\n" for i in range(n)) for n in range(10)]
+    page = await _page_with_history(db_session, test_user, versions)
+
+    formats = (
+        await db_session.scalars(
+            select(WikiPageRevision.storage_format)
+            .where(WikiPageRevision.wiki_page_id == page.id)
+            .order_by(WikiPageRevision.revision_number)
+        )
+    ).all()
+    # Revision 4 and 8 are keyframes, 9 is the newest; the rest are deltas
+    assert [number for number, f in enumerate(formats, start=1) if f == FULL] == [
+        4,
+        8,
+        9,
+    ]
+
+    for number in range(1, 10):
+        loaded = await load_revision(db_session, page.id, number)
+        assert loaded is not None
+        assert loaded[1] == versions[number - 1]
+    assert await load_revision(db_session, page.id, 10) is None
+
+
+@pytest.mark.asyncio
+async def test_compact_converts_legacy_rows(db_session: AsyncSession, test_user: User):
+    page = WikiPage(user_id=test_user.id, title="Old", slug="old", content="v4\n")
+    db_session.add(page)
+    await db_session.flush()
+    base = "shared line\n" * 200
+    for number in range(1, 4):
+        db_session.add(
+            WikiPageRevision(
+                wiki_page_id=page.id,
+                user_id=test_user.id,
+                title="Old",
+                slug="old",
+                content=f"{base}v{number}\n",
+                revision_number=number,
+            )
+        )
+    await db_session.flush()
+
+    before, after = await compact_page_revisions(db_session, page.id)
+    await db_session.flush()
+
+    assert after < before
+    for number in range(1, 4):
+        loaded = await load_revision(db_session, page.id, number)
+        assert loaded is not None
+        assert loaded[0].content is None
+        assert loaded[1] == f"{base}v{number}\n"
+
+    await compact_page_revisions(db_session, page.id, expand=True)
+    await db_session.flush()
+    loaded = await load_revision(db_session, page.id, 1)
+    assert loaded is not None
+    assert loaded[0].content == f"{base}v1\n"
@@ -3,6 +3,10 @@
  *
  * Generates a per-tab ID so the backend can tag which browser tab
  * originated a mutation. Handles auto-reconnect with exponential backoff.
+ *
+ * Tracks the id of the last event received and sends it when reconnecting,
+ * so the backend can replay missed events. The backend sends a `resync`
+ * event when it can't, and the reconnect callback reloads everything.
  */
 
 import { writable } from 'svelte/store';
@@ -32,6 +36,7 @@ let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
 let reconnectAttempt = 0;
 const handlers = new Set<ChangeHandler>();
 let onReconnectCallback: (() => void) | null = null;
+let lastEventId: string | null = null;
 
 const BASE_DELAY = 1000;
 const MAX_DELAY = 30_000;
@@ -57,24 +62,39 @@ export function clearReconnectCallback(): void {
 	onReconnectCallback = null;
 }
 
+function trackEventId(e: MessageEvent): void {
+	if (e.lastEventId) {
+		lastEventId = e.lastEventId;
+	}
+}
+
+function streamUrl(): string {
+	if (!lastEventId) return '/api/events/stream';
+	return `/api/events/stream?last_event_id=${encodeURIComponent(lastEventId)}`;
+}
+
 export function connect(): void {
 	if (eventSource) return;
 
 	connectionState.set('connecting');
 
 	const wasReconnect = reconnectAttempt > 0;
-	eventSource = new EventSource('/api/events/stream');
+	eventSource = new EventSource(streamUrl());
 
 	eventSource.onopen = () => {
 		connectionState.set('connected');
 		reconnectAttempt = 0;
-		// On reconnect, reload all stores to catch missed events
-		if (wasReconnect && onReconnectCallback) {
+		// Without an event id to resume from, the backend can't replay what
+		// was missed, so reload all stores
+		if (wasReconnect && !lastEventId && onReconnectCallback) {
 			onReconnectCallback();
 		}
 	};
 
+	eventSource.addEventListener('ready', trackEventId);
+
 	eventSource.addEventListener('change', (e: MessageEvent) => {
+		trackEventId(e);
 		try {
 			const data: ChangeEvent = JSON.parse(e.data);
 			for (const handler of handlers) {
@@ -85,6 +105,15 @@ export function connect(): void {
 		}
 	});
 
+	// Missed events can't be replayed (too far behind, or the gap is older
+	// than the server's buffer) — reload
+	eventSource.addEventListener('resync', (e: MessageEvent) => {
+		trackEventId(e);
+		if (onReconnectCallback) {
+			onReconnectCallback();
+		}
+	});
+
 	eventSource.onerror = () => {
 		cleanup();
 		connectionState.set('connecting');
@@ -107,5 +136,6 @@ export function disconnect(): void {
 	}
 	cleanup();
 	reconnectAttempt = 0;
+	lastEventId = null;
 	connectionState.set('disconnected');
 }
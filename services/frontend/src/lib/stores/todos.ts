@@ -186,6 +186,13 @@ function createTodoStore() {
 		getAttachmentUrl: (todoId: number, attachmentId: number): string => {
 			return `/api/todos/${todoId}/attachments/${attachmentId}`;
 		},
+		getAttachmentThumbnailUrl: (
+			todoId: number,
+			attachmentId: number,
+			size: 'small' | 'medium' = 'small'
+		): string => {
+			return `/api/todos/${todoId}/attachments/${attachmentId}/thumbnails/${size}`;
+		},
 		// Dependency methods
 		loadDependencies: async (todoId: number): Promise<TaskDependency[]> => {
 			try {
@@ -285,6 +285,7 @@ export interface FeedSource {
 	fetch_interval_hours: number;
 	last_fetched_at: string | null;
 	quality_score: number;
+	keywords: string[] | null;
 	created_at: string;
 }
 
@@ -296,6 +297,7 @@ export interface FeedSourceCreate {
 	is_active?: boolean;
 	is_featured?: boolean;
 	fetch_interval_hours?: number;
+	keywords?: string[] | null;
 }
 
 export interface FeedSourceUpdate extends Partial<FeedSourceCreate> {}
@@ -60,6 +60,10 @@ DEVICE_CODE_GRANT_TYPE = "urn:ietf:params:oauth:grant-type:device_code"
 
 ALLOWED_MCP_ORIGINS = parse_allowed_origins()
 
+# How often the size of the access-token table is logged. Counting is a full
+# scan, so it runs on this timer instead of on the introspection path.
+TOKEN_COUNT_INTERVAL_SECONDS = 60.0
+
 
 def transform_backend_error_to_oauth(backend_response: dict[str, Any]) -> dict[str, str]:
     """
@@ -1265,6 +1269,27 @@ def create_authorization_server(
     return Starlette(routes=[*routes, static_mount], middleware=[Middleware(LoggingMiddleware)])
 
 
+async def report_token_count(
+    token_storage: "TokenStorage", interval: float = TOKEN_COUNT_INTERVAL_SECONDS
+) -> None:
+    """Log the number of stored access tokens every ``interval`` seconds.
+
+    The line carries the value in ``extra["access_token_count"]`` so the log
+    pipeline can chart it as a gauge. Runs until cancelled.
+    """
+    while True:
+        try:
+            count = await token_storage.get_token_count()
+        except Exception as e:
+            logger.warning(f"Failed to count stored access tokens: {e}")
+        else:
+            logger.info(
+                f"Access tokens in storage: {count}",
+                extra={"access_token_count": count},
+            )
+        await asyncio.sleep(interval)
+
+
 async def run_server(
     host: str, port: int, server_url: AnyHttpUrl, auth_settings: TaskManagerAuthSettings
 ) -> None:
@@ -1321,9 +1346,14 @@ async def run_server(
     logger.info(f"💾 Token storage: {storage_type}")
     logger.info("=" * 60)
 
+    token_count_task = (
+        asyncio.create_task(report_token_count(token_storage)) if token_storage else None
+    )
     try:
         await server.serve()
     finally:
+        if token_count_task:
+            token_count_task.cancel()
         # Clean up token storage on shutdown
         if token_storage:
             await token_storage.close()
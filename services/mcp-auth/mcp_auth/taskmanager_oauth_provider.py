@@ -770,10 +770,7 @@ class TaskManagerOAuthProvider(
                 expires_at=refresh_expires_at,
                 resource=authorization_code.resource,
             )
-            token_count = await self.token_storage.get_token_count()
-            logger.info(
-                f"Stored access and refresh tokens in database, total access tokens: {token_count}"
-            )
+            logger.info("Stored access and refresh tokens in database")
         else:
             self.tokens[mcp_token] = access_token
             self.refresh_tokens[mcp_refresh_token] = RefreshToken(
@@ -808,26 +805,20 @@ class TaskManagerOAuthProvider(
         This checks if the token exists and hasn't expired. For tokens
         that were issued based on taskmanager authentication, you might
         want to add additional validation here.
-        """
-        logger.info("=== LOAD ACCESS TOKEN ===")
-        logger.info(
-            f"Looking for token: {token[:20]}...{token[-10:]}"
-            if len(token) > 30
-            else f"Token: {token}"
-        )
 
+        This runs on every introspection, so it does a single indexed lookup
+        and only logs at DEBUG level on success. The size of the token table
+        is reported separately by the auth server (see report_token_count).
+        """
         # Try database storage first if available
         if self.token_storage:
-            token_count = await self.token_storage.get_token_count()
-            logger.info(f"Database token storage has {token_count} tokens")
-
             token_data = await self.token_storage.load_token(token)
             if not token_data:
-                logger.warning("Token NOT FOUND in database!")
+                logger.warning("Access token not found in database")
                 return None
 
-            logger.info(
-                f"Token found in database! Client: {token_data['client_id']}, "
+            logger.debug(
+                f"Token found in database. Client: {token_data['client_id']}, "
                 f"Scopes: {token_data['scopes']}"
             )
 
@@ -840,19 +831,18 @@ class TaskManagerOAuthProvider(
                 resource=token_data["resource"],
             )
 
-            logger.info(f"Token valid, expires at: {access_token.expires_at}")
             return cast(AccessTokenT, access_token)
 
         # Fall back to in-memory storage
-        logger.info(f"In-memory token storage has {len(self.tokens)} tokens")
-
         access_token = self.tokens.get(token)
         if not access_token:
-            logger.warning("Token NOT FOUND in memory storage!")
-            logger.warning(f"Available token prefixes: {[k[:20] for k in self.tokens]}")
+            logger.warning("Access token not found in memory storage")
             return None
 
-        logger.info(f"Token found! Client: {access_token.client_id}, Scopes: {access_token.scopes}")
+        logger.debug(
+            f"Token found in memory. Client: {access_token.client_id}, "
+            f"Scopes: {access_token.scopes}"
+        )
 
         # Check if expired
         if access_token.expires_at and access_token.expires_at < time.time():
@@ -862,7 +852,6 @@ class TaskManagerOAuthProvider(
             del self.tokens[token]
             return None
 
-        logger.info(f"Token valid, expires at: {access_token.expires_at}")
         return cast(AccessTokenT, access_token)
 
     async def _get_refresh_token_resource(self, refresh_token: str) -> str | None:
@@ -1084,20 +1073,6 @@ class TaskManagerOAuthProvider(
         This is used by MCP Resource Servers to validate tokens without
         direct access to token storage. Returns token metadata if valid.
         """
-        logger.info("=== INTROSPECT TOKEN ===")
-        logger.info(
-            f"Token to introspect: {token[:20]}...{token[-10:]}"
-            if len(token) > 30
-            else f"Token: {token}"
-        )
-
-        if self.token_storage:
-            token_count = await self.token_storage.get_token_count()
-            logger.info(f"Using database storage with {token_count} tokens")
-        else:
-            logger.info(f"Using in-memory storage with {len(self.tokens)} tokens")
-            logger.info(f"Available token keys: {[k[:20] + '...' for k in self.tokens]}")
-
         access_token = await self.load_access_token(token)
         if not access_token:
             logger.warning("Token not found or expired in introspection")
@@ -0,0 +1,150 @@
+"""Load test: token introspection throughput against a large token table.
+
+Seeds ``mcp_access_tokens`` with synthetic tokens (one million by default),
+then drives ``TaskManagerOAuthProvider.introspect_token`` from concurrent
+workers for a fixed duration and reports introspections/sec and latency
+percentiles. Pass ``--with-count`` to add the two ``get_token_count()`` calls
+that introspection used to make, to compare against the old hot path.
+
+Seeded rows share a prefix and are deleted afterwards unless ``--keep`` is
+given, in which case a later run with the same ``--rows`` reuses them.
+
+Usage:
+    DATABASE_URL=postgresql://... uv run python scripts/load_test_introspection.py
+    uv run python scripts/load_test_introspection.py --rows 100000 --with-count
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+
+import asyncpg
+import click
+from mcp_auth_framework.storage import PostgresTokenStorage
+
+from mcp_auth.taskmanager_oauth_provider import (
+    TaskManagerAuthSettings,
+    TaskManagerOAuthProvider,
+)
+
+TOKEN_PREFIX = "loadtest_"
+SEED_BATCH = 50_000
+
+
+def _token(index: int) -> str:
+    return f"{TOKEN_PREFIX}{index:012d}"
+
+
+async def _seed(database_url: str, rows: int) -> None:
+    conn = await asyncpg.connect(database_url)
+    try:
+        existing = await conn.fetchval(
+            "SELECT count(*) FROM mcp_access_tokens WHERE token LIKE $1",
+            f"{TOKEN_PREFIX}%",
+        )
+        if existing == rows:
+            click.echo(f"Reusing {rows:,} seeded tokens")
+            return
+        await conn.execute("DELETE FROM mcp_access_tokens WHERE token LIKE $1", f"{TOKEN_PREFIX}%")
+        expires_at = datetime.now(UTC) + timedelta(days=1)
+        started = time.perf_counter()
+        for start in range(0, rows, SEED_BATCH):
+            await conn.copy_records_to_table(
+                "mcp_access_tokens",
+                columns=["token", "client_id", "scopes", "resource", "expires_at"],
+                records=[
+                    (_token(i), "loadtest-client", "read", None, expires_at)
+                    for i in range(start, min(start + SEED_BATCH, rows))
+                ],
+            )
+        await conn.execute("ANALYZE mcp_access_tokens")
+        click.echo(f"Seeded {rows:,} tokens in {time.perf_counter() - started:.1f}s")
+    finally:
+        await conn.close()
+
+
+async def _cleanup(database_url: str) -> None:
+    conn = await asyncpg.connect(database_url)
+    try:
+        await conn.execute("DELETE FROM mcp_access_tokens WHERE token LIKE $1", f"{TOKEN_PREFIX}%")
+    finally:
+        await conn.close()
+
+
+async def _run(
+    database_url: str,
+    rows: int,
+    concurrency: int,
+    duration: float,
+    with_count: bool,
+) -> None:
+    storage = PostgresTokenStorage(database_url)
+    await storage.initialize()
+    provider = TaskManagerOAuthProvider(  # type: ignore[var-annotated]
+        TaskManagerAuthSettings(
+            base_url="http://localhost:4321",
+            client_id="loadtest",
+            client_secret="loadtest",  # pragma: allowlist secret
+        ),
+        server_url="http://localhost:9000",
+        token_storage=storage,
+    )
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker(seed: int) -> None:
+        rng = random.Random(seed)  # noqa: S311 - picks test tokens, not secrets
+        while time.perf_counter() < deadline:
+            token = _token(rng.randrange(rows))
+            started = time.perf_counter()
+            if with_count:
+                await storage.get_token_count()
+                await storage.get_token_count()
+            result = await provider.introspect_token(token)
+            latencies.append(time.perf_counter() - started)
+            assert result and result["active"], f"{token} should be active"
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(seed) for seed in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await storage.close()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    click.echo(
+        f"{'with' if with_count else 'without'} COUNT(*): "
+        f"{len(latencies) / elapsed:,.0f} introspections/sec over {len(latencies):,} "
+        f"calls, p50 {statistics.median(latencies) * 1000:.2f} ms, "
+        f"p99 {p99 * 1000:.2f} ms"
+    )
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, show_default=True, help="Tokens to seed.")
+@click.option("--concurrency", default=10, show_default=True, help="Concurrent workers.")
+@click.option("--duration", default=10.0, show_default=True, help="Seconds to run.")
+@click.option("--with-count", is_flag=True, help="Also run the old per-call COUNT(*)s.")
+@click.option("--keep", is_flag=True, help="Keep the seeded tokens afterwards.")
+def main(rows: int, concurrency: int, duration: float, with_count: bool, keep: bool) -> None:
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        raise click.UsageError("DATABASE_URL must point at the token database")
+
+    async def run() -> None:
+        await _seed(database_url, rows)
+        try:
+            await _run(database_url, rows, concurrency, duration, with_count)
+        finally:
+            if not keep:
+                await _cleanup(database_url)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -377,3 +377,70 @@ class TestOAuthCallbackTokenValidation:
         stored_token = provider.tokens.get("tm-access-token-list")
         assert stored_token is not None
         assert stored_token.scopes == ["read", "admin"]
+
+
+class TestIntrospectToken:
+    """Test that introspection is a single storage lookup."""
+
+    def _provider_with_storage(
+        self, token_data: dict | None
+    ) -> tuple[TaskManagerOAuthProvider, AsyncMock]:
+        provider = _create_provider()
+        storage = AsyncMock()
+        storage.load_token.return_value = token_data
+        provider.token_storage = storage
+        return provider, storage
+
+    @pytest.mark.asyncio
+    async def test_active_token_uses_one_lookup(self) -> None:
+        """An active token is resolved without counting the token table."""
+        expires_at = int(time.time()) + 3600
+        provider, storage = self._provider_with_storage(
+            {
+                "token": "mcp_token",
+                "client_id": "client-1",
+                "scopes": ["read"],
+                "expires_at": expires_at,
+                "resource": "http://localhost:8001",
+            }
+        )
+
+        result = await provider.introspect_token("mcp_token")
+
+        assert result is not None
+        assert result["active"] is True
+        assert result["client_id"] == "client-1"
+        assert result["exp"] == expires_at
+        storage.load_token.assert_awaited_once_with("mcp_token")
+        storage.get_token_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_is_inactive(self) -> None:
+        """A token missing from storage is reported inactive."""
+        provider, storage = self._provider_with_storage(None)
+
+        assert await provider.introspect_token("missing") == {"active": False}
+        storage.get_token_count.assert_not_awaited()
+
+
+class TestReportTokenCount:
+    """Test the periodic token-count gauge."""
+
+    @pytest.mark.asyncio
+    async def test_logs_count_until_cancelled(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The count is read from storage on each tick and logged."""
+        from mcp_auth.auth_server import report_token_count
+
+        storage = AsyncMock()
+        storage.get_token_count.return_value = 1_000_000
+
+        with (
+            caplog.at_level("INFO", logger="mcp_auth.auth_server"),
+            patch("mcp_auth.auth_server.asyncio.sleep", side_effect=[None, TimeoutError]),
+            pytest.raises(TimeoutError),
+        ):
+            await report_token_count(storage, interval=1)
+
+        assert storage.get_token_count.await_count == 2
+        counts = [getattr(r, "access_token_count", None) for r in caplog.records]
+        assert [c for c in counts if c is not None] == [1_000_000, 1_000_000]
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,15 +19,41 @@ logger = logging.getLogger(__name__)
 
 # Redis key prefixes
 _CHANNELS_KEY = "relay:channels"  # SET of channel names
-_CHANNEL_PREFIX = "relay:channel:"  # LIST per channel (JSON messages)
+_INDEX_PREFIX = "relay:index:"  # ZSET per channel: message id -> timestamp (µs)
+_MESSAGES_PREFIX = "relay:messages:"  # HASH per channel: message id -> JSON message
+_LEGACY_CHANNEL_PREFIX = "relay:channel:"  # LIST per channel (pre-index layout)
+_NOTIFY_CHANNEL = "relay:notify"  # pub/sub: {"channel": ..., "origin": ...} per new message
+
+# How long wait_for_new waits for the notification subscription before
+# falling back to local-only wake-ups.
+_SUBSCRIBE_WAIT = 1.0
+_RESUBSCRIBE_MAX_DELAY = 30.0
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _score(timestamp: str) -> int:
+    """Microseconds since the epoch for an ISO timestamp (naive means UTC)."""
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
 
 
 class RedisMessageStore:
     """Redis-backed message store with the same async interface as MessageStore.
 
-    Messages are stored as JSON in Redis lists (one list per channel).
-    Channel names are tracked in a Redis set. New-message notifications
-    use local asyncio events for the wait_for_new long-poll mechanism.
+    Each channel is a sorted set of message IDs scored by timestamp plus a
+    hash of ID -> JSON message, so reads fetch and parse only the requested
+    window (``ZRANK``/``ZCOUNT`` to locate it, ``ZRANGE`` + ``HMGET`` to load
+    it) and a single message is deleted with ``ZREM`` + ``HDEL``. Messages
+    with equal timestamps are ordered by ID. Channel names are tracked in a
+    Redis set.
+
+    New messages wake ``wait_for_new`` long-polls through local asyncio
+    events. So that replicas wake each other, ``add`` also publishes to a
+    Redis pub/sub channel, and each process keeps one subscription (started
+    by its first long-poll) that fans notifications out to its local events.
     """
 
     def __init__(
@@ -41,9 +68,16 @@ class RedisMessageStore:
         self._max_channels = max_channels
         self._max_message_size = max_message_size
         self._events: dict[str, asyncio.Event] = {}
+        self._migrated: set[str] = set()
+        self._origin = uuid.uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
 
-    def _channel_key(self, channel: str) -> str:
-        return f"{_CHANNEL_PREFIX}{channel}"
+    def _index_key(self, channel: str) -> str:
+        return f"{_INDEX_PREFIX}{channel}"
+
+    def _messages_key(self, channel: str) -> str:
+        return f"{_MESSAGES_PREFIX}{channel}"
 
     def _parse_message(self, raw: str | bytes) -> Message:
         if isinstance(raw, bytes):
@@ -57,9 +91,41 @@ class RedisMessageStore:
             timestamp=d["timestamp"],
         )
 
-    async def _get_all_messages(self, channel: str) -> list[Message]:
-        raw_messages = await self._redis.lrange(self._channel_key(channel), 0, -1)
-        return [self._parse_message(raw) for raw in raw_messages]
+    async def _migrate_legacy(self, channel: str) -> None:
+        """Move a channel stored as a JSON list into the indexed layout.
+
+        Checked once per channel per process; a no-op once migrated.
+        """
+        if channel in self._migrated:
+            return
+        legacy_key = f"{_LEGACY_CHANNEL_PREFIX}{channel}"
+        raw_messages = await self._redis.lrange(legacy_key, 0, -1)
+        if raw_messages:
+            pipe = self._redis.pipeline(transaction=True)
+            for raw in raw_messages:
+                msg = self._parse_message(raw)
+                pipe.hset(self._messages_key(channel), msg.id, json.dumps(msg.to_dict()))
+                pipe.zadd(self._index_key(channel), {msg.id: _score(msg.timestamp)})
+            pipe.delete(legacy_key)
+            await pipe.execute()
+            logger.info(f"Migrated {len(raw_messages)} messages in channel '{channel}'")
+        self._migrated.add(channel)
+
+    async def _load(self, channel: str, start: int, end: int) -> list[Message]:
+        """Load the messages at ranks ``start``..``end`` (inclusive) in order."""
+        if end < start:
+            return []
+        ids = await self._redis.zrange(self._index_key(channel), start, end)
+        if not ids:
+            return []
+        raw_messages = await self._redis.hmget(self._messages_key(channel), ids)
+        return [self._parse_message(raw) for raw in raw_messages if raw is not None]
+
+    async def _rank(self, channel: str, message_id: str) -> int:
+        rank = await self._redis.zrank(self._index_key(channel), message_id)
+        if rank is None:
+            raise ValueError(f"Cursor ID not found: {message_id}")
+        return int(rank)
 
     async def add(self, channel: str, content: str, sender: str = "anonymous") -> Message:
         """Add a message to a channel."""
@@ -68,13 +134,14 @@ class RedisMessageStore:
                 f"Message too large: {len(content)} bytes (max {self._max_message_size})"
             )
 
-        channel_key = self._channel_key(channel)
         is_new_channel = not await self._redis.sismember(_CHANNELS_KEY, channel)
         if is_new_channel:
             current_count = await self._redis.scard(_CHANNELS_KEY)
             if current_count >= self._max_channels:
                 raise ValueError(f"Channel limit reached: {self._max_channels} channels")
             await self._redis.sadd(_CHANNELS_KEY, channel)
+        else:
+            await self._migrate_legacy(channel)
 
         msg = Message(
             id=str(uuid.uuid4()),
@@ -84,13 +151,33 @@ class RedisMessageStore:
             timestamp=datetime.now(UTC).isoformat(),
         )
 
-        await self._redis.rpush(channel_key, json.dumps(msg.to_dict()))
-        await self._redis.ltrim(channel_key, -self._max_per_channel, -1)
-
-        # Signal local asyncio waiters
-        if channel in self._events:
-            self._events[channel].set()
-            self._events[channel] = asyncio.Event()
+        index_key = self._index_key(channel)
+        messages_key = self._messages_key(channel)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hset(messages_key, msg.id, json.dumps(msg.to_dict()))
+        pipe.zadd(index_key, {msg.id: _score(msg.timestamp)})
+        # The oldest messages beyond the per-channel limit, as of this add
+        pipe.zrange(index_key, 0, -(self._max_per_channel + 1))
+        *_, evicted = await pipe.execute()
+
+        # Remove exactly those messages. Concurrent adds may pick overlapping
+        # ranges; removing a member twice is a no-op, so they never evict more
+        # than the overflow.
+        if evicted:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.zrem(index_key, *evicted)
+            pipe.hdel(messages_key, *evicted)
+            await pipe.execute()
+
+        # Signal local asyncio waiters, then other replicas
+        self._notify_local(channel)
+        try:
+            await self._redis.publish(
+                _NOTIFY_CHANNEL, json.dumps({"channel": channel, "origin": self._origin})
+            )
+        except Exception as e:
+            # The message is stored; remote long-polls will see it on their next read
+            logger.warning(f"Failed to publish new-message notification for '{channel}': {e}")
 
         return msg
 
@@ -103,43 +190,50 @@ class RedisMessageStore:
         after: str | None = None,
         before: str | None = None,
     ) -> tuple[list[Message], bool]:
-        """Retrieve messages from a channel with optional filtering."""
+        """Retrieve messages from a channel with optional filtering.
+
+        Cost is O(log n + limit) in the channel size n.
+        """
         if sort_order not in ("asc", "desc"):
             raise ValueError(f"Invalid sort_order: '{sort_order}'. Must be 'asc' or 'desc'.")
 
         if not await self._redis.sismember(_CHANNELS_KEY, channel):
             return [], False
+        await self._migrate_legacy(channel)
 
         limit = min(limit, MAX_READ_LIMIT)
-        messages = await self._get_all_messages(channel)
+        index_key = self._index_key(channel)
 
+        # Ranks [first, total) are the messages newer than ``since``
+        first = 0
         if since:
             try:
-                since_dt = datetime.fromisoformat(since)
+                since_score = _score(since)
             except ValueError:
                 raise ValueError(f"Invalid ISO timestamp for 'since': {since}") from None
-            messages = [m for m in messages if datetime.fromisoformat(m.timestamp) > since_dt]
+            first = int(await self._redis.zcount(index_key, "-inf", since_score))
+        total = int(await self._redis.zcard(index_key))
 
         if after:
-            after_idx = next((i for i, m in enumerate(messages) if m.id == after), None)
-            if after_idx is None:
+            rank = await self._rank(channel, after)
+            if rank < first:
                 raise ValueError(f"Cursor ID not found: {after}")
-            messages = messages[after_idx + 1 :]
-            has_more = len(messages) > limit
-            return messages[:limit], has_more
+            # Forward pagination: the oldest N after the cursor
+            start = rank + 1
+            return await self._load(channel, start, start + limit - 1), total - start > limit
 
         if before:
-            before_idx = next((i for i, m in enumerate(messages) if m.id == before), None)
-            if before_idx is None:
+            rank = await self._rank(channel, before)
+            if rank < first:
                 raise ValueError(f"Cursor ID not found: {before}")
-            messages = messages[:before_idx]
-            has_more = len(messages) > limit
-            return messages[-limit:], has_more
+            # Backward pagination: the most recent N before the cursor
+            start = max(first, rank - limit)
+            return await self._load(channel, start, rank - 1), rank - first > limit
 
-        has_more = len(messages) > limit
+        has_more = total - first > limit
         if sort_order == "asc":
-            return messages[:limit], has_more
-        return messages[-limit:], has_more
+            return await self._load(channel, first, first + limit - 1), has_more
+        return await self._load(channel, max(first, total - limit), total - 1), has_more
 
     async def list_channels(self) -> list[ChannelInfo]:
         """List all channels with message counts and last activity."""
@@ -148,14 +242,13 @@ class RedisMessageStore:
         for name in channel_names:
             if isinstance(name, bytes):
                 name = name.decode("utf-8")
-            channel_key = self._channel_key(name)
-            count = await self._redis.llen(channel_key)
+            await self._migrate_legacy(name)
+            count = int(await self._redis.zcard(self._index_key(name)))
             last_activity: str | None = None
             if count > 0:
-                raw_last = await self._redis.lindex(channel_key, -1)
-                if raw_last:
-                    last_msg = self._parse_message(raw_last)
-                    last_activity = last_msg.timestamp
+                last = await self._load(name, -1, -1)
+                if last:
+                    last_activity = last[0].timestamp
             result.append(ChannelInfo(name=name, message_count=count, last_activity=last_activity))
         return result
 
@@ -163,16 +256,25 @@ class RedisMessageStore:
         """Clear all messages in a channel."""
         if not await self._redis.sismember(_CHANNELS_KEY, channel):
             return False
-        await self._redis.delete(self._channel_key(channel))
+        await self._redis.delete(
+            self._index_key(channel),
+            self._messages_key(channel),
+            f"{_LEGACY_CHANNEL_PREFIX}{channel}",
+        )
         return True
 
     async def delete(self, channel: str) -> bool:
         """Fully remove a channel and its messages."""
         if not await self._redis.sismember(_CHANNELS_KEY, channel):
             return False
-        await self._redis.delete(self._channel_key(channel))
+        await self._redis.delete(
+            self._index_key(channel),
+            self._messages_key(channel),
+            f"{_LEGACY_CHANNEL_PREFIX}{channel}",
+        )
         await self._redis.srem(_CHANNELS_KEY, channel)
         self._events.pop(channel, None)
+        self._migrated.discard(channel)
         return True
 
     async def delete_message(
@@ -184,27 +286,74 @@ class RedisMessageStore:
         """Delete a single message by ID from a channel."""
         if not await self._redis.sismember(_CHANNELS_KEY, channel):
             return False
+        await self._migrate_legacy(channel)
 
-        channel_key = self._channel_key(channel)
-        messages = await self._get_all_messages(channel)
-
-        target = next((m for m in messages if m.id == message_id), None)
-        if target is None:
+        raw = await self._redis.hget(self._messages_key(channel), message_id)
+        if raw is None:
             return False
 
-        if sender is not None and target.sender != sender:
+        if sender is not None and self._parse_message(raw).sender != sender:
             return False
 
-        new_messages = [m for m in messages if m.id != message_id]
-
-        pipe = self._redis.pipeline()
-        pipe.delete(channel_key)
-        for m in new_messages:
-            pipe.rpush(channel_key, json.dumps(m.to_dict()))
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.zrem(self._index_key(channel), message_id)
+        pipe.hdel(self._messages_key(channel), message_id)
         await pipe.execute()
 
         return True
 
+    def _notify_local(self, channel: str) -> None:
+        if channel in self._events:
+            self._events[channel].set()
+            self._events[channel] = asyncio.Event()
+
+    def _handle_notification(self, data: str | bytes) -> None:
+        try:
+            notification = json.loads(data)
+            channel = notification["channel"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed relay notification: {data!r}")
+            return
+        # Local adds already woke this process's waiters
+        if notification.get("origin") != self._origin:
+            self._notify_local(channel)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Fan out new-message notifications from Redis to local waiters.
+
+        Reconnects with exponential backoff. After every (re)subscription all
+        local waiters are woken so they re-check for messages published while
+        the subscription was down.
+        """
+        delay = 1.0
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(_NOTIFY_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        self._subscribed.set()
+                        delay = 1.0
+                        for channel in list(self._events):
+                            self._notify_local(channel)
+                    elif message["type"] == "message":
+                        self._handle_notification(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Relay notification subscription failed: {e}; retrying in {delay:.0f}s"
+                )
+            finally:
+                self._subscribed.clear()
+                await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RESUBSCRIBE_MAX_DELAY)
+
     async def wait_for_new(
         self,
         channel: str,
@@ -212,22 +361,42 @@ class RedisMessageStore:
         timeout: int = 30,
     ) -> tuple[list[Message], bool]:
         """Wait for new messages. Returns (messages, timed_out)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        # Take the event before checking so a message added in between still wakes us
+        event = self._events.setdefault(channel, asyncio.Event())
+        self._ensure_listener()
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=min(_SUBSCRIBE_WAIT, timeout))
+        except TimeoutError:
+            logger.warning("Relay notifications unavailable; only local messages wake waiters")
+
         existing, _ = await self.get(channel, since=since)
         if existing:
             return existing, False
 
-        if channel not in self._events:
-            self._events[channel] = asyncio.Event()
-
-        event = self._events[channel]
-        try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        except TimeoutError:
-            return [], True
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return [], True
+            try:
+                await asyncio.wait_for(event.wait(), timeout=remaining)
+            except TimeoutError:
+                return [], True
 
-        messages, _ = await self.get(channel, since=since)
-        return messages, False
+            # Take the next event before checking again, as above
+            event = self._events.setdefault(channel, asyncio.Event())
+            messages, _ = await self.get(channel, since=since)
+            if messages:
+                return messages, False
+            # Woken without new messages (e.g. after a resubscribe): wait again
 
     async def close(self) -> None:
-        """Close the Redis connection."""
+        """Stop the notification listener and close the Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
         await self._redis.aclose()
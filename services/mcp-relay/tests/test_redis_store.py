@@ -33,7 +33,9 @@ async def store(redis):
     """Create a RedisMessageStore backed by fakeredis."""
     from mcp_relay.redis_store import RedisMessageStore
 
-    return RedisMessageStore(redis=redis, max_per_channel=1000, max_channels=100)
+    store = RedisMessageStore(redis=redis, max_per_channel=1000, max_channels=100)
+    yield store
+    await store.close()
 
 
 class TestRedisMessageStore:
@@ -271,3 +273,214 @@ class TestRedisMessageStore:
         assert len(messages) == 5
         assert messages[0].content == "msg-5"
         assert messages[4].content == "msg-9"
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_has_more(self, store) -> None:
+        ids = [(await store.add("test", f"msg-{i}")).id for i in range(10)]
+
+        page, has_more = await store.get("test", after=ids[2], limit=3)
+        assert [m.content for m in page] == ["msg-3", "msg-4", "msg-5"]
+        assert has_more is True
+
+        page, has_more = await store.get("test", after=ids[6], limit=3)
+        assert [m.content for m in page] == ["msg-7", "msg-8", "msg-9"]
+        assert has_more is False
+
+        page, has_more = await store.get("test", before=ids[4], limit=3)
+        assert [m.content for m in page] == ["msg-1", "msg-2", "msg-3"]
+        assert has_more is True
+
+        page, has_more = await store.get("test", before=ids[0])
+        assert page == []
+        assert has_more is False
+
+    @pytest.mark.asyncio
+    async def test_cursor_not_found(self, store) -> None:
+        await store.add("test", "msg")
+        with pytest.raises(ValueError, match="Cursor ID not found"):
+            await store.get("test", after="missing")
+
+    @pytest.mark.asyncio
+    async def test_since_combined_with_cursor(self, store) -> None:
+        msgs = [await store.add("test", f"msg-{i}") for i in range(5)]
+
+        page, _ = await store.get("test", since=msgs[1].timestamp, after=msgs[2].id)
+        assert [m.content for m in page] == ["msg-3", "msg-4"]
+
+        with pytest.raises(ValueError, match="Cursor ID not found"):
+            await store.get("test", since=msgs[3].timestamp, after=msgs[2].id)
+
+    @pytest.mark.asyncio
+    async def test_reads_only_load_the_requested_window(self, store, redis) -> None:
+        for i in range(100):
+            await store.add("test", f"msg-{i}")
+
+        loaded: list[int] = []
+        hmget = redis.hmget
+
+        async def counting_hmget(name, keys, *args):
+            loaded.append(len(keys))
+            return await hmget(name, keys, *args)
+
+        redis.hmget = counting_hmget
+        messages, has_more = await store.get("test", limit=5)
+
+        assert [m.content for m in messages] == [f"msg-{i}" for i in range(95, 100)]
+        assert has_more is True
+        assert loaded == [5]
+
+    @pytest.mark.asyncio
+    async def test_delete_message_keeps_order(self, store, redis) -> None:
+        msgs = [await store.add("test", f"msg-{i}") for i in range(5)]
+
+        assert await store.delete_message("test", msgs[2].id) is True
+        assert await store.delete_message("test", msgs[2].id) is False
+
+        remaining, _ = await store.get("test")
+        assert [m.content for m in remaining] == ["msg-0", "msg-1", "msg-3", "msg-4"]
+        assert await redis.hlen("relay:messages:test") == 4
+
+    @pytest.mark.asyncio
+    async def test_eviction_removes_message_bodies(self, redis) -> None:
+        from mcp_relay.redis_store import RedisMessageStore
+
+        store = RedisMessageStore(redis=redis, max_per_channel=3)
+        for i in range(5):
+            await store.add("test", f"msg-{i}")
+
+        assert await redis.zcard("relay:index:test") == 3
+        assert await redis.hlen("relay:messages:test") == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_do_not_over_evict(self, redis) -> None:
+        from mcp_relay.redis_store import RedisMessageStore
+
+        store = RedisMessageStore(redis=redis, max_per_channel=3)
+        for i in range(3):
+            await store.add("test", f"msg-{i}")
+
+        await asyncio.gather(*(store.add("test", f"new-{i}") for i in range(3)))
+
+        messages, _ = await store.get("test")
+        assert sorted(m.content for m in messages) == ["new-0", "new-1", "new-2"]
+        assert await redis.hlen("relay:messages:test") == 3
+
+    @pytest.mark.asyncio
+    async def test_migrates_legacy_list_channels(self, store, redis) -> None:
+        import json
+
+        legacy = [
+            {
+                "id": f"id-{i}",
+                "channel": "old",
+                "sender": "alice",
+                "content": f"legacy-{i}",
+                "timestamp": datetime(2026, 1, 1, 0, 0, i, tzinfo=UTC).isoformat(),
+            }
+            for i in range(3)
+        ]
+        await redis.sadd("relay:channels", "old")
+        await redis.rpush("relay:channel:old", *(json.dumps(m) for m in legacy))
+
+        messages, _ = await store.get("old")
+        assert [m.content for m in messages] == ["legacy-0", "legacy-1", "legacy-2"]
+        assert await redis.exists("relay:channel:old") == 0
+
+        page, _ = await store.get("old", after="id-0")
+        assert [m.id for m in page] == ["id-1", "id-2"]
+
+
+class TestRedisNotifications:
+    """Cross-replica wake-ups: two stores sharing one Redis server."""
+
+    @pytest.fixture
+    async def replicas(self):
+        from mcp_relay.redis_store import RedisMessageStore
+
+        server = fakeredis.FakeServer()
+        stores = [
+            RedisMessageStore(redis=fakeredis.aioredis.FakeRedis(server=server)) for _ in range(2)
+        ]
+        yield stores
+        for store in stores:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_add_on_one_replica_wakes_waiter_on_another(self, replicas) -> None:
+        a, b = replicas
+
+        async def send_later():
+            await asyncio.sleep(0.1)
+            await b.add("test", "from b")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        task = asyncio.create_task(send_later())
+        messages, timed_out = await a.wait_for_new("test", timeout=10)
+        await task
+
+        assert timed_out is False
+        assert [m.content for m in messages] == ["from b"]
+        assert loop.time() - started < 2
+
+    @pytest.mark.asyncio
+    async def test_own_notifications_are_ignored(self, replicas) -> None:
+        import json
+
+        a, _ = replicas
+        await a.wait_for_new("test", timeout=0.1)  # starts the listener
+        event = a._events["test"]
+
+        await a._redis.publish("relay:notify", json.dumps({"channel": "test", "origin": a._origin}))
+        await asyncio.sleep(0.1)
+        assert not event.is_set()
+
+        await a._redis.publish("relay:notify", json.dumps({"channel": "test", "origin": "other"}))
+        await asyncio.sleep(0.1)
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_spurious_wake_keeps_waiting(self, replicas) -> None:
+        a, b = replicas
+
+        async def send_later():
+            await asyncio.sleep(0.1)
+            a._notify_local("test")  # wake without a new message
+            await asyncio.sleep(0.1)
+            await b.add("test", "real")
+
+        task = asyncio.create_task(send_later())
+        messages, timed_out = await a.wait_for_new("test", timeout=5)
+        await task
+
+        assert timed_out is False
+        assert [m.content for m in messages] == ["real"]
+
+    @pytest.mark.asyncio
+    async def test_message_during_recheck_wakes_waiter(self, replicas) -> None:
+        a, _ = replicas
+        get = a.get
+        woken = raced = False
+
+        async def get_then_add(*args, **kwargs):
+            nonlocal raced
+            result = await get(*args, **kwargs)
+            if woken and not raced:
+                # Lands after the re-check read but before the waiter sleeps
+                raced = True
+                await a.add("test", "raced")
+            return result
+
+        async def wake_spuriously():
+            nonlocal woken
+            await asyncio.sleep(0.1)
+            woken = True
+            a._notify_local("test")
+
+        task = asyncio.create_task(wake_spuriously())
+        a.get = get_then_add
+        messages, timed_out = await a.wait_for_new("test", timeout=2)
+        await task
+
+        assert timed_out is False
+        assert [m.content for m in messages] == ["raced"]
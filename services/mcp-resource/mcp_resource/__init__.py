@@ -13,6 +13,7 @@ from mcp_resource_framework.security import (
 )
 from taskmanager_sdk import (
     ApiResponse,
+    AsyncTaskManagerClient,
     TaskManagerClient,
     create_authenticated_client,
 )
@@ -22,6 +23,7 @@ TaskManagerAPI = TaskManagerClient
 
 __all__ = [
     "ApiResponse",
+    "AsyncTaskManagerClient",
     "TaskManagerAPI",
     "TaskManagerClient",
     "create_authenticated_client",
@@ -2,7 +2,7 @@ import datetime
 import json
 import logging
 import os
-from functools import partial
+from functools import cache, partial
 from typing import Any
 from urllib.parse import urlparse
 
@@ -22,7 +22,7 @@ from mcp_resource_framework.validation import (
     validate_list_response,
 )
 from pydantic import AnyHttpUrl
-from taskmanager_sdk import VALID_DEADLINE_TYPES, TaskManagerClient
+from taskmanager_sdk import VALID_DEADLINE_TYPES, AsyncTaskManagerClient
 
 logger = logging.getLogger(__name__)
 
@@ -57,18 +57,26 @@ API_KEY = os.environ.get("TASKMANAGER_API_KEY")
 ALLOWED_MCP_ORIGINS = parse_allowed_origins()
 
 
-def get_api_client() -> TaskManagerClient:
+@cache
+def _shared_api_client(base_url: str, api_key: str) -> AsyncTaskManagerClient:
+    """One client, and so one keep-alive connection pool, per process."""
+    logger.debug("Created TaskManager API client with API key authentication")
+    return AsyncTaskManagerClient(base_url=base_url, access_token=api_key)
+
+
+def get_api_client() -> AsyncTaskManagerClient:
     """Get API client for authenticated user.
 
     Uses an API key for authentication. The API key should be set
-    via the TASKMANAGER_API_KEY environment variable.
+    via the TASKMANAGER_API_KEY environment variable. The client is shared
+    by all tool calls; its methods are awaitable and don't block the event
+    loop, so concurrent tool calls run concurrently.
 
     Returns:
-        TaskManagerClient: Authenticated API client
+        AsyncTaskManagerClient: Authenticated API client
 
     Raises:
         RuntimeError: If TASKMANAGER_API_KEY is not configured
-        NetworkError: If unable to connect to backend
     """
     if not API_KEY:
         raise RuntimeError(
@@ -78,12 +86,7 @@ def get_api_client() -> TaskManagerClient:
 
     # Use the public TaskManager URL for API calls
     # Pass API key as access_token - SDK will use it as Bearer token
-    task_manager = TaskManagerClient(
-        base_url=f"{TASKMANAGER_URL}/api",
-        access_token=API_KEY,
-    )
-    logger.debug("Created TaskManager API client with API key authentication")
-    return task_manager
+    return _shared_api_client(f"{TASKMANAGER_URL}/api", API_KEY)
 
 
 def create_resource_server(
@@ -161,7 +164,7 @@ def create_resource_server(
     async def resource_health() -> str:
         """Backend health check with per-subsystem status."""
         api_client = get_api_client()
-        response = api_client.health_check()
+        response = await api_client.health_check()
         data, error = validate_dict_response(response, "health")
         if error:
             return json_error(error)
@@ -171,7 +174,7 @@ def create_resource_server(
     async def resource_categories() -> str:
         """List all task categories with the count of tasks in each."""
         api_client = get_api_client()
-        response = api_client.get_categories()
+        response = await api_client.get_categories()
         categories, error = validate_list_response(response, "categories")
         if error:
             return json_error(error)
@@ -181,7 +184,7 @@ def create_resource_server(
     async def resource_snippet_categories() -> str:
         """List all snippet categories with the count of snippets in each."""
         api_client = get_api_client()
-        response = api_client.get_snippet_categories()
+        response = await api_client.get_snippet_categories()
         categories, error = validate_list_response(response, "categories", key="data")
         if error:
             return json_error(error)
@@ -191,7 +194,7 @@ def create_resource_server(
     async def resource_wiki_pages() -> str:
         """List all wiki pages (id, title, slug, timestamps)."""
         api_client = get_api_client()
-        response = api_client.list_wiki_pages()
+        response = await api_client.list_wiki_pages()
         pages, error = validate_list_response(response, "wiki pages", key="data")
         if error:
             return json_error(error)
@@ -202,7 +205,7 @@ def create_resource_server(
     # -----------------------------------------------------------------------
 
     @app.tool()
-    @guard_tool(input_params=["status", "category"], screen_output=True)
+    @guard_tool(input_params=["status", "category"], screen_output=True, read_only=True)
     async def get_tasks(
         status: str | None = None,
         start_date: str | None = None,
@@ -246,7 +249,7 @@ def create_resource_server(
             logger.debug("API client created successfully")
 
             # SDK handles all filtering server-side
-            response = api_client.get_todos(
+            response = await api_client.get_todos(
                 status=status if status and status.lower() != "all" else None,
                 start_date=start_date,
                 end_date=end_date,
@@ -377,7 +380,7 @@ def create_resource_server(
                     return json_error(f"Invalid parent_id format: {parent_id}")
 
             # Use SDK method with parent_id support
-            response = api_client.create_todo(
+            response = await api_client.create_todo(
                 title=title,
                 description=description,
                 category=category,
@@ -476,8 +479,8 @@ def create_resource_server(
         try:
             if not tasks:
                 return json_error("tasks array must not be empty")
-            if len(tasks) > 50:
-                return json_error("Maximum 50 tasks per batch")
+            if len(tasks) > 1000:
+                return json_error("Maximum 1000 tasks per batch")
 
             # Validate and transform each task
             todo_dicts: list[dict[str, Any]] = []
@@ -548,7 +551,7 @@ def create_resource_server(
                 todo_dicts.append(todo)
 
             api_client = get_api_client()
-            response = api_client.batch_create_todos(
+            response = await api_client.batch_create_todos(
                 todo_dicts,
                 skip_duplicates=skip_duplicates,
                 wiki_page_id=wiki_page_id,
@@ -689,7 +692,7 @@ def create_resource_server(
                 updated_fields.append("estimated_hours")
 
             # Use SDK method with parent_id support
-            response = api_client.update_todo(
+            response = await api_client.update_todo(
                 todo_id=todo_id,
                 title=title,
                 description=description,
@@ -755,7 +758,7 @@ def create_resource_server(
             api_client = get_api_client()
             logger.debug("API client created successfully")
 
-            response = api_client.create_project(
+            response = await api_client.create_project(
                 name=name,
                 description=description,
                 color=color,
@@ -789,7 +792,7 @@ def create_resource_server(
             return json_error(str(e))
 
     @app.tool()
-    @guard_tool(input_params=["query", "category"], screen_output=True)
+    @guard_tool(input_params=["query", "category"], screen_output=True, read_only=True)
     async def search_tasks(
         query: str,
         category: str | None = None,
@@ -829,7 +832,7 @@ def create_resource_server(
             logger.debug("API client created successfully")
 
             # SDK provides dedicated full-text search endpoint
-            response = api_client.search_tasks(query=query, category=category)
+            response = await api_client.search_tasks(query=query, category=category)
             logger.info(
                 f"search_tasks response: success={response.success}, status={response.status_code}"
             )
@@ -916,7 +919,7 @@ def create_resource_server(
             return json_error(str(e))
 
     @app.tool()
-    @guard_tool(input_params=["query"], screen_output=True)
+    @guard_tool(input_params=["query"], screen_output=True, read_only=True)
     async def unified_search(
         query: str,
         types: str | None = None,
@@ -942,7 +945,7 @@ def create_resource_server(
         logger.info(f"=== unified_search called: query='{query}', types={types}, limit={limit} ===")
         try:
             api_client = get_api_client()
-            response = api_client.search(query=query, types=types, limit=limit)
+            response = await api_client.search(query=query, types=types, limit=limit)
             logger.info(
                 f"unified_search response: success={response.success}, "
                 f"status={response.status_code}"
@@ -987,7 +990,7 @@ def create_resource_server(
                 return json_error(f"Invalid task_id format: {task_id}")
 
             # Get attachments using SDK method
-            response = api_client.get_attachments(todo_id)
+            response = await api_client.get_attachments(todo_id)
             logger.info(
                 f"list_attachments response: success={response.success}, status={response.status_code}"
             )
@@ -1033,7 +1036,7 @@ def create_resource_server(
             except ValueError:
                 return json_error(f"Invalid task_id format: {task_id}")
 
-            response = api_client.get_comments(todo_id)
+            response = await api_client.get_comments(todo_id)
             logger.info(
                 f"list_comments response: success={response.success}, status={response.status_code}"
             )
@@ -1079,7 +1082,7 @@ def create_resource_server(
             except ValueError:
                 return json_error(f"Invalid task_id format: {task_id}")
 
-            response = api_client.create_comment(todo_id, content)
+            response = await api_client.create_comment(todo_id, content)
             logger.info(
                 f"create_comment response: success={response.success}, status={response.status_code}"
             )
@@ -1135,7 +1138,7 @@ def create_resource_server(
                 return json_error(f"Invalid task_id format: {task_id}")
 
             # Get task details using SDK method
-            response = api_client.get_todo(todo_id)
+            response = await api_client.get_todo(todo_id)
             logger.info(
                 f"get_todo response: success={response.success}, status={response.status_code}"
             )
@@ -1221,7 +1224,7 @@ def create_resource_server(
                 return json_error(f"Invalid task_id format: {task_id}")
 
             # Delete task using SDK method
-            response = api_client.delete_todo(todo_id)
+            response = await api_client.delete_todo(todo_id)
             logger.info(
                 f"delete_todo response: success={response.success}, status={response.status_code}"
             )
@@ -1243,7 +1246,7 @@ def create_resource_server(
             return json_error(str(e))
 
     @app.tool()
-    @guard_tool(input_params=["status", "category"], screen_output=True)
+    @guard_tool(input_params=["status", "category"], screen_output=True, read_only=True)
     async def get_agent_tasks(
         due_today: bool = False,
         agent_actionable_only: bool = False,
@@ -1284,7 +1287,7 @@ def create_resource_server(
                 end_date = today
 
             # Get all pending/in_progress tasks
-            response = api_client.get_todos(
+            response = await api_client.get_todos(
                 status="pending",
                 start_date=start_date,
                 end_date=end_date,
@@ -1466,7 +1469,7 @@ def create_resource_server(
                 autonomy_tier = default_tiers.get(action_type, 3)
 
             # Update task with classification
-            response = api_client.update_todo(
+            response = await api_client.update_todo(
                 todo_id=todo_id,
                 action_type=action_type,
                 agent_actionable=agent_actionable,
@@ -1524,7 +1527,7 @@ def create_resource_server(
 
             # Get current task to append notes if needed
             if append:
-                task_response = api_client.get_todo(todo_id)
+                task_response = await api_client.get_todo(todo_id)
                 if task_response.success and task_response.data:
                     existing_notes = task_response.data.get("agent_notes") or ""
                     if existing_notes:
@@ -1534,7 +1537,7 @@ def create_resource_server(
                         note = f"{existing_notes}\n\n---\n[{timestamp}]\n{note}"
 
             # Update task with note
-            response = api_client.update_todo(
+            response = await api_client.update_todo(
                 todo_id=todo_id,
                 agent_notes=note,
             )
@@ -1603,7 +1606,7 @@ def create_resource_server(
                 return json_error("blocking_reason is required when status is 'blocked'")
 
             # Update task with agent status
-            response = api_client.update_todo(
+            response = await api_client.update_todo(
                 todo_id=todo_id,
                 agent_status=status,
                 blocking_reason=blocking_reason if status == "blocked" else None,
@@ -1653,7 +1656,7 @@ def create_resource_server(
                 return json_error(f"Invalid task_id format: {task_id}")
 
             # Complete task using SDK method
-            response = api_client.complete_todo(todo_id)
+            response = await api_client.complete_todo(todo_id)
             logger.info(
                 f"complete_todo response: success={response.success}, status={response.status_code}"
             )
@@ -1701,7 +1704,7 @@ def create_resource_server(
             except ValueError:
                 return json_error(f"Invalid task_id format: {task_id}")
 
-            response = api_client.get_dependencies(todo_id)
+            response = await api_client.get_dependencies(todo_id)
             logger.info(
                 f"get_dependencies response: success={response.success}, status={response.status_code}"
             )
@@ -1782,7 +1785,7 @@ def create_resource_server(
             except ValueError:
                 return json_error(f"Invalid dependency_id format: {dependency_id}")
 
-            response = api_client.add_dependency(todo_id, dep_id)
+            response = await api_client.add_dependency(todo_id, dep_id)
             logger.info(
                 f"add_dependency response: success={response.success}, status={response.status_code}"
             )
@@ -1809,7 +1812,7 @@ def create_resource_server(
     # -----------------------------------------------------------------------
 
     @app.tool()
-    @guard_tool(input_params=["q"], screen_output=True)
+    @guard_tool(input_params=["q"], screen_output=True, read_only=True)
     async def search_wiki_pages(q: str) -> str:
         """
         Search wiki pages by title or content.
@@ -1827,7 +1830,7 @@ def create_resource_server(
         logger.info(f"=== search_wiki_pages called: q={q} ===")
         try:
             api_client = get_api_client()
-            response = api_client.list_wiki_pages(q=q)
+            response = await api_client.list_wiki_pages(q=q)
             logger.info(
                 f"search_wiki_pages response: success={response.success}, status={response.status_code}"
             )
@@ -1877,7 +1880,7 @@ def create_resource_server(
         )
         try:
             api_client = get_api_client()
-            response = api_client.create_wiki_page(
+            response = await api_client.create_wiki_page(
                 title=title, content=content, slug=slug, parent_id=parent_id
             )
             logger.info(
@@ -1917,7 +1920,7 @@ def create_resource_server(
         logger.info(f"=== get_wiki_page called: slug_or_id='{slug_or_id}' ===")
         try:
             api_client = get_api_client()
-            response = api_client.get_wiki_page(slug_or_id)
+            response = await api_client.get_wiki_page(slug_or_id)
             logger.info(
                 f"get_wiki_page response: success={response.success}, status={response.status_code}"
             )
@@ -1977,7 +1980,7 @@ def create_resource_server(
             return json_error("parent_id and remove_parent are mutually exclusive")
         try:
             api_client = get_api_client()
-            response = api_client.update_wiki_page(
+            response = await api_client.update_wiki_page(
                 page_id=page_id,
                 title=title,
                 content=content,
@@ -2025,7 +2028,7 @@ def create_resource_server(
         logger.info(f"=== delete_wiki_page called: page_id={page_id} ===")
         try:
             api_client = get_api_client()
-            response = api_client.delete_wiki_page(page_id)
+            response = await api_client.delete_wiki_page(page_id)
             logger.info(
                 f"delete_wiki_page response: success={response.success}, status={response.status_code}"
             )
@@ -2074,7 +2077,7 @@ def create_resource_server(
             except ValueError:
                 return json_error(f"Invalid task_id format: {task_id}")
 
-            response = api_client.link_wiki_page_to_task(page_id, todo_id)
+            response = await api_client.link_wiki_page_to_task(page_id, todo_id)
             logger.info(
                 f"link_wiki_page_to_task response: success={response.success}, status={response.status_code}"
             )
@@ -2114,7 +2117,7 @@ def create_resource_server(
         logger.info(f"=== get_wiki_page_linked_tasks called: page_id={page_id} ===")
         try:
             api_client = get_api_client()
-            response = api_client.get_wiki_page_linked_tasks(page_id)
+            response = await api_client.get_wiki_page_linked_tasks(page_id)
             logger.info(
                 f"get_wiki_page_linked_tasks response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2166,7 +2169,7 @@ def create_resource_server(
             except ValueError:
                 return json_error(f"Invalid task_id format: {task_id}")
 
-            response = api_client.get_task_wiki_pages(todo_id)
+            response = await api_client.get_task_wiki_pages(todo_id)
             logger.info(
                 f"get_task_wiki_pages response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2225,7 +2228,7 @@ def create_resource_server(
             if invalid_ids:
                 return json_error(f"Invalid task_id format(s): {', '.join(invalid_ids)}")
 
-            response = api_client.batch_link_wiki_page_to_tasks(page_id, todo_ids)
+            response = await api_client.batch_link_wiki_page_to_tasks(page_id, todo_ids)
             logger.info(
                 f"batch_link_wiki_page_to_tasks response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2257,7 +2260,7 @@ def create_resource_server(
     # -----------------------------------------------------------------------
 
     @app.tool()
-    @guard_tool(input_params=["q"], screen_output=True)
+    @guard_tool(input_params=["q"], screen_output=True, read_only=True)
     async def list_snippets(
         q: str | None = None,
         category: str | None = None,
@@ -2288,7 +2291,7 @@ def create_resource_server(
         )
         try:
             api_client = get_api_client()
-            response = api_client.list_snippets(
+            response = await api_client.list_snippets(
                 q=q, category=category, tag=tag, date_from=date_from, date_to=date_to
             )
             logger.info(
@@ -2345,7 +2348,7 @@ def create_resource_server(
         )
         try:
             api_client = get_api_client()
-            response = api_client.create_snippet(
+            response = await api_client.create_snippet(
                 category=category,
                 title=title,
                 content=content,
@@ -2390,7 +2393,7 @@ def create_resource_server(
         logger.info(f"=== get_snippet called: snippet_id={snippet_id} ===")
         try:
             api_client = get_api_client()
-            response = api_client.get_snippet(snippet_id)
+            response = await api_client.get_snippet(snippet_id)
             logger.info(
                 f"get_snippet response: success={response.success}, status={response.status_code}"
             )
@@ -2442,7 +2445,7 @@ def create_resource_server(
         )
         try:
             api_client = get_api_client()
-            response = api_client.update_snippet(
+            response = await api_client.update_snippet(
                 snippet_id=snippet_id,
                 category=category,
                 title=title,
@@ -2490,7 +2493,7 @@ def create_resource_server(
         logger.info(f"=== delete_snippet called: snippet_id={snippet_id} ===")
         try:
             api_client = get_api_client()
-            response = api_client.delete_snippet(snippet_id)
+            response = await api_client.delete_snippet(snippet_id)
             logger.info(
                 f"delete_snippet response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2518,6 +2521,7 @@ def create_resource_server(
     @guard_tool(
         input_params=["unread_only", "search", "feed_type", "featured"],
         screen_output=True,
+        read_only=True,
     )
     async def list_articles(
         unread_only: bool = False,
@@ -2553,7 +2557,7 @@ def create_resource_server(
             return json_error(f"Invalid feed_type '{feed_type}'. Must be one of: article, paper")
         try:
             api_client = get_api_client()
-            response = api_client.list_articles(
+            response = await api_client.list_articles(
                 unread_only=unread_only,
                 search=search,
                 feed_type=feed_type,
@@ -2604,7 +2608,7 @@ def create_resource_server(
         logger.info(f"=== get_article called: article_id={article_id} ===")
         try:
             api_client = get_api_client()
-            response = api_client.get_article(article_id)
+            response = await api_client.get_article(article_id)
             logger.info(
                 f"get_article response: success={response.success}, status={response.status_code}"
             )
@@ -2641,7 +2645,7 @@ def create_resource_server(
         logger.info(f"=== mark_article_read called: article_id={article_id}, is_read={is_read} ===")
         try:
             api_client = get_api_client()
-            response = api_client.mark_article_read(article_id, is_read)
+            response = await api_client.mark_article_read(article_id, is_read)
             logger.info(
                 f"mark_article_read response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2681,7 +2685,7 @@ def create_resource_server(
             )
         try:
             api_client = get_api_client()
-            response = api_client.rate_article(article_id, rating)
+            response = await api_client.rate_article(article_id, rating)
             logger.info(
                 f"rate_article response: success={response.success}, status={response.status_code}"
             )
@@ -2703,7 +2707,7 @@ def create_resource_server(
             return json_error(str(e))
 
     @app.tool()
-    @guard_tool(input_params=["featured"], screen_output=True)
+    @guard_tool(input_params=["featured"], screen_output=True, read_only=True)
     async def list_feed_sources(featured: bool | None = None) -> str:
         """
         List RSS/Atom feed sources.
@@ -2717,7 +2721,7 @@ def create_resource_server(
         logger.info(f"=== list_feed_sources called: featured={featured} ===")
         try:
             api_client = get_api_client()
-            response = api_client.list_feed_sources(featured=featured)
+            response = await api_client.list_feed_sources(featured=featured)
             logger.info(
                 f"list_feed_sources response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2777,7 +2781,7 @@ def create_resource_server(
             return json_error(f"Invalid feed_type '{feed_type}'. Must be one of: article, paper")
         try:
             api_client = get_api_client()
-            response = api_client.create_feed_source(
+            response = await api_client.create_feed_source(
                 name=name,
                 url=url,
                 description=description,
@@ -2847,7 +2851,7 @@ def create_resource_server(
             return json_error(f"Invalid feed_type '{feed_type}'. Must be one of: article, paper")
         try:
             api_client = get_api_client()
-            response = api_client.update_feed_source(
+            response = await api_client.update_feed_source(
                 source_id=source_id,
                 name=name,
                 url=url,
@@ -2897,7 +2901,7 @@ def create_resource_server(
         logger.info(f"=== delete_feed_source called: source_id={source_id} ===")
         try:
             api_client = get_api_client()
-            response = api_client.delete_feed_source(source_id)
+            response = await api_client.delete_feed_source(source_id)
             logger.info(
                 f"delete_feed_source response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2937,7 +2941,7 @@ def create_resource_server(
         )
         try:
             api_client = get_api_client()
-            response = api_client.toggle_feed_source(source_id, is_active)
+            response = await api_client.toggle_feed_source(source_id, is_active)
             logger.info(
                 f"toggle_feed_source response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2975,7 +2979,7 @@ def create_resource_server(
         logger.info(f"=== force_fetch_feed called: source_id={source_id}, hours={hours} ===")
         try:
             api_client = get_api_client()
-            response = api_client.force_fetch_feed(source_id, hours)
+            response = await api_client.force_fetch_feed(source_id, hours)
             logger.info(
                 f"force_fetch_feed response: success={response.success}, "
                 f"status={response.status_code}"
@@ -2,7 +2,7 @@
 
 import datetime
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from mcp_resource_framework.validation import validate_dict_response, validate_list_response
@@ -179,13 +179,13 @@ class TestMCPToolsIntegration:
     """Integration tests for MCP tool functions with mocked API client."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
+    def mock_api_client(self) -> AsyncMock:
         """Create a mock API client."""
-        client = MagicMock()
+        client = AsyncMock()
         return client
 
     @pytest.mark.asyncio
-    async def test_get_tasks_with_wrapped_response(self, mock_api_client: MagicMock) -> None:
+    async def test_get_tasks_with_wrapped_response(self, mock_api_client: AsyncMock) -> None:
         """Test get_tasks handles wrapped {'tasks': [...]} response."""
         mock_api_client.get_todos.return_value = ApiResponse(
             success=True,
@@ -202,13 +202,13 @@ class TestMCPToolsIntegration:
             # Import here to get patched version
 
             # We can't easily test the async tool directly, so verify the helper works
-            response = mock_api_client.get_todos()
+            response = await mock_api_client.get_todos()
             tasks, error = validate_list_response(response, "tasks")
             assert error is None
             assert len(tasks) == 2
 
     @pytest.mark.asyncio
-    async def test_get_tasks_with_plain_list_response(self, mock_api_client: MagicMock) -> None:
+    async def test_get_tasks_with_plain_list_response(self, mock_api_client: AsyncMock) -> None:
         """Test get_tasks handles plain list response."""
         mock_api_client.get_todos.return_value = ApiResponse(
             success=True,
@@ -219,13 +219,13 @@ class TestMCPToolsIntegration:
             status_code=200,
         )
 
-        response = mock_api_client.get_todos()
+        response = await mock_api_client.get_todos()
         tasks, error = validate_list_response(response, "tasks")
         assert error is None
         assert len(tasks) == 2
 
     @pytest.mark.asyncio
-    async def test_search_tasks_with_wrapped_response(self, mock_api_client: MagicMock) -> None:
+    async def test_search_tasks_with_wrapped_response(self, mock_api_client: AsyncMock) -> None:
         """Test search_tasks handles wrapped {'tasks': [...]} response."""
         mock_api_client.search_tasks.return_value = ApiResponse(
             success=True,
@@ -236,13 +236,13 @@ class TestMCPToolsIntegration:
             status_code=200,
         )
 
-        response = mock_api_client.search_tasks(query="matching")
+        response = await mock_api_client.search_tasks(query="matching")
         tasks, error = validate_list_response(response, "tasks")
         assert error is None
         assert len(tasks) == 1
 
     @pytest.mark.asyncio
-    async def test_create_task_with_dict_response(self, mock_api_client: MagicMock) -> None:
+    async def test_create_task_with_dict_response(self, mock_api_client: AsyncMock) -> None:
         """Test create_task handles dict response."""
         mock_api_client.create_todo.return_value = ApiResponse(
             success=True,
@@ -250,14 +250,14 @@ class TestMCPToolsIntegration:
             status_code=201,
         )
 
-        response = mock_api_client.create_todo(title="New Task")
+        response = await mock_api_client.create_todo(title="New Task")
         task, error = validate_dict_response(response, "created task")
         assert error is None
         assert task is not None
         assert task["id"] == 123
 
     @pytest.mark.asyncio
-    async def test_api_error_handling(self, mock_api_client: MagicMock) -> None:
+    async def test_api_error_handling(self, mock_api_client: AsyncMock) -> None:
         """Test error handling when API returns an error."""
         mock_api_client.get_todos.return_value = ApiResponse(
             success=False,
@@ -265,7 +265,7 @@ class TestMCPToolsIntegration:
             status_code=401,
         )
 
-        response = mock_api_client.get_todos()
+        response = await mock_api_client.get_todos()
         tasks, error = validate_list_response(response, "tasks")
         assert error == "Authentication failed"
         assert tasks == []
@@ -467,7 +467,7 @@ class TestSubtasksSupport:
     @pytest.mark.asyncio
     async def test_get_tasks_with_subtasks_response(self) -> None:
         """Test get_tasks handles tasks with subtasks."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={
@@ -485,7 +485,7 @@ class TestSubtasksSupport:
             status_code=200,
         )
 
-        response = mock_client._make_request("GET", "/todos", {"include_subtasks": True})
+        response = await mock_client._make_request("GET", "/todos", {"include_subtasks": True})
         tasks, error = validate_list_response(response, "tasks")
 
         assert error is None
@@ -500,7 +500,7 @@ class TestAttachmentTools:
     @pytest.mark.asyncio
     async def test_list_attachments_response(self) -> None:
         """Test list_task_attachments returns attachment data."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={
@@ -526,7 +526,7 @@ class TestAttachmentTools:
             status_code=200,
         )
 
-        response = mock_client._make_request("GET", "/todos/10/attachments")
+        response = await mock_client._make_request("GET", "/todos/10/attachments")
         attachments, error = validate_list_response(response, "attachments")
 
         assert error is None
@@ -538,14 +538,14 @@ class TestAttachmentTools:
     @pytest.mark.asyncio
     async def test_list_attachments_empty(self) -> None:
         """Test list_task_attachments with no attachments."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={"attachments": []},
             status_code=200,
         )
 
-        response = mock_client._make_request("GET", "/todos/10/attachments")
+        response = await mock_client._make_request("GET", "/todos/10/attachments")
         attachments, error = validate_list_response(response, "attachments")
 
         assert error is None
@@ -578,7 +578,7 @@ class TestGetTaskTool:
     @pytest.mark.asyncio
     async def test_get_task_success(self) -> None:
         """Test get_task retrieves a single task with full details."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={
@@ -607,7 +607,7 @@ class TestGetTaskTool:
             status_code=200,
         )
 
-        response = mock_client._make_request("GET", "/todos/42")
+        response = await mock_client._make_request("GET", "/todos/42")
         task, error = validate_dict_response(response, "task")
 
         assert error is None
@@ -622,12 +622,12 @@ class TestGetTaskTool:
     @pytest.mark.asyncio
     async def test_get_task_not_found(self) -> None:
         """Test get_task handles task not found error."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=False, error="Task not found", status_code=404
         )
 
-        response = mock_client._make_request("GET", "/todos/999")
+        response = await mock_client._make_request("GET", "/todos/999")
         task, error = validate_dict_response(response, "task")
 
         assert error == "Task not found"
@@ -652,12 +652,12 @@ class TestDeleteTaskTool:
     @pytest.mark.asyncio
     async def test_delete_task_success(self) -> None:
         """Test delete_task successfully deletes a task."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True, data={"deleted": True}, status_code=200
         )
 
-        response = mock_client._make_request("DELETE", "/todos/10")
+        response = await mock_client._make_request("DELETE", "/todos/10")
 
         assert response.success is True
         assert response.data is not None
@@ -666,12 +666,12 @@ class TestDeleteTaskTool:
     @pytest.mark.asyncio
     async def test_delete_task_not_found(self) -> None:
         """Test delete_task handles task not found error."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=False, error="Task not found", status_code=404
         )
 
-        response = mock_client._make_request("DELETE", "/todos/999")
+        response = await mock_client._make_request("DELETE", "/todos/999")
 
         assert response.success is False
         assert response.error == "Task not found"
@@ -679,13 +679,13 @@ class TestDeleteTaskTool:
     @pytest.mark.asyncio
     async def test_delete_task_with_subtasks(self) -> None:
         """Test that deleting a task also deletes its subtasks."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         # Backend handles cascade delete, so we just verify the request succeeds
         mock_client._make_request.return_value = ApiResponse(
             success=True, data={"deleted": True}, status_code=200
         )
 
-        response = mock_client._make_request("DELETE", "/todos/10")
+        response = await mock_client._make_request("DELETE", "/todos/10")
 
         assert response.success is True
 
@@ -702,12 +702,12 @@ class TestCompleteTaskTool:
     @pytest.mark.asyncio
     async def test_complete_task_success(self) -> None:
         """Test complete_task marks a task as completed."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True, data={"completed": True}, status_code=200
         )
 
-        response = mock_client._make_request("POST", "/todos/10/complete")
+        response = await mock_client._make_request("POST", "/todos/10/complete")
 
         assert response.success is True
         assert response.data is not None
@@ -716,12 +716,12 @@ class TestCompleteTaskTool:
     @pytest.mark.asyncio
     async def test_complete_task_not_found(self) -> None:
         """Test complete_task handles task not found error."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=False, error="Task not found", status_code=404
         )
 
-        response = mock_client._make_request("POST", "/todos/999/complete")
+        response = await mock_client._make_request("POST", "/todos/999/complete")
 
         assert response.success is False
         assert response.error == "Task not found"
@@ -729,13 +729,13 @@ class TestCompleteTaskTool:
     @pytest.mark.asyncio
     async def test_complete_already_completed_task(self) -> None:
         """Test completing an already completed task."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         # Backend allows re-completing tasks
         mock_client._make_request.return_value = ApiResponse(
             success=True, data={"completed": True}, status_code=200
         )
 
-        response = mock_client._make_request("POST", "/todos/10/complete")
+        response = await mock_client._make_request("POST", "/todos/10/complete")
 
         assert response.success is True
 
@@ -758,14 +758,14 @@ class TestCreateProjectTool:
     @pytest.mark.asyncio
     async def test_create_project_success(self) -> None:
         """Test create_project creates a project with all fields."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={"id": 1, "name": "Phase 1", "description": "First phase", "color": "#FF5733"},
             status_code=201,
         )
 
-        response = mock_client._make_request("POST", "/projects")
+        response = await mock_client._make_request("POST", "/projects")
         project, error = validate_dict_response(response, "created project")
 
         assert error is None
@@ -776,14 +776,14 @@ class TestCreateProjectTool:
     @pytest.mark.asyncio
     async def test_create_project_minimal(self) -> None:
         """Test create_project with only required name field."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={"id": 2, "name": "My Project"},
             status_code=201,
         )
 
-        response = mock_client._make_request("POST", "/projects")
+        response = await mock_client._make_request("POST", "/projects")
         project, error = validate_dict_response(response, "created project")
 
         assert error is None
@@ -793,14 +793,14 @@ class TestCreateProjectTool:
     @pytest.mark.asyncio
     async def test_create_project_error(self) -> None:
         """Test create_project handles API errors."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=False,
             error="Project name already exists",
             status_code=400,
         )
 
-        response = mock_client._make_request("POST", "/projects")
+        response = await mock_client._make_request("POST", "/projects")
         project, error = validate_dict_response(response, "created project")
 
         assert error == "Project name already exists"
@@ -813,7 +813,7 @@ class TestDependencyTools:
     @pytest.mark.asyncio
     async def test_list_dependencies_success(self) -> None:
         """Test list_dependencies returns dependency tasks."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data=[
@@ -830,7 +830,7 @@ class TestDependencyTools:
             status_code=200,
         )
 
-        response = mock_client._make_request("GET", "/todos/10/dependencies")
+        response = await mock_client._make_request("GET", "/todos/10/dependencies")
         dependencies, error = validate_list_response(response, "dependencies")
 
         assert error is None
@@ -842,14 +842,14 @@ class TestDependencyTools:
     @pytest.mark.asyncio
     async def test_list_dependencies_empty(self) -> None:
         """Test list_dependencies with no dependencies."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data=[],
             status_code=200,
         )
 
-        response = mock_client._make_request("GET", "/todos/10/dependencies")
+        response = await mock_client._make_request("GET", "/todos/10/dependencies")
         dependencies, error = validate_list_response(response, "dependencies")
 
         assert error is None
@@ -858,14 +858,16 @@ class TestDependencyTools:
     @pytest.mark.asyncio
     async def test_add_dependency_success(self) -> None:
         """Test add_dependency creates a dependency relationship."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=True,
             data={"id": 5, "title": "Blocking Task", "status": "pending"},
             status_code=201,
         )
 
-        response = mock_client._make_request("POST", "/todos/10/dependencies", {"dependency_id": 5})
+        response = await mock_client._make_request(
+            "POST", "/todos/10/dependencies", {"dependency_id": 5}
+        )
 
         assert response.success is True
         assert response.data is not None
@@ -874,14 +876,16 @@ class TestDependencyTools:
     @pytest.mark.asyncio
     async def test_add_dependency_circular_error(self) -> None:
         """Test add_dependency handles circular dependency error."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=False,
             error="Circular dependency detected",
             status_code=400,
         )
 
-        response = mock_client._make_request("POST", "/todos/10/dependencies", {"dependency_id": 5})
+        response = await mock_client._make_request(
+            "POST", "/todos/10/dependencies", {"dependency_id": 5}
+        )
 
         assert response.success is False
         assert "Circular dependency" in (response.error or "")
@@ -889,14 +893,14 @@ class TestDependencyTools:
     @pytest.mark.asyncio
     async def test_add_dependency_self_error(self) -> None:
         """Test add_dependency handles self-dependency error."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client._make_request.return_value = ApiResponse(
             success=False,
             error="A task cannot depend on itself",
             status_code=400,
         )
 
-        response = mock_client._make_request(
+        response = await mock_client._make_request(
             "POST", "/todos/10/dependencies", {"dependency_id": 10}
         )
 
@@ -944,9 +948,9 @@ class TestCreateTaskDeadlineTypeValidation:
     """Tests for deadline_type validation in create_task."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
+    def mock_api_client(self) -> AsyncMock:
         """Create a mock API client."""
-        client = MagicMock()
+        client = AsyncMock()
         client.create_todo.return_value = ApiResponse(
             success=True,
             data={"id": 1, "title": "Test Task"},
@@ -955,7 +959,7 @@ class TestCreateTaskDeadlineTypeValidation:
         return client
 
     @pytest.mark.asyncio
-    async def test_valid_deadline_types_accepted(self, mock_api_client: MagicMock) -> None:
+    async def test_valid_deadline_types_accepted(self, mock_api_client: AsyncMock) -> None:
         """Test that all valid deadline_type values are accepted."""
         import json
 
@@ -985,7 +989,7 @@ class TestCreateTaskDeadlineTypeValidation:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1008,7 +1012,7 @@ class TestCreateTaskDeadlineTypeValidation:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1024,7 +1028,7 @@ class TestCreateTaskDeadlineTypeValidation:
             assert "Invalid deadline_type" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_deadline_type_passed_to_sdk(self, mock_api_client: MagicMock) -> None:
+    async def test_deadline_type_passed_to_sdk(self, mock_api_client: AsyncMock) -> None:
         """Test that deadline_type is passed through to the SDK create_todo call."""
         from mcp_resource.server import create_resource_server
 
@@ -1050,9 +1054,9 @@ class TestUpdateTaskDeadlineTypeValidation:
     """Tests for deadline_type validation in update_task."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
+    def mock_api_client(self) -> AsyncMock:
         """Create a mock API client."""
-        client = MagicMock()
+        client = AsyncMock()
         client.update_todo.return_value = ApiResponse(
             success=True,
             data={"id": 1, "updated_fields": ["deadline_type"], "status": "updated"},
@@ -1061,7 +1065,7 @@ class TestUpdateTaskDeadlineTypeValidation:
         return client
 
     @pytest.mark.asyncio
-    async def test_valid_deadline_types_accepted(self, mock_api_client: MagicMock) -> None:
+    async def test_valid_deadline_types_accepted(self, mock_api_client: AsyncMock) -> None:
         """Test that all valid deadline_type values are accepted in update_task."""
         import json
 
@@ -1089,7 +1093,7 @@ class TestUpdateTaskDeadlineTypeValidation:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1105,7 +1109,7 @@ class TestUpdateTaskDeadlineTypeValidation:
             assert "Invalid deadline_type" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_deadline_type_passed_to_sdk(self, mock_api_client: MagicMock) -> None:
+    async def test_deadline_type_passed_to_sdk(self, mock_api_client: AsyncMock) -> None:
         """Test that deadline_type is passed through to the SDK update_todo call."""
         from mcp_resource.server import create_resource_server
 
@@ -1126,7 +1130,7 @@ class TestUpdateTaskDeadlineTypeValidation:
             assert call_kwargs["deadline_type"] == "hard"
 
     @pytest.mark.asyncio
-    async def test_deadline_type_in_updated_fields(self, mock_api_client: MagicMock) -> None:
+    async def test_deadline_type_in_updated_fields(self, mock_api_client: AsyncMock) -> None:
         """Test that deadline_type appears in updated_fields when provided."""
         import json
 
@@ -1252,8 +1256,8 @@ class TestCreateTasksBatch:
     """Tests for the create_tasks (batch) MCP tool."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
-        client = MagicMock()
+    def mock_api_client(self) -> AsyncMock:
+        client = AsyncMock()
         client.batch_create_todos.return_value = ApiResponse(
             success=True,
             data=[
@@ -1265,7 +1269,7 @@ class TestCreateTasksBatch:
         return client
 
     @pytest.mark.asyncio
-    async def test_batch_create_success(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_success(self, mock_api_client: AsyncMock) -> None:
         """Test successful batch creation of tasks."""
         import json
 
@@ -1301,7 +1305,7 @@ class TestCreateTasksBatch:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1323,7 +1327,7 @@ class TestCreateTasksBatch:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1345,7 +1349,7 @@ class TestCreateTasksBatch:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1362,12 +1366,12 @@ class TestCreateTasksBatch:
 
     @pytest.mark.asyncio
     async def test_batch_create_over_limit(self) -> None:
-        """Test that more than 50 tasks returns error."""
+        """Test that more than 1000 tasks returns error."""
         import json
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1377,13 +1381,13 @@ class TestCreateTasksBatch:
             )
             tools = server._tool_manager._tools
             create_tasks_tool = tools["create_tasks"]
-            result = await create_tasks_tool.fn(tasks=[{"title": f"Task {i}"} for i in range(51)])
+            result = await create_tasks_tool.fn(tasks=[{"title": f"Task {i}"} for i in range(1001)])
             parsed = json.loads(result)
             assert "error" in parsed
-            assert "50" in parsed["error"]
+            assert "1000" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_batch_create_passes_to_sdk(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_passes_to_sdk(self, mock_api_client: AsyncMock) -> None:
         """Test that tasks are correctly passed to the SDK."""
         from mcp_resource.server import create_resource_server
 
@@ -1414,7 +1418,7 @@ class TestCreateTasksBatch:
             assert todos[1]["tags"] == ["urgent"]
 
     @pytest.mark.asyncio
-    async def test_batch_create_with_parent_id(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_with_parent_id(self, mock_api_client: AsyncMock) -> None:
         """Test that parent_id is correctly parsed from task_ format."""
         from mcp_resource.server import create_resource_server
 
@@ -1434,7 +1438,7 @@ class TestCreateTasksBatch:
             assert todos[0]["parent_id"] == 42
 
     @pytest.mark.asyncio
-    async def test_batch_create_with_parent_index(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_with_parent_index(self, mock_api_client: AsyncMock) -> None:
         """Test that parent_index is passed through to the SDK."""
         from mcp_resource.server import create_resource_server
 
@@ -1467,7 +1471,7 @@ class TestCreateTasksBatch:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1495,7 +1499,7 @@ class TestCreateTasksBatch:
 
         from mcp_resource.server import create_resource_server
 
-        with patch("mcp_resource.server.get_api_client", return_value=MagicMock()):
+        with patch("mcp_resource.server.get_api_client", return_value=AsyncMock()):
             server = create_resource_server(
                 port=8001,
                 server_url="https://localhost:8001",
@@ -1517,7 +1521,7 @@ class TestCreateTasksBatch:
 
     @pytest.mark.asyncio
     async def test_batch_create_with_parent_index_response_includes_parent_id(
-        self, mock_api_client: MagicMock
+        self, mock_api_client: AsyncMock
     ) -> None:
         """Test that response includes parent_id for tasks created with parent_index."""
         import json
@@ -1558,7 +1562,7 @@ class TestCreateTasksBatch:
             assert parsed["created"][1]["parent_id"] == "task_10"
 
     @pytest.mark.asyncio
-    async def test_batch_create_with_wiki_page_id(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_with_wiki_page_id(self, mock_api_client: AsyncMock) -> None:
         """Test that wiki_page_id is passed to the SDK."""
         import json
 
@@ -1587,7 +1591,7 @@ class TestCreateTasksBatch:
             assert call_args.kwargs["wiki_page_id"] == 42
 
     @pytest.mark.asyncio
-    async def test_batch_create_without_wiki_page_id(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_without_wiki_page_id(self, mock_api_client: AsyncMock) -> None:
         """Test that wiki_page_id is not in result when not provided."""
         import json
 
@@ -1615,7 +1619,7 @@ class TestCreateTasksBatch:
             assert call_args.kwargs["wiki_page_id"] is None
 
     @pytest.mark.asyncio
-    async def test_batch_create_with_estimated_hours(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_create_with_estimated_hours(self, mock_api_client: AsyncMock) -> None:
         """Test that estimated_hours is passed through to the SDK."""
         from mcp_resource.server import create_resource_server
 
@@ -1649,7 +1653,7 @@ class TestCreateTaskCategoryResolution:
     in their responses, so callers can confirm what project was matched or auto-created.
     """
 
-    def _make_server_tools(self, mock_client: MagicMock) -> Any:
+    def _make_server_tools(self, mock_client: AsyncMock) -> Any:
         from mcp_resource.server import create_resource_server
 
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
@@ -1667,7 +1671,7 @@ class TestCreateTaskCategoryResolution:
         """Test that create_task includes the project_name from the API as 'category'."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.create_todo.return_value = ApiResponse(
             success=True,
             data={"id": 42, "title": "My Task", "project_name": "Work"},
@@ -1687,7 +1691,7 @@ class TestCreateTaskCategoryResolution:
         """Test that create_task category is None when the API returns no project_name."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.create_todo.return_value = ApiResponse(
             success=True,
             data={"id": 7, "title": "Uncategorized"},
@@ -1707,7 +1711,7 @@ class TestCreateTaskCategoryResolution:
         """Test that create_tasks includes project_name as 'category' for each task."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.batch_create_todos.return_value = ApiResponse(
             success=True,
             data=[
@@ -1737,12 +1741,12 @@ class TestWikiTools:
     """Tests for wiki MCP tools."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
+    def mock_api_client(self) -> AsyncMock:
         """Create a mock API client with wiki methods."""
-        client = MagicMock()
+        client = AsyncMock()
         return client
 
-    def _create_server(self, mock_client: MagicMock) -> Any:
+    def _create_server(self, mock_client: AsyncMock) -> Any:
         """Helper to create a patched MCP server and return tools dict."""
         from mcp_resource.server import create_resource_server
 
@@ -1757,7 +1761,7 @@ class TestWikiTools:
             return server._tool_manager._tools
 
     @pytest.mark.asyncio
-    async def test_search_wiki_pages_success(self, mock_api_client: MagicMock) -> None:
+    async def test_search_wiki_pages_success(self, mock_api_client: AsyncMock) -> None:
         """Test searching wiki pages returns matching page summaries."""
         import json
 
@@ -1785,7 +1789,7 @@ class TestWikiTools:
             mock_api_client.list_wiki_pages.assert_called_with(q="meeting")
 
     @pytest.mark.asyncio
-    async def test_create_wiki_page_success(self, mock_api_client: MagicMock) -> None:
+    async def test_create_wiki_page_success(self, mock_api_client: AsyncMock) -> None:
         """Test creating a wiki page."""
         import json
 
@@ -1812,7 +1816,7 @@ class TestWikiTools:
             assert parsed["page"]["slug"] == "new-page"
 
     @pytest.mark.asyncio
-    async def test_get_wiki_page_by_slug(self, mock_api_client: MagicMock) -> None:
+    async def test_get_wiki_page_by_slug(self, mock_api_client: AsyncMock) -> None:
         """Test getting a wiki page by slug."""
         import json
 
@@ -1838,7 +1842,7 @@ class TestWikiTools:
             assert parsed["page"]["content"] == "Content here"
 
     @pytest.mark.asyncio
-    async def test_get_wiki_page_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_get_wiki_page_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test getting a wiki page that doesn't exist."""
         import json
 
@@ -1856,7 +1860,7 @@ class TestWikiTools:
             assert "not found" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_update_wiki_page_success(self, mock_api_client: MagicMock) -> None:
+    async def test_update_wiki_page_success(self, mock_api_client: AsyncMock) -> None:
         """Test updating a wiki page."""
         import json
 
@@ -1884,7 +1888,7 @@ class TestWikiTools:
             assert parsed["page"]["title"] == "Updated Title"
 
     @pytest.mark.asyncio
-    async def test_delete_wiki_page_success(self, mock_api_client: MagicMock) -> None:
+    async def test_delete_wiki_page_success(self, mock_api_client: AsyncMock) -> None:
         """Test deleting a wiki page."""
         import json
 
@@ -1903,7 +1907,7 @@ class TestWikiTools:
             assert parsed["page_id"] == 3
 
     @pytest.mark.asyncio
-    async def test_link_wiki_page_to_task_success(self, mock_api_client: MagicMock) -> None:
+    async def test_link_wiki_page_to_task_success(self, mock_api_client: AsyncMock) -> None:
         """Test linking a wiki page to a task."""
         import json
 
@@ -1930,7 +1934,7 @@ class TestWikiTools:
             mock_api_client.link_wiki_page_to_task.assert_called_with(5, 10)
 
     @pytest.mark.asyncio
-    async def test_link_wiki_page_invalid_task_id(self, mock_api_client: MagicMock) -> None:
+    async def test_link_wiki_page_invalid_task_id(self, mock_api_client: AsyncMock) -> None:
         """Test linking with invalid task ID format."""
         import json
 
@@ -1942,7 +1946,7 @@ class TestWikiTools:
             assert "Invalid task_id" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_get_wiki_page_linked_tasks(self, mock_api_client: MagicMock) -> None:
+    async def test_get_wiki_page_linked_tasks(self, mock_api_client: AsyncMock) -> None:
         """Test getting tasks linked to a wiki page."""
         import json
 
@@ -1977,7 +1981,7 @@ class TestWikiTools:
             assert parsed["tasks"][1]["id"] == "task_2"
 
     @pytest.mark.asyncio
-    async def test_get_task_wiki_pages(self, mock_api_client: MagicMock) -> None:
+    async def test_get_task_wiki_pages(self, mock_api_client: AsyncMock) -> None:
         """Test getting wiki pages linked to a task."""
         import json
 
@@ -2006,7 +2010,7 @@ class TestWikiTools:
             mock_api_client.get_task_wiki_pages.assert_called_with(42)
 
     @pytest.mark.asyncio
-    async def test_get_task_wiki_pages_invalid_id(self, mock_api_client: MagicMock) -> None:
+    async def test_get_task_wiki_pages_invalid_id(self, mock_api_client: AsyncMock) -> None:
         """Test getting wiki pages with invalid task ID."""
         import json
 
@@ -2018,7 +2022,7 @@ class TestWikiTools:
             assert "Invalid task_id" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_update_wiki_page_append(self, mock_api_client: MagicMock) -> None:
+    async def test_update_wiki_page_append(self, mock_api_client: AsyncMock) -> None:
         """Test updating a wiki page with append mode."""
         import json
 
@@ -2055,7 +2059,7 @@ class TestWikiTools:
             )
 
     @pytest.mark.asyncio
-    async def test_create_wiki_page_with_parent_id(self, mock_api_client: MagicMock) -> None:
+    async def test_create_wiki_page_with_parent_id(self, mock_api_client: AsyncMock) -> None:
         """Test creating a wiki page with parent_id."""
         import json
 
@@ -2087,7 +2091,7 @@ class TestWikiTools:
             )
 
     @pytest.mark.asyncio
-    async def test_update_wiki_page_with_parent_id(self, mock_api_client: MagicMock) -> None:
+    async def test_update_wiki_page_with_parent_id(self, mock_api_client: AsyncMock) -> None:
         """Test moving a wiki page under a new parent."""
         import json
 
@@ -2124,7 +2128,7 @@ class TestWikiTools:
             )
 
     @pytest.mark.asyncio
-    async def test_update_wiki_page_remove_parent(self, mock_api_client: MagicMock) -> None:
+    async def test_update_wiki_page_remove_parent(self, mock_api_client: AsyncMock) -> None:
         """Test removing a wiki page's parent to make it a root page."""
         import json
 
@@ -2162,7 +2166,7 @@ class TestWikiTools:
 
     @pytest.mark.asyncio
     async def test_update_wiki_page_parent_id_and_remove_parent_conflict(
-        self, mock_api_client: MagicMock
+        self, mock_api_client: AsyncMock
     ) -> None:
         """Test that passing both parent_id and remove_parent returns an error."""
         import json
@@ -2176,7 +2180,7 @@ class TestWikiTools:
             mock_api_client.update_wiki_page.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_batch_link_wiki_page_to_tasks_success(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_link_wiki_page_to_tasks_success(self, mock_api_client: AsyncMock) -> None:
         """Test batch linking tasks to a wiki page."""
         import json
 
@@ -2199,7 +2203,7 @@ class TestWikiTools:
             mock_api_client.batch_link_wiki_page_to_tasks.assert_called_with(5, [1, 2, 99])
 
     @pytest.mark.asyncio
-    async def test_batch_link_invalid_task_ids(self, mock_api_client: MagicMock) -> None:
+    async def test_batch_link_invalid_task_ids(self, mock_api_client: AsyncMock) -> None:
         """Test batch linking with invalid task ID format."""
         import json
 
@@ -2217,12 +2221,12 @@ class TestSnippetTools:
     """Tests for snippet MCP tools."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
+    def mock_api_client(self) -> AsyncMock:
         """Create a mock API client with snippet methods."""
-        client = MagicMock()
+        client = AsyncMock()
         return client
 
-    def _create_server(self, mock_client: MagicMock) -> Any:
+    def _create_server(self, mock_client: AsyncMock) -> Any:
         """Helper to create a patched MCP server and return tools dict."""
         from mcp_resource.server import create_resource_server
 
@@ -2237,7 +2241,7 @@ class TestSnippetTools:
             return server._tool_manager._tools
 
     @pytest.mark.asyncio
-    async def test_list_snippets_success(self, mock_api_client: MagicMock) -> None:
+    async def test_list_snippets_success(self, mock_api_client: AsyncMock) -> None:
         """Test list_snippets returns snippet data."""
         import json
 
@@ -2276,7 +2280,7 @@ class TestSnippetTools:
             assert parsed["snippets"][0]["category"] == "standup"
 
     @pytest.mark.asyncio
-    async def test_list_snippets_empty(self, mock_api_client: MagicMock) -> None:
+    async def test_list_snippets_empty(self, mock_api_client: AsyncMock) -> None:
         """Test list_snippets with no snippets."""
         import json
 
@@ -2295,7 +2299,7 @@ class TestSnippetTools:
             assert parsed["snippets"] == []
 
     @pytest.mark.asyncio
-    async def test_list_snippets_api_error(self, mock_api_client: MagicMock) -> None:
+    async def test_list_snippets_api_error(self, mock_api_client: AsyncMock) -> None:
         """Test list_snippets handles API errors."""
         import json
 
@@ -2313,7 +2317,7 @@ class TestSnippetTools:
             assert parsed["error"] == "Authentication failed"
 
     @pytest.mark.asyncio
-    async def test_list_snippets_with_filters(self, mock_api_client: MagicMock) -> None:
+    async def test_list_snippets_with_filters(self, mock_api_client: AsyncMock) -> None:
         """Test list_snippets passes filter parameters to SDK."""
         import json
 
@@ -2345,7 +2349,7 @@ class TestSnippetTools:
             )
 
     @pytest.mark.asyncio
-    async def test_create_snippet_success(self, mock_api_client: MagicMock) -> None:
+    async def test_create_snippet_success(self, mock_api_client: AsyncMock) -> None:
         """Test create_snippet creates a snippet."""
         import json
 
@@ -2377,7 +2381,7 @@ class TestSnippetTools:
             assert parsed["snippet"]["category"] == "standup"
 
     @pytest.mark.asyncio
-    async def test_create_snippet_error(self, mock_api_client: MagicMock) -> None:
+    async def test_create_snippet_error(self, mock_api_client: AsyncMock) -> None:
         """Test create_snippet handles API errors."""
         import json
 
@@ -2397,7 +2401,7 @@ class TestSnippetTools:
             assert "error" in parsed
 
     @pytest.mark.asyncio
-    async def test_get_snippet_success(self, mock_api_client: MagicMock) -> None:
+    async def test_get_snippet_success(self, mock_api_client: AsyncMock) -> None:
         """Test get_snippet retrieves a single snippet."""
         import json
 
@@ -2426,7 +2430,7 @@ class TestSnippetTools:
             assert parsed["snippet"]["tags"] == ["sprint", "planning"]
 
     @pytest.mark.asyncio
-    async def test_get_snippet_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_get_snippet_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test get_snippet handles snippet not found."""
         import json
 
@@ -2444,7 +2448,7 @@ class TestSnippetTools:
             assert parsed["error"] == "Snippet not found"
 
     @pytest.mark.asyncio
-    async def test_update_snippet_success(self, mock_api_client: MagicMock) -> None:
+    async def test_update_snippet_success(self, mock_api_client: AsyncMock) -> None:
         """Test update_snippet updates a snippet."""
         import json
 
@@ -2476,7 +2480,7 @@ class TestSnippetTools:
             assert parsed["snippet"]["title"] == "Updated title"
 
     @pytest.mark.asyncio
-    async def test_update_snippet_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_update_snippet_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test update_snippet handles snippet not found."""
         import json
 
@@ -2497,7 +2501,7 @@ class TestSnippetTools:
             assert parsed["error"] == "Snippet not found"
 
     @pytest.mark.asyncio
-    async def test_delete_snippet_success(self, mock_api_client: MagicMock) -> None:
+    async def test_delete_snippet_success(self, mock_api_client: AsyncMock) -> None:
         """Test delete_snippet successfully deletes a snippet."""
         import json
 
@@ -2516,7 +2520,7 @@ class TestSnippetTools:
             assert parsed["snippet_id"] == 1
 
     @pytest.mark.asyncio
-    async def test_delete_snippet_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_delete_snippet_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test delete_snippet handles snippet not found."""
         import json
 
@@ -2537,7 +2541,7 @@ class TestSnippetTools:
 class TestResourceDefinitions:
     """Tests for MCP resource definitions (read-only lookups)."""
 
-    def _create_server(self, mock_client: MagicMock) -> Any:
+    def _create_server(self, mock_client: AsyncMock) -> Any:
         """Helper to create a patched MCP server."""
         from mcp_resource.server import create_resource_server
 
@@ -2552,7 +2556,7 @@ class TestResourceDefinitions:
 
     def test_health_resource_registered(self) -> None:
         """Test that taskmanager://health resource is registered."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
             server = self._create_server(mock_client)
             resources = server._resource_manager._resources
@@ -2563,7 +2567,7 @@ class TestResourceDefinitions:
         """Test that the health resource calls the SDK and returns data."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.health_check.return_value = ApiResponse(
             success=True,
             data={
@@ -2590,7 +2594,7 @@ class TestResourceDefinitions:
 
     def test_categories_resource_registered(self) -> None:
         """Test that taskmanager://categories resource is registered."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
             server = self._create_server(mock_client)
             resources = server._resource_manager._resources
@@ -2598,7 +2602,7 @@ class TestResourceDefinitions:
 
     def test_snippet_categories_resource_registered(self) -> None:
         """Test that taskmanager://snippets/categories resource is registered."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
             server = self._create_server(mock_client)
             resources = server._resource_manager._resources
@@ -2606,7 +2610,7 @@ class TestResourceDefinitions:
 
     def test_wiki_pages_resource_registered(self) -> None:
         """Test that taskmanager://wiki/pages resource is registered."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
             server = self._create_server(mock_client)
             resources = server._resource_manager._resources
@@ -2614,7 +2618,7 @@ class TestResourceDefinitions:
 
     def test_deleted_tools_not_registered(self) -> None:
         """Test that removed tools are no longer registered."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
             server = self._create_server(mock_client)
             tools = server._tool_manager._tools
@@ -2634,7 +2638,7 @@ class TestResourceDefinitions:
 
     def test_search_wiki_pages_tool_registered(self) -> None:
         """Test that search_wiki_pages (renamed from list_wiki_pages) is registered."""
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
             server = self._create_server(mock_client)
             tools = server._tool_manager._tools
@@ -2645,7 +2649,7 @@ class TestResourceDefinitions:
         """Test that the categories resource calls the API and returns data."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.get_categories.return_value = ApiResponse(
             success=True,
             data={"categories": [{"name": "Work", "task_count": 5}]},
@@ -2666,7 +2670,7 @@ class TestResourceDefinitions:
         """Test that the snippet categories resource returns data."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.get_snippet_categories.return_value = ApiResponse(
             success=True,
             data=[
@@ -2689,7 +2693,7 @@ class TestResourceDefinitions:
         """Test that the wiki pages resource returns data."""
         import json
 
-        mock_client = MagicMock()
+        mock_client = AsyncMock()
         mock_client.list_wiki_pages.return_value = ApiResponse(
             success=True,
             data=[
@@ -2714,12 +2718,12 @@ class TestNewsFeedTools:
     """Tests for news/RSS feed MCP tools."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
+    def mock_api_client(self) -> AsyncMock:
         """Create a mock API client with news methods."""
-        client = MagicMock()
+        client = AsyncMock()
         return client
 
-    def _create_server(self, mock_client: MagicMock) -> Any:
+    def _create_server(self, mock_client: AsyncMock) -> Any:
         """Helper to create a patched MCP server and return tools dict."""
         from mcp_resource.server import create_resource_server
 
@@ -2736,7 +2740,7 @@ class TestNewsFeedTools:
     # --- list_articles ---
 
     @pytest.mark.asyncio
-    async def test_list_articles_success(self, mock_api_client: MagicMock) -> None:
+    async def test_list_articles_success(self, mock_api_client: AsyncMock) -> None:
         """Test list_articles returns article data."""
         import json
 
@@ -2769,7 +2773,7 @@ class TestNewsFeedTools:
             assert parsed["articles"][0]["title"] == "New Python Release"
 
     @pytest.mark.asyncio
-    async def test_list_articles_empty(self, mock_api_client: MagicMock) -> None:
+    async def test_list_articles_empty(self, mock_api_client: AsyncMock) -> None:
         """Test list_articles with no articles."""
         import json
 
@@ -2788,7 +2792,7 @@ class TestNewsFeedTools:
             assert parsed["articles"] == []
 
     @pytest.mark.asyncio
-    async def test_list_articles_api_error(self, mock_api_client: MagicMock) -> None:
+    async def test_list_articles_api_error(self, mock_api_client: AsyncMock) -> None:
         """Test list_articles handles API errors."""
         import json
 
@@ -2806,7 +2810,7 @@ class TestNewsFeedTools:
             assert parsed["error"] == "Authentication failed"
 
     @pytest.mark.asyncio
-    async def test_list_articles_with_filters(self, mock_api_client: MagicMock) -> None:
+    async def test_list_articles_with_filters(self, mock_api_client: AsyncMock) -> None:
         """Test list_articles passes filter parameters to SDK."""
         import json
 
@@ -2833,7 +2837,7 @@ class TestNewsFeedTools:
             )
 
     @pytest.mark.asyncio
-    async def test_list_articles_invalid_feed_type(self, mock_api_client: MagicMock) -> None:
+    async def test_list_articles_invalid_feed_type(self, mock_api_client: AsyncMock) -> None:
         """Test list_articles rejects invalid feed_type."""
         import json
 
@@ -2847,7 +2851,7 @@ class TestNewsFeedTools:
     # --- get_article ---
 
     @pytest.mark.asyncio
-    async def test_get_article_success(self, mock_api_client: MagicMock) -> None:
+    async def test_get_article_success(self, mock_api_client: AsyncMock) -> None:
         """Test get_article returns article data."""
         import json
 
@@ -2872,7 +2876,7 @@ class TestNewsFeedTools:
             assert parsed["article"]["title"] == "New Python Release"
 
     @pytest.mark.asyncio
-    async def test_get_article_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_get_article_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test get_article handles not found."""
         import json
 
@@ -2891,7 +2895,7 @@ class TestNewsFeedTools:
     # --- mark_article_read ---
 
     @pytest.mark.asyncio
-    async def test_mark_article_read(self, mock_api_client: MagicMock) -> None:
+    async def test_mark_article_read(self, mock_api_client: AsyncMock) -> None:
         """Test marking an article as read."""
         import json
 
@@ -2912,7 +2916,7 @@ class TestNewsFeedTools:
             assert parsed["status"] == "updated"
 
     @pytest.mark.asyncio
-    async def test_mark_article_unread(self, mock_api_client: MagicMock) -> None:
+    async def test_mark_article_unread(self, mock_api_client: AsyncMock) -> None:
         """Test marking an article as unread."""
         import json
 
@@ -2931,7 +2935,7 @@ class TestNewsFeedTools:
             assert parsed["read_at"] is None
 
     @pytest.mark.asyncio
-    async def test_mark_article_read_error(self, mock_api_client: MagicMock) -> None:
+    async def test_mark_article_read_error(self, mock_api_client: AsyncMock) -> None:
         """Test mark_article_read handles errors."""
         import json
 
@@ -2950,7 +2954,7 @@ class TestNewsFeedTools:
     # --- rate_article ---
 
     @pytest.mark.asyncio
-    async def test_rate_article_success(self, mock_api_client: MagicMock) -> None:
+    async def test_rate_article_success(self, mock_api_client: AsyncMock) -> None:
         """Test rating an article."""
         import json
 
@@ -2970,7 +2974,7 @@ class TestNewsFeedTools:
             assert parsed["status"] == "rated"
 
     @pytest.mark.asyncio
-    async def test_rate_article_invalid_rating(self, mock_api_client: MagicMock) -> None:
+    async def test_rate_article_invalid_rating(self, mock_api_client: AsyncMock) -> None:
         """Test rate_article rejects invalid ratings."""
         import json
 
@@ -2982,7 +2986,7 @@ class TestNewsFeedTools:
             assert "Invalid rating" in parsed["error"]
 
     @pytest.mark.asyncio
-    async def test_rate_article_all_valid_ratings(self, mock_api_client: MagicMock) -> None:
+    async def test_rate_article_all_valid_ratings(self, mock_api_client: AsyncMock) -> None:
         """Test rate_article accepts all valid rating values."""
         import json
 
@@ -3003,7 +3007,7 @@ class TestNewsFeedTools:
     # --- list_feed_sources ---
 
     @pytest.mark.asyncio
-    async def test_list_feed_sources_success(self, mock_api_client: MagicMock) -> None:
+    async def test_list_feed_sources_success(self, mock_api_client: AsyncMock) -> None:
         """Test list_feed_sources returns source data."""
         import json
 
@@ -3026,7 +3030,7 @@ class TestNewsFeedTools:
             assert parsed["sources"][0]["name"] == "PythonNews"
 
     @pytest.mark.asyncio
-    async def test_list_feed_sources_featured_filter(self, mock_api_client: MagicMock) -> None:
+    async def test_list_feed_sources_featured_filter(self, mock_api_client: AsyncMock) -> None:
         """Test list_feed_sources passes featured filter."""
         import json
 
@@ -3046,7 +3050,7 @@ class TestNewsFeedTools:
     # --- create_feed_source ---
 
     @pytest.mark.asyncio
-    async def test_create_feed_source_success(self, mock_api_client: MagicMock) -> None:
+    async def test_create_feed_source_success(self, mock_api_client: AsyncMock) -> None:
         """Test creating a feed source."""
         import json
 
@@ -3073,7 +3077,7 @@ class TestNewsFeedTools:
             assert parsed["status"] == "created"
 
     @pytest.mark.asyncio
-    async def test_create_feed_source_error(self, mock_api_client: MagicMock) -> None:
+    async def test_create_feed_source_error(self, mock_api_client: AsyncMock) -> None:
         """Test create_feed_source handles errors."""
         import json
 
@@ -3094,7 +3098,7 @@ class TestNewsFeedTools:
     # --- update_feed_source ---
 
     @pytest.mark.asyncio
-    async def test_update_feed_source_success(self, mock_api_client: MagicMock) -> None:
+    async def test_update_feed_source_success(self, mock_api_client: AsyncMock) -> None:
         """Test updating a feed source."""
         import json
 
@@ -3117,7 +3121,7 @@ class TestNewsFeedTools:
             assert parsed["status"] == "updated"
 
     @pytest.mark.asyncio
-    async def test_update_feed_source_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_update_feed_source_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test update_feed_source handles not found."""
         import json
 
@@ -3136,7 +3140,7 @@ class TestNewsFeedTools:
     # --- delete_feed_source ---
 
     @pytest.mark.asyncio
-    async def test_delete_feed_source_success(self, mock_api_client: MagicMock) -> None:
+    async def test_delete_feed_source_success(self, mock_api_client: AsyncMock) -> None:
         """Test deleting a feed source."""
         import json
 
@@ -3155,7 +3159,7 @@ class TestNewsFeedTools:
             assert parsed["status"] == "deleted"
 
     @pytest.mark.asyncio
-    async def test_delete_feed_source_not_found(self, mock_api_client: MagicMock) -> None:
+    async def test_delete_feed_source_not_found(self, mock_api_client: AsyncMock) -> None:
         """Test delete_feed_source handles not found."""
         import json
 
@@ -3174,7 +3178,7 @@ class TestNewsFeedTools:
     # --- toggle_feed_source ---
 
     @pytest.mark.asyncio
-    async def test_toggle_feed_source_success(self, mock_api_client: MagicMock) -> None:
+    async def test_toggle_feed_source_success(self, mock_api_client: AsyncMock) -> None:
         """Test toggling a feed source."""
         import json
 
@@ -3194,7 +3198,7 @@ class TestNewsFeedTools:
             assert parsed["status"] == "toggled"
 
     @pytest.mark.asyncio
-    async def test_toggle_feed_source_error(self, mock_api_client: MagicMock) -> None:
+    async def test_toggle_feed_source_error(self, mock_api_client: AsyncMock) -> None:
         """Test toggle_feed_source handles errors."""
         import json
 
@@ -3213,7 +3217,7 @@ class TestNewsFeedTools:
     # --- force_fetch_feed ---
 
     @pytest.mark.asyncio
-    async def test_force_fetch_feed_success(self, mock_api_client: MagicMock) -> None:
+    async def test_force_fetch_feed_success(self, mock_api_client: AsyncMock) -> None:
         """Test force fetching a feed."""
         import json
 
@@ -3234,7 +3238,7 @@ class TestNewsFeedTools:
             assert parsed["result"]["articles_fetched"] == 5
 
     @pytest.mark.asyncio
-    async def test_force_fetch_feed_default_hours(self, mock_api_client: MagicMock) -> None:
+    async def test_force_fetch_feed_default_hours(self, mock_api_client: AsyncMock) -> None:
         """Test force_fetch_feed uses default hours."""
         import json
 
@@ -3253,7 +3257,7 @@ class TestNewsFeedTools:
             mock_api_client.force_fetch_feed.assert_called_once_with(1, 168)
 
     @pytest.mark.asyncio
-    async def test_force_fetch_feed_error(self, mock_api_client: MagicMock) -> None:
+    async def test_force_fetch_feed_error(self, mock_api_client: AsyncMock) -> None:
         """Test force_fetch_feed handles errors."""
         import json
 
@@ -3274,10 +3278,10 @@ class TestGetTasksAndSearchTasksPayloadShape:
     """Tests for the summary-by-default response shape of get_tasks and search_tasks."""
 
     @pytest.fixture
-    def mock_api_client(self) -> MagicMock:
-        return MagicMock()
+    def mock_api_client(self) -> AsyncMock:
+        return AsyncMock()
 
-    def _create_server(self, mock_client: MagicMock) -> Any:
+    def _create_server(self, mock_client: AsyncMock) -> Any:
         from mcp_resource.server import create_resource_server
 
         with patch("mcp_resource.server.get_api_client", return_value=mock_client):
@@ -3312,7 +3316,7 @@ class TestGetTasksAndSearchTasksPayloadShape:
         }
 
     @pytest.mark.asyncio
-    async def test_get_tasks_summary_by_default(self, mock_api_client: MagicMock) -> None:
+    async def test_get_tasks_summary_by_default(self, mock_api_client: AsyncMock) -> None:
         import json
 
         mock_api_client.get_todos.return_value = ApiResponse(
@@ -3337,7 +3341,7 @@ class TestGetTasksAndSearchTasksPayloadShape:
 
     @pytest.mark.asyncio
     async def test_get_tasks_opt_in_descriptions_and_subtasks(
-        self, mock_api_client: MagicMock
+        self, mock_api_client: AsyncMock
     ) -> None:
         import json
 
@@ -3359,7 +3363,7 @@ class TestGetTasksAndSearchTasksPayloadShape:
         assert mock_api_client.get_todos.call_args.kwargs["include_subtasks"] is True
 
     @pytest.mark.asyncio
-    async def test_search_tasks_summary_and_total_matches(self, mock_api_client: MagicMock) -> None:
+    async def test_search_tasks_summary_and_total_matches(self, mock_api_client: AsyncMock) -> None:
         import json
 
         payloads = [self._task_payload(task_id=i) for i in range(1, 11)]
@@ -3382,7 +3386,7 @@ class TestGetTasksAndSearchTasksPayloadShape:
             assert "subtasks" not in task
 
     @pytest.mark.asyncio
-    async def test_search_tasks_opt_in_descriptions(self, mock_api_client: MagicMock) -> None:
+    async def test_search_tasks_opt_in_descriptions(self, mock_api_client: AsyncMock) -> None:
         import json
 
         mock_api_client.search_tasks.return_value = ApiResponse(
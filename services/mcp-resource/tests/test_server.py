@@ -270,3 +270,30 @@ class TestTransportSecurityConfiguration:
         call_kwargs = mock_fastmcp.call_args[1]
         transport_security = call_kwargs["transport_security"]
         assert "mcp.example.com:8443" in transport_security.allowed_hosts
+
+
+class TestGetApiClient:
+    """Tests for the shared async API client."""
+
+    @patch("mcp_resource.server.API_KEY", "test-api-key")
+    def test_returns_one_shared_async_client(self) -> None:
+        """Tool calls reuse one client (and its connection pool)."""
+        from taskmanager_sdk import AsyncTaskManagerClient
+
+        from mcp_resource.server import get_api_client
+
+        first = get_api_client()
+        second = get_api_client()
+
+        assert isinstance(first, AsyncTaskManagerClient)
+        assert first is second
+        assert first.access_token == "test-api-key"
+        assert first.base_url.endswith("/api")
+
+    @patch("mcp_resource.server.API_KEY", None)
+    def test_requires_api_key(self) -> None:
+        """A missing API key is reported instead of sending anonymous requests."""
+        from mcp_resource.server import get_api_client
+
+        with pytest.raises(RuntimeError, match="TASKMANAGER_API_KEY"):
+            get_api_client()
@@ -1,5 +1,7 @@
 """Unit tests for IntrospectionTokenVerifier class."""
 
+import asyncio
+import time
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -296,3 +298,107 @@ class TestIntrospectionTokenVerifier:
         result = verifier._is_valid_resource("https://api.example.com")
 
         assert result is False
+
+
+def _active_response(**extra: Any) -> dict[str, Any]:
+    return {"active": True, "client_id": "client123", "scope": "read", **extra}
+
+
+class TestIntrospectionCache:
+    def _verifier(self, handler: Any, **kwargs: Any) -> IntrospectionTokenVerifier:
+        verifier = IntrospectionTokenVerifier(
+            introspection_endpoint="https://auth.example.com/introspect",
+            server_url="https://api.example.com",
+            **kwargs,
+        )
+        verifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return verifier
+
+    @pytest.mark.asyncio
+    async def test_active_token_is_cached(self) -> None:
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=_active_response())
+
+        verifier = self._verifier(handler)
+        first = await verifier.verify_token("tok")
+        second = await verifier.verify_token("tok")
+
+        assert first is not None and second is not None
+        assert second.client_id == "client123"
+        assert len(calls) == 1
+        assert (verifier.stats.misses, verifier.stats.hits) == (1, 1)
+        await verifier.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_respects_token_expiry(self) -> None:
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=_active_response(exp=time.time() - 1))
+
+        verifier = self._verifier(handler)
+        await verifier.verify_token("tok")
+        await verifier.verify_token("tok")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_inactive_token_is_negatively_cached(self) -> None:
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"active": False})
+
+        verifier = self._verifier(handler)
+        assert await verifier.verify_token("tok") is None
+        assert await verifier.verify_token("tok") is None
+
+        assert len(calls) == 1
+        assert verifier.stats.negative_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503)
+
+        verifier = self._verifier(handler)
+        assert await verifier.verify_token("tok") is None
+        assert await verifier.verify_token("tok") is None
+
+        assert len(calls) == 2
+        assert verifier.stats.failures == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self) -> None:
+        calls: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=_active_response())
+
+        verifier = self._verifier(handler)
+        results = await asyncio.gather(*(verifier.verify_token("tok") for _ in range(5)))
+
+        assert all(result is not None for result in results)
+        assert len(calls) == 1
+        assert verifier.stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=_active_response())
+
+        verifier = self._verifier(handler, max_cache_entries=2)
+        for token in ("a", "b", "c"):
+            await verifier.verify_token(token)
+
+        assert len(verifier._cache) == 2